@@ -3,10 +3,7 @@ import json
 import os
 from typing import Optional, Any
 
-import pandas as pd
-
 import cosa.utils.util as du
-import cosa.utils.util_pandas        as dup
 import cosa.memory.solution_snapshot as ss
 
 from cosa.agents.raw_output_formatter import RawOutputFormatter
@@ -16,7 +13,7 @@ from cosa.agents.runnable_code import RunnableCode
 from cosa.config.configuration_manager import ConfigurationManager
 from cosa.memory.solution_snapshot import SolutionSnapshot
 from cosa.agents.two_word_id_generator import TwoWordIdGenerator
-from cosa.agents.io_models.utils.xml_parser_factory import XmlParserFactory
+from cosa.agents.agent_resource_cache import AgentResourceCache
 
 class CodeGenerationFailedException( Exception ):
     """
@@ -41,6 +38,9 @@ class AgentBase( RunnableCode, abc.ABC ):
     STATE_STOPPED_ERROR        = "error"
     STATE_STOPPED_DONE         = "done"
     
+    # do_not_serialize fields a queued job still needs after a queue WAL replay: who asked, and where to answer
+    JOB_IDENTITY_FIELDS        = frozenset( { "user_id", "user_email", "session_id", "two_word_id", "websocket_id" } )
+    
     # ROUTING_COMMAND_TEMPLATE         = "agent router go to {routing_command}"
     # PROMPT_TEMPLATE_KEY_TEMPLATE     = "prompt template for agent router go to {routing_command}"
     # LLM_SPEC_KEY_TEMPLATE            = "llm spec key for agent router go to {routing_command}"
@@ -138,34 +138,25 @@ class AgentBase( RunnableCode, abc.ABC ):
         
         self.config_mgr            = ConfigurationManager( env_var_name="LUPIN_CONFIG_MGR_CLI_ARGS" )
         
+        # Templates, dataframes and the XML parser factory are shared process-wide, and only rebuilt when their files change
+        resource_cache             = AgentResourceCache()
+        
         # Initialize XML parser factory for configurable parsing strategy
-        self.xml_parser_factory    = XmlParserFactory( config_mgr=self.config_mgr )
+        self.xml_parser_factory    = resource_cache.get_xml_parser_factory( self.config_mgr )
         
         self.df                    = None
         self.do_not_serialize      = { "df", "config_mgr", "xml_parser_factory", "two_word_id", "execution_state", "websocket_id", "user_id", "user_email", "session_id" }
 
         self.model_name            = self.config_mgr.get( f"llm spec key for {routing_command}" )
         template_path              = self.config_mgr.get( f"prompt template for {routing_command}" )
-        self.prompt_template       = du.get_file_as_string( du.get_project_root() + template_path )
-        
-        # Always process template for dynamic XML
-        try:
-            from cosa.agents.io_models.utils.prompt_template_processor import PromptTemplateProcessor
-            processor = PromptTemplateProcessor( debug=self.debug, verbose=self.verbose )
-            self.prompt_template = processor.process_template( self.prompt_template, routing_command )
-            if self.debug:
-                print( f"✓ Processed template for {routing_command} with dynamic XML" )
-        except Exception as e:
-            if self.debug:
-                print( f"⚠ Dynamic XML processing failed for {routing_command}: {e}" )
-            # Continue with original template if processing fails
+        self.prompt_template       = resource_cache.get_prompt_template( du.get_project_root() + template_path, routing_command, debug=self.debug, verbose=self.verbose )
         
         self.prompt                = None
         
         if self.df_path_key is not None:
 
-            self.df = pd.read_csv( du.get_project_root() + self.config_mgr.get( self.df_path_key ) )
-            self.df = dup.cast_to_datetime( self.df )
+            # Each agent gets its own copy, so in-place edits don't leak into the shared frame
+            self.df = resource_cache.get_dataframe( du.get_project_root() + self.config_mgr.get( self.df_path_key ) )
 
         # QueueableJob protocol compliance - status tracking attributes
         self.answer       = ""
@@ -177,6 +168,55 @@ class AgentBase( RunnableCode, abc.ABC ):
 
         self.execution_state = AgentBase.STATE_WAITING_TO_RUN
     
+    def __getstate__( self ) -> dict[str, Any]:
+        """
+        Return the job state that pickling (e.g. the queue WAL) persists.
+        
+        Requires:
+            - do_not_serialize names every process-local handle on this agent
+            
+        Ensures:
+            - Leaves out the do_not_serialize fields (config_mgr singleton, XML parser factory, dataframe, ...)
+            - Keeps JOB_IDENTITY_FIELDS, so a replayed job still reaches the user who queued it
+        """
+        skip = self.do_not_serialize - AgentBase.JOB_IDENTITY_FIELDS
+        return { key: value for key, value in self.__dict__.items() if key not in skip }
+    
+    def __setstate__( self, state: dict[str, Any] ) -> None:
+        """
+        Restore a pickled agent and rebuild what __getstate__ left out.
+        
+        Ensures:
+            - All persisted fields are restored as-is
+            - _restore_runtime_state() has rebuilt the process-local handles
+        """
+        self.__dict__.update( state )
+        self._restore_runtime_state()
+    
+    def _restore_runtime_state( self ) -> None:
+        """
+        Rebuild the process-local handles of an unpickled agent.
+        
+        Subclasses that add their own do_not_serialize handles extend this.
+        
+        Requires:
+            - Persisted fields (routing_command, df_path_key, debug, ...) are already restored
+            
+        Ensures:
+            - config_mgr is this process's ConfigurationManager singleton
+            - xml_parser_factory and df come from the shared AgentResourceCache
+            - execution_state is STATE_WAITING_TO_RUN: a replayed job has not run in this process
+        """
+        self.config_mgr         = ConfigurationManager( env_var_name="LUPIN_CONFIG_MGR_CLI_ARGS" )
+        resource_cache          = AgentResourceCache()
+        self.xml_parser_factory = resource_cache.get_xml_parser_factory( self.config_mgr )
+        self.df                 = None
+        
+        if self.df_path_key is not None:
+            self.df = resource_cache.get_dataframe( du.get_project_root() + self.config_mgr.get( self.df_path_key ) )
+        
+        self.execution_state    = AgentBase.STATE_WAITING_TO_RUN
+    
     @abc.abstractmethod
     def restore_from_serialized_state( file_path: str ) -> 'AgentBase':
         """
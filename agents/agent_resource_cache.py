@@ -0,0 +1,182 @@
+"""
+Process-wide cache of the read-only resources every AgentBase instance needs.
+
+Each agent used to read its prompt template from disk, run it through
+PromptTemplateProcessor, load and datetime-cast its CSV dataframe and build a
+fresh XmlParserFactory on every construction -- once per queued job. These
+resources only change when the underlying files change, so they are built once
+and shared.
+
+Design by Contract:
+    Requires:
+        - Paths handed in are absolute file paths
+
+    Ensures:
+        - Templates are keyed by ( path, mtime, routing_command ) and rebuilt when the file changes
+        - Dataframes are keyed by ( path, mtime, size ), rebuilt when the file changes,
+          and every caller gets its own copy
+        - One XmlParserFactory per ConfigurationManager instance
+        - Thread-safe; hit/miss counters available via get_stats()
+"""
+
+import os
+import threading
+from typing import Any, Optional
+
+import pandas as pd
+
+import cosa.utils.util        as du
+import cosa.utils.util_pandas as dup
+
+from cosa.agents.io_models.utils.xml_parser_factory import XmlParserFactory
+
+
+class AgentResourceCache:
+    """
+    Singleton cache for agent prompt templates, dataframes and XML parser factories.
+
+    Requires:
+        - Nothing; entries are built lazily on first request
+
+    Ensures:
+        - File-backed entries are revalidated with a single os.stat() per request
+        - Only the latest version of each file is kept
+    """
+
+    _instance = None
+    _lock     = threading.Lock()
+
+    def __new__( cls, debug: bool=False, verbose: bool=False ) -> "AgentResourceCache":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__( cls )
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__( self, debug: bool=False, verbose: bool=False ) -> None:
+        if self._initialized: return
+
+        self.debug        = debug
+        self.verbose      = verbose
+        self._templates   = { }
+        self._dataframes  = { }
+        self._xml_factory = None
+        self._cache_lock  = threading.Lock()
+        self._stats       = { "template_hits": 0, "template_misses": 0, "dataframe_hits": 0, "dataframe_misses": 0 }
+        self._initialized = True
+
+    def get_prompt_template( self, path: str, routing_command: Optional[str], debug: bool=False, verbose: bool=False ) -> str:
+        """
+        Return the processed prompt template for a routing command.
+
+        Requires:
+            - path is an existing template file
+
+        Ensures:
+            - Reads and processes the file only when it's new or its mtime changed
+            - Paths that can't be stat'd are read directly and not cached
+            - Falls back to the raw template if dynamic XML processing fails, as AgentBase always did
+
+        Raises:
+            - FileNotFoundError if the template file can't be read
+        """
+        key       = ( path, routing_command )
+        signature = _file_signature( path, include_size=False )
+
+        with self._cache_lock:
+            entry = self._templates.get( key )
+            if signature is not None and entry is not None and entry[ 0 ] == signature:
+                self._stats[ "template_hits" ] += 1
+                return entry[ 1 ]
+
+        template = du.get_file_as_string( path )
+
+        # Always process template for dynamic XML
+        try:
+            from cosa.agents.io_models.utils.prompt_template_processor import PromptTemplateProcessor
+            processor = PromptTemplateProcessor( debug=debug, verbose=verbose )
+            template  = processor.process_template( template, routing_command )
+            if debug:
+                print( f"✓ Processed template for {routing_command} with dynamic XML" )
+        except Exception as e:
+            if debug:
+                print( f"⚠ Dynamic XML processing failed for {routing_command}: {e}" )
+            # Continue with original template if processing fails
+
+        with self._cache_lock:
+            if signature is not None: self._templates[ key ] = ( signature, template )
+            self._stats[ "template_misses" ] += 1
+
+        return template
+
+    def get_dataframe( self, path: str ) -> pd.DataFrame:
+        """
+        Return a private copy of the datetime-cast dataframe stored at path.
+
+        Requires:
+            - path is an existing CSV file
+
+        Ensures:
+            - Parses the CSV only when it's new or its mtime or size changed
+            - Paths that can't be stat'd are read directly and not cached
+            - Callers may mutate the returned frame without affecting the cached one
+
+        Raises:
+            - FileNotFoundError if the CSV file can't be read
+        """
+        signature = _file_signature( path, include_size=True )
+
+        with self._cache_lock:
+            entry = self._dataframes.get( path )
+            if signature is not None and entry is not None and entry[ 0 ] == signature:
+                self._stats[ "dataframe_hits" ] += 1
+                return entry[ 1 ].copy()
+
+        df = dup.cast_to_datetime( pd.read_csv( path ) )
+
+        with self._cache_lock:
+            if signature is not None: self._dataframes[ path ] = ( signature, df )
+            self._stats[ "dataframe_misses" ] += 1
+
+        return df.copy()
+
+    def get_xml_parser_factory( self, config_mgr: Any ) -> XmlParserFactory:
+        """
+        Return the shared XmlParserFactory for a configuration manager.
+
+        Ensures:
+            - Builds a new factory only if none exists or config_mgr is a different instance
+        """
+        with self._cache_lock:
+            if self._xml_factory is None or self._xml_factory.config_mgr is not config_mgr:
+                self._xml_factory = XmlParserFactory( config_mgr=config_mgr )
+            return self._xml_factory
+
+    def get_stats( self ) -> dict[str, int]:
+        """Return a snapshot of the hit/miss counters."""
+        with self._cache_lock:
+            return dict( self._stats )
+
+    def clear( self ) -> None:
+        """Drop every cached resource and reset the counters."""
+        with self._cache_lock:
+            self._templates.clear()
+            self._dataframes.clear()
+            self._xml_factory = None
+            for name in self._stats: self._stats[ name ] = 0
+
+
+def _file_signature( path: str, include_size: bool ) -> Optional[Any]:
+    """
+    Return the change-detection signature for a file, or None if it can't be stat'd.
+
+    Ensures:
+        - mtime_ns alone, or ( mtime_ns, size ) when include_size is True
+    """
+    try:
+        stat = os.stat( path )
+    except OSError:
+        return None
+
+    return ( stat.st_mtime_ns, stat.st_size ) if include_size else stat.st_mtime_ns
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Any
-import asyncio
 
 import cosa.utils.util as du
+from cosa.agents.event_loop_runner import run_sync
 
 
 class LlmClientInterface( ABC ):
@@ -165,13 +165,7 @@ class BaseLlmClient( ABC ):
             - Same exceptions as complete()
             - RuntimeError if event loop cannot be created
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop( loop )
-        
-        return loop.run_until_complete( self.complete( request ) )
+        return run_sync( self.complete( request ) )
     
     @abstractmethod
     async def validate_config( self ) -> bool:
@@ -1,15 +1,19 @@
-import os
 import time
 from typing import Optional, Any
-import asyncio
-import concurrent.futures
 
 from pydantic_ai import Agent
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
 import cosa.utils.util as du
 from cosa.agents.base_llm_client import LlmClientInterface
 from cosa.agents.token_counter import TokenCounter
+from cosa.agents.event_loop_runner import run_sync
+from cosa.agents.llm_response_cache import LlmResponseCache
+
+# Vendor prefixes served through an OpenAI-compatible endpoint when a base_url is given
+OPENAI_COMPATIBLE_VENDORS: tuple[str, ...] = ( "openai", "groq", "mistralai", "vllm", "deepily" )
 
 
 class ChatClient( LlmClientInterface ):
@@ -29,7 +33,7 @@ class ChatClient( LlmClientInterface ):
         - Consistent interface with other LLM clients via run() method
         - Token counting for prompt and completion
         - Performance metrics (tokens/second, duration)
-        - Proper environment variable configuration for API access
+        - Credentials passed explicitly to the model provider, never through os.environ
         - Streaming and non-streaming response options
     """
     
@@ -40,6 +44,7 @@ class ChatClient( LlmClientInterface ):
         model_tokenizer_map: Optional[dict[str, str]] = None,
         debug: bool = False,
         verbose: bool = False,
+        response_cache: Optional[ LlmResponseCache ] = None,
         **generation_args: Any
     ) -> None:
         """
@@ -48,24 +53,21 @@ class ChatClient( LlmClientInterface ):
         Requires:
             - model_name: A valid model identifier for pydantic-ai
             - api_key: If required, a valid API key for the service
+            - response_cache: Optional shared LlmResponseCache; None disables response caching
             
         Ensures:
-            - Sets up environment variables for API access if needed
+            - Leaves process-wide environment variables untouched
             - Initializes Agent with the specified model
             - Creates TokenCounter for usage tracking
             - Stores generation parameters for use with LLM calls
         """
-        # Set environment variables if provided
-        if api_key:
-            os.environ[ "OPENAI_API_KEY" ] = api_key
-        if base_url:
-            os.environ[ "OPENAI_BASE_URL" ] = base_url
-        
         self.model_name      = model_name
+        self.base_url        = base_url
         self.token_counter   = TokenCounter( model_tokenizer_map )
         self.generation_args = generation_args
         self.debug           = debug
         self.verbose         = verbose
+        self.response_cache  = response_cache
         
         # Initialize the Agent with the model
         if self.debug:
@@ -73,7 +75,33 @@ class ChatClient( LlmClientInterface ):
 
         # Wrap generation parameters in ModelSettings for pydantic_ai API
         model_settings = ModelSettings( **generation_args )
-        self.model = Agent( model_name, model_settings=model_settings )
+        self.model = Agent( self._build_model( model_name, api_key, base_url ), model_settings=model_settings )
+
+    def _build_model( self, model_name: str, api_key: Optional[ str ], base_url: Optional[ str ] ) -> Any:
+        """
+        Resolve the model handed to the pydantic-ai Agent.
+
+        Requires:
+            - model_name: Either "vendor:model" or a bare model identifier
+
+        Ensures:
+            - Returns model_name unchanged when no base_url is given, or when the vendor isn't
+              OpenAI-compatible, so pydantic-ai resolves it natively
+            - Otherwise returns an OpenAIModel bound to its own provider carrying base_url and api_key,
+              so clients for different endpoints can coexist in one process
+
+        Returns:
+            - A model string or OpenAIModel instance
+        """
+        if not base_url: return model_name
+
+        # A bare model name with a base_url is an OpenAI-compatible endpoint (e.g. vLLM)
+        vendor, separator, bare_name = model_name.partition( ":" )
+        if not separator: bare_name = model_name
+        elif vendor.lower() not in OPENAI_COMPATIBLE_VENDORS: return model_name
+
+        provider = OpenAIProvider( base_url=base_url, api_key=api_key or "EMPTY" )
+        return OpenAIModel( bare_name, provider=provider )
     
     async def _stream_async( self, prompt: str, **generation_args: Any ) -> str:
         """
@@ -139,7 +167,15 @@ class ChatClient( LlmClientInterface ):
         }
         
         if not updated_gen_args["stream"]:
-            # Non-streaming mode
+            # Non-streaming mode: deterministic (temperature 0) prompts may be answered from the response cache
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = self.response_cache.make_key( self.model_name, prompt, updated_gen_args, base_url=self.base_url )
+                cached    = self.response_cache.get( cache_key ) if cache_key else None
+                if cached is not None:
+                    if self.debug and self.verbose: print( f"LLM response cache HIT for {self.model_name}" )
+                    return cached
+            
             start_time = time.perf_counter()
             # Wrap generation parameters in ModelSettings for pydantic_ai API
             runtime_settings = ModelSettings( **updated_gen_args )
@@ -150,6 +186,7 @@ class ChatClient( LlmClientInterface ):
             completion_tokens = self.token_counter.count_tokens( self.model_name, response )
             if self.debug and self.verbose:
                 self._print_metadata( prompt_tokens, completion_tokens, duration, client_type="Chat" )
+            if cache_key is not None: self.response_cache.put( cache_key, response, model_name=self.model_name )
             return response
         
         # Streaming mode
@@ -176,27 +213,11 @@ class ChatClient( LlmClientInterface ):
             
         Ensures:
             - Works in both sync and async contexts
+            - Runs on the persistent EventLoopRunner loop rather than a new loop per call
             - Returns string response from the model
             
         Returns:
             - String response from the LLM
         """
-        def run_in_new_loop():
-            """Helper function to run async code in a new event loop in a thread"""
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop( new_loop )
-            try:
-                return new_loop.run_until_complete( self.run_async( prompt, stream, **kwargs ) )
-            finally:
-                new_loop.close()
-        
-        try:
-            # Check if we're in an existing event loop
-            loop = asyncio.get_running_loop()
-            # We're in async context - run in a separate thread to avoid blocking
-            with concurrent.futures.ThreadPoolExecutor( max_workers=1 ) as executor:
-                future = executor.submit( run_in_new_loop )
-                return future.result()
-        except RuntimeError:
-            # No event loop running - we're in sync context
-            return run_in_new_loop()
\ No newline at end of file
+        # Submit to the shared background loop so HTTP clients and their keep-alive connections survive across calls
+        return run_sync( self.run_async( prompt, stream, **kwargs ) )
\ No newline at end of file
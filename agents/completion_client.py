@@ -1,14 +1,14 @@
-import os
 import time
 import re
 from typing import Optional, Any
 import asyncio
-import concurrent.futures
 
 import cosa.utils.util as du
 from cosa.agents.base_llm_client import LlmClientInterface
 from cosa.agents.llm_completion import LlmCompletion
 from cosa.agents.token_counter import TokenCounter
+from cosa.agents.event_loop_runner import run_sync
+from cosa.agents.llm_response_cache import LlmResponseCache
 
 
 def clean_llm_response( response: str ) -> str:
@@ -49,7 +49,7 @@ class CompletionClient( LlmClientInterface ):
         - Consistent interface with other LLM clients via run() method
         - Token counting for prompt and completion
         - Performance metrics (tokens/second, duration)
-        - Proper environment variable configuration for API access
+        - Credentials passed explicitly to LlmCompletion, never through os.environ
         - Streaming and non-streaming response options
         - Support for special prompt formats (instruction_completion, special_token)
     """
@@ -62,6 +62,7 @@ class CompletionClient( LlmClientInterface ):
         model_tokenizer_map: Optional[dict[str, str]] = None,
         debug: bool = False,
         verbose: bool = False,
+        response_cache: Optional[ LlmResponseCache ] = None,
         **generation_args: Any
     ) -> None:
         """
@@ -71,18 +72,14 @@ class CompletionClient( LlmClientInterface ):
             - base_url: A valid API endpoint URL for completions
             - model_name: A valid model identifier for the service
             - api_key: If required, a valid API key for the service
+            - response_cache: Optional shared LlmResponseCache; None disables response caching
             
         Ensures:
-            - Sets up environment variables for API access
+            - Leaves process-wide environment variables untouched
             - Initializes LlmCompletion with the specified configuration
             - Creates TokenCounter for usage tracking
             - Stores generation parameters for use with LLM calls
         """
-        # Set environment variables if provided
-        if api_key:
-            os.environ[ "OPENAI_API_KEY" ] = api_key
-        os.environ[ "OPENAI_BASE_URL" ] = base_url
-        
         self.base_url        = base_url
         self.model_name      = model_name
         self.prompt_format   = prompt_format
@@ -90,6 +87,7 @@ class CompletionClient( LlmClientInterface ):
         self.generation_args = generation_args
         self.debug           = debug
         self.verbose         = verbose
+        self.response_cache  = response_cache
         
         # Initialize the LlmCompletion model
         if self.debug and self.verbose:
@@ -169,11 +167,18 @@ class CompletionClient( LlmClientInterface ):
         }
         
         if not updated_gen_args["stream"]:
-            # Non-streaming mode
+            # Non-streaming mode: deterministic (temperature 0) prompts may be answered from the response cache
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = self.response_cache.make_key( self.model_name, prompt, updated_gen_args, base_url=self.base_url )
+                cached    = self.response_cache.get( cache_key ) if cache_key else None
+                if cached is not None:
+                    if self.debug and self.verbose: print( f"LLM response cache HIT for {self.model_name}" )
+                    return cached
+            
             start_time = time.perf_counter()
-            # Note: LlmCompletion might not have async support yet
-            # This may need to be adapted based on the actual implementation
-            response = self.model.run( prompt, **updated_gen_args )
+            # LlmCompletion is synchronous: keep it off the shared event loop so concurrent callers aren't stalled
+            response = await asyncio.to_thread( self.model.run, prompt, **updated_gen_args )
             duration = time.perf_counter() - start_time
             
             # Clean the response to remove extraneous backticks
@@ -182,6 +187,7 @@ class CompletionClient( LlmClientInterface ):
             completion_tokens = self.token_counter.count_tokens( self.model_name, cleaned_response )
             if self.debug and self.verbose:
                 self._print_metadata( prompt_tokens, completion_tokens, duration, client_type="Completion" )
+            if cache_key is not None: self.response_cache.put( cache_key, cleaned_response, model_name=self.model_name )
             return cleaned_response
         
         # Streaming mode
@@ -211,27 +217,11 @@ class CompletionClient( LlmClientInterface ):
             
         Ensures:
             - Works in both sync and async contexts
+            - Runs on the persistent EventLoopRunner loop rather than a new loop per call
             - Returns string response from the model
             
         Returns:
             - String response from the LLM
         """
-        def run_in_new_loop():
-            """Helper function to run async code in a new event loop in a thread"""
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop( new_loop )
-            try:
-                return new_loop.run_until_complete( self.run_async( prompt, stream, **kwargs ) )
-            finally:
-                new_loop.close()
-        
-        try:
-            # Check if we're in an existing event loop
-            loop = asyncio.get_running_loop()
-            # We're in async context - run in a separate thread to avoid blocking
-            with concurrent.futures.ThreadPoolExecutor( max_workers=1 ) as executor:
-                future = executor.submit( run_in_new_loop )
-                return future.result()
-        except RuntimeError:
-            # No event loop running - we're in sync context
-            return run_in_new_loop()
\ No newline at end of file
+        # Submit to the shared background loop so HTTP clients and their keep-alive connections survive across calls
+        return run_sync( self.run_async( prompt, stream, **kwargs ) )
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+Persistent background event loop for synchronous callers of async LLM clients.
+
+ChatClient.run(), CompletionClient.run() and LlmClient.run() are synchronous
+wrappers around async run_async() methods. Creating a fresh event loop for every
+call throws away everything bound to the previous loop, most importantly the
+keep-alive connections in pydantic_ai's shared httpx.AsyncClient. This module
+keeps a single long-lived loop running in a daemon thread and lets sync code
+submit coroutines to it with asyncio.run_coroutine_threadsafe().
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+import cosa.utils.util as du
+
+T = TypeVar( "T" )
+
+
+class EventLoopRunner:
+    """
+    Singleton owner of one background asyncio event loop.
+
+    Requires:
+        - Nothing; the loop thread is started lazily on first use
+
+    Ensures:
+        - Exactly one loop thread per process (restarted if it ever dies)
+        - run() is safe to call from any thread, including threads with their own running loop
+        - Calls made from the runner's own loop thread run in a throwaway loop instead of deadlocking
+    """
+
+    _instance = None
+    _lock     = threading.Lock()
+
+    def __new__( cls, debug: bool=False ) -> "EventLoopRunner":
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__( cls )
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__( self, debug: bool=False ) -> None:
+        if self._initialized: return
+
+        self.debug        = debug
+        self._loop        = None
+        self._thread      = None
+        self._start_lock  = threading.Lock()
+        self._initialized = True
+
+    def _ensure_started( self ) -> asyncio.AbstractEventLoop:
+        """
+        Start the loop thread if it is not already running.
+
+        Ensures:
+            - Returns a running event loop owned by the background thread
+        """
+        if self._thread is not None and self._thread.is_alive(): return self._loop
+
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive(): return self._loop
+
+            loop    = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run_forever() -> None:
+                asyncio.set_event_loop( loop )
+                loop.call_soon( started.set )
+                loop.run_forever()
+
+            self._loop   = loop
+            self._thread = threading.Thread( target=run_forever, name="EventLoopRunner", daemon=True )
+            self._thread.start()
+            started.wait()
+
+            if self.debug: print( "EventLoopRunner: background event loop started" )
+
+        return self._loop
+
+    @property
+    def loop( self ) -> asyncio.AbstractEventLoop:
+        """The background event loop, started on first access."""
+        return self._ensure_started()
+
+    def is_loop_thread( self ) -> bool:
+        """Return True if the caller is running on the runner's own loop thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run( self, coroutine: Coroutine[Any, Any, T], timeout: Optional[float]=None ) -> T:
+        """
+        Run a coroutine on the background loop and block until it finishes.
+
+        Requires:
+            - coroutine is an un-awaited coroutine object
+
+        Ensures:
+            - Returns the coroutine's result, or re-raises its exception
+            - Cancels the coroutine if the wait times out or is interrupted
+
+        Raises:
+            - concurrent.futures.TimeoutError if timeout expires
+            - Any exception raised by the coroutine
+        """
+        if self.is_loop_thread():
+            # Blocking here would deadlock the loop we're running on
+            return _run_in_throwaway_loop( coroutine )
+
+        future = asyncio.run_coroutine_threadsafe( coroutine, self._ensure_started() )
+        try:
+            return future.result( timeout=timeout )
+        except BaseException:
+            future.cancel()
+            raise
+
+
+def _run_in_throwaway_loop( coroutine: Coroutine[Any, Any, T] ) -> T:
+    """
+    Run a coroutine to completion in a new event loop on a new thread.
+
+    Ensures:
+        - Never touches the calling thread's event loop
+    """
+    result = { }
+
+    def target() -> None:
+        try:
+            result[ "value" ] = asyncio.run( coroutine )
+        except BaseException as e:
+            result[ "error" ] = e
+
+    thread = threading.Thread( target=target, name="EventLoopRunnerReentrant", daemon=True )
+    thread.start()
+    thread.join()
+
+    if "error" in result: raise result[ "error" ]
+    return result[ "value" ]
+
+
+def run_sync( coroutine: Coroutine[Any, Any, T], timeout: Optional[float]=None ) -> T:
+    """
+    Run a coroutine from synchronous code on the shared background event loop.
+
+    This is a convenience function that uses the singleton EventLoopRunner.
+
+    Requires:
+        - coroutine is an un-awaited coroutine object
+
+    Ensures:
+        - Same as EventLoopRunner.run()
+    """
+    return EventLoopRunner().run( coroutine, timeout=timeout )
+
+
+def quick_benchmark( calls: int=200 ) -> dict[str, float]:
+    """
+    Compare per-call overhead of a fresh loop per call vs the persistent runner.
+
+    Uses a local keep-alive HTTP stub server. "Before" mirrors the old pattern,
+    where every call gets a new event loop and therefore a new httpx connection
+    pool. "After" reuses one httpx.AsyncClient on the persistent loop.
+
+    Requires:
+        - httpx is installed
+        - calls >= 1
+
+    Ensures:
+        - Returns mean milliseconds per call for 'new_loop_per_call' and 'persistent_loop'
+    """
+    import time
+    import httpx
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StubHandler( BaseHTTPRequestHandler ):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST( self ):
+            self.rfile.read( int( self.headers.get( "Content-Length", 0 ) ) )
+            body = b'{"choices": [ { "text": "ok" } ]}'
+            self.send_response( 200 )
+            self.send_header( "Content-Type", "application/json" )
+            self.send_header( "Content-Length", str( len( body ) ) )
+            self.end_headers()
+            self.wfile.write( body )
+
+        def log_message( self, *args ):
+            pass
+
+    server = ThreadingHTTPServer( ( "127.0.0.1", 0 ), StubHandler )
+    threading.Thread( target=server.serve_forever, daemon=True ).start()
+    url    = f"http://127.0.0.1:{server.server_address[ 1 ]}/v1/completions"
+
+    async def call_with_new_client() -> None:
+        async with httpx.AsyncClient() as client:
+            ( await client.post( url, json={ "prompt": "hi" } ) ).raise_for_status()
+
+    shared_client = run_sync( _make_async_client() )
+
+    async def call_with_shared_client() -> None:
+        ( await shared_client.post( url, json={ "prompt": "hi" } ) ).raise_for_status()
+
+    try:
+        start = time.perf_counter()
+        for _ in range( calls ):
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete( call_with_new_client() )
+            finally:
+                loop.close()
+        before_ms = ( time.perf_counter() - start ) * 1000 / calls
+
+        run_sync( call_with_shared_client() )
+        start = time.perf_counter()
+        for _ in range( calls ): run_sync( call_with_shared_client() )
+        after_ms = ( time.perf_counter() - start ) * 1000 / calls
+
+    finally:
+        run_sync( shared_client.aclose() )
+        server.shutdown()
+
+    return { "new_loop_per_call": before_ms, "persistent_loop": after_ms }
+
+
+async def _make_async_client() -> Any:
+    """Create an httpx.AsyncClient on the loop that will use it."""
+    import httpx
+    return httpx.AsyncClient()
+
+
+def quick_smoke_test():
+    """Quick smoke test for EventLoopRunner functionality."""
+    du.print_banner( "EventLoopRunner Smoke Test", prepend_nl=True )
+
+    try:
+        async def add( a, b ):
+            await asyncio.sleep( 0 )
+            return a + b
+
+        print( f"✓ run_sync result: {run_sync( add( 2, 3 ) )}" )
+
+        runner = EventLoopRunner()
+        print( f"✓ Singleton: {runner is EventLoopRunner()}" )
+
+        async def nested():
+            # Sync call made from inside a running loop (e.g. a FastAPI handler)
+            return run_sync( add( 1, 1 ) )
+
+        print( f"✓ Call from inside a running loop: {asyncio.run( nested() )}" )
+
+        results = quick_benchmark()
+        print( f"✓ Per-call overhead: new loop per call {results[ 'new_loop_per_call' ]:.2f} ms, persistent loop {results[ 'persistent_loop' ]:.2f} ms" )
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="event_loop_runner.quick_smoke_test()" )
+
+    print( "\n✓ EventLoopRunner smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
@@ -1,11 +1,13 @@
 import os
 import time
+import asyncio
 from typing import Optional, Any
 
 import cosa.utils.util as du
 from cosa.agents.llm_completion import LlmCompletion
 
 from cosa.agents.token_counter import TokenCounter
+from cosa.agents.event_loop_runner import run_sync
 
 from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
@@ -242,9 +244,8 @@ class LlmClient:
                 response = await self.model.run( prompt, model_settings=runtime_settings )
                 response = response.output
             else:
-                # For LlmCompletion, need to await the async version
-                # TODO: Check if LlmCompletion has async support
-                response = self.model.run( prompt, **updated_gen_args )
+                # LlmCompletion is synchronous: keep it off the shared event loop so concurrent callers aren't stalled
+                response = await asyncio.to_thread( self.model.run, prompt, **updated_gen_args )
 
             duration = time.perf_counter() - start_time
             completion_tokens = self.token_counter.count_tokens( self.model_name, response )
@@ -269,10 +270,9 @@ class LlmClient:
         """
         Send a prompt to the LLM and get the response.
         
-        This method now supports both sync and async contexts. When called
-        from an async context (like FastAPI), it runs the async operation
-        in a separate thread to avoid event loop conflicts. When called from a 
-        sync context, it handles the event loop creation automatically.
+        This method supports both sync and async contexts. In either case the
+        async operation is submitted to the persistent EventLoopRunner loop, so
+        no event loop is created per call and HTTP connections are reused.
         
         Requires:
             - prompt: A non-empty string to send to the LLM
@@ -300,31 +300,8 @@ class LlmClient:
             - Develop more sophisticated message history management
         """
         
-        # Import asyncio at function level to avoid issues
-        import asyncio
-        import concurrent.futures
-        import threading
-        
-        def run_in_new_loop():
-            """Helper function to run async code in a new event loop in a thread"""
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop( new_loop )
-            try:
-                return new_loop.run_until_complete( self.run_async( prompt, stream, **kwargs ) )
-            finally:
-                new_loop.close()
-        
-        try:
-            # Check if we're in an existing event loop
-            loop = asyncio.get_running_loop()
-            # We're in async context - run in a separate thread to avoid blocking
-            with concurrent.futures.ThreadPoolExecutor( max_workers=1 ) as executor:
-                future = executor.submit( run_in_new_loop )
-                return future.result()
-        except RuntimeError:
-            # No event loop running - we're in sync context
-            # Can run directly with a new event loop
-            return run_in_new_loop()
+        # Submit to the shared background loop so HTTP clients and their keep-alive connections survive across calls
+        return run_sync( self.run_async( prompt, stream, **kwargs ) )
     
     # def _format_duration( self, seconds: float ) -> str:
     #     """
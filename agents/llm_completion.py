@@ -68,6 +68,9 @@ class LlmCompletion:
         self.verbose = verbose
         self.generation_args = generation_args
 
+        # Keep-alive connection pool reused across run() calls
+        self._session = requests.Session()
+
     def run( self, prompt: str, stream: bool=False, **kwargs: Any ) -> str:
         """
         Send a prompt to the LLM and get a completion response.
@@ -122,7 +125,7 @@ class LlmCompletion:
         
         # Non-streaming request
         if self.debug: timer = Stopwatch( msg="Requesting completion..." )
-        response = requests.post( self.base_url, headers=headers, data=json.dumps( data ) )
+        response = self._session.post( self.base_url, headers=headers, data=json.dumps( data ) )
         if self.debug: timer.print( msg="Done!", use_millis=True )
         
         if response.status_code == 200:
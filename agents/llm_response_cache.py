@@ -0,0 +1,287 @@
+"""
+Content-addressed cache for deterministic LLM responses.
+
+Agents like MathAgent, DateAndTimeAgent and the router prompt send identical
+prompts at temperature 0 over and over. This cache stores their responses
+keyed on a SHA-256 of ( model, rendered prompt, sampling params ) so repeat
+calls skip the LLM entirely.
+
+Design by Contract:
+    Requires:
+        - Opt-in: clients only consult the cache when one is passed to them
+        - db_path (if given) points to a writable SQLite file location
+
+    Ensures:
+        - Tier 1 is an in-process LRU (OrderedDict), tier 2 a SQLite table that
+          survives restarts
+        - Entries older than ttl_seconds are treated as misses and dropped
+        - Both tiers are bounded (max_memory_entries / max_disk_entries)
+        - Non-deterministic requests (temperature > 0) are never cached
+        - Hit, miss, store and bypass counts are tracked
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import cosa.utils.util as du
+
+
+class LlmResponseCache:
+    """
+    Two-tier (memory LRU + SQLite) response cache for temperature 0 prompts.
+
+    Thread-safe: one lock guards both tiers, so a single instance can be
+    shared by every pooled client in the process.
+    """
+
+    TABLE_NAME = "llm_response_cache"
+
+    def __init__( self,
+        db_path: Optional[str] = None,
+        max_memory_entries: int = 1024,
+        max_disk_entries: int = 50000,
+        ttl_seconds: Optional[float] = 7 * 24 * 60 * 60,
+        debug: bool = False,
+        verbose: bool = False
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Requires:
+            - max_memory_entries >= 1 and max_disk_entries >= 1
+            - ttl_seconds is None (no expiry) or > 0
+
+        Ensures:
+            - Memory tier is empty
+            - SQLite table exists when db_path is given; memory-only otherwise
+
+        Raises:
+            - sqlite3.Error if the database can't be opened
+        """
+        self.debug              = debug
+        self.verbose            = verbose
+        self.db_path            = db_path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries   = max_disk_entries
+        self.ttl_seconds        = ttl_seconds
+
+        self._memory = OrderedDict()
+        self._lock   = threading.Lock()
+        self._conn   = None
+
+        self._stats = { "memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "bypassed": 0, "expired": 0 }
+
+        if db_path:
+            os.makedirs( os.path.dirname( db_path ) or ".", exist_ok=True )
+            self._conn = sqlite3.connect( db_path, check_same_thread=False )
+            self._conn.execute( f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                    cache_key     TEXT PRIMARY KEY,
+                    model_name    TEXT NOT NULL,
+                    response      TEXT NOT NULL,
+                    created_at    REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            """ )
+            self._conn.execute( f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_last_accessed ON {self.TABLE_NAME} ( last_accessed )" )
+            self._conn.commit()
+
+        if self.debug: print( f"LlmResponseCache initialized: memory={max_memory_entries}, disk={db_path or 'off'}, ttl={ttl_seconds}s" )
+
+    def make_key( self, model_name: str, prompt: str, sampling_params: dict[str, Any], base_url: Optional[str] = None ) -> Optional[str]:
+        """
+        Build the content-addressed key for a request.
+
+        Requires:
+            - sampling_params holds the resolved generation args (temperature, max_tokens, ...)
+            - base_url is the endpoint serving the model, or None for the vendor's default endpoint
+
+        Ensures:
+            - Returns None unless temperature is explicitly 0: a missing or None temperature
+              leaves the provider's own (often non-zero) default in effect
+            - Returns None when streaming, so callers bypass the cache
+            - Otherwise returns a SHA-256 hex digest of endpoint, model, prompt and sorted params,
+              so two servers exposing the same model name never share entries
+        """
+        temperature   = sampling_params.get( "temperature" )
+        deterministic = isinstance( temperature, ( int, float ) ) and not isinstance( temperature, bool ) and temperature == 0
+        if not deterministic or sampling_params.get( "stream" ):
+            with self._lock: self._stats[ "bypassed" ] += 1
+            return None
+
+        params  = { k: v for k, v in sampling_params.items() if k != "stream" }
+        payload = json.dumps( [ base_url, model_name, prompt, params ], sort_keys=True, default=str )
+
+        return hashlib.sha256( payload.encode( "utf-8" ) ).hexdigest()
+
+    def get( self, cache_key: str ) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Ensures:
+            - Checks memory first, then SQLite (promoting disk hits into memory)
+            - Expired entries are removed and reported as misses
+            - Returns None on miss
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get( cache_key )
+            if entry is not None:
+                response, created_at = entry
+                if not self._is_expired( created_at, now ):
+                    self._memory.move_to_end( cache_key )
+                    self._stats[ "memory_hits" ] += 1
+                    return response
+
+                del self._memory[ cache_key ]
+                self._delete_from_disk( cache_key )
+                self._stats[ "expired" ] += 1
+                self._stats[ "misses" ] += 1
+                return None
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    f"SELECT response, created_at FROM {self.TABLE_NAME} WHERE cache_key = ?", ( cache_key, )
+                ).fetchone()
+
+                if row is not None:
+                    response, created_at = row
+                    if not self._is_expired( created_at, now ):
+                        self._conn.execute( f"UPDATE {self.TABLE_NAME} SET last_accessed = ? WHERE cache_key = ?", ( now, cache_key ) )
+                        self._conn.commit()
+                        self._remember( cache_key, response, created_at )
+                        self._stats[ "disk_hits" ] += 1
+                        return response
+
+                    self._delete_from_disk( cache_key )
+                    self._stats[ "expired" ] += 1
+
+            self._stats[ "misses" ] += 1
+            return None
+
+    def put( self, cache_key: str, response: str, model_name: str = "" ) -> None:
+        """
+        Store a response in both tiers.
+
+        Requires:
+            - cache_key came from make_key()
+
+        Ensures:
+            - Empty responses are not stored
+            - Least recently used entries are evicted once a tier is over its limit
+        """
+        if not response: return
+
+        now = time.time()
+
+        with self._lock:
+            self._remember( cache_key, response, now )
+
+            if self._conn is not None:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.TABLE_NAME} ( cache_key, model_name, response, created_at, last_accessed ) VALUES ( ?, ?, ?, ?, ? )",
+                    ( cache_key, model_name, response, now, now )
+                )
+                self._conn.execute(
+                    f"DELETE FROM {self.TABLE_NAME} WHERE cache_key IN ( SELECT cache_key FROM {self.TABLE_NAME} ORDER BY last_accessed DESC LIMIT -1 OFFSET ? )",
+                    ( self.max_disk_entries, )
+                )
+                self._conn.commit()
+
+            self._stats[ "stores" ] += 1
+
+    def clear( self ) -> None:
+        """Remove every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute( f"DELETE FROM {self.TABLE_NAME}" )
+                self._conn.commit()
+            for name in self._stats: self._stats[ name ] = 0
+
+    def get_stats( self ) -> dict[str, Any]:
+        """
+        Return a snapshot of the hit/miss counters.
+
+        Ensures:
+            - Includes per-tier hits, misses, stores, bypassed, expired
+            - hit_rate is hits / ( hits + misses ), 0.0 before any lookup
+        """
+        with self._lock:
+            stats = dict( self._stats )
+            stats[ "memory_entries" ] = len( self._memory )
+
+        hits    = stats[ "memory_hits" ] + stats[ "disk_hits" ]
+        lookups = hits + stats[ "misses" ]
+        stats[ "hits" ]     = hits
+        stats[ "hit_rate" ] = hits / lookups if lookups else 0.0
+
+        return stats
+
+    def close( self ) -> None:
+        """Close the SQLite connection, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _is_expired( self, created_at: float, now: float ) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember( self, cache_key: str, response: str, created_at: float ) -> None:
+        """Insert into the memory LRU, evicting the oldest entry when full. Caller holds the lock."""
+        self._memory[ cache_key ] = ( response, created_at )
+        self._memory.move_to_end( cache_key )
+        while len( self._memory ) > self.max_memory_entries:
+            self._memory.popitem( last=False )
+
+    def _delete_from_disk( self, cache_key: str ) -> None:
+        """Remove one entry from SQLite. Caller holds the lock."""
+        if self._conn is None: return
+        self._conn.execute( f"DELETE FROM {self.TABLE_NAME} WHERE cache_key = ?", ( cache_key, ) )
+        self._conn.commit()
+
+
+def quick_smoke_test():
+    """Quick smoke test for LlmResponseCache functionality."""
+    import tempfile
+
+    du.print_banner( "LlmResponseCache Smoke Test", prepend_nl=True )
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join( temp_dir, "llm_response_cache.db" )
+            cache   = LlmResponseCache( db_path=db_path, max_memory_entries=2, debug=True )
+            params  = { "temperature": 0.0, "max_tokens": 64, "stop": None, "top_p": 1.0, "stream": False }
+
+            key = cache.make_key( "test-model", "What is 2 + 2?", params )
+            print( f"✓ Miss before store: {cache.get( key ) is None}" )
+
+            cache.put( key, "4", model_name="test-model" )
+            print( f"✓ Memory hit: {cache.get( key )}" )
+
+            cache.close()
+            cache = LlmResponseCache( db_path=db_path )
+            print( f"✓ Disk hit after restart: {cache.get( key )}" )
+
+            hot = cache.make_key( "test-model", "What is 2 + 2?", { **params, "temperature": 0.7 } )
+            print( f"✓ Bypassed at temperature > 0: {hot is None}" )
+
+            print( f"✓ Stats: {cache.get_stats()}" )
+            cache.close()
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="llm_response_cache.quick_smoke_test()" )
+
+    print( "\n✓ LlmResponseCache smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
@@ -35,11 +35,22 @@ class ReceptionistAgent( AgentBase ):
         super().__init__( df_path_key=None, question=question, question_gist=question_gist, last_question_asked=last_question_asked, routing_command=routing_command, push_counter=push_counter, user_id=user_id, user_email=user_email, session_id=session_id, debug=debug, verbose=verbose, auto_debug=auto_debug, inject_bugs=inject_bugs )
         
         self.io_tbl                   = InputAndOutputTable( debug=self.debug, verbose=self.verbose )
+        self.do_not_serialize.add( "io_tbl" )
         self.prompt                   = self._get_prompt()
         self.xml_response_tag_names   = [ "thoughts", "category", "answer" ]
         self.serialize_prompt_to_json = self.config_mgr.get( "agent_receptionist_serialize_prompt_to_json", default=False, return_type="boolean" )
         # self.serialize_code_to_json   = self.config_mgr.get( "agent_receptionist_serialize_code_to_json",   default=False, return_type="boolean" )
     
+    def _restore_runtime_state( self ) -> None:
+        """
+        Rebuild the base handles plus the memory table an unpickled receptionist queries.
+        
+        Ensures:
+            - io_tbl is a fresh InputAndOutputTable
+        """
+        super()._restore_runtime_state()
+        self.io_tbl = InputAndOutputTable( debug=self.debug, verbose=self.verbose )
+    
     def _get_prompt( self ) -> str:
         """
         Generate prompt with memory entries.
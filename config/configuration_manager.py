@@ -37,6 +37,9 @@ def singleton( cls: type ) -> Callable[..., Any]:
     
     instances = { }
     
+    # app_debug is read once per instance: a typed get() on every reuse sat on every agent's construction path
+    announce_reuse = { }
+    
     def wrapper( *args: Any, **kwargs: Any ) -> Any:
         
         # Check for the special _reset_singleton flag for testing
@@ -50,8 +53,9 @@ def singleton( cls: type ) -> Callable[..., Any]:
         if cls not in instances:
             # print( "Instantiating ConfigurationManager() singleton...", end="\n\n" )
             instances[ cls ] = cls( *args, **kwargs )
+            announce_reuse[ cls ] = instances[ cls ].get( "app_debug", default=False, return_type="boolean" )
         else:
-            if instances[ cls ].get( "app_debug", default=False, return_type="boolean" ):
+            if announce_reuse.get( cls ):
                 print( "Reusing ConfigurationManager() singleton..." )
             
         return instances[ cls ]
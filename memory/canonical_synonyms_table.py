@@ -86,6 +86,9 @@ class CanonicalSynonymsTable:
         else:
             self._canonical_synonyms_table = db.open_table( "canonical_synonyms" )
 
+        # In-memory exact-match indexes: built once here, maintained by add_synonym() and delete_synonym()
+        self._build_exact_match_indexes()
+
         if self.verbose:
             print( f"Opened canonical_synonyms table w/ [{self._canonical_synonyms_table.count_rows()}] rows" )
 
@@ -198,6 +201,74 @@ class CanonicalSynonymsTable:
             pa.field( "source", pa.string() ),                # 'migration', 'runtime', etc.
         ] )
 
+    def _build_exact_match_indexes( self ) -> None:
+        """
+        Build the verbatim, normalized and gist hash indexes from the table.
+
+        Requires:
+            - self._canonical_synonyms_table is initialized
+
+        Ensures:
+            - Each index maps question text -> list of lightweight row dicts (no embeddings)
+            - Rows are kept in table order so the first entry matches the old pandas iloc[ 0 ] result
+            - Indexes are left empty if the table cannot be read
+        """
+        self._verbatim_index   = {}
+        self._normalized_index = {}
+        self._gist_index       = {}
+
+        if self.debug:
+            timer = Stopwatch( msg="Building canonical synonyms exact-match indexes..." )
+
+        try:
+            # Only the lookup columns are read, embeddings stay on disk (to_arrow() would load them first)
+            columns = [ "snapshot_id", "question_verbatim", "question_normalized", "question_gist" ]
+            rows    = self._canonical_synonyms_table.to_lance().to_table( columns=columns ).to_pylist()
+
+            for row in rows:
+                self._index_row( row )
+
+            if self.debug:
+                timer.print( f"✓ Indexed [{len( rows )}] synonyms", use_millis=True )
+
+        except Exception as e:
+            if self.debug:
+                timer.print( f"Warning: Could not build exact-match indexes: {e}", use_millis=True )
+
+    def _index_row( self, row: Dict[str, Any] ) -> None:
+        """
+        Add a row to all three exact-match indexes.
+
+        Requires:
+            - row contains snapshot_id, question_verbatim, question_normalized and question_gist
+
+        Ensures:
+            - Row appended to the bucket for each of its three question keys
+        """
+        self._verbatim_index.setdefault( row[ "question_verbatim" ], [] ).append( row )
+        self._normalized_index.setdefault( row[ "question_normalized" ], [] ).append( row )
+        self._gist_index.setdefault( row[ "question_gist" ], [] ).append( row )
+
+    def _unindex_row( self, row: Dict[str, Any] ) -> None:
+        """
+        Remove a row from all three exact-match indexes.
+
+        Requires:
+            - row was previously added via _index_row()
+
+        Ensures:
+            - Row removed from each bucket it appears in
+            - Empty buckets are dropped so lookups stay O(1) misses
+        """
+        for index, key in ( ( self._verbatim_index,   row[ "question_verbatim" ] ),
+                            ( self._normalized_index, row[ "question_normalized" ] ),
+                            ( self._gist_index,       row[ "question_gist" ] ) ):
+            bucket = index.get( key, [] )
+            if row in bucket:
+                bucket.remove( row )
+            if not bucket:
+                index.pop( key, None )
+
     def add_synonym( self,
                     snapshot_id: str,
                     question_verbatim: str,
@@ -284,6 +355,14 @@ class CanonicalSynonymsTable:
             # Add to table
             self._canonical_synonyms_table.add( [row_data] )
 
+            # Keep exact-match indexes in step with the table
+            self._index_row( {
+                "snapshot_id": snapshot_id,
+                "question_verbatim": question_verbatim,
+                "question_normalized": question_normalized,
+                "question_gist": question_gist,
+            } )
+
             if self.debug:
                 timer.print( f"✓ Added synonym for snapshot {snapshot_id}", use_millis=True )
 
@@ -295,6 +374,47 @@ class CanonicalSynonymsTable:
             du.print_stack_trace( e, explanation="add_synonym() failed", caller="CanonicalSynonymsTable.add_synonym()" )
             return False
 
+    def delete_synonym( self, question_verbatim: str ) -> bool:
+        """
+        Delete a synonym from the table.
+
+        Requires:
+            - question_verbatim is a non-empty string
+            - Table is initialized
+
+        Ensures:
+            - Removes the row(s) with this verbatim question from the table
+            - Removes the same row(s) from the exact-match indexes
+            - Returns True if something was deleted, False otherwise
+
+        Args:
+            question_verbatim: Exact question text to delete
+
+        Returns:
+            True if synonym deleted, False if not found or on error
+        """
+        try:
+            rows = list( self._verbatim_index.get( question_verbatim, [] ) )
+            if not rows:
+                if self.debug:
+                    print( f"Synonym not found for: '{du.truncate_string( question_verbatim )}'" )
+                return False
+
+            escaped_question = question_verbatim.replace( "'", "''" )
+            self._canonical_synonyms_table.delete( f"question_verbatim = '{escaped_question}'" )
+
+            for row in rows:
+                self._unindex_row( row )
+
+            if self.debug:
+                print( f"✓ Deleted [{len( rows )}] synonym(s) for: '{du.truncate_string( question_verbatim )}'" )
+
+            return True
+
+        except Exception as e:
+            du.print_stack_trace( e, explanation="delete_synonym() failed", caller="CanonicalSynonymsTable.delete_synonym()" )
+            return False
+
     def find_exact_verbatim( self, question: str ) -> Optional[str]:
         """
         Find exact match for verbatim question.
@@ -319,15 +439,13 @@ class CanonicalSynonymsTable:
             timer = Stopwatch( msg=f"Exact verbatim search: '{du.truncate_string( question )}'" )
 
         try:
-            # Use pandas filtering for exact match (NOT search().where() which requires vector)
-            # LanceDB's search() without a query vector returns arbitrary results
-            df = self._canonical_synonyms_table.to_pandas()
-            matches = df[df['question_verbatim'] == question]
+            # O(1) hash lookup against the in-memory index (no table scan)
+            matches = self._verbatim_index.get( question )
 
-            if len( matches ) > 0:
+            if matches:
                 # Update usage stats
                 self._update_usage_stats( question )
-                snapshot_id = matches.iloc[0]['snapshot_id']
+                snapshot_id = matches[ 0 ][ 'snapshot_id' ]
 
                 if self.debug:
                     timer.print( f"✓ Found snapshot: {snapshot_id}", use_millis=True )
@@ -368,15 +486,13 @@ class CanonicalSynonymsTable:
             timer = Stopwatch( msg=f"Exact normalized search: '{du.truncate_string( question_normalized )}'" )
 
         try:
-            # Use pandas filtering for exact match (NOT search().where() which requires vector)
-            # LanceDB's search() without a query vector returns arbitrary results
-            df = self._canonical_synonyms_table.to_pandas()
-            matches = df[ df[ 'question_normalized' ] == question_normalized ]
+            # O(1) hash lookup against the in-memory index (no table scan)
+            matches = self._normalized_index.get( question_normalized )
 
-            if len( matches ) > 0:
+            if matches:
                 # Update usage stats using verbatim question
-                self._update_usage_stats( matches.iloc[ 0 ][ 'question_verbatim' ] )
-                snapshot_id = matches.iloc[ 0 ][ 'snapshot_id' ]
+                self._update_usage_stats( matches[ 0 ][ 'question_verbatim' ] )
+                snapshot_id = matches[ 0 ][ 'snapshot_id' ]
 
                 if self.debug:
                     timer.print( f"✓ Found snapshot: {snapshot_id}", use_millis=True )
@@ -417,15 +533,13 @@ class CanonicalSynonymsTable:
             timer = Stopwatch( msg=f"Exact gist search: '{du.truncate_string( question_gist )}'" )
 
         try:
-            # Use pandas filtering for exact match (NOT search().where() which requires vector)
-            # LanceDB's search() without a query vector returns arbitrary results
-            df = self._canonical_synonyms_table.to_pandas()
-            matches = df[ df[ 'question_gist' ] == question_gist ]
+            # O(1) hash lookup against the in-memory index (no table scan)
+            matches = self._gist_index.get( question_gist )
 
-            if len( matches ) > 0:
+            if matches:
                 # Update usage stats using verbatim question
-                self._update_usage_stats( matches.iloc[ 0 ][ 'question_verbatim' ] )
-                snapshot_id = matches.iloc[ 0 ][ 'snapshot_id' ]
+                self._update_usage_stats( matches[ 0 ][ 'question_verbatim' ] )
+                snapshot_id = matches[ 0 ][ 'snapshot_id' ]
 
                 if self.debug:
                     timer.print( f"✓ Found snapshot: {snapshot_id}", use_millis=True )
@@ -579,5 +693,72 @@ def quick_smoke_test():
     print( "\n✓ CanonicalSynonymsTable smoke test completed" )
 
 
+def quick_benchmark( sizes: tuple = ( 1_000, 10_000, 100_000 ), probes: int = 200 ) -> None:
+    """
+    Compare exact-match probe latency: full-table pandas scan vs. in-memory hash index.
+
+    Requires:
+        - LUPIN_CONFIG_MGR_CLI_ARGS environment variable is set
+
+    Ensures:
+        - Populates a throwaway table in a temp directory for each size
+        - Prints mean per-probe latency for both strategies at each size
+        - Leaves the configured database untouched
+    """
+    import tempfile
+    import time
+    import numpy as np
+
+    du.print_banner( "CanonicalSynonymsTable Exact-Match Benchmark", prepend_nl=True )
+
+    for size in sizes:
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+
+            synonyms_table = CanonicalSynonymsTable( db_path=tmp_dir, debug=False, verbose=False )
+            zero_vector    = np.zeros( synonyms_table._embedding_dim, dtype=np.float32 ).tolist()
+            now_ms         = du.get_timestamp_ms()
+
+            rows = [ {
+                "id": f"bench_{i}",
+                "snapshot_id": f"snapshot_{i}",
+                "question_verbatim": f"what is question number {i}?",
+                "question_normalized": f"what be question number {i}",
+                "question_gist": f"question {i}",
+                "embedding_verbatim": zero_vector,
+                "embedding_normalized": zero_vector,
+                "embedding_gist": zero_vector,
+                "confidence_score": 100.0,
+                "usage_count": 0,
+                "last_matched": now_ms,
+                "created_date": now_ms,
+                "source": "benchmark",
+            } for i in range( size ) ]
+            synonyms_table._canonical_synonyms_table.add( rows )
+            synonyms_table._build_exact_match_indexes()
+
+            questions = [ f"what is question number {i}?" for i in np.random.randint( 0, size, probes ) ]
+
+            # Old strategy: materialize the whole table, then filter
+            scan_probes = max( 1, probes // 20 )
+            start = time.perf_counter()
+            for question in questions[ :scan_probes ]:
+                df = synonyms_table._canonical_synonyms_table.to_pandas()
+                df[ df[ 'question_verbatim' ] == question ]
+            scan_ms = ( time.perf_counter() - start ) * 1000 / scan_probes
+
+            # New strategy: hash index
+            start = time.perf_counter()
+            for question in questions:
+                synonyms_table.find_exact_verbatim( question )
+            index_ms = ( time.perf_counter() - start ) * 1000 / probes
+
+            print( f"  {size:>7,} rows: scan {scan_ms:10.3f} ms/probe | index {index_ms:8.4f} ms/probe | {scan_ms / max( index_ms, 1e-9 ):,.0f}x" )
+
+
 if __name__ == "__main__":
-    quick_smoke_test()
\ No newline at end of file
+    import sys
+    if "--benchmark" in sys.argv:
+        quick_benchmark()
+    else:
+        quick_smoke_test()
\ No newline at end of file
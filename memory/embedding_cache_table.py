@@ -3,12 +3,26 @@ Embedding Cache Table for LanceDB storage.
 
 Manages normalized text embedding cache to improve performance and reduce
 OpenAI API calls by storing frequently requested embeddings.
+
+New embeddings are buffered in memory and written in batches: every LanceDB
+add() creates a new data fragment, and one fragment per embedding made every
+filtered lookup slower as the table grew. Lookups go through a bounded
+in-process LRU that also remembers recent misses, so repeated lookups of the
+same text within a job don't scan the table again. Table probes go through a
+BTREE index on normalized_text and a reused dataset handle (see
+lancedb_exact_lookup).
 """
 
+import atexit
+import threading
+import time
+from collections import OrderedDict
+
 import lancedb
-from typing import Optional
+from typing import Optional, Tuple
 import cosa.utils.util as du
 from cosa.config.configuration_manager import ConfigurationManager
+from cosa.memory.lancedb_exact_lookup import ExactMatchLookup, ensure_scalar_index
 from cosa.utils.util_stopwatch import Stopwatch
 
 
@@ -18,6 +32,15 @@ class EmbeddingCacheTable:
     
     Caches embeddings for normalized text to avoid regenerating them.
     Supports embedding lookup and storage with singleton pattern.
+
+    Writes go through a write-behind buffer that is served to readers
+    immediately and flushed to LanceDB when it fills up, when its oldest
+    entry reaches the age limit, and at interpreter shutdown. Every
+    "compact every flushes" flushes the table is optimized so fragments
+    from earlier flushes get merged.
+
+    Reads check the write buffer, then an LRU of recently used embeddings,
+    then a TTL'd set of recent misses, and only then scan the table.
     """
     def __init__( self, debug: bool=False, verbose: bool=False ) -> None:
         """
@@ -31,6 +54,7 @@ class EmbeddingCacheTable:
             - Opens connection to LanceDB
             - Opens embedding_cache_tbl
             - Prints table row count
+            - Registers close() to flush buffered embeddings at exit
             
         Raises:
             - FileNotFoundError if database path invalid
@@ -44,6 +68,26 @@ class EmbeddingCacheTable:
         # Get standardized embedding dimension from config
         self._embedding_dim = int( self._config_mgr.get( "embedding dimensions", default="768" ) )
 
+        # Write-behind buffer settings: a buffer size of 1 writes every embedding immediately
+        self._write_buffer_size     = max( 1, int( self._config_mgr.get( "embedding cache write buffer size", default="256" ) ) )
+        self._write_buffer_max_age  = float( self._config_mgr.get( "embedding cache write buffer max age seconds", default="5.0" ) )
+        self._compact_every_flushes = int( self._config_mgr.get( "embedding cache compact every flushes", default="16" ) )
+
+        self._pending      = { }                # normalized_text -> embedding, not yet written
+        self._pending_lock = threading.Lock()   # guards _pending, _flush_timer and the counters
+        self._flush_lock   = threading.Lock()   # serializes writes to the table
+        self._flush_timer  = None
+        self._write_stats  = { "flushes": 0, "rows_written": 0, "rows_rejected": 0, "compactions": 0 }
+
+        # In-process lookup tier: LRU of embeddings plus recent misses (negative cache); size 0 disables it
+        self._lru_size     = max( 0, int( self._config_mgr.get( "embedding cache lru size", default="4096" ) ) )
+        self._negative_ttl = float( self._config_mgr.get( "embedding cache negative ttl seconds", default="30.0" ) )
+
+        self._lru          = OrderedDict()      # normalized_text -> embedding
+        self._negative     = OrderedDict()      # normalized_text -> time.monotonic() expiry
+        self._lru_lock     = threading.Lock()
+        self._lookup_stats = { "hits": 0, "misses": 0, "negative_hits": 0, "evictions": 0 }
+
         uri = du.get_project_root() + self._config_mgr.get( "database_path_wo_root" )
 
         db = lancedb.connect( uri )
@@ -65,6 +109,11 @@ class EmbeddingCacheTable:
                 db.drop_table( "embedding_cache_tbl" )
                 self._create_table_if_needed( db )
                 print( "✓ Table recreated successfully (cache was cleared)" )
+            else:
+                # Tables created before the BTREE index existed get it here; others get it refreshed
+                ensure_scalar_index( self._embedding_cache_tbl, "normalized_text", debug=self.debug )
+
+        self._lookup = ExactMatchLookup( self._embedding_cache_tbl )
 
         try:
             row_count = self._embedding_cache_tbl.count_rows()
@@ -72,6 +121,8 @@ class EmbeddingCacheTable:
         except Exception as e:
             print( f"⚠️ WARNING: Could not count rows in embedding_cache_tbl: {e}" )
 
+        atexit.register( self.close )
+
     def _is_table_corrupted( self ) -> bool:
         """
         Check if the table is corrupted by attempting to read actual data.
@@ -145,7 +196,7 @@ class EmbeddingCacheTable:
             
         Ensures:
             - Creates table with normalized_text and embedding fields
-            - Sets up FTS index for search
+            - Creates a BTREE index on normalized_text for exact-match lookups
             - Sets self._embedding_cache_tbl to the new table
             
         Raises:
@@ -162,11 +213,10 @@ class EmbeddingCacheTable:
         ] )
 
         self._embedding_cache_tbl = db.create_table( "embedding_cache_tbl", schema=schema, mode="overwrite" )
-        self._embedding_cache_tbl.create_fts_index( "normalized_text", replace=True )
+        ensure_scalar_index( self._embedding_cache_tbl, "normalized_text", debug=self.debug )
 
         if self.debug:
             print( f"✓ Created embedding_cache_tbl with schema: {schema}" )
-            print( f"✓ Created FTS index on normalized_text field" )
 
     def has_cached_embedding( self, normalized_text: str ) -> bool:
         """
@@ -177,30 +227,15 @@ class EmbeddingCacheTable:
             - Table is initialized
             
         Ensures:
-            - Returns True if normalized text exists in table
+            - Returns True if normalized text exists in table or in the write buffer
             - Returns False if normalized text not found
             - Performs exact string match
+            - Goes through get_cached_embedding(), so a following get is served from memory
             
         Raises:
             - None (handles errors gracefully)
         """
-        if self.debug and self.verbose: timer = Stopwatch( msg=f"has_cached_embedding( '{normalized_text}' )" )
-
-        try:
-            # Escape single quotes by doubling them to prevent SQL parsing errors
-            escaped_text = normalized_text.replace( "'", "''" )
-            # Use to_lance().scanner() to avoid nprobes warning (filter-only query, no vector search)
-            results = self._embedding_cache_tbl.to_lance().scanner(
-                filter=f"normalized_text = '{escaped_text}'",
-                limit=1,
-                columns=[ "normalized_text" ]
-            ).to_table().to_pylist()
-            if self.debug and self.verbose: timer.print( "Done!", use_millis=True )
-            return len( results ) > 0
-        except Exception as e:
-            if self.debug and self.verbose: timer.print( f"Error: {e}", use_millis=True )
-            du.print_stack_trace( e, explanation="has_cached_embedding() failed", caller="EmbeddingCacheTable.has_cached_embedding()" )
-            return False
+        return self.get_cached_embedding( normalized_text ) is not None
     
     def get_cached_embedding( self, normalized_text: str ) -> Optional[ list[ float ] ]:
         """
@@ -211,36 +246,81 @@ class EmbeddingCacheTable:
             - Table is initialized
             
         Ensures:
-            - Returns embedding from cache if found
-            - Returns None if not in cache
+            - Returns embedding from the write buffer, the LRU or the table if found
+            - Returns None if not in cache; the miss is remembered for "embedding cache negative ttl seconds"
+            - Table errors are not remembered as misses
             - Returns list of 1536 floats if found
             
         Raises:
             - None (handles exceptions internally)
         """
+        known, embedding = self._lookup_in_memory( normalized_text )
+        if known: return embedding
+
         if self.debug and self.verbose: timer = Stopwatch( msg=f"get_cached_embedding( '{normalized_text}' )", silent=True )
 
         try:
-            # Escape single quotes by doubling them to prevent SQL parsing errors
-            escaped_text = normalized_text.replace( "'", "''" )
-            # Use to_lance().scanner() to avoid nprobes warning (filter-only query, no vector search)
-            rows_returned = self._embedding_cache_tbl.to_lance().scanner(
-                filter=f"normalized_text = '{escaped_text}'",
-                limit=1,
-                columns=[ "embedding" ]
-            ).to_table().to_pylist()
-            if self.debug and self.verbose: timer.print( f"Done! w/ {len( rows_returned )} rows returned", use_millis=True )
+            row = self._lookup.first( "normalized_text", normalized_text, columns=[ "embedding" ] )
+            if self.debug and self.verbose: timer.print( f"Done! w/ {int( row is not None )} rows returned", use_millis=True )
 
-            if rows_returned:
-                return rows_returned[ 0 ][ "embedding" ]
-            else:
-                return None
+            embedding = row[ "embedding" ] if row else None
+            self._remember( normalized_text, embedding )
+            return embedding
 
         except Exception as e:
             if self.debug and self.verbose: timer.print( f"Error: {e}", use_millis=True )
             du.print_stack_trace( e, explanation="get_cached_embedding() failed", caller="EmbeddingCacheTable.get_cached_embedding()" )
             return None
         
+    def get_cached_embeddings( self, normalized_texts: list[ str ] ) -> dict[ str, list[ float ] ]:
+        """
+        Get cached embeddings for many normalized texts in a single scan.
+        
+        Requires:
+            - normalized_texts is a list of strings (may be empty)
+            - Table is initialized
+            
+        Ensures:
+            - Serves buffered, LRU'd and recently missed texts from memory, then issues one
+              normalized_text IN (...) scan per 1000 remaining texts (none if all are known)
+            - Returns dict of normalized_text -> embedding for every cache hit
+            - Texts not in cache are absent from the returned dict
+            - Returns empty dict on error
+            
+        Raises:
+            - None (handles exceptions internally)
+        """
+        if not normalized_texts: return {}
+        
+        buffered  = { }
+        remaining = set()
+        for text in set( normalized_texts ):
+            known, embedding = self._lookup_in_memory( text )
+            if not known:
+                remaining.add( text )
+            elif embedding is not None:
+                buffered[ text ] = embedding
+        if not remaining: return buffered
+        
+        if self.debug and self.verbose: timer = Stopwatch( msg=f"get_cached_embeddings( [{len( remaining )}] texts )", silent=True )
+
+        try:
+            rows_returned = self._lookup.rows( "normalized_text", remaining, columns=[ "normalized_text", "embedding" ] )
+            if self.debug and self.verbose: timer.print( f"Done! w/ {len( rows_returned )} rows returned", use_millis=True )
+
+            # First row wins, matching get_cached_embedding()'s limit=1 behavior
+            cached = buffered
+            for row in rows_returned:
+                cached.setdefault( row[ "normalized_text" ], row[ "embedding" ] )
+            for text in remaining:
+                self._remember( text, cached.get( text ) )
+            return cached
+
+        except Exception as e:
+            if self.debug and self.verbose: timer.print( f"Error: {e}", use_millis=True )
+            du.print_stack_trace( e, explanation="get_cached_embeddings() failed", caller="EmbeddingCacheTable.get_cached_embeddings()" )
+            return buffered
+        
     def cache_embedding( self, normalized_text: str, embedding: list[ float ] ) -> None:
         """
         Add a normalized text and its embedding to the cache.
@@ -251,19 +331,243 @@ class EmbeddingCacheTable:
             - Table is initialized
             
         Ensures:
-            - Adds row to table with normalized text and embedding
+            - Embedding is readable from the cache immediately and clears any remembered miss
+            - Row is written to the table once the buffer holds "embedding cache write buffer size"
+              rows or its oldest row is "embedding cache write buffer max age seconds" old
+            - A text already waiting in the buffer keeps its first embedding
+            - An empty embedding (a failed embedding call) is neither buffered nor remembered,
+              so has_cached_embedding() doesn't report it as cached, as in cache_embeddings()
+            - Handles LanceDB errors gracefully
+            
+        Raises:
+            - None (catches and logs errors)
+        """
+        if not embedding:
+            if self.debug: print( f"⚠️ Not caching empty embedding for: '{du.truncate_string( normalized_text )}'" )
+            return
+        
+        self._remember( normalized_text, embedding )
+
+        with self._pending_lock:
+            self._pending.setdefault( normalized_text, embedding )
+            buffer_full = len( self._pending ) >= self._write_buffer_size
+            if not buffer_full and self._flush_timer is None and self._write_buffer_max_age > 0:
+                self._flush_timer = threading.Timer( self._write_buffer_max_age, self.flush )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if self.debug and self.verbose: print( f"Cached embedding for normalized text: '{du.truncate_string( normalized_text )}'" )
+
+        if buffer_full: self.flush()
+    
+    def cache_embeddings( self, embeddings: dict[ str, list[ float ] ] ) -> None:
+        """
+        Add many normalized texts and their embeddings to the cache in a single write.
+        
+        Requires:
+            - embeddings is a dict of normalized_text -> embedding (may be empty)
+            - Table is initialized
+            
+        Ensures:
+            - Adds all rows, together with anything already buffered, with one table add() call
+            - Skips entries with empty embeddings
             - Handles LanceDB errors gracefully
             
         Raises:
             - None (catches and logs errors)
         """
-        new_row = [ { "normalized_text": normalized_text, "embedding": embedding } ]
+        new_rows = { text: embedding for text, embedding in embeddings.items() if embedding }
+        if not new_rows: return
+        
+        for text, embedding in new_rows.items():
+            self._remember( text, embedding )
+
+        with self._pending_lock:
+            for text, embedding in new_rows.items():
+                self._pending.setdefault( text, embedding )
+        
+        rows_written = self.flush()
+        if self.debug and self.verbose: print( f"Cached [{len( new_rows )}] embeddings, wrote [{rows_written}] rows in one write" )
+    
+    def flush( self ) -> int:
+        """
+        Write every buffered embedding to the table with one add() call.
+        
+        Requires:
+            - Table is initialized
+            
+        Ensures:
+            - Buffered rows stay readable until the write has completed
+            - If the batch add() fails, rows are retried one at a time: rows the table rejects
+              (e.g. the wrong embedding dimension) are dropped, logged and counted in rows_rejected,
+              so one bad row can't block every later flush or grow the buffer without bound
+            - If every row fails on its own as well, the failure is taken to be the table's, not the
+              rows': they stay buffered for the next flush
+            - Runs compact() after every "embedding cache compact every flushes" successful flushes
+            - Returns the number of rows written
+            
+        Raises:
+            - None (catches and logs errors)
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                rows = dict( self._pending )
+            
+            if not rows: return 0
+            
+            rejected = { }
+            try:
+                self._embedding_cache_tbl.add( [ { "normalized_text": text, "embedding": embedding } for text, embedding in rows.items() ] )
+            except Exception as e:
+                if self.debug: print( f"⚠️ Batch flush of [{len( rows )}] rows failed ({e}), retrying one row at a time" )
+                rejected = self._add_rows_one_at_a_time( rows )
+                
+                if len( rejected ) == len( rows ):
+                    du.print_stack_trace( e, explanation="flush() failed for every row, keeping rows buffered", caller="EmbeddingCacheTable.flush()" )
+                    return 0
+                
+                print( f"⚠️ WARNING: embedding_cache_tbl rejected [{len( rejected )}] buffered rows, dropping them: {list( rejected.items() )[ :3 ]}" )
+            
+            with self._pending_lock:
+                for text in rows:
+                    self._pending.pop( text, None )
+                written = len( rows ) - len( rejected )
+                self._write_stats[ "flushes" ]       += 1
+                self._write_stats[ "rows_written" ]  += written
+                self._write_stats[ "rows_rejected" ] += len( rejected )
+                compact_now = self._compact_every_flushes > 0 and self._write_stats[ "flushes" ] % self._compact_every_flushes == 0
+            
+            if self.debug and self.verbose: print( f"Flushed [{written}] buffered embeddings to embedding_cache_tbl" )
+            
+            if compact_now: self.compact()
+            
+            return written
+    
+    def _add_rows_one_at_a_time( self, rows: dict[ str, list[ float ] ] ) -> dict[ str, str ]:
+        """
+        Add rows individually after a failed batch add().
+        
+        Requires:
+            - Caller holds _flush_lock
+            
+        Ensures:
+            - Every row the table accepts is written
+            - Returns normalized_text -> error message for each row the table rejected
+        """
+        rejected = { }
+        for text, embedding in rows.items():
+            try:
+                self._embedding_cache_tbl.add( [ { "normalized_text": text, "embedding": embedding } ] )
+            except Exception as e:
+                rejected[ text ] = str( e )
+        return rejected
+    
+    def compact( self ) -> None:
+        """
+        Merge small data fragments and update indexes via LanceDB optimize().
+        
+        Requires:
+            - Table is initialized
+            
+        Ensures:
+            - Filtered lookups scan few large fragments instead of one per flush
+            
+        Raises:
+            - None (catches and logs errors)
+        """
+        timer = Stopwatch( msg="Compacting embedding_cache_tbl...", silent=not self.debug )
         
         try:
-            self._embedding_cache_tbl.add( new_row )
-            if self.debug and self.verbose: print( f"Cached embedding for normalized text: '{du.truncate_string( normalized_text )}'" )
+            self._embedding_cache_tbl.optimize()
+            with self._pending_lock:
+                self._write_stats[ "compactions" ] += 1
+            timer.print( "Done!", use_millis=True )
         except Exception as e:
-            du.print_stack_trace( e, explanation="cache_embedding() failed", caller="EmbeddingCacheTable.cache_embedding()" )
+            du.print_stack_trace( e, explanation="compact() failed", caller="EmbeddingCacheTable.compact()" )
+    
+    def close( self ) -> None:
+        """
+        Stop the age timer and write anything still buffered.
+        
+        Ensures:
+            - Safe to call more than once (registered with atexit)
+        """
+        self.flush()
+    
+    def get_write_stats( self ) -> dict[ str, int ]:
+        """Return buffered row count plus flush, written row and compaction counters."""
+        with self._pending_lock:
+            return { "buffered": len( self._pending ), **self._write_stats }
+    
+    def get_lookup_stats( self ) -> dict[ str, int ]:
+        """Return LRU/negative cache sizes plus hit, miss, negative hit and eviction counters."""
+        with self._lru_lock:
+            return { "lru_entries": len( self._lru ), "negative_entries": len( self._negative ), **self._lookup_stats }
+    
+    def _lookup_in_memory( self, normalized_text: str ) -> Tuple[ bool, Optional[ list[ float ] ] ]:
+        """
+        Look a text up in the write buffer, the LRU and the negative cache.
+        
+        Ensures:
+            - Returns ( True, embedding ) for a buffered or LRU'd text
+            - Returns ( True, None ) for a miss remembered within the TTL
+            - Returns ( False, None ) if the table has to be scanned
+        """
+        with self._pending_lock:
+            embedding = self._pending.get( normalized_text )
+        
+        with self._lru_lock:
+            if embedding is None:
+                embedding = self._lru.get( normalized_text )
+                if embedding is not None: self._lru.move_to_end( normalized_text )
+            if embedding is not None:
+                self._lookup_stats[ "hits" ] += 1
+                return True, embedding
+            
+            expiry = self._negative.get( normalized_text )
+            if expiry is not None:
+                if expiry > time.monotonic():
+                    self._lookup_stats[ "negative_hits" ] += 1
+                    return True, None
+                del self._negative[ normalized_text ]
+            
+            self._lookup_stats[ "misses" ] += 1
+            return False, None
+    
+    def _remember( self, normalized_text: str, embedding: Optional[ list[ float ] ] ) -> None:
+        """
+        Record a lookup result: embeddings go into the LRU, None into the negative cache.
+        
+        Ensures:
+            - An empty embedding is remembered as a miss, never as an LRU hit
+            - Both tiers are bounded by "embedding cache lru size", evicting least recently used first
+            - Storing an embedding removes any remembered miss for the same text
+        """
+        if self._lru_size == 0: return
+        
+        with self._lru_lock:
+            if not embedding:
+                if self._negative_ttl <= 0: return
+                self._negative[ normalized_text ] = time.monotonic() + self._negative_ttl
+                self._negative.move_to_end( normalized_text )
+                while len( self._negative ) > self._lru_size:
+                    self._negative.popitem( last=False )
+            else:
+                self._negative.pop( normalized_text, None )
+                self._lru[ normalized_text ] = embedding
+                self._lru.move_to_end( normalized_text )
+                while len( self._lru ) > self._lru_size:
+                    self._lru.popitem( last=False )
+                    self._lookup_stats[ "evictions" ] += 1
+    
+    def _clear_lookup_cache( self ) -> None:
+        """Forget every remembered embedding and miss (the table was replaced)."""
+        with self._lru_lock:
+            self._lru.clear()
+            self._negative.clear()
     
     def init_tbl( self ) -> None:
         """
@@ -275,7 +579,7 @@ class EmbeddingCacheTable:
         Ensures:
             - Creates table with proper schema
             - Sets up normalized_text and embedding fields
-            - Creates FTS index for search
+            - Creates a BTREE index on normalized_text
             - Overwrites existing table if present
             
         Raises:
@@ -294,10 +598,12 @@ class EmbeddingCacheTable:
         ] )
 
         self._embedding_cache_tbl = db.create_table( "embedding_cache_tbl", schema=schema, mode="overwrite" )
-        self._embedding_cache_tbl.create_fts_index( "normalized_text", replace=True )
+        ensure_scalar_index( self._embedding_cache_tbl, "normalized_text", debug=self.debug )
+        self._lookup = ExactMatchLookup( self._embedding_cache_tbl )
+        self._clear_lookup_cache()
 
         print( f"✓ Created embedding_cache_tbl with schema: {schema}" )
-        print( f"✓ Created FTS index on normalized_text field" )
+        print( f"✓ Created BTREE index on normalized_text field" )
         print( f"✓ Table initialized with {self._embedding_cache_tbl.count_rows()} rows" )
 
 
@@ -321,7 +627,8 @@ def quick_smoke_test():
         print( f"\nTest 3: Caching dummy embedding for '{test_text}'..." )
         dummy_embedding = [ 0.1 ] * cache_table._embedding_dim  # Create 1536-dimension dummy embedding
         cache_table.cache_embedding( test_text, dummy_embedding )
-        print( "✓ Embedding cached successfully" )
+        print( f"✓ Embedding cached successfully, write stats: {cache_table.get_write_stats()}" )
+        print( f"✓ Flushed [{cache_table.flush()}] buffered row(s) to the table" )
         
         # Test 4: Verify cache hit
         print( f"\nTest 4: Verifying cache hit for '{test_text}'..." )
@@ -24,6 +24,9 @@ class EmbeddingManager:
     _instance = None
     _lock = Lock()
     
+    # OpenAI accepts at most 2048 inputs per embeddings request
+    EMBEDDING_BATCH_SIZE = 2048
+    
     def __new__( cls, debug=False, verbose=False ):
         """
         Create or return singleton instance.
@@ -69,6 +72,15 @@ class EmbeddingManager:
         # Initialize configuration manager
         self._config_mgr = ConfigurationManager( env_var_name="LUPIN_CONFIG_MGR_CLI_ARGS" )
         
+        # Read embedding settings once rather than on every call
+        self._embedding_model         = self._config_mgr.get( "embedding model name" )
+        self._embedding_dim           = int( self._config_mgr.get( "embedding dimensions", default="768" ) )
+        self._expand_symbols_to_words = self._config_mgr.get( "expand symbols to words", default=False, return_type="boolean" )
+        
+        # OpenAI client is created on first cache miss and reused for the life of the process
+        self._embedding_client      = None
+        self._embedding_client_lock = Lock()
+        
         # Initialize embedding cache table
         self._embedding_cache_table = EmbeddingCacheTable( debug=debug, verbose=verbose )
         
@@ -159,8 +171,8 @@ class EmbeddingManager:
 
             # Check if we should expand symbols to words
             if expand_symbols_to_words is None:
-                # Get from configuration, default to False
-                expand_symbols_to_words = self._config_mgr.get( "expand symbols to words", default=False, return_type="boolean" )
+                # Use value read from configuration at init, default to False
+                expand_symbols_to_words = self._expand_symbols_to_words
                 if self.debug and self.verbose: print( f"Got expand_symbols_to_words from config: {expand_symbols_to_words}" )
             
             if expand_symbols_to_words:
@@ -198,6 +210,92 @@ class EmbeddingManager:
             # Return original text if normalization fails
             return text.lower()
     
+    def _get_embedding_client( self ) -> openai.OpenAI:
+        """
+        Get the process-wide OpenAI client used for embeddings, creating it on first use.
+        
+        Requires:
+            - OpenAI API key is available
+            
+        Ensures:
+            - Creates the client at most once (thread-safe)
+            - Client always targets OpenAI's API, bypassing environment variables
+            - Returns the same client (and its HTTP connection pool) on every call
+        """
+        if self._embedding_client is None:
+            with self._embedding_client_lock:
+                if self._embedding_client is None:
+                    api_key = du.get_api_key( "openai" )
+                    
+                    if self.debug and self.verbose:
+                        print( f"  API key (first 10 chars): {api_key[ :10 ] if api_key else 'NOT FOUND'}..." )
+                        print( f"  OpenAI client version: {openai.__version__}" )
+                    
+                    # This ensures we always use OpenAI's API for embeddings, not local completion servers
+                    self._embedding_client = openai.OpenAI(
+                        api_key=api_key,
+                        base_url="https://api.openai.com/v1"  # Force use of OpenAI's API for embeddings
+                    )
+        
+        return self._embedding_client
+    
+    def _has_embedding_model( self ) -> bool:
+        """
+        Check that an embedding model is configured, explaining how to fix it if not.
+        
+        Ensures:
+            - Returns True if 'embedding model name' is configured
+            - Prints a configuration error banner and returns False otherwise
+        """
+        if self._embedding_model: return True
+        
+        du.print_banner( "CONFIGURATION ERROR - MISSING EMBEDDING MODEL", prepend_nl=True )
+        print( "The 'embedding model name' key is not configured." )
+        print( "" )
+        print( "TO FIX THIS ERROR:" )
+        print( f"1. Add 'embedding model name' to your configuration file" )
+        print( f"2. Common values: 'text-embedding-ada-002', 'text-embedding-3-small', 'text-embedding-3-large'" )
+        print( f"3. Check the configuration file specified in your config block" )
+        du.print_banner( "CANNOT GENERATE EMBEDDINGS", prepend_nl=True )
+        return False
+    
+    def _print_embedding_error( self, e: Exception ) -> None:
+        """
+        Print troubleshooting details for a failed embeddings request.
+        
+        Requires:
+            - e is the exception raised by the embeddings request
+            
+        Ensures:
+            - Prints 404-specific guidance for openai.NotFoundError
+            - Prints generic error details otherwise
+        """
+        if isinstance( e, openai.NotFoundError ):
+            du.print_banner( "EMBEDDING API ERROR - 404 NOT FOUND", prepend_nl=True )
+            print( "The OpenAI embedding service returned a 404 error." )
+            print( "This usually means one of the following:" )
+            print( "1. Your OpenAI API key is invalid or expired" )
+            print( f"2. The embedding model '{self._embedding_model}' is not accessible" )
+            print( "3. Your account doesn't have access to the embeddings API" )
+            print( "" )
+            print( "TO FIX THIS ERROR:" )
+            print( f"1. Check your API key in: {du.get_project_root()}/src/conf/keys/openai" )
+            print( "2. Verify your OpenAI account has embedding API access" )
+            print( "3. Test your API key at: https://platform.openai.com/account/api-keys" )
+            print( f"4. Verify embedding model name in config: '{self._embedding_model}'" )
+            print( "" )
+            print( f"Error details: {e}" )
+            print( f"Error type: {type( e )}" )
+            print( f"Error response: {getattr( e, 'response', 'No response attribute' )}" )
+        else:
+            du.print_banner( f"EMBEDDING API ERROR - {type( e ).__name__}", prepend_nl=True )
+            print( f"Failed to generate embedding: {e}" )
+            print( f"Error type: {type( e )}" )
+            print( f"Error details: {repr( e )}" )
+            print( "Continuing without embeddings..." )
+        
+        du.print_banner( "CONTINUING WITHOUT EMBEDDINGS", prepend_nl=True )
+    
     def generate_embedding( self, text: str, normalize_for_cache: bool=True ) -> list[ float ]:
         """
         Generate OpenAI embedding for text with optional normalization for caching.
@@ -253,49 +351,24 @@ class EmbeddingManager:
         timer = sw.Stopwatch( msg=f"Generating embedding for [{du.truncate_string( text_for_embedding )}]...", silent=not (self.debug and self.verbose) )
         
         try:
-            # Get embedding model name from config - NO FALLBACK
-            embedding_model = self._config_mgr.get( "embedding model name" )
-
             if self.debug and self.verbose:
                 print( f"\nConfiguration details:" )
-                print( f"  Embedding model: {embedding_model}" )
+                print( f"  Embedding model: {self._embedding_model}" )
                 print( f"  API key location: {du.get_project_root()}/src/conf/keys/openai" )
             
-            if not embedding_model:
-                du.print_banner( "CONFIGURATION ERROR - MISSING EMBEDDING MODEL", prepend_nl=True )
-                print( "The 'embedding model name' key is not configured." )
-                print( "" )
-                print( "TO FIX THIS ERROR:" )
-                print( f"1. Add 'embedding model name' to your configuration file" )
-                print( f"2. Common values: 'text-embedding-ada-002', 'text-embedding-3-small', 'text-embedding-3-large'" )
-                print( f"3. Check the configuration file specified in your config block" )
-                du.print_banner( "CANNOT GENERATE EMBEDDINGS", prepend_nl=True )
-                return [ ]
-            
-            # Get API key
-            api_key = du.get_api_key( "openai" )
-
-            if self.debug and self.verbose:
-                print( f"  API key (first 10 chars): {api_key[ :10 ] if api_key else 'NOT FOUND'}..." )
-                print( f"  OpenAI client version: {openai.__version__}" )
-            
-            # Create a dedicated OpenAI client for embeddings that bypasses environment variables
-            # This ensures we always use OpenAI's API for embeddings, not local completion servers
-            embedding_client = openai.OpenAI(
-                api_key=api_key,
-                base_url="https://api.openai.com/v1"  # Force use of OpenAI's API for embeddings
-            )
+            if not self._has_embedding_model(): return [ ]
+            
+            embedding_client = self._get_embedding_client()
 
             if self.debug and self.verbose:
-                print( f"\nAttempting to generate embedding with model: {embedding_model}" )
+                print( f"\nAttempting to generate embedding with model: {self._embedding_model}" )
                 print( f"Using OpenAI API endpoint: https://api.openai.com/v1" )
             
             # Generate embedding for text_for_embedding (normalized or exact)
-            embedding_dim = int( self._config_mgr.get( "embedding dimensions", default="768" ) )
             response = embedding_client.embeddings.create(
                 input=text_for_embedding,
-                model=embedding_model,
-                dimensions=embedding_dim
+                model=self._embedding_model,
+                dimensions=self._embedding_dim
             )
             timer.print( "Done!", use_millis=True )
 
@@ -308,45 +381,75 @@ class EmbeddingManager:
             
             return embedding
         
-        except openai.NotFoundError as e:
-            # Get model name for error message
-            try:
-                embedding_model = self._config_mgr.get( "embedding model name" )
-            except:
-                embedding_model = "[UNKNOWN - CONFIG ERROR]"
-            
-            du.print_banner( "EMBEDDING API ERROR - 404 NOT FOUND", prepend_nl=True )
-            print( "The OpenAI embedding service returned a 404 error." )
-            print( "This usually means one of the following:" )
-            print( "1. Your OpenAI API key is invalid or expired" )
-            print( f"2. The embedding model '{embedding_model}' is not accessible" )
-            print( "3. Your account doesn't have access to the embeddings API" )
-            print( "" )
-            print( "TO FIX THIS ERROR:" )
-            print( f"1. Check your API key in: {du.get_project_root()}/src/conf/keys/openai" )
-            print( "2. Verify your OpenAI account has embedding API access" )
-            print( "3. Test your API key at: https://platform.openai.com/account/api-keys" )
-            print( f"4. Verify embedding model name in config: '{embedding_model}'" )
-            print( "" )
-            print( f"Error details: {e}" )
-            print( f"Error type: {type( e )}" )
-            print( f"Error response: {getattr( e, 'response', 'No response attribute' )}" )
-            du.print_banner( "CONTINUING WITHOUT EMBEDDINGS", prepend_nl=True )
+        except Exception as e:
+            self._print_embedding_error( e )
             
             # Return empty embedding to allow execution to continue
             return [ ]
+    
+    def generate_embeddings( self, texts: list[ str ], normalize_for_cache: bool=True ) -> list[ list[ float ] ]:
+        """
+        Generate embeddings for many texts with one cache lookup, batched API requests and one cache write.
         
-        except Exception as e:
-            du.print_banner( f"EMBEDDING API ERROR - {type( e ).__name__}", prepend_nl=True )
-            print( f"Failed to generate embedding: {e}" )
-            print( f"Error type: {type( e )}" )
-            print( f"Error details: {repr( e )}" )
-            print( "Continuing without embeddings..." )
-            du.print_banner( "CONTINUING WITHOUT EMBEDDINGS", prepend_nl=True )
+        Args:
+            texts: Input texts to generate embeddings for
+            normalize_for_cache: Same meaning as in generate_embedding(), applied to every text
             
-            # Return empty embedding to allow execution to continue
-            return [ ]
-
+        Requires:
+            - texts is a list of non-empty strings
+            - OpenAI API key is available (only if there are cache misses)
+            - 'embedding model name' is configured (only if there are cache misses)
+            
+        Ensures:
+            - Returns one embedding per input text, in input order
+            - Looks up all cache keys with a single EmbeddingCacheTable filter
+            - Sends only distinct cache misses, batched, through the shared client
+            - Writes all new embeddings back with a single add
+            - Returns empty lists for texts whose embeddings could not be generated
+        """
+        if not texts: return [ ]
+        
+        # Cache key doubles as the text sent for embedding, exactly as in generate_embedding()
+        if normalize_for_cache:
+            cache_keys = [ self.normalize_text_for_cache( text ) for text in texts ]
+        else:
+            cache_keys = list( texts )
+        
+        unique_keys = list( dict.fromkeys( cache_keys ) )
+        embeddings  = self._embedding_cache_table.get_cached_embeddings( unique_keys )
+        misses      = [ key for key in unique_keys if key not in embeddings ]
+        
+        if self.debug and self.verbose:
+            print( f"Batch of [{len( texts )}] texts: [{len( unique_keys ) - len( misses )}] cache hits, [{len( misses )}] misses" )
+        
+        if misses:
+            timer = sw.Stopwatch( msg=f"Generating [{len( misses )}] embeddings in batches of up to [{self.EMBEDDING_BATCH_SIZE}]...", silent=not (self.debug and self.verbose) )
+            
+            try:
+                if not self._has_embedding_model(): return [ embeddings.get( key, [ ] ) for key in cache_keys ]
+                
+                embedding_client = self._get_embedding_client()
+                new_embeddings   = { }
+                
+                for start in range( 0, len( misses ), self.EMBEDDING_BATCH_SIZE ):
+                    batch    = misses[ start:start + self.EMBEDDING_BATCH_SIZE ]
+                    response = embedding_client.embeddings.create(
+                        input=batch,
+                        model=self._embedding_model,
+                        dimensions=self._embedding_dim
+                    )
+                    for item in response.data:
+                        new_embeddings[ batch[ item.index ] ] = item.embedding
+                
+                timer.print( "Done!", use_millis=True )
+                
+                self._embedding_cache_table.cache_embeddings( new_embeddings )
+                embeddings.update( new_embeddings )
+            
+            except Exception as e:
+                self._print_embedding_error( e )
+        
+        return [ embeddings.get( key, [ ] ) for key in cache_keys ]
 
 def get_embedding_manager( debug: bool=False, verbose: bool=False ) -> EmbeddingManager:
     """
@@ -397,6 +500,26 @@ def generate_embedding( text: str, normalize_for_cache: bool=True, debug: bool=F
     return embedding_manager.generate_embedding( text, normalize_for_cache=normalize_for_cache )
 
 
+def generate_embeddings( texts: list[ str ], normalize_for_cache: bool=True, debug: bool=False ) -> list[ list[ float ] ]:
+    """
+    Generate OpenAI embeddings for many texts using batched cache lookups and API requests.
+    
+    This is a convenience function that uses the singleton EmbeddingManager.
+    
+    Requires:
+        - texts is a list of non-empty strings
+        - normalize_for_cache is boolean
+        
+    Ensures:
+        - Returns one embedding per input text, in input order
+        
+    Raises:
+        - None (handled by EmbeddingManager)
+    """
+    embedding_manager = get_embedding_manager( debug=debug )
+    return embedding_manager.generate_embeddings( texts, normalize_for_cache=normalize_for_cache )
+
+
 def quick_smoke_test():
     """Run quick smoke tests with various inputs to validate embedding functionality."""
     du.print_banner( "EmbeddingManager Singleton Smoke Test", prepend_nl=True )
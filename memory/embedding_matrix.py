@@ -0,0 +1,238 @@
+"""
+Contiguous float32 embedding matrix for vectorized similarity search.
+
+FileBasedSolutionManager used to score a query against every snapshot with
+one Python-level np.dot() call per pair. This module keeps all embeddings in a
+single row-major float32 matrix plus a parallel row -> key/payload index, so a
+search is one matrix-vector product followed by np.argpartition() for the top-k.
+
+Design by Contract:
+    Requires:
+        - Embeddings are unit-normalized lists/arrays of floats of one dimension
+
+    Ensures:
+        - upsert() and remove() update the matrix in place (amortized O(1) / O(dim))
+        - search() returns ( score, payload ) tuples sorted descending, scores in 0-100
+        - Returned scores are recomputed in float64 against the original embedding,
+          so threshold decisions match SolutionSnapshot.get_embedding_similarity()
+"""
+
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+import cosa.utils.util as du
+
+
+class EmbeddingMatrix:
+    """
+    Growable float32 matrix of embeddings addressed by key.
+
+    Requires:
+        - Keys are hashable and unique per row
+
+    Ensures:
+        - Rows [ 0, len ) are live; capacity doubles when full
+        - Rows with empty or wrong-dimension embeddings are not stored
+    """
+
+    # Candidates within this many points below the threshold are rescored in float64
+    FLOAT32_SLACK = 1e-3
+
+    def __init__( self, initial_capacity: int = 1024, debug: bool = False, verbose: bool = False ) -> None:
+        """
+        Initialize an empty matrix.
+
+        Requires:
+            - initial_capacity >= 1
+
+        Ensures:
+            - Dimension is fixed by the first stored embedding
+        """
+        self.debug             = debug
+        self.verbose           = verbose
+        self._initial_capacity = max( 1, initial_capacity )
+        self.clear()
+
+    def __len__( self ) -> int:
+        return self._size
+
+    def __contains__( self, key: Hashable ) -> bool:
+        return key in self._row_by_key
+
+    @property
+    def dimension( self ) -> Optional[int]:
+        return self._dim
+
+    def clear( self ) -> None:
+        """Drop every row and release the matrix."""
+        self._dim        = None
+        self._matrix     = None
+        self._size       = 0
+        self._row_by_key = { }
+        self._keys       = [ ]
+        self._payloads   = [ ]
+        self._vectors    = [ ]
+
+    def rebuild( self, items: Iterable[Tuple[Hashable, Any, Any]] ) -> None:
+        """
+        Replace the contents with ( key, embedding, payload ) items.
+
+        Ensures:
+            - Equivalent to clear() followed by upsert() for each item
+        """
+        self.clear()
+        for key, embedding, payload in items:
+            self.upsert( key, embedding, payload )
+
+    def upsert( self, key: Hashable, embedding: Any, payload: Any ) -> bool:
+        """
+        Insert or replace the row for key.
+
+        Ensures:
+            - Returns True if the row was stored
+            - Returns False (and drops any existing row for key) if the embedding is empty or the wrong dimension
+        """
+        vector = np.asarray( embedding, dtype=np.float32 ).ravel()
+
+        if vector.size == 0 or ( self._dim is not None and vector.size != self._dim ):
+            if self.debug and vector.size:
+                print( f"EmbeddingMatrix: skipping [{key}], dimension {vector.size} != {self._dim}" )
+            self.remove( key )
+            return False
+
+        if self._dim is None:
+            self._dim    = vector.size
+            self._matrix = np.empty( ( self._initial_capacity, self._dim ), dtype=np.float32 )
+
+        row = self._row_by_key.get( key )
+        if row is None:
+            if self._size == self._matrix.shape[ 0 ]:
+                self._grow()
+            row = self._size
+            self._size += 1
+            self._row_by_key[ key ] = row
+            self._keys.append( key )
+            self._payloads.append( payload )
+            self._vectors.append( embedding )
+        else:
+            self._payloads[ row ] = payload
+            self._vectors[ row ]  = embedding
+
+        self._matrix[ row ] = vector
+        return True
+
+    def remove( self, key: Hashable ) -> bool:
+        """
+        Remove the row for key by moving the last row into its slot.
+
+        Ensures:
+            - Returns True if a row was removed
+        """
+        row = self._row_by_key.pop( key, None )
+        if row is None: return False
+
+        last = self._size - 1
+        if row != last:
+            self._matrix[ row ]   = self._matrix[ last ]
+            moved_key             = self._keys[ last ]
+            self._keys[ row ]     = moved_key
+            self._payloads[ row ] = self._payloads[ last ]
+            self._vectors[ row ]  = self._vectors[ last ]
+            self._row_by_key[ moved_key ] = row
+
+        self._keys.pop()
+        self._payloads.pop()
+        self._vectors.pop()
+        self._size = last
+        return True
+
+    def search( self,
+        query_embedding: Any,
+        threshold: float,
+        limit: int,
+        exclude: Optional[Callable[[Any], bool]] = None
+    ) -> List[Tuple[float, Any]]:
+        """
+        Return the best-scoring payloads at or above threshold.
+
+        Requires:
+            - limit >= 1
+            - exclude (if given) returns True for payloads to skip
+
+        Ensures:
+            - At most limit ( score, payload ) tuples, sorted by score descending
+            - Scores are dot product * 100, as in SolutionSnapshot.get_embedding_similarity()
+            - Returns [] when empty or the query dimension doesn't match
+        """
+        if self._size == 0 or limit < 1: return [ ]
+
+        query = np.asarray( query_embedding, dtype=np.float32 ).ravel()
+        if query.size != self._dim:
+            if self.debug: print( f"EmbeddingMatrix: query dimension {query.size} != {self._dim}" )
+            return [ ]
+
+        scores     = ( self._matrix[ :self._size ] @ query ) * 100
+        candidates = np.flatnonzero( scores >= threshold - self.FLOAT32_SLACK )
+        if candidates.size == 0: return [ ]
+
+        query_64 = np.asarray( query_embedding, dtype=np.float64 ).ravel()
+        k        = limit
+
+        while True:
+            if candidates.size > k:
+                top = candidates[ np.argpartition( -scores[ candidates ], k - 1 )[ :k ] ]
+            else:
+                top = candidates
+
+            results = [ ]
+            for row in top:
+                payload = self._payloads[ row ]
+                if exclude is not None and exclude( payload ): continue
+                score = float( np.dot( query_64, np.asarray( self._vectors[ row ], dtype=np.float64 ) ) * 100 )
+                if score >= threshold:
+                    results.append( ( score, payload ) )
+
+            if len( results ) >= limit or top.size == candidates.size:
+                break
+            # Some of the top rows were excluded or fell below the threshold in float64: widen the window
+            k *= 2
+
+        results.sort( key=lambda item: item[ 0 ], reverse=True )
+        return results[ :limit ]
+
+    def _grow( self ) -> None:
+        """Double the row capacity, keeping live rows."""
+        grown = np.empty( ( self._matrix.shape[ 0 ] * 2, self._dim ), dtype=np.float32 )
+        grown[ :self._size ] = self._matrix[ :self._size ]
+        self._matrix = grown
+
+
+def quick_smoke_test():
+    """Quick smoke test for EmbeddingMatrix functionality."""
+    du.print_banner( "EmbeddingMatrix Smoke Test", prepend_nl=True )
+
+    try:
+        rng     = np.random.default_rng( 42 )
+        vectors = rng.standard_normal( ( 1000, 768 ) )
+        vectors /= np.linalg.norm( vectors, axis=1, keepdims=True )
+
+        matrix = EmbeddingMatrix( initial_capacity=16 )
+        for i, vector in enumerate( vectors ):
+            matrix.upsert( f"question {i}", vector.tolist(), f"snapshot {i}" )
+        print( f"✓ Stored {len( matrix )} rows of dimension {matrix.dimension}" )
+
+        results = matrix.search( vectors[ 7 ], threshold=90.0, limit=3 )
+        print( f"✓ Self match: {results[ 0 ][ 1 ]} at {results[ 0 ][ 0 ]:.2f}" )
+
+        matrix.remove( "question 7" )
+        print( f"✓ After remove: {len( matrix.search( vectors[ 7 ], threshold=90.0, limit=3 ) )} match(es), {len( matrix )} rows" )
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="embedding_matrix.quick_smoke_test()" )
+
+    print( "\n✓ EmbeddingMatrix smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
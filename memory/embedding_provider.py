@@ -174,8 +174,8 @@ class EmbeddingProvider:
         timer = sw.Stopwatch( silent=True )
 
         if self._provider == "openai":
-            # OpenAI engine doesn't support batch - loop
-            embeddings = [ self._get_openai_engine().generate_embedding( t ) for t in texts ]
+            # One cache lookup + batched API request for all misses
+            embeddings = self._get_openai_engine().generate_embeddings( texts )
         elif content_type == "code":
             embeddings = self._get_code_engine().encode_code( texts )
         else:
@@ -16,6 +16,7 @@ import time
 import hashlib
 import glob
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Dict, Any
 
 import cosa.utils.util as du
@@ -25,6 +26,8 @@ from cosa.memory.snapshot_manager_interface import (
     PerformanceMonitor
 )
 from cosa.memory.solution_snapshot import SolutionSnapshot
+from cosa.memory.embedding_matrix import EmbeddingMatrix
+from cosa.memory.snapshot_file_cache import SnapshotFileCache
 from cosa.memory.embedding_manager import EmbeddingManager
 from cosa.memory.embedding_provider import get_embedding_provider
 from cosa.memory.question_embeddings_table import QuestionEmbeddingsTable
@@ -59,7 +62,8 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
             - Issues deprecation warning
 
         Args:
-            config: Configuration dictionary with "path" key
+            config: Configuration dictionary with "path" key and optional
+                    "load_workers" (thread pool size) and "enable_load_cache" (manifest + .npy sidecars)
             debug: Enable debug output
             verbose: Enable verbose output
 
@@ -92,6 +96,16 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
         self._snapshots_by_question_gist = None
         self._question_embeddings_tbl = None
 
+        # Vectorized similarity indexes, kept in step with the question and gist dicts
+        self._question_matrix = EmbeddingMatrix( debug=debug, verbose=verbose )
+        self._gist_matrix     = EmbeddingMatrix( debug=debug, verbose=verbose )
+
+        # Startup loading: parallel parse, incremental via manifest + embedding sidecars
+        self._load_workers      = max( 1, int( config.get( "load_workers", min( 8, os.cpu_count() or 1 ) ) ) )
+        self._enable_load_cache = config.get( "enable_load_cache", True )
+        self._load_stats        = { }
+        self._startup_metrics   = None
+
         # Validate path exists or can be created
         if not os.path.exists( self.path ):
             try:
@@ -135,10 +149,6 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
             self.load_snapshots()
             self._initialized = True
 
-            if self.debug:
-                snapshot_count = len( self._snapshots_by_question )
-                print( f"✓ Loaded {snapshot_count} snapshots from {self.path}" )
-
         except Exception as e:
             self._initialized = False
             if self.debug:
@@ -147,6 +157,20 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
         finally:
             monitor.stop()
 
+        if self._performance_monitoring:
+            files = self._load_stats.get( "files", 0 )
+            self._startup_metrics = monitor.get_metrics(
+                result_count=len( self._snapshots_by_question ),
+                cache_hit_rate=self._load_stats.get( "from_cache", 0 ) / files if files else 0.0
+            )
+            self._startup_metrics.initialization_time_ms = self._startup_metrics.search_time_ms
+
+        if self.debug:
+            snapshot_count = len( self._snapshots_by_question )
+            print( f"✓ Loaded {snapshot_count} snapshots from {self.path}" )
+            if self._startup_metrics is not None:
+                print( f"  Startup: {self._startup_metrics.initialization_time_ms:.1f}ms, {self._load_stats}" )
+
         # Initialization complete, no return value needed
     
     def add_snapshot( self, snapshot: SolutionSnapshot ) -> bool:
@@ -181,6 +205,7 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
             # Add to in-memory indexes
             question = self._normalizer.normalize( snapshot.question )
             self._snapshots_by_question[ question ] = snapshot
+            self._question_matrix.upsert( question, snapshot.question_embedding, snapshot )
 
             # Update synonymous questions index
             for syn_question, similarity_score in snapshot.synonymous_questions.items():
@@ -189,6 +214,7 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
             # Update gist index
             for gist, similarity_score in snapshot.synonymous_question_gists.items():
                 self._snapshots_by_question_gist[ gist ] = ( similarity_score, snapshot )
+                self._gist_matrix.upsert( gist, snapshot.question_embedding, snapshot )
 
             if self.debug:
                 print( f"✓ Added snapshot for question: {du.truncate_string( snapshot.question, 50 )}" )
@@ -289,6 +315,7 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
             if self.debug:
                 print( f"Deleting snapshot from manager [{question}]...", end="" )
             del self._snapshots_by_question[ question ]
+            self._question_matrix.remove( question )
 
             # Remove from synonymous questions and gists indexes
             # (This is a simplified cleanup - could be more thorough)
@@ -305,6 +332,7 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
                     keys_to_remove.append( key )
             for key in keys_to_remove:
                 del self._snapshots_by_question_gist[ key ]
+                self._gist_matrix.remove( key )
 
             if self.debug:
                 print( "Done!" )
@@ -553,8 +581,11 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
                 "storage_size_mb": round( storage_size_mb, 2 ),
                 "storage_path": self.path,
                 "backend_type": "file_based",
-                "last_updated": time.strftime( "%Y-%m-%d @ %H:%M:%S %Z" )
+                "last_updated": time.strftime( "%Y-%m-%d @ %H:%M:%S %Z" ),
+                "load_stats": dict( self._load_stats )
             }
+            if self._startup_metrics is not None:
+                stats[ "startup_metrics" ] = self._startup_metrics.to_dict()
 
             if self.debug:
                 print( f"Stats: {snapshot_count} snapshots, {stats['storage_size_mb']} MB" )
@@ -650,6 +681,7 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
         self._snapshots_by_question = self._load_snapshots_by_question()
         self._snapshots_by_synonymous_questions = self._load_snapshots_by_synonymous_questions( self._snapshots_by_question )
         self._snapshots_by_question_gist = self._load_snapshots_by_gist( self._snapshots_by_question )
+        self._rebuild_embedding_matrices()
         self._question_embeddings_tbl = QuestionEmbeddingsTable()
 
         if self.debug:
@@ -688,6 +720,27 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
         if self.debug:
             print( f"✓ Reloaded {len( self._snapshots_by_question )} snapshots" )
 
+    def _rebuild_embedding_matrices( self ) -> None:
+        """
+        Rebuild the question and gist embedding matrices from the in-memory indexes.
+
+        Requires:
+            - _snapshots_by_question and _snapshots_by_question_gist are populated
+
+        Ensures:
+            - One question-matrix row per question key, one gist-matrix row per gist key
+            - Both rows hold the snapshot's question embedding, as the per-pair search did
+
+        Raises:
+            - None
+        """
+        self._question_matrix.rebuild(
+            ( question, snapshot.question_embedding, snapshot ) for question, snapshot in self._snapshots_by_question.items()
+        )
+        self._gist_matrix.rebuild(
+            ( gist, entry[ 1 ].question_embedding, entry[ 1 ] ) for gist, entry in self._snapshots_by_question_gist.items()
+        )
+
     def _load_snapshots_by_question( self ) -> Dict[str, SolutionSnapshot]:
         """
         Load snapshots indexed by question.
@@ -699,30 +752,49 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
         Ensures:
             - Returns dict mapping questions to snapshots
             - Filters out hidden files and non-JSON files
+            - Files are loaded on a thread pool of self._load_workers threads
+            - Unchanged files are rebuilt from the load cache instead of re-parsed
+            - Records file/cache/parse/failure counts in self._load_stats
 
         Raises:
             - None (handles errors internally)
         """
         snapshots_by_question = {}
         if self.debug:
-            print( f"Loading snapshots by question from [{self.path}]..." )
+            print( f"Loading snapshots by question from [{self.path}] with {self._load_workers} worker(s)..." )
 
         filtered_files = [ file for file in os.listdir( self.path ) if not file.startswith( "._" ) and file.endswith( ".json" ) ]
         if self.debug and self.verbose:
             du.print_list( filtered_files )
 
+        load_cache = SnapshotFileCache( self.path, debug=self.debug, verbose=self.verbose ) if self._enable_load_cache else None
+
+        with ThreadPoolExecutor( max_workers=self._load_workers ) as executor:
+            results = list( executor.map( lambda file: self._load_snapshot_entry( file, load_cache ), filtered_files ) )
+
         failed_files = []
-        for file in filtered_files:
-            json_file = os.path.join( self.path, file )
-            try:
-                snapshot = self._load_snapshot_from_file( json_file )
+        from_cache   = 0
+        for file, ( snapshot, cached, error ) in zip( filtered_files, results ):
+            if snapshot is not None:
                 snapshots_by_question[ snapshot.question ] = snapshot
-            except Exception as e:
-                failed_files.append( ( file, str( e ) ) )
+                from_cache += cached
+            else:
+                failed_files.append( ( file, error ) )
                 if self.debug:
-                    print( f"ERROR: Failed to load snapshot from {file}: {str(e)}" )
+                    print( f"ERROR: Failed to load snapshot from {file}: {error}" )
                     print( f"       Continuing with remaining snapshots..." )
 
+        if load_cache is not None:
+            load_cache.prune( filtered_files )
+            load_cache.save()
+
+        self._load_stats = {
+            "files"     : len( filtered_files ),
+            "from_cache": from_cache,
+            "parsed"    : len( filtered_files ) - from_cache - len( failed_files ),
+            "failed"    : len( failed_files )
+        }
+
         if failed_files:
             print( f"WARNING: Failed to load {len(failed_files)} snapshot file(s):" )
             for file, error in failed_files:
@@ -731,6 +803,43 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
 
         return snapshots_by_question
 
+    def _load_snapshot_entry( self, file: str, load_cache: Optional[SnapshotFileCache] ) -> Tuple[Optional[SolutionSnapshot], bool, str]:
+        """
+        Load one snapshot file, from the load cache when it's unchanged.
+
+        Requires:
+            - file is a JSON file name inside self.path
+
+        Ensures:
+            - Returns ( snapshot, from_cache, "" ) on success
+            - Returns ( None, False, error message ) on failure
+            - Freshly parsed files are added to the load cache
+
+        Raises:
+            - None (safe to run on a worker thread)
+        """
+        json_file = os.path.join( self.path, file )
+        try:
+            if load_cache is None:
+                return self._load_snapshot_from_file( json_file ), False, ""
+
+            stat = os.stat( json_file )
+            data = load_cache.lookup( file, json_file, stat )
+            if data is not None:
+                return SolutionSnapshot( **data ), True, ""
+
+            if self.debug:
+                print( f"Loading snapshot from: {json_file}" )
+            with open( json_file, "rb" ) as f:
+                raw = f.read()
+            data = json.loads( raw )
+            load_cache.store( file, stat, raw, data )
+
+            return SolutionSnapshot( **data ), False, ""
+
+        except Exception as e:
+            return None, False, str( e )
+
     def _load_snapshots_by_gist( self, snapshots_by_question: Dict[str, SolutionSnapshot] ) -> Dict[str, Tuple[float, SolutionSnapshot]]:
         """
         Create gist-based index of snapshots.
@@ -1014,39 +1123,28 @@ class FileBasedSolutionManager( SolutionSnapshotManagerInterface ):
         if self.debug and self.verbose and question_gist_embedding:
             print( f"question_gist_embedding: {question_gist_embedding[0:16]}" )
 
-        similar_snapshots = []
-
-        # Iterate the snapshots and compare the question embeddings
-        for snapshot in self._snapshots_by_question.values():
-
+        # Score every snapshot at once: one matrix-vector product, then top-k by argpartition
+        def is_blacklisted( snapshot: SolutionSnapshot ) -> bool:
             if exclude_non_synonymous_questions and question in snapshot.non_synonymous_questions:
                 if self.debug:
                     du.print_banner( f"Snapshot [{question}] is in the NON synonymous list!", prepend_nl=True )
                     print( f"Snapshot [{question}] has been blacklisted by [{snapshot.question}]" )
                     print( "Continuing to next snapshot..." )
-                continue
-
-            similarity_score = SolutionSnapshot.get_embedding_similarity( question_embedding, snapshot.question_embedding )
+                return True
+            return False
 
-            if similarity_score >= threshold_question:
-                similar_snapshots.append( ( similarity_score, snapshot ) )
-                if self.debug:
-                    print( f"Score [{similarity_score:.2f}]% for question [{snapshot.question}] IS similar enough to [{question}]" )
-            else:
-                if self.debug and self.verbose:
-                    print( f"Score [{similarity_score:.2f}]% for question [{snapshot.question}] is NOT similar enough to [{question}]" )
+        similar_snapshots = self._question_matrix.search( question_embedding, threshold_question, limit, exclude=is_blacklisted )
+        if self.debug:
+            for similarity_score, snapshot in similar_snapshots:
+                print( f"Score [{similarity_score:.2f}]% for question [{snapshot.question}] IS similar enough to [{question}]" )
 
-        # Iterate snapshots by question gist and compare the embeddings
+        # Compare the question gist embedding against the snapshots indexed by gist
         if question_gist is not None:
-            for snapshot in self._snapshots_by_question_gist.values():
-                similarity_score = SolutionSnapshot.get_embedding_similarity( question_gist_embedding, snapshot[ 1 ].question_embedding )
-                if similarity_score >= threshold_gist:
-                    similar_snapshots.append( ( similarity_score, snapshot[ 1 ] ) )
-                    if self.debug:
-                        print( f"Score [{similarity_score:.2f}]% for gist [{snapshot[ 1 ].question_gist}] IS similar enough to [{question_gist}]" )
-                else:
-                    if self.debug and self.verbose:
-                        print( f"Score [{similarity_score:.2f}]% for gist [{snapshot[ 1 ].question_gist}] is NOT similar enough to [{question_gist}]" )
+            gist_snapshots = self._gist_matrix.search( question_gist_embedding, threshold_gist, limit )
+            if self.debug:
+                for similarity_score, snapshot in gist_snapshots:
+                    print( f"Score [{similarity_score:.2f}]% for gist [{snapshot.question_gist}] IS similar enough to [{question_gist}]" )
+            similar_snapshots.extend( gist_snapshots )
 
         # Sort by similarity score, descending
         similar_snapshots.sort( key=lambda x: x[ 0 ], reverse=True )
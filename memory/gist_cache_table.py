@@ -27,6 +27,7 @@ from typing import Optional, Dict, Any
 import cosa.utils.util as cu
 from cosa.utils.util_stopwatch import Stopwatch
 from cosa.memory.normalizer import Normalizer
+from cosa.memory.lancedb_exact_lookup import ExactMatchLookup, ensure_scalar_index
 
 
 class GistCacheTable:
@@ -47,6 +48,9 @@ class GistCacheTable:
         - Expected hit rate: 70-80%
     """
 
+    # Exact-match lookup keys, each covered by a BTREE scalar index
+    KEY_COLUMNS = ( "question_verbatim", "question_normalized" )
+
     def __init__( self, db_uri: str, table_name: str = "gist_cache", debug: bool = False, verbose: bool = False ):
         """
         Initialize gist cache table.
@@ -91,6 +95,12 @@ class GistCacheTable:
                 db.drop_table( table_name )
                 self._create_table( db, table_name )
                 print( "✓ Table recreated successfully (cache was cleared)" )
+            else:
+                # Tables created with the old FTS indexes are migrated to BTREE here; others get refreshed
+                for column in self.KEY_COLUMNS:
+                    ensure_scalar_index( self._gist_cache_tbl, column, debug=self.debug )
+
+        self._lookup = ExactMatchLookup( self._gist_cache_tbl )
 
         if self.debug:
             count = self._gist_cache_tbl.count_rows()
@@ -129,14 +139,12 @@ class GistCacheTable:
         empty_data = pa.Table.from_pylist( [], schema=schema )
         self._gist_cache_tbl = db.create_table( table_name, empty_data )
 
-        # Create FTS indexes for fast exact string lookups (verbatim and normalized)
-        self._gist_cache_tbl.create_fts_index( "question_verbatim", replace=True )
-        self._gist_cache_tbl.create_fts_index( "question_normalized", replace=True )
+        # BTREE indexes for exact string lookups (verbatim and normalized)
+        for column in self.KEY_COLUMNS:
+            ensure_scalar_index( self._gist_cache_tbl, column, debug=self.debug )
 
         if self.debug:
             print( f"✓ Created gist cache table: '{table_name}'" )
-            print( f"✓ Created FTS index on question_verbatim field" )
-            print( f"✓ Created FTS index on question_normalized field" )
 
     def _is_table_corrupted( self ) -> bool:
         """
@@ -192,13 +200,7 @@ class GistCacheTable:
             - ~5ms for typical cache check
         """
         try:
-            escaped = question.replace( "'", "''" )
-            # Use to_lance().scanner() to avoid nprobes warning (filter-only query, no vector search)
-            results = self._gist_cache_tbl.to_lance().scanner(
-                filter=f"question_verbatim = '{escaped}'",
-                limit=1
-            ).to_table().to_pylist()
-            return len( results ) > 0
+            return self._lookup.first( "question_verbatim", question, columns=[ "question_verbatim" ] ) is not None
         except Exception as e:
             if self.debug:
                 print( f"⚠ Error checking cache: {e}" )
@@ -284,20 +286,11 @@ class GistCacheTable:
             Cached gist string if found, None otherwise
 
         Performance:
-            - ~1-2ms with FTS index on question_verbatim
+            - ~1-2ms with BTREE index on question_verbatim
         """
         try:
-            escaped = question.replace( "'", "''" )
-            # Use to_lance().scanner() to avoid nprobes warning (filter-only query, no vector search)
-            rows = self._gist_cache_tbl.to_lance().scanner(
-                filter=f"question_verbatim = '{escaped}'",
-                limit=1
-            ).to_table().to_pylist()
-
-            if rows:
-                return rows[ 0 ][ "question_gist" ]
-
-            return None
+            row = self._lookup.first( "question_verbatim", question, columns=[ "question_gist" ] )
+            return row[ "question_gist" ] if row else None
 
         except Exception as e:
             if self.debug:
@@ -323,24 +316,15 @@ class GistCacheTable:
             Cached gist string if found, None otherwise
 
         Performance:
-            - ~2-3ms with FTS index on question_normalized
+            - ~2-3ms with BTREE index on question_normalized
 
         Example Matches:
             - "What's the weather?" ↔ "What is the weather?"
             - "It's hot" ↔ "It is hot"
         """
         try:
-            escaped = question_normalized.replace( "'", "''" )
-            # Use to_lance().scanner() to avoid nprobes warning (filter-only query, no vector search)
-            rows = self._gist_cache_tbl.to_lance().scanner(
-                filter=f"question_normalized = '{escaped}'",
-                limit=1
-            ).to_table().to_pylist()
-
-            if rows:
-                return rows[ 0 ][ "question_gist" ]
-
-            return None
+            row = self._lookup.first( "question_normalized", question_normalized, columns=[ "question_gist" ] )
+            return row[ "question_gist" ] if row else None
 
         except Exception as e:
             if self.debug:
@@ -111,7 +111,7 @@ class GistNormalizer:
         
         return normalized_gist
     
-    def process_batch( self, texts ):
+    def process_batch( self, texts, batch_size=64, n_process=1 ):
         """
         Process multiple texts efficiently.
         
@@ -119,8 +119,8 @@ class GistNormalizer:
             - texts is a list of strings
             
         Ensures:
-            - Returns list of normalized gists
-            - Processes efficiently in batch where possible
+            - Returns list of normalized gists, each identical to get_normalized_gist( text )
+            - Normalizes all gists in one streamed spaCy pass (see Normalizer.normalize_many)
         """
         if self.verbose: 
             du.print_banner( f"Batch processing {len(texts)} texts" )
@@ -133,7 +133,7 @@ class GistNormalizer:
             gists.append( gist )
         
         # Normalize all gists in batch
-        normalized_gists = self.normalizer.normalize_batch( gists )
+        normalized_gists = self.normalizer.normalize_many( gists, batch_size=batch_size, n_process=n_process )
         
         return normalized_gists
 
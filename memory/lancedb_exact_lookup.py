@@ -0,0 +1,212 @@
+"""
+Exact-match lookups and BTREE scalar indexes for text-keyed LanceDB cache tables.
+
+EmbeddingCacheTable, GistCacheTable and QuestionEmbeddingsTable are keyed by free
+text and probe it with `column = '...'` filters. Without a scalar index every probe
+scans the whole key column, and calling to_lance() per probe re-opens the dataset,
+so whatever index there is gets reloaded each time. This module gives those tables
+one place to:
+
+    - create a BTREE index on each key column and keep it covering the table
+    - quote values as SQL string literals
+    - run single-value and multi-value (IN) probes through a reused dataset handle
+
+Design by Contract:
+    Requires:
+        - table is a lancedb table whose key columns are strings
+
+    Ensures:
+        - Lookups return exactly what an unindexed `=` / `IN` filter would
+        - Rows appended after the index was built are still found (Lance scans the unindexed tail)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import cosa.utils.util as du
+
+
+# Rebuild the BTREE index once this fraction of the indexed rows has been appended unindexed
+INDEX_REFRESH_FRACTION = 0.1
+
+# Values per IN (...) filter; longer key lists are split into several scans
+IN_LIST_BATCH_SIZE = 1000
+
+
+def sql_string_literal( value: str ) -> str:
+    """
+    Quote a Python string as a Lance SQL string literal.
+
+    Requires:
+        - value is a str
+
+    Ensures:
+        - Single quotes are doubled, so the literal always matches value verbatim
+    """
+    return "'" + value.replace( "'", "''" ) + "'"
+
+
+def equals_filter( column: str, value: str ) -> str:
+    """Return a `column = '<value>'` filter with value properly quoted."""
+    return f"{column} = {sql_string_literal( value )}"
+
+
+def in_filter( column: str, values: Iterable[str] ) -> str:
+    """Return a `column IN ('<v1>', '<v2>', ...)` filter with every value properly quoted."""
+    return f"{column} IN ({', '.join( sql_string_literal( value ) for value in values )})"
+
+
+def ensure_scalar_index( table: Any, column: str, refresh_fraction: float = INDEX_REFRESH_FRACTION, debug: bool = False ) -> str:
+    """
+    Make sure a BTREE scalar index covers a key column.
+
+    Requires:
+        - column exists in table
+
+    Ensures:
+        - Other indexes on the column (the FTS indexes these tables used to create, which no
+          lookup ever queried) are dropped first, so the BTREE index can take their name
+        - Creates the BTREE index if missing ("created")
+        - Rebuilds it when more than refresh_fraction of the indexed row count has been
+          appended since it was built ("rebuilt"), otherwise leaves it alone ("current")
+        - Never raises: failures are reported in debug mode and return "failed"
+    """
+    try:
+        btree_index = None
+        for index in table.list_indices():
+            if list( index.columns ) != [ column ]: continue
+            if "btree" in str( index.index_type ).lower():
+                btree_index = index
+            else:
+                table.drop_index( index.name )
+                if debug: print( f"Dropped {index.index_type} index [{index.name}] on [{column}]" )
+
+        if btree_index is None:
+            table.create_scalar_index( column, index_type="BTREE", replace=True )
+            if debug: print( f"✓ Created BTREE index on [{column}]" )
+            return "created"
+
+        stats     = table.index_stats( btree_index.name )
+        indexed   = getattr( stats, "num_indexed_rows", 0 ) or 0
+        unindexed = getattr( stats, "num_unindexed_rows", 0 ) or 0
+        if unindexed > refresh_fraction * indexed:
+            table.create_scalar_index( column, index_type="BTREE", replace=True )
+            if debug: print( f"✓ Rebuilt BTREE index on [{column}]: {unindexed} of {indexed + unindexed} rows were unindexed" )
+            return "rebuilt"
+
+        return "current"
+
+    except Exception as e:
+        if debug: print( f"⚠ Could not ensure BTREE index on [{column}]: {e}" )
+        return "failed"
+
+
+class ExactMatchLookup:
+    """
+    Prepared exact-match probes against one LanceDB table.
+
+    Keeps the Lance dataset handle, and with it the loaded scalar index pages, across
+    calls instead of re-opening the dataset per probe. The handle is replaced whenever
+    the table's version moves, so writes made through the table are always visible.
+
+    Requires:
+        - table is a lancedb table (not a dataset)
+
+    Ensures:
+        - first() and rows() see the same data as table.to_lance() would at call time
+        - Errors from the scan propagate to the caller
+    """
+
+    def __init__( self, table: Any ) -> None:
+        self._table   = table
+        self._dataset = None
+        self._version = None
+
+    def first( self, column: str, value: str, columns: Optional[List[str]] = None ) -> Optional[Dict[str, Any]]:
+        """
+        Return the first row whose column equals value, or None.
+
+        Requires:
+            - columns (if given) names the columns to return
+
+        Ensures:
+            - At most one row is read
+        """
+        rows = self._dataset_handle().scanner(
+            filter=equals_filter( column, value ),
+            limit=1,
+            columns=columns
+        ).to_table().to_pylist()
+
+        return rows[ 0 ] if rows else None
+
+    def rows( self, column: str, values: Iterable[str], columns: Optional[List[str]] = None ) -> List[Dict[str, Any]]:
+        """
+        Return every row whose column is one of values.
+
+        Requires:
+            - columns (if given) includes column when callers need to tell rows apart
+
+        Ensures:
+            - Duplicate values are probed once
+            - Uses one IN scan per IN_LIST_BATCH_SIZE distinct values (none for an empty list)
+            - Row order within the result is unspecified
+        """
+        unique  = list( dict.fromkeys( values ) )
+        dataset = self._dataset_handle() if unique else None
+        results = [ ]
+
+        for start in range( 0, len( unique ), IN_LIST_BATCH_SIZE ):
+            batch = unique[ start:start + IN_LIST_BATCH_SIZE ]
+            results.extend( dataset.scanner(
+                filter=in_filter( column, batch ),
+                columns=columns
+            ).to_table().to_pylist() )
+
+        return results
+
+    def _dataset_handle( self ) -> Any:
+        """Return the cached dataset, re-opening it if the table has moved to a new version."""
+        version = self._table.version
+        if self._dataset is None or version != self._version:
+            self._dataset = self._table.to_lance()
+            self._version = version
+
+        return self._dataset
+
+
+def quick_smoke_test():
+    """Quick smoke test for exact-match lookups and BTREE index maintenance."""
+    import tempfile
+
+    import lancedb
+    import pyarrow as pa
+
+    du.print_banner( "LanceDB Exact Lookup Smoke Test", prepend_nl=True )
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db    = lancedb.connect( temp_dir )
+            table = db.create_table( "smoke_tbl", schema=pa.schema( [ pa.field( "question", pa.string() ), pa.field( "answer", pa.string() ) ] ) )
+            print( f"✓ Index on empty table: {ensure_scalar_index( table, 'question', debug=True )}" )
+
+            table.add( [ { "question": f"what's {i} + {i}", "answer": str( i + i ) } for i in range( 1000 ) ] )
+            print( f"✓ Index after 1000 appends: {ensure_scalar_index( table, 'question', debug=True )}" )
+            print( f"✓ Index once refreshed: {ensure_scalar_index( table, 'question', debug=True )}" )
+
+            lookup = ExactMatchLookup( table )
+            row    = lookup.first( "question", "what's 7 + 7", columns=[ "answer" ] )
+            rows   = lookup.rows( "question", [ "what's 1 + 1", "what's 2 + 2", "missing" ], columns=[ "question" ] )
+            print( f"✓ first(): {row}" )
+            print( f"✓ rows() found: {len( rows )} of 2" )
+
+            table.add( [ { "question": "added later", "answer": "yes" } ] )
+            print( f"✓ Sees later writes: {lookup.first( 'question', 'added later' ) is not None}" )
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="lancedb_exact_lookup.quick_smoke_test()" )
+
+    print( "\n✓ LanceDB exact lookup smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
@@ -8,7 +8,9 @@ while maintaining 100% API compatibility with the file-based implementation.
 
 import os
 import json
+import math
 import time
+from collections import OrderedDict
 from threading import Lock
 from typing import List, Tuple, Optional, Dict, Any
 
@@ -17,6 +19,7 @@ import pyarrow as pa
 import numpy as np
 
 import cosa.utils.util as du
+import cosa.utils.util_stopwatch as sw
 from cosa.config.configuration_manager import ConfigurationManager
 from cosa.memory.snapshot_manager_interface import (
     SolutionSnapshotManagerInterface,
@@ -24,6 +27,7 @@ from cosa.memory.snapshot_manager_interface import (
     PerformanceMonitor
 )
 from cosa.memory.solution_snapshot import SolutionSnapshot
+from cosa.memory.lazy_solution_snapshot import LazySolutionSnapshot, EMBEDDING_FIELDS
 from cosa.memory.question_embeddings_table import QuestionEmbeddingsTable
 
 
@@ -36,6 +40,17 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
     API to file-based implementation while leveraging native vector operations.
     """
 
+    # Columns projected into _id_lookup at startup; everything else is hydrated on demand
+    LOOKUP_COLUMNS = ( "id_hash", "question", "question_normalized", "question_gist" )
+
+    # Embedding columns searched by get_snapshots_by_*() and therefore worth an ANN index
+    VECTOR_INDEX_COLUMNS = ( "question_embedding", "code_embedding", "solution_embedding", "solution_gist_embedding" )
+
+    # Exact re-rank of refine_factor * limit PQ candidates. The similarity thresholds in
+    # _score_vector_results() assume exact distances: recall@10 is ~0.18 at 0 and 1.0 at 20
+    # (benchmark_vector_index_recall). On unindexed tables the flat scan is exact and this is a no-op.
+    DEFAULT_REFINE_FACTOR = 20
+
     # Thread safety: Lock for save operations to prevent TOCTOU race conditions
     # that cause duplicate records when concurrent save_snapshot() calls occur
     _save_lock = Lock()
@@ -84,9 +99,18 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
         self._db = None
         self._table = None
 
-        # Cache for embeddings and quick lookups
+        # Cache for quick lookups (projected columns only, no embeddings)
         self._question_lookup = {}  # question -> id_hash mapping
-        self._id_lookup = {}       # id_hash -> row mapping
+        self._id_lookup = {}       # id_hash -> LOOKUP_COLUMNS mapping
+
+        # Bounded LRU of recently used full rows (embeddings included), filled on demand
+        self._record_cache_size  = max( 1, int( config.get( "record_cache_size", 256 ) ) )
+        self._record_cache       = OrderedDict()  # id_hash -> full row
+        self._record_cache_lock  = Lock()
+        self._record_cache_stats = { "hits": 0, "misses": 0 }
+
+        # Non-embedding columns selected by vector searches (resolved from the table schema)
+        self._snapshot_columns = None
 
         # Initialize components for hierarchical search
         self._canonical_synonyms = None  # Lazy initialization
@@ -95,6 +119,13 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
 
         # Vector search performance tuning (nprobes for IVF index)
         self._nprobes = config.get( "nprobes", 20 )
+        refine_factor = config.get( "refine_factor" )
+        self._refine_factor = self.DEFAULT_REFINE_FACTOR if refine_factor is None else int( refine_factor )  # 0 = raw PQ distances
+
+        # IVF-PQ index lifecycle (see ensure_vector_indexes)
+        self._vector_index_min_rows         = int( config.get( "vector_index_min_rows", 10000 ) )
+        self._vector_index_rebuild_fraction = float( config.get( "vector_index_rebuild_fraction", 0.2 ) )
+        self._vector_index_on_init          = bool( config.get( "vector_index_on_init", False ) )
 
         # Get standardized embedding dimension from config
         _cfg = ConfigurationManager( env_var_name="LUPIN_CONFIG_MGR_CLI_ARGS" )
@@ -442,6 +473,22 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
         Returns:
             Reconstructed SolutionSnapshot
         """
+        # CRITICAL: Passing embeddings to constructor prevents 977ms regeneration
+        embeddings = { field: self._ensure_list( record.get( field, [] ) ) for field in EMBEDDING_FIELDS }
+
+        return SolutionSnapshot( **self._record_to_snapshot_kwargs( record ), **embeddings )
+
+    def _record_to_snapshot_kwargs( self, record: Dict[str, Any] ) -> Dict[str, Any]:
+        """
+        Build SolutionSnapshot constructor arguments for every non-embedding field of a record.
+
+        Requires:
+            - record has question and id_hash
+
+        Ensures:
+            - JSON columns are decoded, falling back to empty containers on bad JSON
+            - Embedding columns are ignored, so projected rows work too
+        """
         # Deserialize JSON fields first for constructor
         try:
             synonymous_questions = json.loads( record.get( "synonymous_questions", "{}" ) )
@@ -471,9 +518,7 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
 
         is_cache_hit = record.get( "is_cache_hit", False )
 
-        # Create SolutionSnapshot with ALL fields INCLUDING embeddings
-        # CRITICAL: Passing embeddings to constructor prevents 977ms regeneration
-        snapshot = SolutionSnapshot(
+        return dict(
             question=record["question"],
             question_normalized=record.get( "question_normalized", "" ),
             question_gist=record.get( "question_gist", "" ),
@@ -500,22 +545,115 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             code_type=record.get( "code_type", "" ),
             programming_language=record.get( "programming_language", "python" ),
             language_version=record.get( "language_version", "3.10" ),
-            # CRITICAL: Pass embeddings to constructor to prevent regeneration
-            question_embedding=self._ensure_list( record.get( "question_embedding", [] ) ),
-            question_normalized_embedding=self._ensure_list( record.get( "question_normalized_embedding", [] ) ),
-            question_gist_embedding=self._ensure_list( record.get( "question_gist_embedding", [] ) ),
-            solution_embedding=self._ensure_list( record.get( "solution_embedding", [] ) ),
-            code_embedding=self._ensure_list( record.get( "code_embedding", [] ) ),
-            thoughts_embedding=self._ensure_list( record.get( "thoughts_embedding", [] ) ),
-            solution_gist_embedding=self._ensure_list( record.get( "solution_gist_embedding", [] ) ),
             # Replay tracking for Time Saved Dashboard
             replay_history=replay_history,
             replay_stats=replay_stats,
             is_cache_hit=is_cache_hit
         )
 
-        return snapshot
-    
+    def _get_snapshot_columns( self ) -> List[str]:
+        """
+        Return the table's non-embedding columns, resolved once per table load.
+
+        Ensures:
+            - Only columns present in the current table (older tables may lack newer ones)
+        """
+        if self._snapshot_columns is None:
+            self._snapshot_columns = [ name for name in self._table.schema.names if name not in EMBEDDING_FIELDS ]
+        return self._snapshot_columns
+
+    def _vector_search( self, query_embedding: List[float], vector_column_name: str, limit: int ) -> pa.Table:
+        """
+        Run a dot-metric vector search and return the matches as an Arrow table.
+
+        Requires:
+            - Manager is initialized
+
+        Ensures:
+            - Selects only non-embedding columns plus _distance
+            - Applies refine_factor (DEFAULT_REFINE_FACTOR unless configured), so indexed
+              searches return exact distances for the thresholds applied afterwards
+            - Rows are sorted by _distance ascending (most similar first)
+        """
+        query = self._table.search(
+            query_embedding,
+            vector_column_name=vector_column_name
+        ).metric( "dot" ).nprobes( self._nprobes )
+
+        # Re-rank refine_factor * limit PQ candidates with exact distances (only matters once indexed)
+        if self._refine_factor > 0:
+            query = query.refine_factor( self._refine_factor )
+
+        return query.select( self._get_snapshot_columns() + [ "_distance" ] ).limit( limit ).to_arrow()
+
+    def _score_vector_results( self,
+                               results: pa.Table,
+                               threshold: float,
+                               exclude_id_hash: Optional[str] = None,
+                               ensure_top_result: bool = False
+                               ) -> Tuple[List[Tuple[float, SolutionSnapshot]], Optional[Tuple[float, SolutionSnapshot]]]:
+        """
+        Filter vector search rows by similarity and materialize only the rows kept.
+
+        Requires:
+            - results comes from _vector_search() (sorted, with _distance)
+
+        Ensures:
+            - Similarity is ( 1 - _distance ) * 100, matching file-based np.dot() * 100
+            - Returns ( rows at or above threshold, first row below threshold or None )
+            - The second element is only filled when ensure_top_result is True
+            - Rows whose id_hash equals exclude_id_hash are skipped
+        """
+        id_hashes = results.column( "id_hash" ).to_pylist()
+        if "_distance" in results.column_names:
+            distances = results.column( "_distance" ).to_pylist()
+        else:
+            distances = [ 0.0 ] * results.num_rows
+
+        above = [ ]
+        below = None
+        for row, ( id_hash, distance ) in enumerate( zip( id_hashes, distances ) ):
+            if exclude_id_hash is not None and id_hash == exclude_id_hash: continue
+
+            similarity_percent = ( 1.0 - distance ) * 100
+            if similarity_percent >= threshold:
+                above.append( ( similarity_percent, row ) )
+            elif ensure_top_result and below is None:
+                # First one below threshold is the best, since LanceDB returns sorted
+                below = ( similarity_percent, row )
+
+        kept      = above + ( [ below ] if below is not None else [ ] )
+        snapshots = self._arrow_to_snapshots( results, [ row for _, row in kept ] )
+        scored    = [ ( score, snapshot ) for ( score, _ ), snapshot in zip( kept, snapshots ) ]
+
+        if below is not None:
+            return scored[ :-1 ], scored[ -1 ]
+        return scored, None
+
+    def _arrow_to_snapshots( self, results: pa.Table, rows: List[int] ) -> List[SolutionSnapshot]:
+        """
+        Materialize selected rows of an Arrow result as lazily hydrated snapshots.
+
+        Requires:
+            - results holds (at least) the non-embedding snapshot columns
+
+        Ensures:
+            - Converts each needed column to Python once, for the selected rows only
+            - Returned snapshots fetch their embeddings through _get_full_record() on first access
+        """
+        if not rows: return [ ]
+
+        taken   = results.take( rows )
+        columns = [ name for name in taken.column_names if name != "_distance" and name not in EMBEDDING_FIELDS ]
+        values  = { name: taken.column( name ).to_pylist() for name in columns }
+
+        snapshots = [ ]
+        for i in range( taken.num_rows ):
+            record = { name: values[ name ][ i ] for name in columns }
+            snapshots.append( LazySolutionSnapshot( self._get_full_record, **self._record_to_snapshot_kwargs( record ) ) )
+
+        return snapshots
+
     def initialize( self ) -> None:
         """
         Initialize LanceDB connection and create/open solution snapshots table.
@@ -585,22 +723,9 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             # Load existing data for caching
             snapshot_count = 0
             try:
-                # Get count of existing records
-                # Get all rows using to_arrow() - efficient full table access in LanceDB 0.23.0
-                result = self._table.to_arrow().to_pandas()
-                snapshot_count = len( result )
-                
-                # Build lookup caches
-                self._question_lookup.clear()
-                self._id_lookup.clear()
-                
-                for _, row in result.iterrows():
-                    question = row["question"]
-                    id_hash = row["id_hash"]
-                    
-                    self._question_lookup[question] = id_hash
-                    self._id_lookup[id_hash] = dict( row )
-                
+                # Project only the lookup columns; full rows are hydrated on demand
+                snapshot_count = self._load_lookups()
+
                 if self.debug:
                     print( f"✓ Loaded {snapshot_count} existing snapshots into cache" )
                     
@@ -609,6 +734,14 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
                     print( f"⚠ Cache loading failed (table may be empty): {cache_error}" )
                 snapshot_count = 0
             
+            # Build or refresh ANN indexes once the table is large enough (no-op below the threshold)
+            if self._vector_index_on_init and snapshot_count >= self._vector_index_min_rows:
+                try:
+                    self.ensure_vector_indexes()
+                except Exception as index_error:
+                    if self.debug:
+                        print( f"⚠ Vector index maintenance failed, searches fall back to flat scan: {index_error}" )
+
             self._initialized = True
             
             if self.debug:
@@ -667,15 +800,7 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
 
             # Reload data into caches
             try:
-                result = self._table.to_pandas()
-                snapshot_count = len( result )
-
-                for _, row in result.iterrows():
-                    question = row["question"]
-                    id_hash = row["id_hash"]
-
-                    self._question_lookup[question] = id_hash
-                    self._id_lookup[id_hash] = dict( row )
+                snapshot_count = self._load_lookups()
 
                 if self.debug:
                     print( f"✓ Reloaded {snapshot_count} snapshots (was {old_count})" )
@@ -689,6 +814,208 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
                 print( f"✗ Failed to reload LanceDB manager: {e}" )
             raise
 
+    def ensure_vector_indexes( self, force: bool = False ) -> Dict[str, str]:
+        """
+        Create or rebuild the IVF-PQ index on each searched embedding column.
+
+        LanceDB answers vector queries on unindexed rows with a flat scan, so an
+        index is only worth building once the table is large, and only worth
+        rebuilding once enough rows have been added since the last build. A build
+        takes tens of seconds per column at 20k rows, so it runs from initialize()
+        only when vector_index_on_init is set; otherwise call it from maintenance jobs.
+        PQ distances are approximate, so searches re-rank with refine_factor
+        (DEFAULT_REFINE_FACTOR) before thresholds are applied; tune nprobes/refine_factor
+        with benchmark_vector_index_recall() in tests/comparison/manager_comparison_suite.py.
+
+        Requires:
+            - self._table is open
+
+        Ensures:
+            - Tables below vector_index_min_rows are left unindexed (unless force)
+            - A column without an index gets one
+            - An index is rebuilt when unindexed rows exceed vector_index_rebuild_fraction of indexed rows
+            - Partitions and sub-vectors come from _choose_index_params()
+            - Returns column -> "created" | "rebuilt" | "current" | "skipped" | "failed: <error>"
+        """
+        row_count = self._table.count_rows()
+        actions   = { }
+
+        if row_count < self._vector_index_min_rows and not force:
+            return { column: "skipped" for column in self.VECTOR_INDEX_COLUMNS }
+
+        # Partition training needs at least one row per partition and PQ needs 256 rows per codebook
+        if row_count < 256:
+            return { column: "skipped" for column in self.VECTOR_INDEX_COLUMNS }
+
+        index_names = self._get_vector_index_names()
+        schema      = self._table.schema
+
+        for column in self.VECTOR_INDEX_COLUMNS:
+            if column not in schema.names:
+                actions[ column ] = "skipped"
+                continue
+
+            action = "created"
+            if column in index_names:
+                stats = self._table.index_stats( index_names[ column ] )
+                if stats is not None and not self._index_needs_rebuild( stats.num_indexed_rows, stats.num_unindexed_rows ):
+                    actions[ column ] = "current"
+                    continue
+                action = "rebuilt"
+
+            num_partitions, num_sub_vectors = self._choose_index_params( row_count, schema.field( column ).type.list_size )
+
+            try:
+                timer = sw.Stopwatch( msg=f"Building IVF-PQ index on {column}...", silent=not self.debug )
+                self._table.create_index(
+                    metric="dot",
+                    vector_column_name=column,
+                    num_partitions=num_partitions,
+                    num_sub_vectors=num_sub_vectors,
+                    replace=True
+                )
+                timer.print( f"Done: {action} ({num_partitions} partitions, {num_sub_vectors} sub-vectors)", use_millis=True )
+                actions[ column ] = action
+            except Exception as e:
+                if self.debug: print( f"⚠ Could not build vector index on {column}: {e}" )
+                actions[ column ] = f"failed: {e}"
+
+        return actions
+
+    def _get_vector_index_names( self ) -> Dict[str, str]:
+        """Return column -> index name for the vector indexes that exist on the table."""
+        names = { }
+        for index in self._table.list_indices():
+            if index.columns and index.columns[ 0 ] in self.VECTOR_INDEX_COLUMNS:
+                names[ index.columns[ 0 ] ] = index.name
+        return names
+
+    def _index_needs_rebuild( self, num_indexed_rows: int, num_unindexed_rows: int ) -> bool:
+        """
+        Decide whether an index has gone stale.
+
+        Ensures:
+            - True when unindexed rows exceed vector_index_rebuild_fraction of the indexed rows
+        """
+        if num_indexed_rows <= 0: return num_unindexed_rows > 0
+        return num_unindexed_rows / num_indexed_rows > self._vector_index_rebuild_fraction
+
+    @staticmethod
+    def _choose_index_params( row_count: int, dimension: int ) -> Tuple[int, int]:
+        """
+        Pick IVF partitions and PQ sub-vectors for a table size and embedding dimension.
+
+        Requires:
+            - row_count >= 256 and dimension >= 1
+
+        Ensures:
+            - num_partitions ~ sqrt( row_count ), with at least 256 rows per partition for k-means
+            - num_sub_vectors divides dimension, aiming for 16-dim sub-vectors (768 -> 48, 1536 -> 96)
+        """
+        num_partitions = max( 1, min( int( math.sqrt( row_count ) ), row_count // 256 ) )
+
+        num_sub_vectors = max( 1, dimension // 16 )
+        while dimension % num_sub_vectors != 0:
+            num_sub_vectors -= 1
+
+        return num_partitions, num_sub_vectors
+
+    def _load_lookups( self ) -> int:
+        """
+        Rebuild the lookup dicts from a column-projected scan of the table.
+
+        Requires:
+            - self._table is open
+
+        Ensures:
+            - Reads only LOOKUP_COLUMNS (no embedding vectors)
+            - _question_lookup maps question -> id_hash, _id_lookup maps id_hash -> projected row
+            - Empties the full-row LRU
+            - Returns the number of rows loaded
+
+        Raises:
+            - Exception from LanceDB if the scan fails
+        """
+        self._question_lookup.clear()
+        self._id_lookup.clear()
+        self._clear_record_cache()
+        self._snapshot_columns = None
+
+        row_count = self._table.count_rows()
+        if row_count == 0: return 0
+
+        columns = [ column for column in self.LOOKUP_COLUMNS if column in self._table.schema.names ]
+        arrow   = self._table.search().select( columns ).limit( row_count ).to_arrow()
+        values  = { column: arrow.column( column ).to_pylist() for column in columns }
+
+        for i, id_hash in enumerate( values[ "id_hash" ] ):
+            self._id_lookup[ id_hash ] = { column: values[ column ][ i ] for column in columns }
+            self._question_lookup[ values[ "question" ][ i ] ] = id_hash
+
+        return arrow.num_rows
+
+    def _cache_record( self, record: Dict[str, Any], question: Optional[str] = None ) -> None:
+        """
+        Index a full row: projected columns into the lookups, the whole row into the LRU.
+
+        Requires:
+            - record has id_hash and question
+
+        Ensures:
+            - _question_lookup is keyed by question if given, else by record["question"]
+            - Least recently used rows are evicted beyond record_cache_size
+        """
+        id_hash = record[ "id_hash" ]
+        self._id_lookup[ id_hash ] = { column: record.get( column, "" ) for column in self.LOOKUP_COLUMNS }
+        self._question_lookup[ question if question is not None else record[ "question" ] ] = id_hash
+
+        with self._record_cache_lock:
+            self._record_cache[ id_hash ] = record
+            self._record_cache.move_to_end( id_hash )
+            while len( self._record_cache ) > self._record_cache_size:
+                self._record_cache.popitem( last=False )
+
+    def _uncache_record( self, id_hash: str, question: Optional[str] = None ) -> None:
+        """Drop a row from the lookups (when question is given) and from the LRU."""
+        self._id_lookup.pop( id_hash, None )
+        if question is not None:
+            self._question_lookup.pop( question, None )
+        with self._record_cache_lock:
+            self._record_cache.pop( id_hash, None )
+
+    def _clear_record_cache( self ) -> None:
+        """Empty the full-row LRU and reset its counters."""
+        with self._record_cache_lock:
+            self._record_cache.clear()
+            self._record_cache_stats = { "hits": 0, "misses": 0 }
+
+    def _get_full_record( self, id_hash: str ) -> Optional[Dict[str, Any]]:
+        """
+        Return the full row for id_hash, from the LRU or the table.
+
+        Requires:
+            - Manager is initialized
+
+        Ensures:
+            - LRU hits don't touch the table
+            - Misses read one row by id_hash and add it to the LRU
+            - Returns None if the row no longer exists
+        """
+        with self._record_cache_lock:
+            record = self._record_cache.get( id_hash )
+            if record is not None:
+                self._record_cache.move_to_end( id_hash )
+                self._record_cache_stats[ "hits" ] += 1
+                return record
+            self._record_cache_stats[ "misses" ] += 1
+
+        records = self._table.search().where( f"id_hash = '{id_hash}'" ).limit( 1 ).to_list()
+        if not records: return None
+
+        record = dict( records[ 0 ] )
+        self._cache_record( record )
+        return record
+
     def save_snapshot( self, snapshot: SolutionSnapshot ) -> bool:
         """
         Save snapshot to LanceDB table using context-aware upsert operations.
@@ -737,8 +1064,7 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
                         # DUPE-GUARD: Found in DB but not cache - restore cache and UPDATE
                         if self.debug: print( f"[DUPE-GUARD] Found existing record in DB (cache miss): {du.truncate_string( question, 50 )}" )
                         # Restore cache entry
-                        self._question_lookup[question] = existing_records[0]["id_hash"]
-                        self._id_lookup[existing_records[0]["id_hash"]] = existing_records[0]
+                        self._cache_record( dict( existing_records[0] ) )
                         return self._update_existing_snapshot( snapshot )
 
                     # Truly new snapshot - use direct INSERT
@@ -827,8 +1153,7 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             
             # Update cache
             id_hash = record["id_hash"]
-            self._question_lookup[snapshot.question] = id_hash
-            self._id_lookup[id_hash] = record
+            self._cache_record( record )
             
             if self.debug:
                 print( f"  ✓ Inserted new snapshot with id_hash: {id_hash[:8]}..." )
@@ -866,7 +1191,6 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
         try:
             # Get existing snapshot's id_hash from cache
             existing_id_hash = self._question_lookup[snapshot.question]
-            existing_record  = self._id_lookup[existing_id_hash]
 
             # Session 108: DON'T modify snapshot.id_hash directly!
             # The snapshot object may be shared (e.g., in the done queue) and modifying it
@@ -919,10 +1243,7 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
 
             # Invalidate cache BEFORE merge to force fresh DB read after
             # This prevents cache from masking persistence failures
-            if id_hash in self._id_lookup:
-                del self._id_lookup[id_hash]
-            if snapshot.question in self._question_lookup:
-                del self._question_lookup[snapshot.question]
+            self._uncache_record( id_hash, snapshot.question )
 
             if self.debug: print( f"[CACHE DEBUG] Invalidated cache for {id_hash[:8]}... before merge" )
 
@@ -956,16 +1277,14 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             # This ensures cache reflects actual persisted data
             fresh_records = self._table.search().where( f"id_hash = '{id_hash}'" ).limit( 1 ).to_list()
             if fresh_records:
-                fresh_record = fresh_records[0]
-                self._id_lookup[id_hash] = dict( fresh_record )
-                self._question_lookup[snapshot.question] = id_hash
+                fresh_record = dict( fresh_records[0] )
+                self._cache_record( fresh_record, question=snapshot.question )
 
                 if self.debug:
                     print( f"[CACHE DEBUG] Repopulated cache from DB with fresh data" )
             else:
                 # Fallback: use in-memory record if DB read fails (should not happen)
-                self._id_lookup[id_hash] = record
-                self._question_lookup[snapshot.question] = id_hash
+                self._cache_record( record, question=snapshot.question )
 
                 if self.debug:
                     print( f"[CACHE DEBUG] ⚠ DB read failed, using in-memory record" )
@@ -1020,7 +1339,13 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
                     print( f"[CONSISTENCY] ⚠ Cache missing entry for {id_hash[:8]}... but DB has it" )
                 return False
 
-            cached_record = self._id_lookup[id_hash]
+            with self._record_cache_lock:
+                cached_record = self._record_cache.get( id_hash )
+
+            if cached_record is None:
+                if self.debug:
+                    print( f"[CONSISTENCY] ✓ Full row for {id_hash[:8]}... not hydrated, nothing to compare" )
+                return True
 
             # Compare critical fields
             import json
@@ -1196,10 +1521,7 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             self._table.delete( f"id_hash = '{id_hash}'" )
 
             # Update cache (remove if present)
-            if question in self._question_lookup:
-                del self._question_lookup[question]
-            if id_hash in self._id_lookup:
-                del self._id_lookup[id_hash]
+            self._uncache_record( id_hash, question )
 
             if self.debug:
                 print( f"✓ Deleted snapshot: {id_hash[:8]}..." )
@@ -1323,11 +1645,11 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
                     print( f"Found exact match in local cache for: {du.truncate_string( question, 50 )}" )
 
                 id_hash = self._question_lookup[question]
-                record = self._id_lookup[id_hash]
-                snapshot = self._record_to_snapshot( record )
+                record = self._get_full_record( id_hash )
 
-                monitor.stop()
-                return [(100.0, snapshot)]
+                if record is not None:
+                    monitor.stop()
+                    return [(100.0, self._record_to_snapshot( record ))]
 
             # Level 4: Vector similarity search using LanceDB
             if self.debug:
@@ -1353,48 +1675,33 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
                         print( f"[SIMILARITY-DEBUG] ⚠️ WARNING: Query embedding appears to be all zeros!" )
 
             # Perform vector similarity search on question_embedding field
-            search_results = self._table.search(
-                query_embedding,
-                vector_column_name="question_embedding"
-            ).metric( "dot" ).nprobes( self._nprobes ).limit( limit if limit > 0 else 100 ).to_list()
+            search_results = self._vector_search( query_embedding, "question_embedding", limit if limit > 0 else 100 )
 
             # Point 2: Raw search results count
             if self.debug and self.verbose:
-                print( f"[SIMILARITY-DEBUG] Raw LanceDB search returned {len( search_results )} results" )
-                if not search_results:
+                print( f"[SIMILARITY-DEBUG] Raw LanceDB search returned {search_results.num_rows} results" )
+                if search_results.num_rows == 0:
                     print( f"[SIMILARITY-DEBUG] ⚠️ No results from LanceDB - database may be empty or embeddings missing" )
 
-            similar_snapshots = []
-            for record in search_results:
-                # Extract distance value from LanceDB
-                # NOTE: With dot metric, _distance = 1 - dot_product (lower = more similar)
-                distance = record.get( "_distance", 0.0 )
-
-                # Convert distance to similarity percentage (0-100 scale)
-                # similarity = 1 - distance, matching file-based np.dot() * 100 formula
-                similarity_percent = ( 1.0 - distance ) * 100
-
-                # Apply threshold filter
-                if similarity_percent >= threshold_question:
-                    snapshot = self._record_to_snapshot( record )
-                    similar_snapshots.append( ( similarity_percent, snapshot ) )
+            # NOTE: With dot metric, _distance = 1 - dot_product (lower = more similar)
+            similar_snapshots, _ = self._score_vector_results( search_results, threshold_question )
 
             # Point 3: Top 10 results logging (regardless of threshold)
-            if self.debug and self.verbose and search_results:
+            if self.debug and self.verbose and search_results.num_rows:
                 print( f"[SIMILARITY-DEBUG] Top 10 results (threshold={threshold_question}%):" )
-                for i, record in enumerate( search_results[:10] ):
+                for i, record in enumerate( search_results.slice( 0, 10 ).to_pylist() ):
                     distance       = record.get( "_distance", 0.0 )
                     score          = ( 1.0 - distance ) * 100
-                    id_hash        = record.get( "id_hash", "?" )[:8]
-                    created_date   = record.get( "created_date", "?" )[:10]  # Just date part
-                    answer_preview = du.truncate_string( record.get( "answer", "?" ), 20 )
-                    q_preview      = du.truncate_string( record.get( "question", "?" ), 40 )
+                    id_hash        = ( record.get( "id_hash" ) or "?" )[:8]
+                    created_date   = ( record.get( "created_date" ) or "?" )[:10]  # Just date part
+                    answer_preview = du.truncate_string( record.get( "answer" ) or "?", 20 )
+                    q_preview      = du.truncate_string( record.get( "question" ) or "?", 40 )
                     pass_fail      = "✓" if score >= threshold_question else "✗"
                     print( f"[SIMILARITY-DEBUG]   {i+1}. {pass_fail} {score:.1f}% [{id_hash}] {created_date} - '{q_preview}' → '{answer_preview}'" )
 
             # Point 4: Summary
             if self.debug:
-                total    = len( search_results )
+                total    = search_results.num_rows
                 passed   = len( similar_snapshots )
                 filtered = total - passed
                 print( f"[SIMILARITY-DEBUG] Vector search: {total} total, {passed} above {threshold_question}%, {filtered} filtered out" )
@@ -1477,35 +1784,19 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             # Request extra results to account for self-exclusion
             effective_limit = ( limit + 1 ) if exclude_self else ( limit if limit > 0 else 100 )
 
-            search_results = self._table.search(
-                query_embedding,
-                vector_column_name="code_embedding"
-            ).metric( "dot" ).nprobes( self._nprobes ).limit( effective_limit ).to_list()
+            search_results = self._vector_search( query_embedding, "code_embedding", effective_limit )
 
             if debug:
-                print( f"[CODE-SIMILARITY] LanceDB returned {len( search_results )} raw results" )
-
-            similar_snapshots = []
-            best_below_threshold = None  # Track best result that doesn't meet threshold
-
-            for record in search_results:
-                # Skip self if requested
-                if exclude_self and record.get( "id_hash" ) == exemplar_snapshot.id_hash:
-                    continue
-
-                # Extract distance and convert to similarity percentage
-                # With dot metric: _distance = 1 - dot_product (lower = more similar)
-                distance = record.get( "_distance", 0.0 )
-                similarity_percent = ( 1.0 - distance ) * 100
-
-                # Apply threshold filter
-                if similarity_percent >= threshold:
-                    snapshot = self._record_to_snapshot( record )
-                    similar_snapshots.append( ( similarity_percent, snapshot ) )
-                elif ensure_top_result and best_below_threshold is None:
-                    # Track the best result below threshold (first one since LanceDB returns sorted)
-                    snapshot = self._record_to_snapshot( record )
-                    best_below_threshold = ( similarity_percent, snapshot )
+                print( f"[CODE-SIMILARITY] LanceDB returned {search_results.num_rows} raw results" )
+
+            # With dot metric: _distance = 1 - dot_product (lower = more similar)
+            # best_below_threshold is the best result that doesn't meet threshold (if ensure_top_result)
+            similar_snapshots, best_below_threshold = self._score_vector_results(
+                search_results,
+                threshold,
+                exclude_id_hash=exemplar_snapshot.id_hash if exclude_self else None,
+                ensure_top_result=ensure_top_result
+            )
 
             # Sort by similarity descending
             similar_snapshots.sort( key=lambda x: x[0], reverse=True )
@@ -1599,35 +1890,19 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             # Request extra results to account for self-exclusion
             effective_limit = ( limit + 1 ) if exclude_self else ( limit if limit > 0 else 100 )
 
-            search_results = self._table.search(
-                query_embedding,
-                vector_column_name="solution_embedding"
-            ).metric( "dot" ).nprobes( self._nprobes ).limit( effective_limit ).to_list()
+            search_results = self._vector_search( query_embedding, "solution_embedding", effective_limit )
 
             if debug:
-                print( f"[SOLUTION-SIMILARITY] LanceDB returned {len( search_results )} raw results" )
-
-            similar_snapshots = []
-            best_below_threshold = None  # Track best result that doesn't meet threshold
-
-            for record in search_results:
-                # Skip self if requested
-                if exclude_self and record.get( "id_hash" ) == exemplar_snapshot.id_hash:
-                    continue
-
-                # Extract distance and convert to similarity percentage
-                # With dot metric: _distance = 1 - dot_product (lower = more similar)
-                distance = record.get( "_distance", 0.0 )
-                similarity_percent = ( 1.0 - distance ) * 100
-
-                # Apply threshold filter
-                if similarity_percent >= threshold:
-                    snapshot = self._record_to_snapshot( record )
-                    similar_snapshots.append( ( similarity_percent, snapshot ) )
-                elif ensure_top_result and best_below_threshold is None:
-                    # Track the best result below threshold (first one since LanceDB returns sorted)
-                    snapshot = self._record_to_snapshot( record )
-                    best_below_threshold = ( similarity_percent, snapshot )
+                print( f"[SOLUTION-SIMILARITY] LanceDB returned {search_results.num_rows} raw results" )
+
+            # With dot metric: _distance = 1 - dot_product (lower = more similar)
+            # best_below_threshold is the best result that doesn't meet threshold (if ensure_top_result)
+            similar_snapshots, best_below_threshold = self._score_vector_results(
+                search_results,
+                threshold,
+                exclude_id_hash=exemplar_snapshot.id_hash if exclude_self else None,
+                ensure_top_result=ensure_top_result
+            )
 
             # Sort by similarity descending
             similar_snapshots.sort( key=lambda x: x[0], reverse=True )
@@ -1722,35 +1997,19 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
             # Request extra results to account for self-exclusion
             effective_limit = ( limit + 1 ) if exclude_self else ( limit if limit > 0 else 100 )
 
-            search_results = self._table.search(
-                query_embedding,
-                vector_column_name="solution_gist_embedding"
-            ).metric( "dot" ).nprobes( self._nprobes ).limit( effective_limit ).to_list()
+            search_results = self._vector_search( query_embedding, "solution_gist_embedding", effective_limit )
 
             if debug:
-                print( f"[GIST-SIMILARITY] LanceDB returned {len( search_results )} raw results" )
-
-            similar_snapshots = []
-            best_below_threshold = None  # Track best result that doesn't meet threshold
-
-            for record in search_results:
-                # Skip self if requested
-                if exclude_self and record.get( "id_hash" ) == exemplar_snapshot.id_hash:
-                    continue
-
-                # Extract distance and convert to similarity percentage
-                # With dot metric: _distance = 1 - dot_product (lower = more similar)
-                distance = record.get( "_distance", 0.0 )
-                similarity_percent = ( 1.0 - distance ) * 100
-
-                # Apply threshold filter
-                if similarity_percent >= threshold:
-                    snapshot = self._record_to_snapshot( record )
-                    similar_snapshots.append( ( similarity_percent, snapshot ) )
-                elif ensure_top_result and best_below_threshold is None:
-                    # Track the best result below threshold (first one since LanceDB returns sorted)
-                    snapshot = self._record_to_snapshot( record )
-                    best_below_threshold = ( similarity_percent, snapshot )
+                print( f"[GIST-SIMILARITY] LanceDB returned {search_results.num_rows} raw results" )
+
+            # With dot metric: _distance = 1 - dot_product (lower = more similar)
+            # best_below_threshold is the best result that doesn't meet threshold (if ensure_top_result)
+            similar_snapshots, best_below_threshold = self._score_vector_results(
+                search_results,
+                threshold,
+                exclude_id_hash=exemplar_snapshot.id_hash if exclude_self else None,
+                ensure_top_result=ensure_top_result
+            )
 
             # Sort by similarity descending
             similar_snapshots.sort( key=lambda x: x[0], reverse=True )
@@ -1850,7 +2109,12 @@ class LanceDBSolutionManager( SolutionSnapshotManagerInterface ):
                 "database_path": self.db_path,
                 "table_name": self.table_name,
                 "backend_type": "lancedb",
-                "last_updated": time.strftime( "%Y-%m-%d @ %H:%M:%S %Z" )
+                "last_updated": time.strftime( "%Y-%m-%d @ %H:%M:%S %Z" ),
+                "hydrated_records": len( self._record_cache ),
+                "record_cache_size": self._record_cache_size,
+                "record_cache_hits": self._record_cache_stats[ "hits" ],
+                "record_cache_misses": self._record_cache_stats[ "misses" ],
+                "vector_indexes": sorted( self._get_vector_index_names() )
             }
             
             if self.debug:
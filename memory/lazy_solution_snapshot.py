@@ -0,0 +1,120 @@
+"""
+SolutionSnapshot whose embedding vectors are loaded on first access.
+
+Vector searches return many rows, and converting seven 768/1536-float embedding
+columns into Python lists for every one of them dominated the per-result cost,
+even though callers mostly read question, answer and code. LanceDBSolutionManager
+builds these views from the non-embedding columns of an Arrow result and fetches
+the embeddings by id_hash only when something actually reads them.
+
+Design by Contract:
+    Requires:
+        - embedding_loader( id_hash ) returns the full stored row (or None)
+
+    Ensures:
+        - Every non-embedding field is set exactly as SolutionSnapshot.__init__ sets it
+        - Reading any embedding field loads all seven at once, then behaves like a plain attribute
+        - copy/pickle/to_jsons see a fully loaded snapshot
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from cosa.memory.solution_snapshot import SolutionSnapshot
+
+
+EMBEDDING_FIELDS = (
+    "question_embedding", "question_normalized_embedding", "question_gist_embedding",
+    "solution_embedding", "code_embedding", "thoughts_embedding", "solution_gist_embedding"
+)
+
+# Truthy stand-in so SolutionSnapshot.__init__ doesn't try to generate embeddings
+_PLACEHOLDER = [ 0.0 ]
+
+
+class LazySolutionSnapshot( SolutionSnapshot ):
+    """
+    Lightweight snapshot view with deferred embedding vectors.
+
+    Requires:
+        - kwargs are SolutionSnapshot constructor arguments without embeddings
+        - kwargs[ "id_hash" ] is the stored row's id_hash
+
+    Ensures:
+        - isinstance( view, SolutionSnapshot ) holds, so callers need no changes
+    """
+
+    def __init__( self, embedding_loader: Callable[[str], Optional[Dict[str, Any]]], **kwargs: Any ) -> None:
+        super().__init__( **{ field: _PLACEHOLDER for field in EMBEDDING_FIELDS }, **kwargs )
+
+        for field in EMBEDDING_FIELDS:
+            del self.__dict__[ field ]
+
+        self._embedding_source_id = self.id_hash
+        self._embedding_loader    = embedding_loader
+
+    def __getattr__( self, name: str ) -> Any:
+        # Only reached when normal lookup fails, i.e. for embeddings not loaded yet
+        if name in EMBEDDING_FIELDS and "_embedding_loader" in self.__dict__:
+            self._load_embeddings()
+            return self.__dict__[ name ]
+        raise AttributeError( f"'{type( self ).__name__}' object has no attribute '{name}'" )
+
+    def __getstate__( self ) -> Dict[str, Any]:
+        self._load_embeddings()
+        return self.__dict__.copy()
+
+    def is_hydrated( self ) -> bool:
+        """Return True once the embedding vectors have been loaded."""
+        return "_embedding_loader" not in self.__dict__
+
+    def to_jsons( self, verbose: bool = True ) -> str:
+        self._load_embeddings()
+        return super().to_jsons( verbose=verbose )
+
+    def _load_embeddings( self ) -> None:
+        """
+        Fetch all embedding vectors from the loader.
+
+        Ensures:
+            - Fields already assigned by callers are kept
+            - Missing vectors (row deleted meanwhile) become empty lists
+            - The loader reference is dropped afterwards
+        """
+        loader = self.__dict__.pop( "_embedding_loader", None )
+        if loader is None: return
+
+        record = loader( self.__dict__.pop( "_embedding_source_id", self.id_hash ) ) or { }
+        for field in EMBEDDING_FIELDS:
+            if field not in self.__dict__:
+                value = record.get( field )
+                self.__dict__[ field ] = list( value ) if value is not None else [ ]
+
+
+def quick_smoke_test():
+    """Quick smoke test for LazySolutionSnapshot functionality."""
+    import cosa.utils.util as du
+
+    du.print_banner( "LazySolutionSnapshot Smoke Test", prepend_nl=True )
+
+    try:
+        calls  = [ ]
+        stored = { field: [ 0.5 ] * 4 for field in EMBEDDING_FIELDS }
+
+        def loader( id_hash ):
+            calls.append( id_hash )
+            return stored
+
+        snapshot = LazySolutionSnapshot( loader, question="what time is it", id_hash="smoke-test-hash", answer="noon" )
+        print( f"✓ Built view, hydrated: {snapshot.is_hydrated()}, loader calls: {len( calls )}" )
+
+        print( f"✓ Embedding length on first read: {len( snapshot.code_embedding )}" )
+        print( f"✓ Hydrated: {snapshot.is_hydrated()}, loader calls: {calls}" )
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="lazy_solution_snapshot.quick_smoke_test()" )
+
+    print( "\n✓ LazySolutionSnapshot smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
@@ -1,5 +1,6 @@
 import spacy
 import re
+from collections import OrderedDict
 from threading import Lock
 
 import cosa.utils.util as du
@@ -19,6 +20,7 @@ class Normalizer:
         - Removes filler words and expands contractions
         - Preserves sentence boundaries
         - Maintains singleton instance
+        - Repeated normalize() calls for the same text are served from an in-process LRU
     """
     
     _instance = None
@@ -111,6 +113,19 @@ class Normalizer:
     # These are punctuation in spaCy but carry semantic meaning in queries
     MATH_OPERATORS = {'+', '-', '*', '/', '=', '>', '<', '>=', '<=', '!=', '==', '%', '^', '(', ')'}
 
+    # Digit-operator-digit runs that get spaces around the operator ("2+2" -> "2 + 2")
+    MATH_SPACING_PATTERN = re.compile( r'(\d)([+\-*/=<>])(\d)' )
+
+    # One alternation over every contraction, longest first so no key can shadow a longer one
+    CONTRACTIONS_PATTERN = re.compile(
+        r'\b(?:' + '|'.join( re.escape( c ) for c in sorted( CONTRACTIONS, key=len, reverse=True ) ) + r')\b',
+        re.IGNORECASE
+    )
+
+    # Pipeline components normalize() reads from: tokens, POS tags and lemmas.
+    # Everything else (parser, ner, ...) is disabled; a rule-based sentencizer supplies doc.sents.
+    REQUIRED_PIPES = { "transformer", "tok2vec", "tagger", "morphologizer", "attribute_ruler", "lemmatizer" }
+
     def __new__( cls ):
         """
         Create or return singleton instance.
@@ -160,14 +175,22 @@ class Normalizer:
             self.nlp = spacy.load( model_name )
             # Disable unnecessary pipeline components for speed
             # Only disable components that actually exist in the pipeline
-            components_to_disable = []
-            if 'ner' in self.nlp.pipe_names:
-                components_to_disable.append( 'ner' )
-            if 'textcat' in self.nlp.pipe_names:
-                components_to_disable.append( 'textcat' )
+            components_to_disable = [ name for name in self.nlp.pipe_names if name not in self.REQUIRED_PIPES ]
             
             if components_to_disable:
                 self.nlp.disable_pipes( components_to_disable )
+
+            # doc.sents came from the parser; the sentencizer sets the same boundaries from punctuation
+            if "sentencizer" not in self.nlp.pipe_names:
+                self.nlp.add_pipe( "sentencizer" )
+
+            if self.debug: print( f"spaCy pipeline: {self.nlp.pipe_names} (disabled: {components_to_disable})" )
+
+            # LRU of normalize() results; size 0 disables it
+            self._cache_size  = max( 0, self._config_mgr.get( "normalizer cache size", 2048, return_type="int" ) )
+            self._cache       = OrderedDict()
+            self._cache_lock  = Lock()
+            self._cache_stats = { "hits": 0, "misses": 0 }
                 
             self._initialized = True
             
@@ -187,16 +210,11 @@ class Normalizer:
             - text is a string
             
         Ensures:
-            - Returns text with contractions expanded
-            - Preserves original capitalization where possible
+            - Returns text with contractions expanded (whole words, case-insensitive)
+            - Expansions are lowercase; the rest of the text keeps its capitalization
+            - Single pass over the text with the precompiled CONTRACTIONS_PATTERN
         """
-        # Create a pattern that matches whole words only
-        for contraction, expansion in self.CONTRACTIONS.items():
-            # Case-insensitive replacement while preserving original case pattern
-            pattern = re.compile( r'\b' + re.escape( contraction ) + r'\b', re.IGNORECASE )
-            text = pattern.sub( expansion, text )
-            
-        return text
+        return self.CONTRACTIONS_PATTERN.sub( lambda match: self.CONTRACTIONS[ match.group( 0 ).lower() ], text )
     
     def remove_filler_words( self, doc ):
         """
@@ -234,20 +252,99 @@ class Normalizer:
               - Lemmatized words
               - Lowercase
               - Preserved sentence boundaries
+            - Results are cached by input text (LRU of "normalizer cache size" entries)
         """
         if not text or not text.strip():
             return ""
-            
+
+        result = self._cache_get( text )
+        if result is not None: return result
+
         if self.debug and self.verbose: print( f"Normalizing: {text[:50]}..." )
         
         # Step 1: Expand contractions
-        text = self.expand_contractions( text )
-        if self.debug and self.verbose: print( f"After contractions: {text}" )
+        expanded = self.expand_contractions( text )
+        if self.debug and self.verbose: print( f"After contractions: {expanded}" )
+        
+        # Step 2: Process with spaCy, then turn the tokens into text
+        result = self._normalize_doc( self.nlp( expanded.lower() ) )
+
+        if self.debug and self.verbose: print( f"Normalized result: {result}" )
+
+        self._cache_put( text, result )
+
+        return result
+
+    def normalize_many( self, texts, batch_size=64, n_process=1 ):
+        """
+        Normalize many texts through spaCy's nlp.pipe(), with output identical to normalize().
         
-        # Step 2: Process with spaCy
-        doc = self.nlp( text.lower() )
+        Requires:
+            - texts is an iterable of strings
+            - n_process > 1 only where spaCy multiprocessing is available (it forks worker processes)
+            
+        Ensures:
+            - Returns [ normalize( text ) for text in texts ], in input order
+            - Blank texts map to "" and cached texts skip spaCy entirely
+            - Duplicate texts go through spaCy once
+            - Texts are expanded lazily as nlp.pipe() consumes them, batch_size at a time
+            - Newly normalized texts are added to the normalize() LRU
+        """
+        texts   = list( texts )
+        results = [ "" ] * len( texts )
+        pending = { }   # text -> positions waiting for spaCy, in first-seen order
+
+        for index, text in enumerate( texts ):
+            if not text or not text.strip(): continue
+            result = self._cache_get( text )
+            if result is not None:
+                results[ index ] = result
+            else:
+                pending.setdefault( text, [ ] ).append( index )
+
+        if not pending: return results
+
+        if self.verbose: du.print_banner( f"Normalizing {len( pending )} texts (batch_size={batch_size}, n_process={n_process})" )
+
+        docs = self.nlp.pipe( ( self.expand_contractions( text ).lower() for text in pending ), batch_size=batch_size, n_process=n_process )
+        for ( text, indexes ), doc in zip( pending.items(), docs ):
+            result = self._normalize_doc( doc )
+            self._cache_put( text, result )
+            for index in indexes:
+                results[ index ] = result
+
+        return results
+
+    def normalize_batch( self, texts ):
+        """
+        Normalize multiple texts efficiently.
         
-        # Step 3: Process sentences to preserve boundaries
+        Requires:
+            - texts is a list of strings
+            
+        Ensures:
+            - Returns list of normalized texts, each identical to normalize( text )
+            - Kept for existing callers; delegates to normalize_many()
+        """
+        return self.normalize_many( texts )
+
+    def get_cache_stats( self ):
+        """Return normalize() LRU hit and miss counters plus the current entry count."""
+        with self._cache_lock:
+            return { **self._cache_stats, "size": len( self._cache ) }
+
+    def _normalize_doc( self, doc ):
+        """
+        Turn a processed spaCy Doc into normalized text; shared by normalize() and normalize_many().
+        
+        Requires:
+            - doc came from self.nlp on contraction-expanded, lowercased text
+            
+        Ensures:
+            - Filler words and punctuation (except math operators) are dropped
+            - Content words are lemmatized, everything else kept as written
+            - Sentences are joined with single spaces; "2+2" becomes "2 + 2"
+        """
         normalized_sentences = []
         
         for sent in doc.sents:
@@ -273,54 +370,27 @@ class Normalizer:
         result = ' '.join( normalized_sentences )
 
         # Ensure consistent spacing around math operators (handles cases like "2+2" -> "2 + 2")
-        result = re.sub( r'(\d)([+\-*/=<>])(\d)', r'\1 \2 \3', result )
+        return self.MATH_SPACING_PATTERN.sub( r'\1 \2 \3', result )
 
-        if self.debug and self.verbose: print( f"Normalized result: {result}" )
+    def _cache_get( self, text ):
+        """Return the cached normalization of text (marking it recently used), or None."""
+        with self._cache_lock:
+            result = self._cache.get( text )
+            if result is not None:
+                self._cache.move_to_end( text )
+                self._cache_stats[ "hits" ] += 1
+            else:
+                self._cache_stats[ "misses" ] += 1
+            return result
 
-        return result
-    
-    def normalize_batch( self, texts ):
-        """
-        Normalize multiple texts efficiently.
-        
-        Requires:
-            - texts is a list of strings
-            
-        Ensures:
-            - Returns list of normalized texts
-            - Processes texts in batch for efficiency
-        """
-        if self.verbose: du.print_banner( f"Batch normalizing {len(texts)} texts" )
-        
-        # Expand contractions first
-        expanded_texts = [ self.expand_contractions( text ) for text in texts ]
-        
-        # Process with spaCy pipe for efficiency
-        normalized_texts = []
-        
-        for doc in self.nlp.pipe( expanded_texts, batch_size=50 ):
-            # Same normalization logic as single normalize
-            normalized_sentences = []
-            
-            for sent in doc.sents:
-                sent_tokens = []
-                
-                for token in sent:
-                    if token.text.lower() not in self.FILLER_WORDS and not token.is_punct:
-                        if token.pos_ in ['NOUN', 'VERB', 'ADJ', 'ADV']:
-                            sent_tokens.append( token.lemma_ )
-                        else:
-                            sent_tokens.append( token.text )
-                    elif token.is_punct and token.text in '.!?':
-                        if sent_tokens:
-                            sent_tokens[-1] += token.text
-                            
-                if sent_tokens:
-                    normalized_sentences.append( ' '.join( sent_tokens ) )
-            
-            normalized_texts.append( ' '.join( normalized_sentences ) )
-        
-        return normalized_texts
+    def _cache_put( self, text, result ):
+        """Remember a normalization, evicting the least recently used entries past the size limit."""
+        if not self._cache_size: return
+        with self._cache_lock:
+            self._cache[ text ] = result
+            self._cache.move_to_end( text )
+            while len( self._cache ) > self._cache_size:
+                self._cache.popitem( last=False )
 
 
 def quick_smoke_test():
@@ -355,10 +425,12 @@ def quick_smoke_test():
         
         # Test batch processing
         du.print_banner( "Testing batch normalization..." )
-        batch_results = norm1.normalize_batch( test_cases[:-1] )  # Exclude empty string
+        batch_results = norm1.normalize_many( test_cases )
         for original, normalized in zip( test_cases[:-1], batch_results ):
             print( f"\nOriginal: {original}" )
             print( f"Normalized: {normalized}" )
+        assert batch_results == [ norm1.normalize( text ) for text in test_cases ], "normalize_many() differs from normalize()"
+        print( "\n✓ normalize_many() matches normalize()" )
         
         print( "\n✓ All smoke tests passed!" )
         
@@ -1,6 +1,7 @@
 import cosa.utils.util as du
 from cosa.memory.embedding_manager import EmbeddingManager
 from cosa.memory.embedding_provider import get_embedding_provider
+from cosa.memory.lancedb_exact_lookup import ExactMatchLookup, ensure_scalar_index
 
 from cosa.config.configuration_manager import ConfigurationManager
 from cosa.utils.util_stopwatch import Stopwatch
@@ -71,6 +72,10 @@ class QuestionEmbeddingsTable():
         self._create_table_if_needed( db )
 
         self._question_embeddings_tbl = db.open_table( "question_embeddings_tbl" )
+
+        # Tables created with the old FTS index are migrated to BTREE here; others get refreshed
+        ensure_scalar_index( self._question_embeddings_tbl, "question", debug=self.debug )
+        self._lookup = ExactMatchLookup( self._question_embeddings_tbl )
         
         print( f"Opened question_embeddings_tbl w/ [{self._question_embeddings_tbl.count_rows()}] rows" )
 
@@ -116,7 +121,7 @@ class QuestionEmbeddingsTable():
 
         Ensures:
             - Creates table with proper schema if it doesn't exist
-            - Creates FTS index on question field
+            - Creates BTREE index on question field
             - No-op if table already exists
 
         Raises:
@@ -132,11 +137,10 @@ class QuestionEmbeddingsTable():
             ] )
 
             self._question_embeddings_tbl = db.create_table( "question_embeddings_tbl", schema=schema, mode="overwrite" )
-            self._question_embeddings_tbl.create_fts_index( "question", replace=True )
+            ensure_scalar_index( self._question_embeddings_tbl, "question", debug=self.debug )
 
             if self.debug:
                 print( f"✓ Created question_embeddings_tbl with schema: {schema}" )
-                print( f"✓ Created FTS index on question field" )
 
     def has( self, question: str ) -> bool:
         """
@@ -156,12 +160,10 @@ class QuestionEmbeddingsTable():
         """
         if self.debug and self.verbose: timer = Stopwatch( msg=f"has( '{question}' )" )
         if self.debug and self.verbose: du.print_banner( f"[{question}]" )
-        # Escape single quotes by doubling them to prevent SQL parsing errors
-        escaped_question = question.replace( "'", "''" )
-        synonyms = self._question_embeddings_tbl.search().where( f"question = '{escaped_question}'" ).limit( 1 ).select( [ "question" ] ).to_list()
+        row = self._lookup.first( "question", question, columns=[ "question" ] )
         if self.debug and self.verbose: timer.print( "Done!", use_millis=True )
         
-        return len( synonyms ) > 0
+        return row is not None
     
     def get_embedding( self, question: str ) -> list[float]:
         """
@@ -182,18 +184,16 @@ class QuestionEmbeddingsTable():
         """
         if self.debug: timer = Stopwatch( msg=f"get_embedding( '{question}' )", silent=True )
         try:
-            # Escape single quotes by doubling them to prevent SQL parsing errors
-            escaped_question = question.replace( "'", "''" )
-            rows_returned = self._question_embeddings_tbl.search().where( f"question = '{escaped_question}'" ).limit( 1 ).select( [ "embedding" ] ).to_list()
+            row = self._lookup.first( "question", question, columns=[ "embedding" ] )
         except Exception as e:
             du.print_stack_trace( e, explanation="search() failed", caller="QuestionEmbeddingsTable.get_embedding()" )
-            rows_returned = []
-        if self.debug: timer.print( f"Done! w/ {len( rows_returned )} rows returned", use_millis=True )
+            row = None
+        if self.debug: timer.print( f"Done! w/ {int( row is not None )} rows returned", use_millis=True )
         
-        if not rows_returned:
+        if row is None:
             return self._embedding_provider.generate_embedding( question, content_type="prose" )
         else:
-            return rows_returned[ 0 ][ "embedding"]
+            return row[ "embedding" ]
         
     def add_embedding( self, question: str, embedding: list[float] ) -> None:
         """
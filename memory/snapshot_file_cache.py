@@ -0,0 +1,272 @@
+"""
+Persistent load cache for FileBasedSolutionManager snapshot files.
+
+Every startup used to json.load() every snapshot file, most of whose bytes are
+seven long float lists. This cache keeps, next to the snapshot directory:
+
+    .snapshot-cache/manifest.json   one entry per snapshot file:
+                                    ( mtime_ns, size, sha256, non-embedding record )
+    .snapshot-cache/<name>.npy      the file's embeddings as one float64 vector
+
+so a restart only re-parses files whose stat or content changed, and unchanged
+files are rebuilt from a small JSON record plus a binary sidecar.
+
+Design by Contract:
+    Requires:
+        - directory is the snapshot directory (JSON files live directly in it)
+
+    Ensures:
+        - lookup() returns exactly the fields json.load() would, or None on any mismatch;
+          embeddings keep json.load()'s float64 precision, so a cache hit never rounds a
+          vector that might later be written back to the snapshot file
+        - Files with a new mtime but identical content (sha256) are still served from cache
+        - Cache write failures never break loading; they only disable the cache
+        - Thread-safe: lookup() and store() can be called from a loader thread pool
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+import cosa.utils.util as du
+
+
+EMBEDDING_FIELDS = (
+    "question_embedding", "question_normalized_embedding", "question_gist_embedding",
+    "solution_embedding", "code_embedding", "thoughts_embedding", "solution_gist_embedding"
+)
+
+
+class SnapshotFileCache:
+    """
+    Manifest + .npy sidecar cache for parsed snapshot files.
+
+    Requires:
+        - Snapshot files are JSON objects as written by FileBasedSolutionManager
+
+    Ensures:
+        - Embeddings are stored as float64, the precision json.load() parses them at
+        - save() writes the manifest atomically and only when something changed
+    """
+
+    CACHE_DIR_NAME   = ".snapshot-cache"
+    MANIFEST_NAME    = "manifest.json"
+    # 2: float64 sidecars; version 1 sidecars held float32-rounded embeddings
+    MANIFEST_VERSION = 2
+
+    def __init__( self, directory: str, debug: bool = False, verbose: bool = False ) -> None:
+        """
+        Open (or start) the cache for a snapshot directory.
+
+        Ensures:
+            - Unreadable or outdated manifests are treated as empty
+        """
+        self.debug         = debug
+        self.verbose       = verbose
+        self.cache_dir     = os.path.join( directory, self.CACHE_DIR_NAME )
+        self.manifest_path = os.path.join( self.cache_dir, self.MANIFEST_NAME )
+
+        self._lock     = threading.Lock()
+        self._dirty    = False
+        self._writable = True
+        self._entries  = self._read_manifest()
+
+    def __len__( self ) -> int:
+        return len( self._entries )
+
+    def lookup( self, filename: str, json_path: str, stat: os.stat_result ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached field dict for a snapshot file, or None if it must be re-parsed.
+
+        Requires:
+            - stat is os.stat( json_path )
+
+        Ensures:
+            - Hit when ( mtime_ns, size ) match, or size matches and the sha256 is unchanged
+            - Returns a fresh dict (safe for the caller to mutate)
+        """
+        with self._lock:
+            entry = self._entries.get( filename )
+        if entry is None: return None
+
+        if ( entry[ "mtime_ns" ], entry[ "size" ] ) != ( stat.st_mtime_ns, stat.st_size ):
+            if entry[ "size" ] != stat.st_size: return None
+            with open( json_path, "rb" ) as file:
+                if file_sha256( file.read() ) != entry[ "sha256" ]: return None
+            with self._lock:
+                entry[ "mtime_ns" ] = stat.st_mtime_ns
+                self._dirty = True
+
+        try:
+            data = json.loads( entry[ "record" ] )
+            if entry[ "embedding_lengths" ]:
+                vector  = np.load( os.path.join( self.cache_dir, entry[ "sidecar" ] ), allow_pickle=False )
+                lengths = entry[ "embedding_lengths" ]
+                if vector.size != sum( lengths.values() ): return None
+
+                offset = 0
+                for field, length in lengths.items():
+                    data[ field ] = vector[ offset:offset + length ].tolist()
+                    offset += length
+        except ( OSError, ValueError ) as e:
+            if self.debug: print( f"SnapshotFileCache: sidecar for [{filename}] unusable, re-parsing: {e}" )
+            return None
+
+        return data
+
+    def store( self, filename: str, stat: os.stat_result, raw: bytes, data: Dict[str, Any] ) -> None:
+        """
+        Record a freshly parsed snapshot file.
+
+        Requires:
+            - raw is the file content data was parsed from
+
+        Ensures:
+            - List-valued embedding fields go to the sidecar, everything else to the manifest record
+            - data itself is not modified
+        """
+        if not self._writable: return
+
+        lengths = { }
+        vectors = [ ]
+        record  = { }
+        for field, value in data.items():
+            vector = _as_flat_vector( value ) if field in EMBEDDING_FIELDS else None
+            if vector is not None:
+                lengths[ field ] = vector.size
+                vectors.append( vector )
+            else:
+                record[ field ] = value
+
+        sidecar = os.path.splitext( filename )[ 0 ] + ".npy"
+
+        try:
+            if lengths:
+                os.makedirs( self.cache_dir, exist_ok=True )
+                temp_path = os.path.join( self.cache_dir, f".{sidecar}.{threading.get_ident()}.tmp" )
+                with open( temp_path, "wb" ) as file:
+                    np.save( file, np.concatenate( vectors ), allow_pickle=False )
+                os.replace( temp_path, os.path.join( self.cache_dir, sidecar ) )
+            entry = {
+                "mtime_ns"         : stat.st_mtime_ns,
+                "size"             : stat.st_size,
+                "sha256"           : file_sha256( raw ),
+                "sidecar"          : sidecar,
+                "embedding_lengths": lengths,
+                "record"           : json.dumps( record )
+            }
+        except ( OSError, TypeError, ValueError ) as e:
+            if self.debug: print( f"SnapshotFileCache: not caching [{filename}]: {e}" )
+            if isinstance( e, OSError ): self._writable = False
+            return
+
+        with self._lock:
+            self._entries[ filename ] = entry
+            self._dirty = True
+
+    def prune( self, live_filenames: Iterable[str] ) -> int:
+        """
+        Drop entries (and sidecars) for snapshot files that no longer exist.
+
+        Ensures:
+            - Returns the number of entries removed
+        """
+        live = set( live_filenames )
+        with self._lock:
+            stale = [ filename for filename in self._entries if filename not in live ]
+            for filename in stale:
+                entry = self._entries.pop( filename )
+                try:
+                    os.remove( os.path.join( self.cache_dir, entry[ "sidecar" ] ) )
+                except OSError:
+                    pass
+            if stale: self._dirty = True
+
+        return len( stale )
+
+    def save( self ) -> None:
+        """
+        Persist the manifest if it changed.
+
+        Ensures:
+            - Atomic replace, so a crash never leaves a half-written manifest
+            - Write failures are reported in debug mode and otherwise ignored
+        """
+        with self._lock:
+            if not self._dirty or not self._writable: return
+            manifest = { "version": self.MANIFEST_VERSION, "files": self._entries }
+
+            try:
+                os.makedirs( self.cache_dir, exist_ok=True )
+                temp_path = self.manifest_path + ".tmp"
+                with open( temp_path, "w" ) as file:
+                    json.dump( manifest, file )
+                os.replace( temp_path, self.manifest_path )
+                self._dirty = False
+            except OSError as e:
+                if self.debug: print( f"SnapshotFileCache: failed to write manifest: {e}" )
+
+    def _read_manifest( self ) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open( self.manifest_path, "r" ) as file:
+                manifest = json.load( file )
+        except ( OSError, ValueError ):
+            return { }
+
+        if manifest.get( "version" ) != self.MANIFEST_VERSION: return { }
+        return manifest.get( "files", { } )
+
+
+def _as_flat_vector( value: Any ) -> Optional[np.ndarray]:
+    """Return a list of numbers as a 1-D float64 array, or None if it isn't one."""
+    if not isinstance( value, list ): return None
+    try:
+        vector = np.asarray( value, dtype=np.float64 )
+    except ( TypeError, ValueError ):
+        return None
+    return vector if vector.ndim == 1 else None
+
+
+def file_sha256( raw: bytes ) -> str:
+    """Return the hex SHA-256 of a file's bytes."""
+    return hashlib.sha256( raw ).hexdigest()
+
+
+def quick_smoke_test():
+    """Quick smoke test for SnapshotFileCache functionality."""
+    import tempfile
+
+    du.print_banner( "SnapshotFileCache Smoke Test", prepend_nl=True )
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = os.path.join( temp_dir, "what-time-is-it-0.json" )
+            data      = { "question": "what time is it", "question_embedding": [ 0.5, 0.25, 0.125 ], "code": [ "print( 1 )" ] }
+            raw       = json.dumps( data ).encode( "utf-8" )
+            with open( json_path, "wb" ) as file:
+                file.write( raw )
+
+            cache = SnapshotFileCache( temp_dir, debug=True )
+            cache.store( "what-time-is-it-0.json", os.stat( json_path ), raw, data )
+            cache.save()
+            print( f"✓ Stored {len( cache )} entry" )
+
+            reopened = SnapshotFileCache( temp_dir )
+            print( f"✓ Round trip equal: {reopened.lookup( 'what-time-is-it-0.json', json_path, os.stat( json_path ) ) == data}" )
+
+            with open( json_path, "wb" ) as file:
+                file.write( raw.replace( b"time", b"date" ) )
+            print( f"✓ Changed file is a miss: {reopened.lookup( 'what-time-is-it-0.json', json_path, os.stat( json_path ) ) is None}" )
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="snapshot_file_cache.quick_smoke_test()" )
+
+    print( "\n✓ SnapshotFileCache smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
@@ -6,6 +6,7 @@ manager implementations based on configuration, enabling runtime switching betwe
 file-based and LanceDB backends.
 """
 
+import os
 from enum import Enum
 from typing import Union, Dict, Any, List
 import cosa.utils.util as du
@@ -208,10 +209,13 @@ class SolutionSnapshotManagerFactory:
         Expected Config Keys:
             - "solution snapshots manager type": "file_based" or "lancedb"
             - "solution snapshots file based path": Path for file-based storage (file_based only)
+            - "solution snapshots file based load workers": Startup loader threads (file_based only, defaults to 8)
+            - "solution snapshots file based enable load cache": Manifest + .npy sidecar cache (file_based only, defaults to True)
             - "storage_backend": "local" or "gcs" (lancedb only, defaults to "local")
             - "solution snapshots lancedb path": Local DB path (lancedb with backend=local)
             - "solution snapshots lancedb gcs uri": GCS URI (lancedb with backend=gcs)
             - "solution snapshots lancedb table": Table name (lancedb only)
+            - "solution snapshots lancedb record cache size": Full rows kept hydrated in memory (lancedb only, defaults to 256)
             
         Raises:
             - ValueError if manager type not configured or invalid
@@ -230,6 +234,10 @@ class SolutionSnapshotManagerFactory:
                 "path": config_mgr.get( "solution snapshots file based path" ),
                 "enable_performance_monitoring": config_mgr.get( 
                     "solution snapshots enable performance monitoring", default=True, return_type="boolean"
+                ),
+                "load_workers": config_mgr.get( "solution snapshots file based load workers", default=min( 8, os.cpu_count() or 1 ), return_type="int" ),
+                "enable_load_cache": config_mgr.get(
+                    "solution snapshots file based enable load cache", default=True, return_type="boolean"
                 )
             }
             
@@ -244,6 +252,15 @@ class SolutionSnapshotManagerFactory:
                 "storage_backend": storage_backend,
                 "table_name": config_mgr.get( "solution snapshots lancedb table" ),
                 "nprobes": config_mgr.get( "solution snapshots lancedb nprobes", default=20, return_type="int" ),
+                "record_cache_size": config_mgr.get( "solution snapshots lancedb record cache size", default=256, return_type="int" ),
+                "refine_factor": config_mgr.get( "solution snapshots lancedb refine factor", default=20, return_type="int" ),
+                "vector_index_min_rows": config_mgr.get( "solution snapshots lancedb vector index min rows", default=10000, return_type="int" ),
+                "vector_index_rebuild_fraction": config_mgr.get(
+                    "solution snapshots lancedb vector index rebuild fraction", default=0.2, return_type="float"
+                ),
+                "vector_index_on_init": config_mgr.get(
+                    "solution snapshots lancedb vector index on init", default=False, return_type="boolean"
+                ),
                 "enable_performance_monitoring": config_mgr.get(
                     "solution snapshots enable performance monitoring", default=True, return_type="boolean"
                 )
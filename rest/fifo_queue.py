@@ -1,6 +1,8 @@
+from bisect import bisect_left, insort
 from collections import OrderedDict
 from typing import Any, Optional
 import re
+import threading
 from cosa.rest.queue_extensions import user_job_tracker
 from cosa.rest.queue_protocol import is_queueable_job
 
@@ -17,8 +19,18 @@ class FifoQueue:
     First-In-First-Out queue implementation with dictionary lookup.
     
     This class provides a FIFO queue with additional features for tracking
-    blocking objects, focus mode, and job acceptance states. Items are
-    stored in both a list (for ordering) and dictionary (for O(1) lookup).
+    blocking objects, focus mode, and job acceptance states. Items live in a
+    single ordered index (queue_dict, id_hash -> item) that serves both FIFO
+    order and O(1) lookup, plus a user_id -> ordered id_hash secondary index
+    so per-user listing costs O(jobs of that user). All queue state is guarded
+    by an internal re-entrant lock.
+    
+    Position lookup uses a push sequence number per item and a sorted list of
+    the sequence numbers removed from ahead of the tail ("holes"), so it is
+    O(log holes) -- effectively O(1) for FIFO traffic.
+    
+    With attach_wal() the queue also logs its pushes and removals to a
+    write-ahead log and restores its contents from it at startup.
     """
     
     def __init__( self, websocket_mgr: Optional[Any] = None, queue_name: Optional[str] = None, emit_enabled: bool = True ) -> None:
@@ -31,7 +43,7 @@ class FifoQueue:
             - emit_enabled is a boolean to control auto-emission
             
         Ensures:
-            - Creates empty queue_list and queue_dict
+            - Creates empty ordered index (queue_dict) and per-user index
             - Initializes push_counter to 0
             - Sets accepting_jobs to True
             - Sets focus_mode to True
@@ -42,9 +54,19 @@ class FifoQueue:
             - None
         """
         
-        self.queue_list      = [ ]
         self.queue_dict      = OrderedDict()
         self.push_counter    = 0
+        self._lock           = threading.RLock()
+        # user_id -> OrderedDict of id_hash -> None, in queue order
+        self._user_index     = { }
+        self._item_user      = { }
+        # id_hash -> push sequence number, plus the sorted sequence numbers removed ahead of the tail
+        self._seq            = { }
+        self._next_seq       = 0
+        self._holes          = [ ]
+        # optional write-ahead log (see attach_wal)
+        self._wal            = None
+        self._wal_name       = None
         self.last_queue_size = 0
         # used to track if the queue is accepting jobs or not, especially important when we're running in focus versus multi tasking mode
         self._accepting_jobs  = True
@@ -131,6 +153,181 @@ class FifoQueue:
     # def set_accepting_jobs( self, accepting_jobs ):
     #     self.accepting_jobs = accepting_jobs
     
+    @property
+    def queue_list( self ) -> list[Any]:
+        """
+        Snapshot of the queued items in FIFO order.
+
+        Kept for callers that index or iterate the queue as a list. Building it
+        is O(n); use head(), get_position() or get_jobs_for_user() on hot paths.
+
+        Requires:
+            - None
+
+        Ensures:
+            - Returns a new list; mutating it does not affect the queue
+
+        Raises:
+            - None
+        """
+        with self._lock:
+            return list( self.queue_dict.values() )
+
+    def _get_user_key( self, item: Any ) -> Optional[str]:
+        """
+        Resolve the user an item is indexed under.
+
+        Requires:
+            - item has an id_hash attribute
+
+        Ensures:
+            - Returns the UserJobTracker association if there is one
+            - Otherwise returns item.user_id (or None)
+
+        Raises:
+            - None
+        """
+        return self.user_job_tracker.get_user_for_job( item.id_hash ) or getattr( item, "user_id", None )
+
+    def _add_item( self, item: Any, index: Optional[int] = None ) -> None:
+        """
+        Index an item at the tail, or at a given position, and count the push.
+
+        Requires:
+            - item has an id_hash attribute
+            - index is None or a non-negative int
+
+        Ensures:
+            - An item already queued under the same id_hash is replaced
+            - Appending is O(1); inserting ahead of the tail re-indexes the queue (O(n))
+            - push_counter is incremented
+            - The push is logged to the attached WAL, if any
+
+        Raises:
+            - None
+        """
+        with self._lock:
+            id_hash = item.id_hash
+            if id_hash in self.queue_dict:
+                self._remove_item( id_hash )
+
+            self.queue_dict[ id_hash ] = item
+            user_id = self._get_user_key( item )
+            if user_id is not None:
+                self._item_user[ id_hash ] = user_id
+                self._user_index.setdefault( user_id, OrderedDict() )[ id_hash ] = None
+
+            if index is not None and index < len( self.queue_dict ) - 1:
+                for key in list( self.queue_dict.keys() )[ index:-1 ]:
+                    self.queue_dict.move_to_end( key )
+                self._reindex()
+            else:
+                self._seq[ id_hash ] = self._next_seq
+                self._next_seq += 1
+
+            self.push_counter += 1
+            if self._wal is not None: self._wal.append( self._wal_name, "push", item )
+
+    def _remove_item( self, id_hash: str ) -> Any:
+        """
+        Remove an item from the ordered index and every secondary index.
+
+        Requires:
+            - id_hash is in queue_dict
+            - Caller holds self._lock
+
+        Ensures:
+            - Returns the removed item
+            - Removing the head prunes holes that are no longer ahead of it
+            - Removing any other item records its sequence number as a hole
+            - The removal is logged to the attached WAL, if any
+
+        Raises:
+            - KeyError if id_hash is not queued
+        """
+        was_head = next( iter( self.queue_dict ) ) == id_hash
+        item     = self.queue_dict.pop( id_hash )
+        seq      = self._seq.pop( id_hash )
+
+        user_id = self._item_user.pop( id_hash, None )
+        if user_id is not None:
+            user_jobs = self._user_index.get( user_id )
+            if user_jobs is not None:
+                user_jobs.pop( id_hash, None )
+                if not user_jobs: del self._user_index[ user_id ]
+
+        if not self.queue_dict:
+            self._holes.clear()
+        elif was_head:
+            head_seq = self._seq[ next( iter( self.queue_dict ) ) ]
+            del self._holes[ :bisect_left( self._holes, head_seq ) ]
+        else:
+            insort( self._holes, seq )
+
+        if self._wal is not None: self._wal.append( self._wal_name, "remove", id_hash=id_hash )
+        return item
+
+    def _reindex( self ) -> None:
+        """
+        Rebuild sequence numbers and per-user order from queue_dict (O(n)).
+
+        Requires:
+            - Caller holds self._lock
+
+        Ensures:
+            - Sequence numbers follow queue order with no holes
+            - Each user's id_hash index follows queue order
+
+        Raises:
+            - None
+        """
+        self._seq        = { id_hash: seq for seq, id_hash in enumerate( self.queue_dict ) }
+        self._next_seq   = len( self._seq )
+        self._holes      = [ ]
+        self._user_index = { }
+        for id_hash in self.queue_dict:
+            user_id = self._item_user.get( id_hash )
+            if user_id is not None:
+                self._user_index.setdefault( user_id, OrderedDict() )[ id_hash ] = None
+
+    def attach_wal( self, wal: Any, replay: bool = True, name: Optional[str] = None ) -> list[dict[str, Any]]:
+        """
+        Start logging this queue to a write-ahead log, replaying what it held before.
+
+        Requires:
+            - wal is a QueueWriteAheadLog (cosa.rest.queue_wal)
+            - name or queue_name identifies this queue uniquely within the WAL
+            - Called at startup, before producers and consumers start
+
+        Ensures:
+            - When replay is True, items the queue held at the last shutdown or crash are
+              pushed back in their original order (without being logged a second time)
+              and re-associated with their users in UserJobTracker
+            - Every later push, remove and clear is logged
+            - Returns the surviving jobs that could not be restored ( id_hash, user_id, question )
+
+        Raises:
+            - ValueError if neither name nor queue_name is set
+        """
+        wal_name = name or self.queue_name
+        if not wal_name:
+            raise ValueError( "attach_wal() needs a queue name" )
+
+        items, lost = wal.load_queue( wal_name ) if replay else ( [ ], [ ] )
+
+        with self._lock:
+            self._wal = None
+            for item in items:
+                user_id = getattr( item, "user_id", None )
+                if user_id and self.user_job_tracker.get_user_for_job( item.id_hash ) is None:
+                    self.user_job_tracker.associate_job_with_user( item.id_hash, user_id )
+                self._add_item( item )
+            self._wal      = wal
+            self._wal_name = wal_name
+
+        if items or lost: print( f"[WAL] Restored {len( items )} jobs into the {wal_name} queue, {len( lost )} could not be restored" )
+        return lost
+
     def push( self, item: Any ) -> None:
         """
         Add an item to the end of the queue.
@@ -139,9 +336,10 @@ class FifoQueue:
             - item must implement QueueableJob protocol
 
         Ensures:
-            - Item is added to end of queue_list
-            - Item is added to queue_dict with id_hash as key
+            - Item is added to the tail of queue_dict with id_hash as key
+            - Item is added to its user's index
             - push_counter is incremented
+            - O(1)
 
         Raises:
             - TypeError if item doesn't implement QueueableJob protocol
@@ -150,9 +348,7 @@ class FifoQueue:
         if not is_queueable_job( item ):
             raise TypeError( f"Job must implement QueueableJob protocol, got {type( item ).__name__}" )
 
-        self.queue_list.append( item )
-        self.queue_dict[ item.id_hash ] = item
-        self.push_counter += 1
+        self._add_item( item )
     
     def get_push_counter( self ) -> int:
         """
@@ -178,17 +374,17 @@ class FifoQueue:
             
         Ensures:
             - Returns first item if queue not empty
-            - Removes item from both queue_list and queue_dict
+            - Removes item from the ordered index and its user's index
             - Returns None if queue is empty
+            - O(1)
             
         Raises:
             - None
         """
-        if not self.is_empty():
-            # Remove from ID_hash first
-            del self.queue_dict[ self.queue_list[ 0 ].id_hash ]
-            result = self.queue_list.pop( 0 )
-            return result
+        with self._lock:
+            if self.queue_dict:
+                return self._remove_item( next( iter( self.queue_dict ) ) )
+            return None
     
     def head( self ) -> Optional[Any]:
         """
@@ -205,9 +401,9 @@ class FifoQueue:
         Raises:
             - None
         """
-        if not self.is_empty():
-            return self.queue_list[ 0 ]
-        else:
+        with self._lock:
+            if self.queue_dict:
+                return next( iter( self.queue_dict.values() ) )
             return None
     
     def get_by_id_hash( self, id_hash: str ) -> Any:
@@ -225,6 +421,28 @@ class FifoQueue:
         """
         
         return self.queue_dict[ id_hash ]
+
+    def get_position( self, id_hash: str ) -> Optional[int]:
+        """
+        Get the 1-based position of an item in the queue.
+
+        Requires:
+            - id_hash is a string
+
+        Ensures:
+            - Returns 1 for the head, size() for the tail
+            - Returns None if id_hash is not queued
+            - O(log holes), where holes are items removed ahead of the tail
+
+        Raises:
+            - None
+        """
+        with self._lock:
+            seq = self._seq.get( id_hash )
+            if seq is None:
+                return None
+            head_seq = self._seq[ next( iter( self.queue_dict ) ) ]
+            return seq - head_seq - bisect_left( self._holes, seq ) + 1
     
     def delete_by_id_hash( self, id_hash: str ) -> bool:
         """
@@ -234,27 +452,28 @@ class FifoQueue:
             - id_hash is a string
             
         Ensures:
-            - Item is removed from queue_dict if found
-            - queue_list is rebuilt from remaining items
+            - Item is removed from the ordered index and its user's index if found
+            - Order of the remaining items is unchanged
             - Prints status message about deletion
             - Returns True if deletion successful, False otherwise
+            - O(1) plus O(log holes) bookkeeping
             
         Returns:
             - bool: True if item was found and deleted, False if not found
         """
         try:
-            # Check if item exists before attempting deletion
-            if id_hash not in self.queue_dict:
-                print( f"ERROR: Could not delete by id_hash - item {id_hash} not found" )
-                return False
-            
-            size_before = self.size()
-            del self.queue_dict[ id_hash ]
-            self.queue_list = list( self.queue_dict.values() )
-            size_after = self.size()
-            
-            if size_after < size_before:
-                print( f"Deleted {size_before - size_after} items from queue" )
+            with self._lock:
+                # Check if item exists before attempting deletion
+                if id_hash not in self.queue_dict:
+                    print( f"ERROR: Could not delete by id_hash - item {id_hash} not found" )
+                    return False
+
+                size_before = len( self.queue_dict )
+                self._remove_item( id_hash )
+                deleted     = size_before - len( self.queue_dict )
+
+            if deleted > 0:
+                print( f"Deleted {deleted} items from queue" )
                 return True
             else:
                 print( "ERROR: Could not delete by id_hash - size didn't change" )
@@ -278,7 +497,7 @@ class FifoQueue:
         Raises:
             - None
         """
-        return len( self.queue_list ) == 0
+        return len( self.queue_dict ) == 0
     
     def size( self ) -> int:
         """
@@ -293,7 +512,7 @@ class FifoQueue:
         Raises:
             - None
         """
-        return len( self.queue_list )
+        return len( self.queue_dict )
     
     def has_changed( self ) -> bool:
         """
@@ -310,11 +529,12 @@ class FifoQueue:
         Raises:
             - None
         """
-        if self.size() != self.last_queue_size:
-            self.last_queue_size = self.size()
-            return True
-        else:
-            return False
+        with self._lock:
+            if self.size() != self.last_queue_size:
+                self.last_queue_size = self.size()
+                return True
+            else:
+                return False
     
     def clear( self ) -> None:
         """
@@ -324,7 +544,7 @@ class FifoQueue:
             - None
 
         Ensures:
-            - Empties both queue_list and queue_dict
+            - Empties the ordered index and every secondary index
             - Resets push_counter to 0
             - Clears blocking_object to None
             - Resets accepting_jobs to True
@@ -332,11 +552,16 @@ class FifoQueue:
         Raises:
             - None
         """
-        self.queue_list.clear()
-        self.queue_dict.clear()
-        self.push_counter = 0
-        self._blocking_object = None
-        self._accepting_jobs = True
+        with self._lock:
+            self.queue_dict.clear()
+            self._user_index.clear()
+            self._item_user.clear()
+            self._seq.clear()
+            self._holes.clear()
+            if self._wal is not None: self._wal.append( self._wal_name, "clear" )
+            self.push_counter = 0
+            self._blocking_object = None
+            self._accepting_jobs = True
     
     def get_jobs_for_user( self, user_id: str ) -> list[Any]:
         """
@@ -347,13 +572,14 @@ class FifoQueue:
 
         Requires:
             - user_id is a valid user identifier string
-            - UserJobTracker singleton is initialized
+            - Jobs are associated with their user (UserJobTracker or job.user_id) before push
 
         Ensures:
-            - Returns list of job objects matching user's job IDs
+            - Returns the user's queued jobs in queue order
             - Returns empty list if user has no jobs
             - Returns raw job objects (NOT HTML formatted)
             - NO authorization checks performed
+            - O(jobs of that user)
 
         Args:
             user_id: The user identifier to filter jobs by
@@ -364,16 +590,11 @@ class FifoQueue:
         Raises:
             - None (returns empty list for nonexistent users)
         """
-        # Get job IDs associated with this user
-        user_job_ids = self.user_job_tracker.get_jobs_for_user( user_id )
-
-        # Filter queue_list to only include jobs matching user's job IDs
-        filtered_jobs = [
-            job for job in self.queue_list
-            if hasattr( job, 'id_hash' ) and job.id_hash in user_job_ids
-        ]
-
-        return filtered_jobs
+        with self._lock:
+            user_jobs = self._user_index.get( user_id )
+            if not user_jobs:
+                return [ ]
+            return [ self.queue_dict[ id_hash ] for id_hash in user_jobs ]
 
     def get_all_jobs( self ) -> list[Any]:
         """
@@ -386,7 +607,7 @@ class FifoQueue:
             - Queue is initialized
 
         Ensures:
-            - Returns complete copy of queue_list
+            - Returns a list copy of every queued job in queue order
             - NO filtering by user
             - Returns raw job objects (NOT HTML formatted)
             - NO authorization checks performed
@@ -397,7 +618,7 @@ class FifoQueue:
         Raises:
             - None
         """
-        return self.queue_list.copy()
+        return self.queue_list
 
     # ========================================================================
     # NOTIFICATION SERVICE METHODS (Session 97 - TTS Migration)
@@ -509,7 +730,7 @@ def quick_smoke_test():
         # Test 1: Basic class and method presence
         print( "Testing core FIFO queue components..." )
         expected_methods = [
-            "push", "pop", "head", "get_by_id_hash", "delete_by_id_hash",
+            "push", "pop", "head", "get_by_id_hash", "get_position", "delete_by_id_hash", "get_jobs_for_user",
             "is_empty", "size", "has_changed", "clear",
             "pop_blocking_object", "push_blocking_object", "is_in_focus_mode", "is_accepting_jobs"
         ]
@@ -776,15 +997,17 @@ def quick_smoke_test():
             for i in range( 5 ):
                 queue.push( TestQueueableItem( f"test_{i}" ) )
 
-            # Check list/dict consistency
-            list_size = len( queue.queue_list )
+            # Check index consistency after a middle delete and a pop
+            queue.delete_by_id_hash( "test_2" )
+            queue.pop()
             dict_size = len( queue.queue_dict )
-            reported_size = queue.size()
+            user_size = len( queue.get_jobs_for_user( "test_user" ) )
+            positions = [ queue.get_position( f"test_{i}" ) for i in range( 5 ) ]
 
-            if list_size == dict_size == reported_size == 5:
+            if dict_size == user_size == queue.size() == 3 and positions == [ None, 1, None, 2, 3 ]:
                 print( "✓ Queue state consistency validated" )
             else:
-                print( f"⚠ State inconsistency: list={list_size}, dict={dict_size}, size={reported_size}" )
+                print( f"⚠ State inconsistency: dict={dict_size}, user={user_size}, size={queue.size()}, positions={positions}" )
 
         except Exception as e:
             print( f"⚠ Queue state consistency issues: {e}" )
@@ -211,10 +211,8 @@ class NotificationFifoQueue( FifoQueue ):
         Raises:
             - None
         """
-        # Add to queue data structures
-        self.queue_list.append( notification )
-        self.queue_dict[ notification.id_hash ] = notification
-        self.push_counter += 1
+        # Add to queue indexes (also increments push_counter)
+        self._add_item( notification )
         
         # Emit enhanced notification_queue_update
         if self.websocket_mgr and self.emit_enabled:
@@ -289,17 +287,16 @@ class NotificationFifoQueue( FifoQueue ):
         
         # Priority handling - urgent/high go to front, but after other urgent/high
         if priority in [ "urgent", "high" ]:
-            # Find insertion point after other urgent/high messages
-            insert_idx = 0
-            for idx, item in enumerate( self.queue_list ):
-                if hasattr( item, 'priority' ) and item.priority not in [ "urgent", "high" ]:
-                    break
-                insert_idx = idx + 1
-            
-            # Manual insertion for priority placement
-            self.queue_list.insert( insert_idx, notification )
-            self.queue_dict[ notification.id_hash ] = notification
-            self.push_counter += 1
+            with self._lock:
+                # Find insertion point after other urgent/high messages
+                insert_idx = 0
+                for idx, item in enumerate( self.queue_dict.values() ):
+                    if hasattr( item, 'priority' ) and item.priority not in [ "urgent", "high" ]:
+                        break
+                    insert_idx = idx + 1
+
+                # Manual insertion for priority placement
+                self._add_item( notification, index=insert_idx )
             
             # Emit enhanced notification_queue_update (same as push method)
             if self.websocket_mgr and self.emit_enabled:
@@ -383,11 +380,8 @@ class NotificationFifoQueue( FifoQueue ):
         Raises:
             - None
         """
-        for item in self.queue_list:
-            # Check user filter
-            if user_id and hasattr( item, 'user_id' ) and item.user_id != user_id:
-                continue
-            
+        items = self.get_jobs_for_user( user_id ) if user_id else self.queue_list
+        for item in items:
             # Check if unplayed
             if hasattr( item, 'played' ) and not item.played:
                 return item
@@ -410,10 +404,9 @@ class NotificationFifoQueue( FifoQueue ):
             - None
         """
         notifications = []
-        for item in self.queue_list:
-            if hasattr( item, 'user_id' ) and item.user_id == user_id:
-                if include_played or not getattr( item, 'played', False ):
-                    notifications.append( item )
+        for item in self.get_jobs_for_user( user_id ):
+            if include_played or not getattr( item, 'played', False ):
+                notifications.append( item )
         
         return notifications
     
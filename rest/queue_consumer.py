@@ -4,19 +4,60 @@ CJ Flow background consumer thread for producer-consumer queue pattern.
 This module implements the consumer side of the TodoFifoQueue -> RunningFifoQueue
 producer-consumer pattern, replacing the old polling-based approach with
 event-driven processing using threading.Condition.
+
+LaneExecutor splits consumption into lanes so that long-running agentic jobs
+(deep research, podcast generation, SWE team) no longer block cached snapshot
+replays and quick AgentBase jobs queued behind them.
 """
 
 import threading
 import time
-from typing import Any
+from typing import Any, Optional
 from datetime import datetime
 import cosa.utils.util as du
+import cosa.utils.code_runner_pool as crp
 from cosa.rest.queue_util import emit_job_state_transition
+from cosa.agents.agentic_job_base import AgenticJobBase
+
+FAST_LANE    = "fast"
+AGENTIC_LANE = "agentic"
+
+
+def _start_running_job( job: Any, running_queue: Any ) -> None:
+    """
+    Emit the todo -> run transition for a job and move it into the running queue.
+
+    Requires:
+        - job implements the QueueableJob protocol
+        - running_queue is a RunningFifoQueue (or compatible)
+
+    Ensures:
+        - Emits todo -> run with card-rendering metadata if running_queue has a websocket_mgr
+        - Pushes job onto running_queue
+    """
+    # Phase 2: Direct attribute access - Protocol guarantees these exist
+    job_id = job.id_hash
+    if hasattr( running_queue, 'websocket_mgr' ):
+        user_id = running_queue.user_job_tracker.get_user_for_job( job_id ) if hasattr( running_queue, 'user_job_tracker' ) else None
+        # Phase 6.1: Include card-rendering metadata for client-side card creation
+        metadata = {
+            'question_text' : job.last_question_asked,
+            'agent_type'    : job.job_type,
+            'timestamp'     : job.created_date,
+            'started_at'    : datetime.now().isoformat()
+        }
+        emit_job_state_transition( running_queue.websocket_mgr, job_id, 'todo', 'run', user_id, metadata )
+
+    # Move to running queue
+    running_queue.push( job )  # Auto-emits 'run_update'
 
 
 def start_todo_producer_run_consumer_thread( todo_queue: Any, running_queue: Any ) -> threading.Thread:
     """
-    Start the background consumer thread for producer-consumer pattern.
+    DEPRECATED: Start the single background consumer thread for producer-consumer pattern.
+    
+    This runs every job serially, so one agentic job blocks all others queued behind it.
+    Use start_lane_executor() instead.
     
     Requires:
         - todo_queue is a TodoFifoQueue with condition variable support
@@ -63,22 +104,8 @@ def start_todo_producer_run_consumer_thread( todo_queue: Any, running_queue: Any
                         # Phase 2: Direct attribute access - Protocol guarantees this exists
                         print( f"[CONSUMER] Processing job: {job.last_question_asked}" )
 
-                    # Emit job state transition (todo -> run) before moving to running queue
-                    # Phase 2: Direct attribute access - Protocol guarantees these exist
-                    job_id = job.id_hash
-                    if hasattr( running_queue, 'websocket_mgr' ):
-                        user_id = running_queue.user_job_tracker.get_user_for_job( job_id ) if hasattr( running_queue, 'user_job_tracker' ) else None
-                        # Phase 6.1: Include card-rendering metadata for client-side card creation
-                        metadata = {
-                            'question_text' : job.last_question_asked,
-                            'agent_type'    : job.job_type,
-                            'timestamp'     : job.created_date,
-                            'started_at'    : datetime.now().isoformat()
-                        }
-                        emit_job_state_transition( running_queue.websocket_mgr, job_id, 'todo', 'run', user_id, metadata )
-
-                    # Move to running queue
-                    running_queue.push( job )  # Auto-emits 'run_update'
+                    # Emit job state transition (todo -> run) and move to running queue
+                    _start_running_job( job, running_queue )
 
                     # Process the job (new method we'll add to RunningFifoQueue)
                     if hasattr( running_queue, '_process_job' ):
@@ -106,6 +133,222 @@ def start_todo_producer_run_consumer_thread( todo_queue: Any, running_queue: Any
     return consumer_thread
 
 
+class LaneExecutor:
+    """
+    Lane-aware, multi-worker consumer for the todo -> running queues.
+
+    Jobs are routed to one of two lanes:
+        - fast:    SolutionSnapshot replays and AgentBase jobs
+        - agentic: AgenticJobBase subclasses (bounded by the agentic worker count)
+
+    Each lane has its own pool of worker threads. Workers claim jobs directly from
+    the todo queue, so jobs stay visible in 'todo' until a worker actually starts them.
+
+    Ordering guarantees:
+        - Within a lane, jobs are started in todo-queue (FIFO) order
+        - A user never has more than one job running per lane, so each user's
+          jobs in a lane run one at a time, in the order they were submitted
+    """
+
+    def __init__( self, todo_queue: Any, running_queue: Any, fast_workers: int=1, agentic_workers: int=1 ) -> None:
+        """
+        Initialize the lane executor (workers are not started until start() is called).
+
+        Requires:
+            - todo_queue is a TodoFifoQueue with condition variable support
+            - running_queue is a RunningFifoQueue with _process_job method
+            - fast_workers and agentic_workers are >= 1
+
+        Ensures:
+            - Lane worker counts are set
+            - No threads are started yet
+
+        Raises:
+            - ValueError if either worker count is < 1
+        """
+        if fast_workers < 1 or agentic_workers < 1:
+            raise ValueError( f"Lane worker counts must be >= 1, got fast={fast_workers}, agentic={agentic_workers}" )
+
+        self.todo_queue    = todo_queue
+        self.running_queue = running_queue
+        self.lane_workers  = { FAST_LANE: fast_workers, AGENTIC_LANE: agentic_workers }
+        self.threads       = [ ]
+
+        # Users with a job currently running, per lane (guarded by todo_queue.condition)
+        self._active_users = { FAST_LANE: set(), AGENTIC_LANE: set() }
+
+    @staticmethod
+    def get_lane( job: Any ) -> str:
+        """
+        Get the lane a job runs in.
+
+        Requires:
+            - job is a queueable job
+
+        Ensures:
+            - Returns AGENTIC_LANE for AgenticJobBase instances, FAST_LANE otherwise
+        """
+        return AGENTIC_LANE if isinstance( job, AgenticJobBase ) else FAST_LANE
+
+    def _get_user( self, job: Any ) -> Optional[str]:
+        """
+        Get the user that owns a job, for per-user ordering.
+
+        Ensures:
+            - Returns job.user_id if set, else the user tracked for the job, else None
+        """
+        user_id = getattr( job, 'user_id', None )
+        if not user_id and hasattr( self.running_queue, 'user_job_tracker' ):
+            user_id = self.running_queue.user_job_tracker.get_user_for_job( job.id_hash )
+        return user_id
+
+    def _claim_next_job( self, lane: str ) -> Optional[Any]:
+        """
+        Remove and return the oldest todo job that this lane may start now.
+
+        Requires:
+            - Caller holds todo_queue.condition
+
+        Ensures:
+            - Returns the first job in todo order that belongs to lane and whose
+              user has no job running in that lane, or None if there is none
+            - Claimed job is removed from the todo queue and its user marked active
+            - The scan holds the queue's own lock, so clear() or delete_by_id_hash() from
+              other threads (e.g. the queues router) can't mutate the index mid-iteration
+        """
+        # Walks the ordered index in place under the queue lock (re-entrant, so pop/delete
+        # can take it again); the loop returns right after removing a job
+        with self.todo_queue._lock:
+            for job in self.todo_queue.queue_dict.values():
+
+                if self.get_lane( job ) != lane: continue
+
+                user_id = self._get_user( job )
+                if user_id is not None and user_id in self._active_users[ lane ]: continue
+
+                if job is self.todo_queue.head():
+                    self.todo_queue.pop()  # Auto-emits 'todo_update'
+                else:
+                    self.todo_queue.delete_by_id_hash( job.id_hash )
+
+                if user_id is not None: self._active_users[ lane ].add( user_id )
+                return job
+
+        return None
+
+    def _lane_worker( self, lane: str ) -> None:
+        """Worker loop: claim a job for this lane, run it, release the user, repeat."""
+        name = threading.current_thread().name
+        print( f"[CONSUMER] Starting {lane} lane worker {name}..." )
+
+        while self.todo_queue.consumer_running:
+            job = None
+            try:
+                # Wait for a job this lane may start (no polling!)
+                with self.todo_queue.condition:
+                    while self.todo_queue.consumer_running:
+                        job = self._claim_next_job( lane )
+                        if job: break
+                        if self.todo_queue.debug:
+                            print( f"[CONSUMER] {name} waiting for jobs..." )
+                        self.todo_queue.condition.wait()  # Sleep until notified
+
+                if not job: break
+
+                if self.todo_queue.debug:
+                    # Phase 2: Direct attribute access - Protocol guarantees this exists
+                    print( f"[CONSUMER] {name} processing job: {job.last_question_asked}" )
+
+                # Emit job state transition (todo -> run) and move to running queue
+                _start_running_job( job, self.running_queue )
+
+                self.running_queue._process_job( job )
+
+            except Exception as e:
+                print( f"[CONSUMER] Error in {name}: {e}" )
+                if self.todo_queue.debug:
+                    import traceback
+                    traceback.print_exc()
+                # Continue running even after errors
+                time.sleep( 1.0 )
+
+            finally:
+                if job:
+                    # Release this user's slot in the lane and wake workers that may now claim their next job
+                    with self.todo_queue.condition:
+                        self._active_users[ lane ].discard( self._get_user( job ) )
+                        self.todo_queue.condition.notify_all()
+
+        print( f"[CONSUMER] {name} shutting down..." )
+
+    def start( self ) -> 'LaneExecutor':
+        """
+        Start all lane worker threads.
+
+        Ensures:
+            - Sets todo_queue.consumer_running to True
+            - Starts one daemon thread per configured worker in each lane
+            - Returns self
+        """
+        self.todo_queue.consumer_running = True
+
+        for lane, count in self.lane_workers.items():
+            for i in range( count ):
+                thread = threading.Thread( target=self._lane_worker, args=( lane, ), daemon=True, name=f"{lane.capitalize()}LaneWorker-{i}" )
+                thread.start()
+                self.threads.append( thread )
+
+        print( f"[CONSUMER] Lane executor started: {self.lane_workers}" )
+        return self
+
+    def stop( self, timeout: float=1.0 ) -> None:
+        """
+        Stop all lane workers.
+
+        Ensures:
+            - Sets todo_queue.consumer_running to False and wakes all waiting workers
+            - Waits up to timeout seconds per thread for idle workers to exit
+            - Jobs already running are allowed to finish in the background
+        """
+        with self.todo_queue.condition:
+            self.todo_queue.consumer_running = False
+            self.todo_queue.condition.notify_all()
+
+        for thread in self.threads:
+            thread.join( timeout=timeout )
+
+    def is_alive( self ) -> bool:
+        """Return True if any lane worker thread is still running."""
+        return any( thread.is_alive() for thread in self.threads )
+
+
+def start_lane_executor( todo_queue: Any, running_queue: Any, config_mgr: Optional[Any]=None ) -> LaneExecutor:
+    """
+    Start the lane-aware consumer that replaces the single TodoConsumerThread.
+
+    Requires:
+        - todo_queue is a TodoFifoQueue with condition variable support
+        - running_queue is a RunningFifoQueue with _process_job method
+        - config_mgr is None or a valid ConfigurationManager
+
+    Ensures:
+        - Reads 'fast lane workers' and 'agentic lane workers' from config (default 1 each)
+        - Code runner pool started first, so solution snapshot replays never pay interpreter cold starts
+        - Returns a started LaneExecutor
+
+    Raises:
+        - ValueError if a configured worker count is < 1
+    """
+    fast_workers    = 1 if config_mgr is None else config_mgr.get( "fast lane workers",    default=1, return_type="int" )
+    agentic_workers = 1 if config_mgr is None else config_mgr.get( "agentic lane workers", default=1, return_type="int" )
+
+    # Spawning is non-blocking: workers finish their pandas imports while the lanes start up
+    crp.get_code_runner_pool()
+
+    executor = LaneExecutor( todo_queue, running_queue, fast_workers=fast_workers, agentic_workers=agentic_workers )
+    return executor.start()
+
+
 def quick_smoke_test():
     """Quick smoke test for consumer thread functionality"""
     from unittest.mock import Mock
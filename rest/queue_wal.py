@@ -0,0 +1,413 @@
+"""
+Crash-safe write-ahead log for the todo / running / done / dead queues.
+
+The queues are in-memory, so a restart used to drop every queued and in-flight
+job and users resubmitted them right after a deploy. A FifoQueue with a WAL
+attached records every push, remove and clear here; at startup the live items
+are replayed back into the queue.
+
+State transitions and completions need no event type of their own: moving a
+job from todo to running, or from running to done / dead, is a remove from one
+queue followed by a push to the other.
+
+Design by Contract:
+    Requires:
+        - Opt-in: queues only log once attach_wal() has been called on them
+        - db_path points to a writable SQLite file location
+        - Queued items are picklable (items that are not are logged without a
+          payload and reported by load_queue() instead of being replayed)
+
+    Ensures:
+        - append() only serializes the item and buffers the record; the caller
+          (who usually holds the queue lock) never waits on disk I/O
+        - A single writer thread commits buffered records in batches, so each
+          batch costs one fsync (SQLite WAL journal, synchronous=FULL)
+        - checkpoint() drops pushes that were later removed or cleared, plus the
+          remove / clear records themselves, then truncates SQLite's own -wal file
+        - Replay restores each queue's surviving items in push order
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import cosa.utils.util as du
+
+
+class QueueWriteAheadLog:
+    """
+    Append-only, batch-fsynced event log shared by all queues of one process.
+
+    Thread-safe: append() may be called from any thread; the SQLite connection
+    is only used by the writer thread and by load_queue() / checkpoint() under
+    a separate database lock.
+    """
+
+    TABLE_NAME = "queue_wal"
+
+    def __init__( self,
+        db_path: str,
+        flush_interval: float = 0.05,
+        max_batch: int = 512,
+        checkpoint_every: int = 10000,
+        dumps: Callable[[Any], bytes] = pickle.dumps,
+        loads: Callable[[bytes], Any] = pickle.loads,
+        debug: bool = False,
+        verbose: bool = False
+    ) -> None:
+        """
+        Open (or create) the log and start the writer thread.
+
+        Requires:
+            - flush_interval > 0, max_batch >= 1, checkpoint_every >= 1
+
+        Ensures:
+            - Table and lookup index exist
+            - New sequence numbers continue after the highest one on disk
+            - Writer thread is running
+
+        Raises:
+            - sqlite3.Error if the database can't be opened
+        """
+        self.debug            = debug
+        self.verbose          = verbose
+        self.db_path          = db_path
+        self.flush_interval   = flush_interval
+        self.max_batch        = max_batch
+        self.checkpoint_every = checkpoint_every
+        self._dumps           = dumps
+        self._loads           = loads
+
+        self._lock         = threading.Lock()
+        self._durable      = threading.Condition( self._lock )
+        self._wake         = threading.Event()
+        self._db_lock      = threading.Lock()
+        self._pending      = [ ]
+        self._closed       = False
+        self._since_ckpt   = 0
+
+        self._stats = { "appended": 0, "written": 0, "batches": 0, "checkpoints": 0, "unserializable": 0, "write_errors": 0 }
+
+        os.makedirs( os.path.dirname( db_path ) or ".", exist_ok=True )
+        self._conn = sqlite3.connect( db_path, check_same_thread=False )
+        self._conn.execute( "PRAGMA journal_mode=WAL" )
+        self._conn.execute( "PRAGMA synchronous=FULL" )
+        self._conn.execute( f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                seq        INTEGER PRIMARY KEY,
+                queue_name TEXT NOT NULL,
+                event      TEXT NOT NULL,
+                id_hash    TEXT,
+                user_id    TEXT,
+                question   TEXT,
+                payload    BLOB,
+                created_at REAL NOT NULL
+            )
+        """ )
+        self._conn.execute( f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_queue_id ON {self.TABLE_NAME} ( queue_name, id_hash, seq )" )
+        self._conn.execute( f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_queue_event ON {self.TABLE_NAME} ( queue_name, event, seq )" )
+        self._conn.commit()
+
+        last_seq           = self._conn.execute( f"SELECT MAX( seq ) FROM {self.TABLE_NAME}" ).fetchone()[ 0 ] or 0
+        self._next_seq     = last_seq + 1
+        self._durable_seq  = last_seq
+
+        self._writer = threading.Thread( target=self._writer_loop, name="queue-wal-writer", daemon=True )
+        self._writer.start()
+
+        if self.debug: print( f"QueueWriteAheadLog opened: {db_path}, next seq {self._next_seq}, flush every {flush_interval}s / {max_batch} records" )
+
+    def append( self, queue_name: str, event: str, item: Any = None, id_hash: Optional[str] = None ) -> int:
+        """
+        Buffer one queue event for the writer thread.
+
+        Requires:
+            - event is "push" (item required), "remove" (id_hash required) or "clear"
+
+        Ensures:
+            - Push payloads are serialized now, so later mutations of the item are not logged
+            - An item that can't be serialized is logged without a payload and counted
+            - Returns the event's sequence number
+            - Never touches the disk
+
+        Raises:
+            - ValueError for an unknown event
+        """
+        if event not in ( "push", "remove", "clear" ):
+            raise ValueError( f"Unknown queue WAL event: {event}" )
+
+        payload  = None
+        user_id  = None
+        question = None
+        if event == "push":
+            id_hash  = item.id_hash
+            user_id  = getattr( item, "user_id", None )
+            question = getattr( item, "last_question_asked", None )
+            try:
+                payload = self._dumps( item )
+            except Exception as e:
+                with self._lock: self._stats[ "unserializable" ] += 1
+                if self.debug: print( f"QueueWriteAheadLog: can't serialize {type( item ).__name__} {id_hash}: {e}" )
+
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._pending.append( ( seq, queue_name, event, id_hash, user_id, question, payload, time.time() ) )
+            self._stats[ "appended" ] += 1
+            if len( self._pending ) >= self.max_batch: self._wake.set()
+
+        return seq
+
+    def flush( self, timeout: Optional[float] = None ) -> bool:
+        """
+        Block until every record appended before this call is on disk.
+
+        Ensures:
+            - Returns True once durable, False if timeout expired first
+        """
+        with self._lock:
+            target = self._next_seq - 1
+            self._wake.set()
+            return self._durable.wait_for( lambda: self._durable_seq >= target or self._closed, timeout=timeout ) and self._durable_seq >= target
+
+    def load_queue( self, queue_name: str ) -> tuple[list[Any], list[dict[str, Any]]]:
+        """
+        Read back the items a queue held when the log was last written.
+
+        Requires:
+            - Called at startup, before the queue logs new events
+
+        Ensures:
+            - Returns ( items, lost ): items are deserialized payloads in push order;
+              lost describes surviving pushes whose payload was missing or unreadable
+              ( id_hash, user_id, question ) so callers can tell those users
+        """
+        self.flush()
+        with self._db_lock:
+            rows = self._conn.execute( f"""
+                SELECT p.id_hash, p.user_id, p.question, p.payload FROM {self.TABLE_NAME} p
+                WHERE p.queue_name = :queue AND p.event = 'push'
+                  AND p.seq > COALESCE( ( SELECT MAX( seq ) FROM {self.TABLE_NAME} WHERE queue_name = :queue AND event = 'clear' ), 0 )
+                  AND NOT EXISTS (
+                    SELECT 1 FROM {self.TABLE_NAME} r
+                    WHERE r.queue_name = p.queue_name AND r.id_hash = p.id_hash AND r.seq > p.seq AND r.event = 'remove'
+                  )
+                ORDER BY p.seq
+            """, { "queue": queue_name } ).fetchall()
+
+        items = [ ]
+        lost  = [ ]
+        for id_hash, user_id, question, payload in rows:
+            try:
+                if payload is None: raise ValueError( "no payload" )
+                items.append( self._loads( payload ) )
+            except Exception as e:
+                lost.append( { "id_hash": id_hash, "user_id": user_id, "question": question } )
+                if self.debug: print( f"QueueWriteAheadLog: can't replay {queue_name} job {id_hash}: {e}" )
+
+        if self.debug: print( f"QueueWriteAheadLog: {queue_name} replay found {len( items )} jobs, {len( lost )} lost" )
+        return items, lost
+
+    def checkpoint( self ) -> int:
+        """
+        Compact the log down to the records that still describe live items.
+
+        Ensures:
+            - Flushes buffered records first
+            - Deletes pushes that a later remove / clear cancels, and every remove / clear
+            - Truncates SQLite's -wal file
+            - Returns the number of rows deleted
+        """
+        self.flush()
+        with self._lock:
+            upto = self._durable_seq
+        deleted = self._checkpoint( upto )
+        return deleted
+
+    def get_stats( self ) -> dict[str, int]:
+        """Return appended / written / batches / checkpoints / unserializable / write_errors counts and the pending backlog."""
+        with self._lock:
+            return { **self._stats, "pending": len( self._pending ) }
+
+    def close( self, timeout: Optional[float] = 10.0 ) -> None:
+        """
+        Flush everything and stop the writer thread.
+
+        Ensures:
+            - All appended records are durable, unless the disk keeps failing for timeout seconds
+            - Later append() calls still buffer but are never written
+        """
+        self.flush( timeout=timeout )
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self._writer.join()
+        with self._db_lock:
+            self._conn.close()
+
+    def _writer_loop( self ) -> None:
+        """Writer thread: every flush_interval (or once max_batch is buffered) commit the buffer in one transaction."""
+        while True:
+            self._wake.wait( self.flush_interval )
+            self._wake.clear()
+
+            with self._lock:
+                batch         = self._pending
+                self._pending = [ ]
+                closed        = self._closed
+
+            if batch:
+                try:
+                    self._write_batch( batch )
+                except Exception as e:
+                    # Keep the records and retry on the next round; flush() keeps waiting meanwhile
+                    du.print_stack_trace( e, explanation="Queue WAL batch write failed", caller="QueueWriteAheadLog._writer_loop()" )
+                    with self._lock:
+                        self._pending = batch + self._pending
+                        self._stats[ "write_errors" ] += 1
+                    if closed: return
+                    time.sleep( self.flush_interval )
+                    continue
+
+                with self._lock:
+                    self._durable_seq = batch[ -1 ][ 0 ]
+                    self._since_ckpt += len( batch )
+                    run_checkpoint    = self._since_ckpt >= self.checkpoint_every
+                    self._durable.notify_all()
+
+                if run_checkpoint: self._checkpoint( batch[ -1 ][ 0 ] )
+
+            if closed:
+                with self._lock: self._durable.notify_all()
+                return
+
+    def _write_batch( self, batch: list[tuple] ) -> None:
+        """Insert one batch and commit it: with synchronous=FULL that is a single fsync."""
+        with self._db_lock:
+            self._conn.executemany( f"INSERT INTO {self.TABLE_NAME} VALUES ( ?, ?, ?, ?, ?, ?, ?, ? )", batch )
+            self._conn.commit()
+
+        with self._lock:
+            self._stats[ "written" ] += len( batch )
+            self._stats[ "batches" ] += 1
+
+    def _checkpoint( self, upto: int ) -> int:
+        """Delete cancelled pushes and remove / clear records at or below upto, then truncate the -wal file."""
+        with self._db_lock:
+            tbl    = self.TABLE_NAME
+            cursor = self._conn.execute( f"""
+                DELETE FROM {tbl}
+                WHERE seq <= :upto AND ( event != 'push'
+                    OR seq < COALESCE( ( SELECT MAX( c.seq ) FROM {tbl} c WHERE c.queue_name = {tbl}.queue_name AND c.event = 'clear' AND c.seq <= :upto ), 0 )
+                    OR EXISTS (
+                        SELECT 1 FROM {tbl} r
+                        WHERE r.queue_name = {tbl}.queue_name AND r.id_hash = {tbl}.id_hash AND r.seq > {tbl}.seq AND r.seq <= :upto AND r.event = 'remove'
+                    ) )
+            """, { "upto": upto } )
+            deleted = cursor.rowcount
+            self._conn.commit()
+            self._conn.execute( "PRAGMA wal_checkpoint(TRUNCATE)" )
+
+        with self._lock:
+            self._since_ckpt = 0
+            self._stats[ "checkpoints" ] += 1
+
+        if self.debug: print( f"QueueWriteAheadLog: checkpoint up to seq {upto} deleted {deleted} records" )
+        return deleted
+
+
+def build_queue_wal( config_mgr: Any, debug: bool = False, verbose: bool = False ) -> Optional[QueueWriteAheadLog]:
+    """
+    Build the shared queue WAL from configuration.
+
+    Requires:
+        - config_mgr is a ConfigurationManager
+
+    Ensures:
+        - Returns None unless "queue wal enabled" is true
+        - Otherwise opens the log at "queue wal path wo root" under the project root
+    """
+    if not config_mgr.get( "queue wal enabled", default=False, return_type="boolean" ): return None
+
+    db_path = du.get_project_root() + config_mgr.get( "queue wal path wo root", default="/src/conf/long-term-memory/queue-wal.db" )
+    return QueueWriteAheadLog(
+        db_path,
+        flush_interval=config_mgr.get( "queue wal flush interval seconds", default=0.05, return_type="float" ),
+        checkpoint_every=config_mgr.get( "queue wal checkpoint every", default=10000, return_type="int" ),
+        debug=debug,
+        verbose=verbose
+    )
+
+
+class _SmokeJob:
+    """Minimal picklable QueueableJob for quick_smoke_test()."""
+
+    push_counter = 0; session_id = "smoke"; routing_command = "smoke"; user_email = "smoke@test.com"
+    run_date = created_date = "2025-01-30"; started_at = completed_at = error = None
+    question = last_question_asked = "what's 2 + 2"; answer = answer_conversational = ""
+    job_type = "SmokeJob"; is_cache_hit = False; status = "pending"
+
+    def __init__( self, id_hash: str ) -> None:
+        self.id_hash = id_hash
+        self.user_id = "smoke_user"
+
+    def do_all( self ) -> str: return "done"
+    def code_ran_to_completion( self ) -> bool: return True
+    def formatter_ran_to_completion( self ) -> bool: return True
+
+
+def quick_smoke_test():
+    """Quick smoke test: replay after an unclean stop, checkpoint, and push overhead vs an in-memory queue."""
+    import tempfile
+
+    from cosa.rest.fifo_queue import FifoQueue
+
+    du.print_banner( "Queue WAL Smoke Test", prepend_nl=True )
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join( temp_dir, "queue-wal.db" )
+
+            wal   = QueueWriteAheadLog( db_path, debug=True )
+            queue = FifoQueue( queue_name="todo" )
+            queue.attach_wal( wal )
+            for i in range( 5 ): queue.push( _SmokeJob( f"job_{i}" ) )
+            queue.pop()
+            queue.delete_by_id_hash( "job_3" )
+            wal.flush()
+
+            replayed = FifoQueue( queue_name="todo" )
+            replayed.attach_wal( QueueWriteAheadLog( db_path ) )
+            print( f"✓ Replayed after unclean stop: {[ job.id_hash for job in replayed.get_all_jobs() ]}" )
+
+            print( f"✓ Checkpoint deleted {wal.checkpoint()} records" )
+            print( f"✓ Stats: {wal.get_stats()}" )
+            wal.close()
+
+            jobs = [ _SmokeJob( f"bench_{i}" ) for i in range( 20000 ) ]
+            for label, attach in ( ( "in-memory", False ), ( "with WAL", True ) ):
+                bench_wal = QueueWriteAheadLog( os.path.join( temp_dir, f"bench-{attach}.db" ) ) if attach else None
+                queue     = FifoQueue( queue_name="todo" )
+                if attach: queue.attach_wal( bench_wal, replay=False )
+                start = time.perf_counter()
+                for job in jobs: queue.push( job )
+                push_us = ( time.perf_counter() - start ) / len( jobs ) * 1e6
+                if attach:
+                    start = time.perf_counter()
+                    bench_wal.flush()
+                    print( f"  {label:9}: {push_us:6.1f}us/push, durable {( time.perf_counter() - start ) * 1000:.0f}ms later, {bench_wal.get_stats()[ 'batches' ]} fsync batches" )
+                    bench_wal.close()
+                else:
+                    print( f"  {label:9}: {push_us:6.1f}us/push" )
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="queue_wal.quick_smoke_test()" )
+
+    print( "\n✓ Queue WAL smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
@@ -17,6 +17,7 @@ import time
 
 import traceback
 import pprint
+import threading
 from datetime import datetime
 from typing import Optional, Any
 
@@ -63,6 +64,81 @@ class RunningFifoQueue( FifoQueue ):
         self.verbose             = False if config_mgr is None else config_mgr.get( "app_verbose", default=False, return_type="boolean" )
         self.io_tbl              = InputAndOutputTable()
         self.gist_normalizer     = GistNormalizer( debug=self.debug, verbose=self.verbose )
+        
+        # Lane workers push and remove running jobs concurrently
+        self._running_lock       = threading.RLock()
+    
+    def push( self, item: Any ) -> None:
+        """
+        Thread-safe push onto the running queue.
+        
+        Requires:
+            - item must implement QueueableJob protocol
+            
+        Ensures:
+            - Item is added via parent method while holding the running lock
+            
+        Raises:
+            - TypeError if item doesn't implement QueueableJob protocol (via parent)
+        """
+        with self._running_lock:
+            super().push( item )
+    
+    def attach_wal( self, wal: Any, replay: bool = True, name: Optional[str] = None ) -> list[dict[str, Any]]:
+        """
+        Attach a write-ahead log, sending jobs that were running at shutdown back to todo.
+
+        Nothing resumes a half-run job, so restored running jobs go to the front of
+        the todo queue (oldest first) instead of back into this queue.
+
+        Requires:
+            - jobs_todo_queue has already been attached to the same WAL
+
+        Ensures:
+            - This queue is empty afterwards and logs every later push and removal
+            - Requeued jobs are logged as a running -> todo transition
+            - Waiting todo consumers are notified
+            - Returns the running jobs that could not be restored
+
+        Raises:
+            - ValueError if no queue name is available
+        """
+        with self._running_lock:
+            lost = super().attach_wal( wal, replay=replay, name=name )
+            interrupted = self.get_all_jobs()
+            if not interrupted: return lost
+
+            todo_condition = getattr( self.jobs_todo_queue, "condition", None ) or threading.Condition()
+            # Condition before the queue's own lock, the same order TodoFifoQueue.push() takes them
+            with todo_condition, self.jobs_todo_queue._lock:
+                for position, job in enumerate( interrupted ):
+                    self._remove_running_job( job )
+                    self.jobs_todo_queue._add_item( job, index=position )
+                todo_condition.notify_all()
+
+        print( f"[WAL] Requeued {len( interrupted )} interrupted jobs at the front of the todo queue" )
+        return lost
+
+    def _remove_running_job( self, job: Any ) -> None:
+        """
+        Remove a specific job from the running queue.
+        
+        With multiple lane workers the job being finished is not necessarily the head,
+        so removal is by id_hash rather than a blind pop().
+        
+        Requires:
+            - job has an id_hash
+            
+        Ensures:
+            - Job with job.id_hash is no longer in the running queue
+            - No-op if it was already removed
+        """
+        with self._running_lock:
+            head = self.head()
+            if head is not None and head.id_hash == job.id_hash:
+                self.pop()
+            elif job.id_hash in self.queue_dict:
+                self.delete_by_id_hash( job.id_hash )
     
     
     def enter_running_loop( self ) -> None:
@@ -117,12 +193,14 @@ class RunningFifoQueue( FifoQueue ):
                 # print( "No jobs to pop from todo Q " )
                 time.sleep( 1 )
     
-    def _process_job( self, job: Any ) -> None:
+    def _process_job( self, job: Optional[Any]=None ) -> None:
         """
         Process a single job (extracted from enter_running_loop).
         
+        Safe to call from several lane workers at once: each call only touches its own job.
+        
         Requires:
-            - job is a valid job instance (AgentBase or SolutionSnapshot)
+            - job is a valid job instance (AgentBase, SolutionSnapshot or AgenticJobBase), or None for the head
             - Job is already in the running queue
             
         Ensures:
@@ -134,8 +212,8 @@ class RunningFifoQueue( FifoQueue ):
             - None (exceptions handled internally)
         """
         try:
-            # Point to the head of the queue without popping it
-            running_job = self.head()
+            # Process the job we were handed; fall back to the head for legacy single-consumer callers
+            running_job = job if job is not None else self.head()
 
             if not running_job:
                 print( "[RUNNING] Warning: _process_job called but no job in running queue" )
@@ -193,8 +271,8 @@ class RunningFifoQueue( FifoQueue ):
             print( f"[RUNNING] Full stack trace:" )
             traceback.print_exc()
 
-            # Get job info BEFORE popping (head is still in queue)
-            failed_job = self.head()
+            # Get job info BEFORE removing it (job is still in queue)
+            failed_job = job if job is not None else self.head()
             if failed_job:
                 job_id  = failed_job.id_hash
                 user_id = self.user_job_tracker.get_user_for_job( job_id )
@@ -228,8 +306,8 @@ class RunningFifoQueue( FifoQueue ):
                 }
                 emit_job_state_transition( self.websocket_mgr, job_id, 'run', 'dead', user_id, metadata )
 
-                # Now pop and move to dead queue
-                self.pop()
+                # Now remove and move to dead queue
+                self._remove_running_job( failed_job )
                 self.jobs_dead_queue.push( failed_job )
     
     def _handle_error_case( self, response: dict, running_job: Any, truncated_question: str, error_message: str=None ) -> Any:
@@ -255,7 +333,7 @@ class RunningFifoQueue( FifoQueue ):
         
         for line in response[ "output" ].split( "\n" ): print( line )
         
-        self.pop()  # Auto-emits 'run_update'
+        self._remove_running_job( running_job )  # Auto-emits 'run_update'
 
         # TTS Migration (Session 97): Use notification service instead of _emit_speech
         notification_msg = error_message if error_message else "I'm sorry Dave, I'm afraid I can't do that. Please check your logs"
@@ -375,7 +453,7 @@ class RunningFifoQueue( FifoQueue ):
                 emit_job_state_transition( self.websocket_mgr, job_id, 'run', 'done', user_id, metadata )
 
                 # Move through queue system
-                self.pop()  # Auto-emits 'run_update'
+                self._remove_running_job( running_job )  # Auto-emits 'run_update'
                 self.jobs_done_queue.push( running_job )  # Auto-emits 'done_update'
 
                 # Log to I/O table (skip if not available)
@@ -434,7 +512,7 @@ class RunningFifoQueue( FifoQueue ):
                 }
                 emit_job_state_transition( self.websocket_mgr, job_id, 'run', 'dead', user_id, metadata )
 
-                self.pop()  # Auto-emits 'run_update'
+                self._remove_running_job( running_job )  # Auto-emits 'run_update'
                 self.jobs_dead_queue.push( running_job )  # Auto-emits 'dead_update'
 
         except Exception as e:
@@ -489,7 +567,7 @@ class RunningFifoQueue( FifoQueue ):
             }
             emit_job_state_transition( self.websocket_mgr, job_id, 'run', 'dead', user_id, metadata )
 
-            self.pop()  # Auto-emits 'run_update'
+            self._remove_running_job( running_job )  # Auto-emits 'run_update'
             self.jobs_dead_queue.push( running_job )  # Auto-emits 'dead_update'
 
         return running_job
@@ -618,7 +696,7 @@ class RunningFifoQueue( FifoQueue ):
             }
             emit_job_state_transition( self.websocket_mgr, job_id, 'run', 'done', user_id, metadata )
 
-            self.pop()  # Auto-emits 'run_update'
+            self._remove_running_job( running_job )  # Auto-emits 'run_update'
             self.jobs_done_queue.push( running_job )  # Auto-emits 'done_update'
 
             # Write the job to the database for posterity's sake
@@ -699,7 +777,7 @@ class RunningFifoQueue( FifoQueue ):
         }
         emit_job_state_transition( self.websocket_mgr, job_id, 'run', 'done', user_id, metadata )
 
-        self.pop()  # Auto-emits 'run_update'
+        self._remove_running_job( running_job )  # Auto-emits 'run_update'
         self.jobs_done_queue.push( running_job )  # Auto-emits 'done_update'
 
         # If we've arrived at this point, then we've successfully run the job
@@ -852,7 +930,7 @@ class RunningFifoQueue( FifoQueue ):
         emit_job_state_transition( self.websocket_mgr, job_id, 'run', 'done', user_id, metadata )
 
         # Move job through the queue system properly
-        self.pop()  # Remove from running queue, auto-emits 'run_update'
+        self._remove_running_job( original_job )  # Remove from running queue, auto-emits 'run_update'
         self.jobs_done_queue.push( done_queue_entry )  # Add COPY to done queue, auto-emits 'done_update'
 
         run_timer.print( "CACHE HIT - result retrieved in ", use_millis=True )
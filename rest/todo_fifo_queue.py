@@ -1,5 +1,7 @@
+import atexit
 import random
 import threading
+import concurrent.futures
 from typing import Any, Optional, Dict, Type, List
 
 from cosa.agents.confirmation_dialog import ConfirmationDialogue
@@ -25,6 +27,7 @@ from cosa.tools.search_lupin_v010 import LupinSearch
 
 # from app       import emit_audio
 from cosa.utils import util     as du
+from cosa.utils.util_stopwatch import Stopwatch
 from cosa.agents.io_models.xml_models import CommandResponse
 from cosa.agents.io_models.utils.util_xml_pydantic import XMLParsingError
 
@@ -125,6 +128,10 @@ class TodoFifoQueue( FifoQueue ):
         self.embedding_manager  = EmbeddingManager( debug=debug, verbose=verbose )
         self._embedding_provider = get_embedding_provider( debug=debug, verbose=verbose )
 
+        # Fan-out pool for push_job preprocessing: gist LLM call and verbatim/normalized embeddings run side by side
+        self._preprocess_executor = concurrent.futures.ThreadPoolExecutor( max_workers=4, thread_name_prefix="TodoPreprocess" )
+        atexit.register( self.close )
+
         if self.debug: print( "TodoFifoQueue: Text processors and three-level architecture components initialized" )
         
         # Salutations to be stripped by a brute force method until the router parses them off for us
@@ -340,6 +347,79 @@ class TodoFifoQueue( FifoQueue ):
                 if self.debug:
                     print( f"[TODO-QUEUE] Failed to send rejection notification: {e}" )
     
+    def close( self ) -> None:
+        """
+        Shut down the push_job preprocessing pool.
+
+        Ensures:
+            - Queued preprocessing work is cancelled; work already running finishes first
+            - Safe to call more than once (registered with atexit)
+        """
+        self._preprocess_executor.shutdown( wait=True, cancel_futures=True )
+
+    def _generate_representations( self, question: str, parsed_question: str ) -> Dict[str, Any]:
+        """
+        Build the three-level representation and its embeddings with maximum overlap.
+
+        Dependency graph:
+            gist (LLM)  ─────────────────────────────> embed gist
+            normalize ──> embed verbatim + normalized (one batch)
+
+        The gist LLM call starts first on the preprocessing pool, normalization runs
+        on the calling thread, the verbatim and normalized embeddings go out together
+        as one batch, and the gist embedding is issued as soon as the gist arrives.
+        The critical path is therefore max( gist + embed gist, normalize + embed V+N )
+        instead of the sum of all stages.
+
+        Requires:
+            - question is the raw user input (verbatim)
+            - parsed_question is question with salutations stripped
+
+        Ensures:
+            - Returns dict with 'verbatim', 'normalized', 'gist', 'embeddings' (verbatim/normalized/gist)
+              and 'timings_ms' (gist, normalize, embed_verbatim_normalized, embed_gist, total)
+            - Gist falls back to the normalized question when input gisting is disabled
+            - Gist embedding reuses the normalized embedding when the texts are identical
+
+        Raises:
+            - Exceptions from the gist, normalization or embedding stages propagate
+        """
+        timings     = { "gist": 0, "normalize": 0, "embed_verbatim_normalized": 0, "embed_gist": 0 }
+        total_timer = Stopwatch( silent=True )
+
+        def timed( stage: str, fn: Any, *args: Any, **kwargs: Any ) -> Any:
+            timer  = Stopwatch( silent=True )
+            result = fn( *args, **kwargs )
+            timings[ stage ] = timer.get_delta_ms()
+            return result
+
+        enable_gisting = self.config_mgr.get( "fifo todo queue enable input gisting", default=True, return_type="boolean" )
+        gist_future    = self._preprocess_executor.submit( timed, "gist", self.gist_normalizer.get_normalized_gist, parsed_question ) if enable_gisting else None
+
+        query_normalized = timed( "normalize", self.normalizer.normalize, parsed_question )
+        verbatim_future  = self._preprocess_executor.submit(
+            timed, "embed_verbatim_normalized", self._embedding_provider.generate_embeddings_batch, [ question, query_normalized ], content_type="prose"
+        )
+
+        query_gist = gist_future.result() if gist_future is not None else query_normalized
+
+        if query_gist == query_normalized:
+            embedding_verbatim, embedding_normalized = verbatim_future.result()
+            embedding_gist = embedding_normalized
+        else:
+            embedding_gist = timed( "embed_gist", self._embedding_provider.generate_embedding, query_gist, content_type="prose" )
+            embedding_verbatim, embedding_normalized = verbatim_future.result()
+
+        timings[ "total" ] = total_timer.get_delta_ms()
+
+        return {
+            "verbatim"   : question,
+            "normalized" : query_normalized,
+            "gist"       : query_gist,
+            "embeddings" : { "verbatim": embedding_verbatim, "normalized": embedding_normalized, "gist": embedding_gist },
+            "timings_ms" : timings
+        }
+
     def push_job( self, question: str, websocket_id: str, user_id: str, user_email: str ) -> Dict:
         """
         Push a new job onto the queue based on the question.
@@ -384,28 +464,15 @@ class TodoFifoQueue( FifoQueue ):
         # This needs to be available for all code paths, so do it before conditionals
         salutations, parsed_question = self.parse_salutations( question )
 
-        # Process the question for gist generation
-        enable_gisting = self.config_mgr.get( "fifo todo queue enable input gisting", default=True, return_type="boolean" )
-        if enable_gisting:
-            question_gist = self.gist_normalizer.get_normalized_gist( parsed_question )
-        else:
-            question_gist = self.normalizer.normalize( parsed_question )
-
-        # Generate three-level representation
-        query_verbatim   = question  # Exact user input
-        query_normalized = self.normalizer.normalize( parsed_question )  # Always normalize for consistency
-        query_gist       = question_gist  # Use the gist computed above
-
-        # Generate embeddings using cache-first strategy
-        embedding_verbatim = self._embedding_provider.generate_embedding(
-            query_verbatim, content_type="prose"
-        )
-        embedding_normalized = self._embedding_provider.generate_embedding(
-            query_normalized, content_type="prose"
-        )
-        embedding_gist = self._embedding_provider.generate_embedding(
-            query_gist, content_type="prose"
-        )
+        # Gist, normalization and the three embeddings, fanned out as a dependency graph
+        representations      = self._generate_representations( question, parsed_question )
+        query_verbatim       = representations[ "verbatim" ]
+        query_normalized     = representations[ "normalized" ]
+        query_gist           = representations[ "gist" ]
+        question_gist        = query_gist
+        embedding_verbatim   = representations[ "embeddings" ][ "verbatim" ]
+        embedding_normalized = representations[ "embeddings" ][ "normalized" ]
+        embedding_gist       = representations[ "embeddings" ][ "gist" ]
 
         # Track cache hits for analytics
         cache_hits = {
@@ -420,6 +487,10 @@ class TodoFifoQueue( FifoQueue ):
             print( f"  Normalized: '{query_normalized}'" )
             print( f"  Gist:       '{query_gist}'" )
             print( f"Embeddings generated - V:{len( embedding_verbatim )} N:{len( embedding_normalized )} G:{len( embedding_gist )}" )
+        if self.debug:
+            timings = representations[ "timings_ms" ]
+            print( f"push_job() preprocessing [ms]: gist={timings[ 'gist' ]}, normalize={timings[ 'normalize' ]}, "
+                   f"embed V+N={timings[ 'embed_verbatim_normalized' ]}, embed G={timings[ 'embed_gist' ]}, critical path={timings[ 'total' ]}" )
 
         # check to see if the queue isn't accepting jobs (because it's waiting for response to a previous request)
         if not self.is_accepting_jobs():
@@ -1178,8 +1249,8 @@ class TodoFifoQueue( FifoQueue ):
         with self.condition:
             # Call parent's push method (includes Protocol validation)
             super().push( item )
-            # Notify consumer thread that work is available
-            self.condition.notify()
+            # Notify consumer threads that work is available (all of them: lane workers wait on different job types)
+            self.condition.notify_all()
 
         # Emit pending → todo state transition for UI rendering
         # Phase 2: Direct attribute access - Protocol guarantees these exist
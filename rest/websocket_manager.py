@@ -1,10 +1,65 @@
 from fastapi import WebSocket
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 import asyncio
+import json
+import threading
 from cosa.config.configuration_manager import ConfigurationManager
 
 
+class _SessionSender:
+    """
+    Bounded outbound queue for one WebSocket, drained by its own writer task.
+
+    Emitters only enqueue already-serialized text, so a slow client backs up its
+    own queue instead of the broadcast. A send that exceeds send_timeout, fails,
+    or finds the queue full gets the session dropped by the manager.
+
+    Requires:
+        - Created and used on the event loop that owns the websocket
+
+    Ensures:
+        - Messages reach the socket in the order they were offered
+        - The writer task ends when the session is dropped or stop() is called
+    """
+
+    def __init__( self, manager: "WebSocketManager", session_id: str, websocket: WebSocket, max_queue: int, send_timeout: float ):
+        self.manager      = manager
+        self.session_id   = session_id
+        self.websocket    = websocket
+        self.send_timeout = send_timeout
+        self.queue        = asyncio.Queue( maxsize=max_queue )
+        self.loop         = asyncio.get_running_loop()
+        self.task         = self.loop.create_task( self._drain() )
+
+    def offer( self, text: str ) -> bool:
+        """Enqueue one serialized message; returns False if the queue is full or the writer has stopped."""
+        if self.task.done():
+            return False
+        try:
+            self.queue.put_nowait( text )
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def stop( self ) -> None:
+        """Cancel the writer task; safe to call from any thread, and a no-op once its loop has closed."""
+        if self.task.done() or self.loop.is_closed(): return
+        self.loop.call_soon_threadsafe( self.task.cancel )
+
+    async def _drain( self ) -> None:
+        while True:
+            text = await self.queue.get()
+            try:
+                await asyncio.wait_for( self.websocket.send_text( text ), timeout=self.send_timeout )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                reason = f"send timed out after {self.send_timeout}s" if isinstance( e, asyncio.TimeoutError ) else f"send failed: {e}"
+                self.manager._drop_session( self.session_id, self.websocket, reason )
+                return
+
+
 class WebSocketManager:
     """
     Manages WebSocket connections and provides Socket.IO-like emit functionality.
@@ -23,6 +78,8 @@ class WebSocketManager:
         - User session management with optional single-session enforcement
         - Event subscription system with validation
         - Automatic cleanup of stale and dead connections
+        - Each event is serialized once; every socket has a bounded outbound queue
+          drained by its own writer task, so a slow client never delays the others
         - Socket.IO-compatible interface for COSA queue system
         
     Usage:
@@ -62,8 +119,24 @@ class WebSocketManager:
         self.single_session_per_user = self.config_mgr.get( "websocket enforce single session per user", default=False, return_type="boolean" )
         self.session_timestamps: Dict[str, datetime] = {}  # Track when sessions connected
         
+        # Outbound fan-out: one bounded queue + writer task per session, created on first send
+        self.outbound_queue_size = self.config_mgr.get( "websocket outbound queue size", default=256, return_type="int" )
+        self.send_timeout        = self.config_mgr.get( "websocket send timeout seconds", default=5.0, return_type="float" )
+        self._senders: Dict[str, _SessionSender] = {}
+        # Sessions dropped since the last heartbeat_check(), which reads and resets this
+        self._dropped_sessions: List[str] = []
+        
+        # Coalescing of bursty per-( user, job ) events from the sync emit paths; 0 ms disables it
+        self.coalesce_window  = self.config_mgr.get( "websocket coalesce window ms", default=75, return_type="int" ) / 1000.0
+        self._coalesce_lock   = threading.Lock()
+        self._pending_emits: Dict[tuple, dict] = {}
+        self.coalesce_stats   = { "received": 0, "scheduled": 0, "merged": 0 }
+        
         # Event subscription system
         self.session_subscriptions: Dict[str, List[str]] = {}  # Map session_id to list of subscribed events
+        # Inverted index kept in step with session_subscriptions: event -> session_ids, plus "*" subscribers
+        self.event_subscribers: Dict[str, Set[str]] = {}
+        self.wildcard_sessions: Set[str] = set()
         
         # Load available events from configuration
         event_list = self.config_mgr.get( "websocket available events", default=[], return_type="list-string" )
@@ -141,7 +214,8 @@ class WebSocketManager:
                         # Clean up the connection
                         self.disconnect( old_session_id )
         
-        # Add the new connection
+        # Add the new connection (a reconnect under the same session_id gets a fresh sender)
+        self._stop_sender( session_id )
         self.active_connections[session_id] = websocket
         self.session_timestamps[session_id] = datetime.now()
         
@@ -155,11 +229,11 @@ class WebSocketManager:
         if subscribed_events:
             # Validate events
             valid_events = [e for e in subscribed_events if e == "*" or e in self.available_events]
-            self.session_subscriptions[session_id] = valid_events
+            self._set_subscriptions( session_id, valid_events )
             print( f"[WS] Session {session_id} subscribed to: {valid_events}" )
         else:
             # Default: subscribe to all events
-            self.session_subscriptions[session_id] = ["*"]
+            self._set_subscriptions( session_id, ["*"] )
             print( f"[WS] Session {session_id} subscribed to: all events (*)" )
     
     def disconnect( self, session_id: str ):
@@ -171,8 +245,9 @@ class WebSocketManager:
             
         Ensures:
             - Removes connection from active_connections if present
+            - Stops the session's outbound writer task
             - Cleans up session timestamp tracking
-            - Removes event subscription mappings
+            - Removes event subscription mappings and inverted index entries
             - Cleans up user-to-session associations
             - Removes empty user session lists
             
@@ -181,14 +256,15 @@ class WebSocketManager:
         """
         if session_id in self.active_connections:
             del self.active_connections[session_id]
+        
+        self._stop_sender( session_id )
             
         # Clean up session timestamp
         if session_id in self.session_timestamps:
             del self.session_timestamps[session_id]
             
-        # Clean up event subscriptions
-        if session_id in self.session_subscriptions:
-            del self.session_subscriptions[session_id]
+        # Clean up event subscriptions and their index entries
+        self._clear_subscriptions( session_id )
             
         # Clean up user association
         if session_id in self.session_to_user:
@@ -244,37 +320,24 @@ class WebSocketManager:
             - data is a dictionary containing event data
             
         Ensures:
-            - Creates timestamped message in expected format
-            - Sends to all clients subscribed to the event or "*"
-            - Automatically disconnects failed connections
-            - Cleans up disconnected clients from tracking
+            - Creates timestamped message in expected format, serialized once
+            - Queues it for every client subscribed to the event or "*", found through
+              the inverted index, so unsubscribed sessions are never visited
+            - Never waits on a client: each socket's writer task sends concurrently
+            - Disconnects clients whose outbound queue is full
             
         Raises:
-            - None (WebSocket send failures handled gracefully)
+            - None (serialization and WebSocket send failures handled gracefully)
         """
-        # Build message in format expected by queue.js
-        message = {
-            "type": event,
-            "timestamp": datetime.now().isoformat(),
-            **data
-        }
+        text = self._serialize( event, data )
+        if text is None: return
         
-        # Send to all connected clients that are subscribed to this event
-        disconnected = []
-        for session_id, websocket in self.active_connections.items():
-            # Check if this session is subscribed to this event
-            subscriptions = self.session_subscriptions.get( session_id, ["*"] )
-            
-            if "*" in subscriptions or event in subscriptions:
-                try:
-                    await websocket.send_json( message )
-                except:
-                    # Mark for removal if send fails
-                    disconnected.append( session_id )
-        
-        # Clean up disconnected clients
-        for session_id in disconnected:
-            self.disconnect( session_id )
+        # Queue for all connected clients that are subscribed to this event
+        targets = [
+            session_id for session_id in self._subscribers_for( event )
+            if session_id in self.active_connections
+        ]
+        self._fan_out( targets, text )
     
     def get_connection_count( self ) -> int:
         """
@@ -317,8 +380,8 @@ class WebSocketManager:
             - data is a dictionary containing event data
             
         Ensures:
-            - Sends timestamped message to specified session if active
-            - Disconnects session if send fails
+            - Queues timestamped message for the specified session if active
+            - Disconnects session if its outbound queue is full or its send fails
             - Returns early if session not found
             
         Raises:
@@ -326,18 +389,11 @@ class WebSocketManager:
         """
         if session_id not in self.active_connections:
             return
-            
-        message = {
-            "type": event,
-            "timestamp": datetime.now().isoformat(),
-            **data
-        }
         
-        try:
-            websocket = self.active_connections[session_id]
-            await websocket.send_json( message )
-        except:
-            self.disconnect( session_id )
+        text = self._serialize( event, data )
+        if text is None: return
+        
+        self._fan_out( [ session_id ], text )
     
     def emit( self, event: str, data: dict ):
         """
@@ -353,7 +409,7 @@ class WebSocketManager:
             - self.main_loop is set and running
             
         Ensures:
-            - Schedules async emission on main event loop
+            - Schedules async emission on main event loop, after coalescing (see _coalesce)
             - Does not block calling thread
             - Prints error messages if event loop unavailable
             - Provides debug output when enabled
@@ -369,17 +425,8 @@ class WebSocketManager:
             print( f"[ERROR] Event loop not running - cannot emit {event}" )
             return
         
-        try:
-            # Schedule coroutine on main event loop from any thread
-            future = asyncio.run_coroutine_threadsafe(
-                self._async_emit( event, data ),
-                self.main_loop
-            )
-            # Don't wait for result to avoid blocking
-            if hasattr( self, 'debug' ) and self.debug:
-                print( f"[WS] Scheduled emission of {event}" )
-        except Exception as e:
-            print( f"[ERROR] Failed to schedule emission: {e}" )
+        for payload_event, payload in self._coalesce( None, event, data ):
+            self._schedule_emit( None, payload_event, payload )
     
     async def _async_emit( self, event: str, data: dict ):
         """
@@ -415,7 +462,7 @@ class WebSocketManager:
             - self.main_loop is set and running
             
         Ensures:
-            - Schedules async emission to user on main event loop
+            - Schedules async emission to user on main event loop, after coalescing (see _coalesce)
             - Does not block calling thread
             - Prints error messages if event loop unavailable
             - Prints confirmation when successfully scheduled
@@ -431,16 +478,168 @@ class WebSocketManager:
             print( f"[ERROR] Event loop not running - cannot emit {event} to user {user_id}" )
             return
         
+        for payload_event, payload in self._coalesce( user_id, event, data ):
+            self._schedule_emit( user_id, payload_event, payload )
+    
+    def _schedule_emit( self, user_id: Optional[str], event: str, data: dict ) -> None:
+        """
+        Schedule one emission on the main event loop without waiting for it.
+        
+        Requires:
+            - self.main_loop is set; callable from any thread, including the loop's own
+            
+        Ensures:
+            - Targets the user's sessions if user_id is given, otherwise broadcasts
+            - Counts the emission in coalesce_stats["scheduled"]
+        """
+        coro = None
         try:
             # Schedule coroutine on main event loop from any thread
-            future = asyncio.run_coroutine_threadsafe(
-                self.emit_to_user( user_id, event, data ),
-                self.main_loop
-            )
+            if user_id:
+                coro = self.emit_to_user( user_id, event, data )
+            else:
+                coro = self._async_emit( event, data )
+            future = asyncio.run_coroutine_threadsafe( coro, self.main_loop )
             # Don't wait for result to avoid blocking the COSA thread
-            print( f"[WS] Scheduled emission of {event} to user {user_id}" )
+            with self._coalesce_lock:
+                self.coalesce_stats["scheduled"] += 1
+            if user_id:
+                print( f"[WS] Scheduled emission of {event} to user {user_id}" )
+            elif hasattr( self, 'debug' ) and self.debug:
+                print( f"[WS] Scheduled emission of {event}" )
         except Exception as e:
-            print( f"[ERROR] Failed to schedule emission to user {user_id}: {e}" )
+            if coro is not None: coro.close()
+            print( f"[ERROR] Failed to schedule emission{f' to user {user_id}' if user_id else ''}: {e}" )
+    
+    def _coalesce_key( self, user_id: Optional[str], event: str, data: dict ) -> tuple:
+        """
+        Classify an event for coalescing.
+        
+        Ensures:
+            - Returns ( key, holdable ): key identifies the ( user, job ) stream the event
+              belongs to, or is None if the event is never coalesced
+            - job_state_transition is holdable unless it ends in done/dead or carries an error
+            - notification_queue_update is holdable only for plain progress notifications:
+              no response requested and not high/urgent priority
+        """
+        if event == "job_state_transition":
+            job_id = data.get( "job_id" )
+            if not job_id: return None, False
+            metadata = data.get( "metadata" ) or {}
+            terminal = data.get( "to_queue" ) in ( "done", "dead" ) or bool( metadata.get( "error" ) )
+            return ( user_id, job_id, event ), not terminal
+        
+        if event == "notification_queue_update":
+            notification = data.get( "notification" ) or {}
+            stream_id    = notification.get( "job_id" ) or notification.get( "sender_id" )
+            if not stream_id: return None, False
+            holdable = (
+                notification.get( "type" ) == "progress"
+                and not notification.get( "response_requested" )
+                and notification.get( "priority" ) not in ( "high", "urgent" )
+            )
+            return ( user_id, stream_id, event ), holdable
+        
+        return None, False
+    
+    def _coalesce( self, user_id: Optional[str], event: str, data: dict ) -> List[tuple]:
+        """
+        Hold or merge bursty events per ( user, job ) for coalesce_window seconds.
+        
+        A cache-hit replay moves a job pending -> todo -> run -> done within
+        milliseconds, and agentic jobs push bursts of progress notifications; each
+        would otherwise be serialized and sent to every one of the user's sockets.
+        
+        Requires:
+            - self.main_loop is running ( the flush timer is scheduled on it )
+            
+        Ensures:
+            - Returns the ( event, payload ) pairs to schedule now, in order ( empty if the event was held )
+            - Consecutive held state transitions collapse into the latest one, keeping the
+              first from_queue so the client sees the whole hop; later metadata wins
+            - Consecutive held progress notifications collapse into the latest one
+            - A merged payload carries coalesced_count, the number of events it stands for
+            - A terminal or error transition is never delayed: it absorbs any held
+              transition for the same job and goes out at once, after any progress
+              still held for that job, so the client never sees progress after done
+            - Any other event for a stream with held progress flushes that progress first
+            - Every held payload is sent within coalesce_window seconds of its first event
+        """
+        if self.coalesce_window <= 0: return [ ( event, data ) ]
+        
+        key, holdable = self._coalesce_key( user_id, event, data )
+        if key is None: return [ ( event, data ) ]
+        
+        with self._coalesce_lock:
+            self.coalesce_stats["received"] += 1
+            pending = self._pending_emits.get( key )
+            
+            # Progress held for a job that just finished or failed goes out ahead of the transition
+            flushed = [ ]
+            if event == "job_state_transition" and not holdable:
+                progress_key = ( user_id, key[1], "notification_queue_update" )
+                progress     = self._pending_emits.pop( progress_key, None )
+                if progress is not None: flushed.append( ( progress_key[2], progress["data"] ) )
+            
+            if pending is not None and event == "job_state_transition":
+                # Supersede the held transition, keeping where the job started from
+                merged = dict( data )
+                merged["from_queue"] = pending["data"]["from_queue"]
+                if "metadata" not in merged and "metadata" in pending["data"]:
+                    merged["metadata"] = pending["data"]["metadata"]
+                merged["coalesced_count"] = pending["count"] + 1
+                self.coalesce_stats["merged"] += 1
+                if holdable:
+                    pending["data"], pending["count"] = merged, pending["count"] + 1
+                    return []
+                del self._pending_emits[key]
+                return flushed + [ ( event, merged ) ]
+            
+            if pending is not None and holdable:
+                # A newer progress notification supersedes the held one
+                merged = dict( data )
+                merged["coalesced_count"] = pending["count"] + 1
+                pending["data"], pending["count"] = merged, pending["count"] + 1
+                self.coalesce_stats["merged"] += 1
+                return []
+            
+            if pending is not None:
+                # Not holdable: the held progress goes out first, then this event, in order
+                del self._pending_emits[key]
+                return [ ( event, pending["data"] ), ( event, data ) ]
+            
+            if not holdable: return flushed + [ ( event, data ) ]
+            
+            self._pending_emits[key] = { "data": data, "count": 1 }
+        
+        try:
+            self.main_loop.call_soon_threadsafe( self.main_loop.call_later, self.coalesce_window, self._flush_coalesced, key )
+        except RuntimeError:
+            # Loop closed under us: nothing will flush, so send now
+            self._flush_coalesced( key )
+        return []
+    
+    def _flush_coalesced( self, key: tuple ) -> None:
+        """Send the payload held under key, if it hasn't already gone out with a later event."""
+        with self._coalesce_lock:
+            pending = self._pending_emits.pop( key, None )
+        if pending is not None:
+            self._schedule_emit( key[0], key[2], pending["data"] )
+    
+    def get_coalescing_stats( self ) -> dict:
+        """
+        Get counters for event coalescing on the sync emit paths.
+        
+        Ensures:
+            - Returns window_ms, events received by the coalescer, events merged away,
+              emissions scheduled ( coalesced or not ) and payloads currently held
+        """
+        with self._coalesce_lock:
+            return {
+                "window_ms": int( self.coalesce_window * 1000 ),
+                **self.coalesce_stats,
+                "pending": len( self._pending_emits )
+            }
     
     def is_user_connected( self, user_id: str ) -> bool:
         """
@@ -503,38 +702,145 @@ class WebSocketManager:
             data: The data to send
             
         Returns:
-            bool: True if message was sent to at least one connection, False if user not available
+            bool: True if message was queued for at least one connection, False if user not available
         """
         if user_id not in self.user_sessions:
             return False
+        
+        text = self._serialize( event, data )
+        if text is None: return False
+        
+        targets = [
+            session_id for session_id in list( self.user_sessions[user_id] )
+            if session_id in self.active_connections and self._is_subscribed( session_id, event )
+        ]
+        
+        return self._fan_out( targets, text ) > 0
+    
+    def _serialize( self, event: str, data: dict ) -> Optional[str]:
+        """
+        Build and serialize an event message once for every recipient.
+        
+        Requires:
+            - data is a JSON-serializable dictionary
             
+        Ensures:
+            - Returns the message in the format expected by queue.js, encoded the way
+              Starlette's send_json() encodes it ( compact, non-ASCII kept )
+            - Returns None ( and logs ) if data can't be serialized
+        """
         message = {
             "type": event,
             "timestamp": datetime.now().isoformat(),
             **data
         }
         
-        sent_count = 0
-        disconnected = []
+        try:
+            return json.dumps( message, separators=( ",", ":" ), ensure_ascii=False )
+        except ( TypeError, ValueError ) as e:
+            print( f"[ERROR] Cannot serialize {event} event: {e}" )
+            return None
+    
+    def _is_subscribed( self, session_id: str, event: str ) -> bool:
+        """Return True if the session subscribes to the event or to everything ("*"); sessions with no subscriptions recorded get everything."""
+        if session_id not in self.session_subscriptions:
+            return True
+        return session_id in self.wildcard_sessions or session_id in self.event_subscribers.get( event, () )
+    
+    def _subscribers_for( self, event: str ) -> Set[str]:
+        """Return the session_ids subscribed to the event, directly or through "*"."""
+        subscribers = self.event_subscribers.get( event )
+        return self.wildcard_sessions | subscribers if subscribers else set( self.wildcard_sessions )
+    
+    def _set_subscriptions( self, session_id: str, events: List[str] ) -> None:
+        """
+        Replace a session's subscriptions and its inverted index entries.
+        
+        Ensures:
+            - session_subscriptions[session_id] == events
+            - The session appears in wildcard_sessions iff "*" is in events, and in
+              event_subscribers[e] iff e is in events; empty event sets are removed
+        """
+        self._clear_subscriptions( session_id )
+        self.session_subscriptions[session_id] = events
+        for event in events:
+            if event == "*":
+                self.wildcard_sessions.add( session_id )
+            else:
+                self.event_subscribers.setdefault( event, set() ).add( session_id )
+    
+    def _clear_subscriptions( self, session_id: str ) -> None:
+        """Remove a session's subscriptions and every inverted index entry for it."""
+        events = self.session_subscriptions.pop( session_id, None )
+        if events is None: return
+        
+        self.wildcard_sessions.discard( session_id )
+        for event in events:
+            subscribers = self.event_subscribers.get( event )
+            if subscribers is not None:
+                subscribers.discard( session_id )
+                if not subscribers: del self.event_subscribers[event]
+    
+    def _fan_out( self, session_ids: List[str], text: str ) -> int:
+        """
+        Queue one serialized message for each session.
         
-        for session_id in self.user_sessions[user_id]:
-            if session_id in self.active_connections:
-                # Check if this session is subscribed to this event
-                subscriptions = self.session_subscriptions.get( session_id, ["*"] )
-                
-                if "*" in subscriptions or event in subscriptions:
-                    try:
-                        websocket = self.active_connections[session_id]
-                        await websocket.send_json( message )
-                        sent_count += 1
-                    except:
-                        disconnected.append( session_id )
-        
-        # Clean up disconnected sessions
-        for session_id in disconnected:
-            self.disconnect( session_id )
+        Requires:
+            - Called on the event loop thread
+            
+        Ensures:
+            - Starts a session's writer task on first use
+            - Sessions whose outbound queue is full are dropped ( stalled client )
+            - Returns the number of sessions the message was queued for
+        """
+        queued = 0
+        for session_id in session_ids:
+            websocket = self.active_connections.get( session_id )
+            if websocket is None: continue
+            
+            sender = self._senders.get( session_id )
+            if sender is None or sender.websocket is not websocket:
+                sender = _SessionSender( self, session_id, websocket, self.outbound_queue_size, self.send_timeout )
+                self._senders[ session_id ] = sender
+            
+            if sender.offer( text ):
+                queued += 1
+            else:
+                self._drop_session( session_id, websocket, f"outbound queue full ({self.outbound_queue_size} messages)" )
+        
+        return queued
+    
+    def _stop_sender( self, session_id: str ) -> None:
+        """Stop and forget a session's writer task, if it has one."""
+        sender = self._senders.pop( session_id, None )
+        if sender is not None:
+            sender.stop()
+    
+    def _drop_session( self, session_id: str, websocket: WebSocket, reason: str ) -> None:
+        """
+        Disconnect a stalled or broken client without waiting on it.
+        
+        Ensures:
+            - No-op if the session has since reconnected with a different socket
+            - Session is disconnected and its socket closed in the background
+        """
+        if self.active_connections.get( session_id ) is not websocket:
+            return
+        
+        print( f"[WS] Dropping session {session_id}: {reason}" )
+        self._dropped_sessions.append( session_id )
+        self.disconnect( session_id )
+        
+        async def close_quietly():
+            try:
+                await asyncio.wait_for( websocket.close( code=1013, reason="Client too slow" ), timeout=self.send_timeout )
+            except Exception:
+                pass
         
-        return sent_count > 0
+        try:
+            asyncio.get_running_loop().create_task( close_quietly() )
+        except RuntimeError:
+            pass
     
     async def emit_to_all( self, event: str, data: dict ):
         """
@@ -671,9 +977,11 @@ class WebSocketManager:
             - Configuration may disable heartbeat checking
             
         Ensures:
-            - Sends sys_ping message to all active connections
-            - Identifies and removes connections that fail to receive ping
-            - Prints summary of removed connections
+            - Queues a sys_ping message for all active connections
+            - Removes connections that are already dead or whose queue is full;
+              pings that later fail or time out drop their session from the writer task
+            - Returns ( and prints ) the number of sessions dropped since the previous
+              check, so failed pings from the last round are counted by this one
             - Returns early if heartbeat disabled in configuration
             
         Raises:
@@ -682,24 +990,14 @@ class WebSocketManager:
         if not self.config_mgr.get( "websocket heartbeat enabled", default=True, return_type="boolean" ):
             return 0
         
-        dead_sessions = []
+        text        = self._serialize( "sys_ping", {} )
+        session_ids = list( self.active_connections )
+        self._fan_out( session_ids, text )
         
-        # Send ping to each connection
-        for session_id, websocket in list( self.active_connections.items() ):
-            try:
-                # Attempt to send a ping message
-                await websocket.send_json( {
-                    "type": "sys_ping",
-                    "timestamp": datetime.now().isoformat()
-                } )
-            except:
-                # Connection is dead, mark for removal
-                dead_sessions.append( session_id )
-        
-        # Clean up dead connections
+        dead_sessions          = self._dropped_sessions
+        self._dropped_sessions = []
         for session_id in dead_sessions:
             print( f"[WS-HEARTBEAT] Detected dead session: {session_id}" )
-            self.disconnect( session_id )
         
         if dead_sessions:
             print( f"[WS-HEARTBEAT] Removed {len(dead_sessions)} dead connection(s)" )
@@ -748,7 +1046,7 @@ class WebSocketManager:
             
         Ensures:
             - Validates events against available_events list
-            - Updates subscriptions according to specified action
+            - Updates subscriptions and the inverted event index according to specified action
             - Prints confirmation of subscription changes
             - Returns True if successful, False if session not found
             - Handles duplicate prevention for "add" action
@@ -763,14 +1061,14 @@ class WebSocketManager:
         valid_events = [e for e in events if e == "*" or e in self.available_events]
         
         if action == "replace":
-            self.session_subscriptions[session_id] = valid_events
+            self._set_subscriptions( session_id, valid_events )
         elif action == "add":
             current = self.session_subscriptions[session_id]
             # Avoid duplicates
-            self.session_subscriptions[session_id] = list( set( current + valid_events ) )
+            self._set_subscriptions( session_id, list( set( current + valid_events ) ) )
         elif action == "remove":
             current = self.session_subscriptions[session_id]
-            self.session_subscriptions[session_id] = [e for e in current if e not in valid_events]
+            self._set_subscriptions( session_id, [e for e in current if e not in valid_events] )
         
         print( f"[WS] Updated subscriptions for {session_id}: {self.session_subscriptions[session_id]}" )
         return True
@@ -842,7 +1140,8 @@ def quick_smoke_test():
             "emit_to_session", "emit", "emit_to_user_sync", "is_user_connected",
             "get_user_connection_count", "emit_to_all", "set_single_session_policy",
             "get_session_info", "get_all_sessions_info", "cleanup_stale_sessions",
-            "heartbeat_check", "auto_cleanup", "update_subscriptions", "get_subscription_stats"
+            "heartbeat_check", "auto_cleanup", "update_subscriptions", "get_subscription_stats",
+            "get_coalescing_stats"
         ]
         
         methods_found = 0
@@ -11,9 +11,12 @@ import json
 from typing import Dict, Any, List, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 import cosa.utils.util as du
 from cosa.memory.snapshot_manager_interface import SolutionSnapshotManagerInterface
 from cosa.memory.solution_snapshot import SolutionSnapshot
+from cosa.memory.embedding_matrix import EmbeddingMatrix
 
 
 @dataclass
@@ -513,6 +516,312 @@ class ManagerComparisonSuite:
                         print( f"                              ... and {failed_count - 3} more" )
 
 
+def benchmark_similarity_search( sizes: Tuple[int, ...] = ( 1000, 10000, 50000 ), dim: int = 768, queries: int = 20, limit: int = 7, threshold: float = 20.0 ) -> Dict[int, Dict[str, float]]:
+    """
+    Benchmark the per-pair similarity loop against the vectorized EmbeddingMatrix search.
+
+    Mirrors FileBasedSolutionManager._get_snapshots_by_question_similarity() before and
+    after the switch to a contiguous float32 matrix, without needing snapshots on disk.
+
+    Requires:
+        - sizes are positive snapshot counts
+
+    Ensures:
+        - Both searches return the same snapshots for every query
+        - Returns { size: { "loop_ms", "matrix_ms", "speedup", "build_ms" } } per-query timings
+    """
+    du.print_banner( "Similarity Search Benchmark: per-pair loop vs EmbeddingMatrix", prepend_nl=True )
+
+    rng     = np.random.default_rng( 42 )
+    results = {}
+
+    for size in sizes:
+        vectors = rng.standard_normal( ( size, dim ) ).astype( np.float32 )
+        vectors /= np.linalg.norm( vectors, axis=1, keepdims=True )
+        embeddings = [ vector.tolist() for vector in vectors ]
+
+        # Queries near existing rows so some rows clear the threshold
+        noise        = 0.05 * rng.standard_normal( ( queries, dim ) )
+        query_arrays = vectors[ rng.integers( 0, size, queries ) ] + noise
+        query_arrays /= np.linalg.norm( query_arrays, axis=1, keepdims=True )
+        query_list   = [ query.tolist() for query in query_arrays ]
+
+        start  = time.perf_counter()
+        matrix = EmbeddingMatrix( initial_capacity=size )
+        for i, embedding in enumerate( embeddings ):
+            matrix.upsert( i, embedding, i )
+        build_ms = ( time.perf_counter() - start ) * 1000
+
+        start = time.perf_counter()
+        loop_hits = []
+        for query in query_list:
+            scored = []
+            for i, embedding in enumerate( embeddings ):
+                score = SolutionSnapshot.get_embedding_similarity( query, embedding )
+                if score >= threshold: scored.append( ( score, i ) )
+            scored.sort( key=lambda item: item[ 0 ], reverse=True )
+            loop_hits.append( [ i for _, i in scored[ :limit ] ] )
+        loop_ms = ( time.perf_counter() - start ) * 1000 / queries
+
+        start = time.perf_counter()
+        matrix_hits = [ [ i for _, i in matrix.search( query, threshold, limit ) ] for query in query_list ]
+        matrix_ms = ( time.perf_counter() - start ) * 1000 / queries
+
+        assert matrix_hits == loop_hits, f"Vectorized search disagrees with the per-pair loop at {size} snapshots"
+
+        results[ size ] = {
+            "loop_ms"  : loop_ms,
+            "matrix_ms": matrix_ms,
+            "speedup"  : loop_ms / matrix_ms if matrix_ms > 0 else float( "inf" ),
+            "build_ms" : build_ms
+        }
+        print( f"  {size:>6,} snapshots: loop {loop_ms:9.2f}ms  matrix {matrix_ms:7.2f}ms  ({results[ size ][ 'speedup' ]:.0f}x faster, build {build_ms:.0f}ms)" )
+
+    return results
+
+
+def _synthetic_snapshot_table( schema: "pa.Schema", rows: int, dim: int, clusters: int = 200, seed: int = 42 ) -> "pa.Table":
+    """
+    Build a table of synthetic snapshot rows matching a LanceDBSolutionManager schema.
+
+    Ensures:
+        - Embedding columns hold unit vectors drawn around `clusters` centroids, so ANN recall
+          resembles real question embeddings rather than uniform noise
+        - id_hash and question columns are unique per row
+    """
+    import pyarrow as pa
+
+    rng       = np.random.default_rng( seed )
+    centroids = rng.standard_normal( ( clusters, dim ) ).astype( np.float32 )
+    columns   = {}
+    for field in schema:
+        if pa.types.is_fixed_size_list( field.type ):
+            vectors  = centroids[ rng.integers( 0, clusters, rows ) ] + 0.5 * rng.standard_normal( ( rows, dim ) ).astype( np.float32 )
+            vectors /= np.linalg.norm( vectors, axis=1, keepdims=True )
+            columns[ field.name ] = pa.FixedSizeListArray.from_arrays( pa.array( vectors.ravel() ), dim )
+        elif pa.types.is_list( field.type ):
+            columns[ field.name ] = pa.array( [ [] ] * rows, type=field.type )
+        elif pa.types.is_boolean( field.type ):
+            columns[ field.name ] = pa.array( [ False ] * rows )
+        elif field.name in ( "id_hash", "question", "question_normalized", "question_gist" ):
+            columns[ field.name ] = pa.array( [ f"{field.name} {i}" for i in range( rows ) ] )
+        else:
+            columns[ field.name ] = pa.array( [ "{}" ] * rows, type=field.type )
+
+    return pa.table( columns, schema=schema )
+
+
+def benchmark_lancedb_initialization( rows: int = 20000, dim: int = 768 ) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark LanceDBSolutionManager startup: full-table pandas load vs projected lookup load.
+
+    Builds a synthetic table with the manager's own schema in a temporary directory, then
+    measures the old to_arrow().to_pandas() + iterrows() load and the current initialize().
+
+    Requires:
+        - lancedb and a working configuration (LanceDBSolutionManager reads "embedding dimensions")
+
+    Ensures:
+        - Returns { "full_load": {...}, "projected_load": {...} } with startup_ms and rss_mb
+        - RSS is the process-level delta reported by PerformanceMonitor, so run it in a fresh process
+    """
+    import tempfile
+
+    import lancedb
+    import pyarrow as pa
+
+    from cosa.memory.lancedb_solution_manager import LanceDBSolutionManager
+    from cosa.memory.snapshot_manager_interface import PerformanceMonitor
+
+    du.print_banner( f"LanceDB Initialization Benchmark: {rows:,} rows", prepend_nl=True )
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config  = { "storage_backend": "local", "db_path": temp_dir, "table_name": "benchmark_snapshots" }
+        manager = LanceDBSolutionManager( config )
+        schema  = manager._get_schema()
+        dim     = manager._embedding_dim or dim
+
+        db    = lancedb.connect( temp_dir )
+        table = db.create_table( config[ "table_name" ], _synthetic_snapshot_table( schema, rows, dim ) )
+
+        # Projected load first, so the full load's allocations don't mask its RSS delta
+        monitor = PerformanceMonitor( "projected_load" )
+        monitor.start()
+        manager.initialize()
+        monitor.stop()
+        metrics = monitor.get_metrics( result_count=len( manager._id_lookup ) )
+        results[ "projected_load" ] = { "startup_ms": metrics.search_time_ms, "rss_mb": metrics.memory_usage_mb }
+
+        monitor = PerformanceMonitor( "full_load" )
+        monitor.start()
+        full_lookup = {}
+        for _, row in table.to_arrow().to_pandas().iterrows():
+            full_lookup[ row[ "id_hash" ] ] = dict( row )
+        monitor.stop()
+        metrics = monitor.get_metrics( result_count=len( full_lookup ) )
+        results[ "full_load" ] = { "startup_ms": metrics.search_time_ms, "rss_mb": metrics.memory_usage_mb }
+        del full_lookup
+
+    for name, data in results.items():
+        print( f"  {name:15}: {data['startup_ms']:8.1f}ms  RSS +{data['rss_mb']:7.1f}MB" )
+
+    return results
+
+
+def benchmark_vector_index_recall( rows: int = 20000,
+                                   queries: int = 50,
+                                   k: int = 10,
+                                   nprobes_values: Tuple[int, ...] = ( 5, 10, 20, 40 ),
+                                   refine_factors: Tuple[int, ...] = ( 0, 5, 20 ) ) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark IVF-PQ recall and latency against brute-force search on question_embedding.
+
+    Builds a synthetic table, indexes it with LanceDBSolutionManager.ensure_vector_indexes(), and
+    for every ( nprobes, refine_factor ) pair measures recall@k against an exact numpy dot-product
+    ranking plus mean query latency. Use it to pick the "solution snapshots lancedb nprobes" and
+    "... refine factor" settings for a given table size.
+
+    Requires:
+        - lancedb and a working configuration (LanceDBSolutionManager reads "embedding dimensions")
+
+    Ensures:
+        - Returns { "flat": {...}, "nprobes=N refine=R": {...} } with recall and mean_ms
+    """
+    import tempfile
+
+    import lancedb
+
+    from cosa.memory.lancedb_solution_manager import LanceDBSolutionManager
+
+    du.print_banner( f"LanceDB Vector Index Recall Benchmark: {rows:,} rows, {queries} queries, k={k}", prepend_nl=True )
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config  = { "storage_backend": "local", "db_path": temp_dir, "table_name": "benchmark_snapshots", "vector_index_on_init": False }
+        manager = LanceDBSolutionManager( config )
+        schema  = manager._get_schema()
+        dim     = manager._embedding_dim
+
+        table = lancedb.connect( temp_dir ).create_table( config[ "table_name" ], _synthetic_snapshot_table( schema, rows, dim ) )
+        manager.initialize()
+
+        matrix = np.asarray( table.to_arrow().column( "question_embedding" ).combine_chunks().flatten(), dtype=np.float32 ).reshape( rows, dim )
+        ids    = table.to_arrow().column( "id_hash" ).to_pylist()
+
+        rng    = np.random.default_rng( 7 )
+        probes = matrix[ rng.choice( rows, queries, replace=False ) ] + 0.1 * rng.standard_normal( ( queries, dim ) ).astype( np.float32 )
+        probes /= np.linalg.norm( probes, axis=1, keepdims=True )
+        truth  = [ { ids[ row ] for row in np.argsort( -( matrix @ probe ) )[ :k ] } for probe in probes ]
+
+        def run( name: str, search ) -> None:
+            recall  = 0.0
+            elapsed = 0.0
+            for probe, expected in zip( probes, truth ):
+                start    = time.perf_counter()
+                found    = search( probe.tolist() )
+                elapsed += time.perf_counter() - start
+                recall  += len( expected.intersection( found ) ) / k
+            results[ name ] = { "recall": recall / queries, "mean_ms": elapsed / queries * 1000 }
+
+        run( "flat", lambda probe: table.search( probe, vector_column_name="question_embedding" )
+             .metric( "dot" ).limit( k ).select( [ "id_hash" ] ).to_arrow().column( "id_hash" ).to_pylist() )
+
+        start   = time.perf_counter()
+        actions = manager.ensure_vector_indexes( force=True )
+        print( f"  Index build: {( time.perf_counter() - start ) * 1000:,.0f}ms {actions}" )
+
+        for nprobes in nprobes_values:
+            for refine_factor in refine_factors:
+                manager._nprobes       = nprobes
+                manager._refine_factor = refine_factor
+                run( f"nprobes={nprobes} refine={refine_factor}",
+                     lambda probe: manager._vector_search( probe, "question_embedding", k ).column( "id_hash" ).to_pylist() )
+
+    for name, data in results.items():
+        print( f"  {name:22}: recall@{k} {data['recall']:.3f}  {data['mean_ms']:7.2f}ms/query" )
+
+    return results
+
+
+def benchmark_exact_lookups( rows: int = 100000, dim: int = 768, probes: int = 200, batch: int = 50 ) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark exact-text cache probes: unindexed scans vs BTREE index vs prepared ExactMatchLookup.
+
+    Builds an embedding_cache_tbl-shaped table ( normalized_text, embedding ) in a temporary
+    directory and measures single-key probes and batch-sized IN probes three ways: the old
+    per-probe to_lance().scanner() without an index, the same with a BTREE index, and
+    ExactMatchLookup, which also reuses the dataset handle between probes.
+
+    Requires:
+        - lancedb
+
+    Ensures:
+        - Returns { variant: { "single_ms": ..., "in_ms": ... } } plus { "index_build": { "ms": ... } }
+        - Every probe is a hit, so each variant reads the same rows
+    """
+    import tempfile
+
+    import lancedb
+    import pyarrow as pa
+
+    from cosa.memory.lancedb_exact_lookup import ExactMatchLookup, ensure_scalar_index, equals_filter, in_filter
+
+    du.print_banner( f"LanceDB Exact Lookup Benchmark: {rows:,} rows, {probes} probes, IN batches of {batch}", prepend_nl=True )
+
+    rng     = np.random.default_rng( 42 )
+    texts   = [ f"what's the cached question number {i} about topic {i % 97}" for i in range( rows ) ]
+    singles = [ texts[ i ] for i in rng.choice( rows, probes, replace=False ) ]
+    batches = [ [ texts[ i ] for i in rng.choice( rows, batch, replace=False ) ] for _ in range( max( 1, probes // batch ) ) ]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        vectors = rng.standard_normal( ( rows, dim ) ).astype( np.float32 )
+        table   = lancedb.connect( temp_dir ).create_table( "embedding_cache_tbl", pa.table( {
+            "normalized_text": pa.array( texts ),
+            "embedding"      : pa.FixedSizeListArray.from_arrays( pa.array( vectors.ravel() ), dim )
+        } ) )
+        del vectors
+
+        def run( name: str, single, many ) -> None:
+            start = time.perf_counter()
+            for text in singles:
+                assert single( text ) is not None
+            single_ms = ( time.perf_counter() - start ) / len( singles ) * 1000
+
+            start = time.perf_counter()
+            for texts_in in batches:
+                assert len( many( texts_in ) ) == len( texts_in )
+            results[ name ] = { "single_ms": single_ms, "in_ms": ( time.perf_counter() - start ) / len( batches ) * 1000 }
+
+        def scan( filter_str: str, limit=None ) -> List[Dict[str, Any]]:
+            return table.to_lance().scanner( filter=filter_str, limit=limit, columns=[ "normalized_text", "embedding" ] ).to_table().to_pylist()
+
+        run( "unindexed scan",
+             lambda text: ( scan( equals_filter( "normalized_text", text ), limit=1 ) or [ None ] )[ 0 ],
+             lambda texts_in: scan( in_filter( "normalized_text", texts_in ) ) )
+
+        start = time.perf_counter()
+        ensure_scalar_index( table, "normalized_text" )
+        results[ "index_build" ] = { "ms": ( time.perf_counter() - start ) * 1000 }
+
+        run( "btree scan",
+             lambda text: ( scan( equals_filter( "normalized_text", text ), limit=1 ) or [ None ] )[ 0 ],
+             lambda texts_in: scan( in_filter( "normalized_text", texts_in ) ) )
+
+        lookup = ExactMatchLookup( table )
+        run( "btree prepared",
+             lambda text: lookup.first( "normalized_text", text, columns=[ "normalized_text", "embedding" ] ),
+             lambda texts_in: lookup.rows( "normalized_text", texts_in, columns=[ "normalized_text", "embedding" ] ) )
+
+    print( f"  BTREE index build: {results[ 'index_build' ][ 'ms' ]:,.0f}ms" )
+    for name, data in results.items():
+        if name == "index_build": continue
+        print( f"  {name:15}: {data['single_ms']:7.2f}ms/probe  {data['in_ms']:7.2f}ms per IN of {batch}" )
+
+    return results
+
+
 def quick_smoke_test():
     """Test the comparison suite framework."""
     du.print_banner( "Manager Comparison Suite Smoke Test", prepend_nl=True )
@@ -550,4 +859,5 @@ def quick_smoke_test():
 
 
 if __name__ == "__main__":
-    quick_smoke_test()
\ No newline at end of file
+    quick_smoke_test()
+    benchmark_similarity_search()
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Unit tests for the process-wide agent resource cache (AgentResourceCache).
+
+Tests the AgentResourceCache including:
+- Prompt templates read and processed once, re-read after the file changes
+- Dataframes parsed once, handed out as independent copies, re-read after the file changes
+- Unstattable paths bypassing the cache
+- One shared XmlParserFactory per configuration manager
+
+Zero external dependencies - files live in a temporary directory.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import tempfile
+import time
+
+# Import test infrastructure
+import sys
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+from cosa.agents.agent_resource_cache import AgentResourceCache
+
+
+PROCESSOR_PATH = "cosa.agents.io_models.utils.prompt_template_processor.PromptTemplateProcessor.process_template"
+
+
+def _touch_later( path: str ) -> None:
+    """Move a file's mtime forward so the change is visible regardless of filesystem timestamp resolution."""
+    stat = os.stat( path )
+    os.utime( path, ns=( stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000 ) )
+
+
+class TestAgentResourceCache( unittest.TestCase ):
+    """
+    Unit tests for AgentResourceCache.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - Warm lookups skip disk reads and parsing
+        - File edits are still picked up
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Empty cache and a fresh temporary directory
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+        self.temp_dir       = tempfile.TemporaryDirectory()
+        self.cache          = AgentResourceCache()
+        self.cache.clear()
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Cache cleared, temporary files removed and mocks reset
+        """
+        self.cache.clear()
+        self.temp_dir.cleanup()
+        self.mock_manager.reset_mocks()
+
+    def _write( self, name: str, content: str ) -> str:
+        path = os.path.join( self.temp_dir.name, name )
+        with open( path, "w" ) as file:
+            file.write( content )
+        return path
+
+    def test_template_processed_once_and_reloaded_on_change( self ):
+        """
+        Test template caching.
+
+        Ensures:
+            - Second lookup is a hit and doesn't re-run the processor
+            - A different routing command is processed separately
+            - Editing the file invalidates the entry
+        """
+        path = self._write( "template.txt", "Question: {question}" )
+
+        with patch( PROCESSOR_PATH, side_effect=lambda template, routing_command: template.upper() ) as mock_process:
+            first  = self.cache.get_prompt_template( path, "agent router go to math" )
+            second = self.cache.get_prompt_template( path, "agent router go to math" )
+
+            self.assertEqual( first, "QUESTION: {QUESTION}" )
+            self.assertEqual( second, first )
+            self.assertEqual( mock_process.call_count, 1 )
+
+            self.cache.get_prompt_template( path, "agent router go to datetime" )
+            self.assertEqual( mock_process.call_count, 2 )
+
+            with open( path, "w" ) as file:
+                file.write( "Edited: {question}" )
+            _touch_later( path )
+
+            self.assertEqual( self.cache.get_prompt_template( path, "agent router go to math" ), "EDITED: {QUESTION}" )
+
+        stats = self.cache.get_stats()
+        self.assertEqual( stats[ "template_hits" ], 1 )
+        self.assertEqual( stats[ "template_misses" ], 3 )
+
+    def test_template_processing_failure_falls_back_to_raw( self ):
+        """
+        Test that a processor error still yields the raw template.
+
+        Ensures:
+            - Raw file content returned and cached
+        """
+        path = self._write( "template.txt", "Raw {question}" )
+
+        with patch( PROCESSOR_PATH, side_effect=ValueError( "bad marker" ) ):
+            self.assertEqual( self.cache.get_prompt_template( path, "agent router go to math" ), "Raw {question}" )
+            self.assertEqual( self.cache.get_prompt_template( path, "agent router go to math" ), "Raw {question}" )
+
+        self.assertEqual( self.cache.get_stats()[ "template_hits" ], 1 )
+
+    def test_unstattable_path_bypasses_cache( self ):
+        """
+        Test that a path that can't be stat'd is read directly every time.
+
+        Ensures:
+            - Reader is called on every lookup and nothing is cached
+        """
+        with patch( "cosa.agents.agent_resource_cache.du.get_file_as_string", return_value="Mocked" ) as mock_read:
+            self.cache.get_prompt_template( "/does/not/exist.txt", "agent router go to math" )
+            self.cache.get_prompt_template( "/does/not/exist.txt", "agent router go to math" )
+
+        self.assertEqual( mock_read.call_count, 2 )
+        self.assertEqual( self.cache.get_stats()[ "template_hits" ], 0 )
+
+    def test_dataframe_copies_and_reload_on_change( self ):
+        """
+        Test dataframe caching.
+
+        Ensures:
+            - *_date columns are cast to datetime
+            - Mutating a returned frame doesn't affect later callers
+            - Editing the CSV invalidates the entry
+        """
+        path = self._write( "events.csv", "event,start_date\nlunch,2025-01-01\n" )
+
+        first = self.cache.get_dataframe( path )
+        self.assertTrue( str( first[ "start_date" ].dtype ).startswith( "datetime64" ) )
+
+        first.loc[ 0, "event" ] = "mutated"
+        second = self.cache.get_dataframe( path )
+        self.assertEqual( second.loc[ 0, "event" ], "lunch" )
+
+        with open( path, "a" ) as file:
+            file.write( "dinner,2025-01-02\n" )
+        _touch_later( path )
+
+        self.assertEqual( len( self.cache.get_dataframe( path ) ), 2 )
+
+        stats = self.cache.get_stats()
+        self.assertEqual( stats[ "dataframe_hits" ], 1 )
+        self.assertEqual( stats[ "dataframe_misses" ], 2 )
+
+    def test_xml_parser_factory_shared_per_config_manager( self ):
+        """
+        Test XmlParserFactory sharing.
+
+        Ensures:
+            - Same config manager gets the same factory
+            - A different config manager gets a new one
+        """
+        config_mgr = MagicMock()
+        config_mgr.get.return_value = False
+
+        factory = self.cache.get_xml_parser_factory( config_mgr )
+        self.assertIs( self.cache.get_xml_parser_factory( config_mgr ), factory )
+
+        other_config_mgr = MagicMock()
+        other_config_mgr.get.return_value = False
+        self.assertIsNot( self.cache.get_xml_parser_factory( other_config_mgr ), factory )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for AgentResourceCache in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "AgentResourceCache Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestAgentResourceCache )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} AgentResourceCache unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
@@ -118,6 +118,14 @@ class ChatClientUnitTests:
             mock_agent.run = AsyncMock( return_value=mock_response )
             mock_agent_class.return_value = mock_agent
             
+            # Mock explicit OpenAI-compatible model and provider construction
+            mock_openai_model_class = stack.enter_context(
+                patch( 'cosa.agents.chat_client.OpenAIModel' )
+            )
+            mock_openai_provider_class = stack.enter_context(
+                patch( 'cosa.agents.chat_client.OpenAIProvider' )
+            )
+            
             # Mock TokenCounter class
             mock_token_counter_class = stack.enter_context(
                 patch( 'cosa.agents.chat_client.TokenCounter' )
@@ -137,21 +145,16 @@ class ChatClientUnitTests:
             )
             mock_perf_counter.side_effect = [ 0.0, 0.08 ]  # 80ms duration
             
-            # Mock asyncio.get_running_loop to force sync context for testing
-            mock_get_running_loop = stack.enter_context(
-                patch( 'cosa.agents.chat_client.asyncio.get_running_loop' )
-            )
-            mock_get_running_loop.side_effect = RuntimeError( "No running event loop" )
-            
             return stack, {
                 'agent_class': mock_agent_class,
+                'openai_model_class': mock_openai_model_class,
+                'openai_provider_class': mock_openai_provider_class,
                 'agent': mock_agent,
                 'response': mock_response,
                 'token_counter_class': mock_token_counter_class,
                 'token_counter': mock_token_counter,
                 'print_banner': mock_print_banner,
-                'perf_counter': mock_perf_counter,
-                'get_running_loop': mock_get_running_loop
+                'perf_counter': mock_perf_counter
             }
         
         return _mock_context
@@ -163,7 +166,7 @@ class ChatClientUnitTests:
         Ensures:
             - ChatClient inherits from LlmClientInterface correctly
             - Configuration parameters are set correctly
-            - Environment variables are configured properly
+            - Credentials are passed explicitly, leaving environment variables untouched
             - pydantic-ai Agent is initialized with correct parameters
             - TokenCounter is initialized
             
@@ -195,14 +198,16 @@ class ChatClientUnitTests:
                 assert client.debug == False, "Debug flag should be set correctly"
                 assert client.verbose == False, "Verbose flag should be set correctly"
                 
-                # Test environment variable setup
-                assert os.environ.get( "OPENAI_API_KEY" ) == self.test_api_key, "API key should be set in environment"
-                assert os.environ.get( "OPENAI_BASE_URL" ) == self.test_base_url, "Base URL should be set in environment"
+                # Test credentials are passed explicitly, not through the environment
+                assert os.environ.get( "OPENAI_API_KEY" ) != self.test_api_key, "API key should not be written to environment"
+                assert os.environ.get( "OPENAI_BASE_URL" ) != self.test_base_url, "Base URL should not be written to environment"
+                mocks[ 'openai_provider_class' ].assert_called_once_with( base_url=self.test_base_url, api_key=self.test_api_key )
                 
                 # Test Agent initialization
                 mocks[ 'agent_class' ].assert_called_once()
                 call_args = mocks[ 'agent_class' ].call_args
-                assert call_args[ 0 ][ 0 ] == self.test_model_name, "Agent should be initialized with correct model name"
+                assert mocks[ 'openai_model_class' ].call_args[ 0 ][ 0 ] == self.test_model_name, "OpenAIModel should be initialized with correct model name"
+                assert call_args[ 0 ][ 0 ] == mocks[ 'openai_model_class' ].return_value, "Agent should be initialized with the explicit model"
                 
                 # Test TokenCounter initialization
                 mocks[ 'token_counter_class' ].assert_called_once()
@@ -153,7 +153,7 @@ class CompletionClientUnitTests:
         Ensures:
             - CompletionClient inherits from LlmClientInterface correctly
             - Configuration parameters are set correctly
-            - Environment variables are configured properly
+            - Credentials are passed explicitly, leaving environment variables untouched
             - LlmCompletion and TokenCounter are initialized
             
         Returns:
@@ -185,15 +185,16 @@ class CompletionClientUnitTests:
                 assert client.debug == False, "Debug flag should be set correctly"
                 assert client.verbose == False, "Verbose flag should be set correctly"
                 
-                # Test environment variable setup
-                assert os.environ.get( "OPENAI_API_KEY" ) == self.test_api_key, "API key should be set in environment"
-                assert os.environ.get( "OPENAI_BASE_URL" ) == self.test_base_url, "Base URL should be set in environment"
+                # Test credentials are passed explicitly, not through the environment
+                assert os.environ.get( "OPENAI_API_KEY" ) != self.test_api_key, "API key should not be written to environment"
+                assert os.environ.get( "OPENAI_BASE_URL" ) != self.test_base_url, "Base URL should not be written to environment"
                 
                 # Test LlmCompletion initialization
                 mocks[ 'llm_completion_class' ].assert_called_once()
                 call_args = mocks[ 'llm_completion_class' ].call_args
                 assert call_args[ 1 ][ 'base_url' ] == self.test_base_url, "LlmCompletion should be initialized with correct base URL"
                 assert call_args[ 1 ][ 'model_name' ] == self.test_model_name, "LlmCompletion should be initialized with correct model"
+                assert call_args[ 1 ][ 'api_key' ] == self.test_api_key, "LlmCompletion should be initialized with the API key"
                 
                 # Test TokenCounter initialization
                 mocks[ 'token_counter_class' ].assert_called_once()
@@ -0,0 +1,255 @@
+"""
+Unit tests for the persistent background event loop (EventLoopRunner).
+
+Tests the EventLoopRunner including:
+- Results and exceptions returned through run_sync()
+- One loop reused across calls, threads and async callers
+- Re-entrant calls from the loop thread
+- Keep-alive HTTP connections surviving across sync calls
+- ChatClient.run() submitting to the shared loop
+
+Zero external dependencies - HTTP traffic goes to a local stub server.
+"""
+
+import unittest
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Import test infrastructure
+import sys
+import os
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+from cosa.agents.event_loop_runner import EventLoopRunner, run_sync
+
+
+async def _current_loop():
+    """Return the loop the coroutine is running on."""
+    await asyncio.sleep( 0 )
+    return asyncio.get_running_loop()
+
+
+class TestEventLoopRunner( unittest.TestCase ):
+    """
+    Unit tests for EventLoopRunner.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - A single long-lived loop serves every sync caller
+        - Errors and re-entrant calls are handled without deadlocks
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Test infrastructure available
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Mocks reset
+        """
+        self.mock_manager.reset_mocks()
+
+    def test_run_sync_reuses_one_loop( self ):
+        """
+        Test that consecutive calls run on the same background loop.
+
+        Ensures:
+            - Same loop object for every call
+            - Loop runs on the runner's thread, not the caller's
+        """
+        first  = run_sync( _current_loop() )
+        second = run_sync( _current_loop() )
+
+        self.assertIs( first, second )
+        self.assertIs( first, EventLoopRunner().loop )
+        self.assertTrue( first.is_running() )
+        self.assertIs( EventLoopRunner(), EventLoopRunner() )
+
+    def test_exceptions_propagate( self ):
+        """
+        Test that coroutine exceptions reach the sync caller.
+
+        Ensures:
+            - Original exception type re-raised
+        """
+        async def boom():
+            raise ValueError( "boom" )
+
+        with self.assertRaises( ValueError ):
+            run_sync( boom() )
+
+    def test_call_from_inside_running_loop( self ):
+        """
+        Test a sync call made from async code (e.g. a FastAPI handler).
+
+        Ensures:
+            - No 'event loop already running' error
+            - Work runs on the shared background loop
+        """
+        async def handler():
+            return run_sync( _current_loop() ), asyncio.get_running_loop()
+
+        shared_loop, caller_loop = asyncio.run( handler() )
+
+        self.assertIs( shared_loop, EventLoopRunner().loop )
+        self.assertIsNot( shared_loop, caller_loop )
+
+    def test_reentrant_call_from_loop_thread( self ):
+        """
+        Test that a sync call made on the loop thread itself doesn't deadlock.
+
+        Ensures:
+            - Nested call completes and returns its result
+        """
+        async def add( a, b ):
+            return a + b
+
+        async def outer():
+            return run_sync( add( 2, 3 ) )
+
+        self.assertEqual( run_sync( outer(), timeout=5 ), 5 )
+
+    def test_concurrent_callers( self ):
+        """
+        Test many threads submitting at once.
+
+        Ensures:
+            - Every caller gets its own result
+            - Coroutines overlap on the loop instead of running one per loop
+        """
+        async def slow_echo( i ):
+            await asyncio.sleep( 0.1 )
+            return i
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor( max_workers=10 ) as executor:
+            results = list( executor.map( lambda i: run_sync( slow_echo( i ) ), range( 10 ) ) )
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual( results, list( range( 10 ) ) )
+        self.assertLess( elapsed, 0.5 )
+
+    def test_keep_alive_connections_survive_across_calls( self ):
+        """
+        Test that a shared httpx.AsyncClient keeps its connection between sync calls.
+
+        Ensures:
+            - Ten sequential run_sync() requests use a single TCP connection
+        """
+        import httpx
+
+        client_ports = set()
+
+        class StubHandler( BaseHTTPRequestHandler ):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET( self ):
+                client_ports.add( self.client_address[ 1 ] )
+                self.send_response( 200 )
+                self.send_header( "Content-Length", "2" )
+                self.end_headers()
+                self.wfile.write( b"ok" )
+
+            def log_message( self, *args ):
+                pass
+
+        server = ThreadingHTTPServer( ( "127.0.0.1", 0 ), StubHandler )
+        threading.Thread( target=server.serve_forever, daemon=True ).start()
+        url = f"http://127.0.0.1:{server.server_address[ 1 ]}/"
+
+        async def make_client():
+            return httpx.AsyncClient()
+
+        client = run_sync( make_client() )
+
+        async def get():
+            return ( await client.get( url ) ).text
+
+        try:
+            for _ in range( 10 ): self.assertEqual( run_sync( get() ), "ok" )
+        finally:
+            run_sync( client.aclose() )
+            server.shutdown()
+
+        self.assertEqual( len( client_ports ), 1 )
+
+    def test_chat_client_run_uses_shared_loop( self ):
+        """
+        Test that ChatClient.run() submits run_async() to the shared loop.
+
+        Ensures:
+            - Both calls execute on the EventLoopRunner loop
+            - Prompt and stream arguments passed through
+        """
+        from cosa.agents.chat_client import ChatClient
+
+        loops  = [ ]
+        client = ChatClient.__new__( ChatClient )
+
+        async def fake_run_async( prompt, stream=False, **kwargs ):
+            loops.append( asyncio.get_running_loop() )
+            return f"{prompt}:{stream}"
+
+        client.run_async = fake_run_async
+
+        self.assertEqual( client.run( "hello" ), "hello:False" )
+        self.assertEqual( client.run( "again", stream=True ), "again:True" )
+        self.assertIs( loops[ 0 ], loops[ 1 ] )
+        self.assertIs( loops[ 0 ], EventLoopRunner().loop )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for EventLoopRunner in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "EventLoopRunner Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestEventLoopRunner )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} EventLoopRunner unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
@@ -10,6 +10,7 @@ This test module validates:
 - Client creation for different model types and vendors
 - Configuration loading and vendor-specific setup
 - API key management and environment variable handling
+- Client instance pooling and explicit credential passing
 - Error handling for unsupported vendors and missing configurations
 - Performance requirements for client creation
 """
@@ -394,6 +395,85 @@ class LlmClientFactoryUnitTests:
             self.utils.print_test_status( f"Client creation mocking test failed: {e}", "FAIL" )
             return False
     
+    def test_client_pooling( self ) -> bool:
+        """
+        Test client instance pooling and explicit credential passing.
+        
+        Ensures:
+            - Repeat calls for the same model reuse one client instance
+            - Concurrent callers share a single instance
+            - A different API key gets its own client
+            - Pooled lookups don't re-read key files
+            - Credentials are passed as arguments and OPENAI_* variables are never written
+            
+        Returns:
+            True if test passes
+        """
+        self.utils.print_test_banner( "Testing Client Pooling" )
+        
+        try:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with patch( 'cosa.agents.llm_client_factory.ConfigurationManager' ) as mock_cm_class, \
+                 patch( 'cosa.agents.llm_client_factory.ChatClient' ) as mock_chat_client, \
+                 patch.dict( 'os.environ', { "OPENAI_API_KEY": "key_one" }, clear=True ):
+                
+                mock_config = self.mock_mgr.config_manager_mock( {} ).__enter__()
+                mock_cm_class.return_value = mock_config
+                mock_config.exists.return_value = False
+                
+                mock_chat_client.side_effect = lambda **kwargs: MagicMock( spec=LlmClientInterface )
+                
+                LlmClientFactory._instance = None
+                factory = LlmClientFactory()
+                
+                # Test reuse across sequential and concurrent calls
+                first = factory.get_client( "openai:gpt-4o-mini" )
+                with ThreadPoolExecutor( max_workers=8 ) as executor:
+                    clients = list( executor.map( lambda _: factory.get_client( "openai:gpt-4o-mini" ), range( 16 ) ) )
+                
+                assert all( client is first for client in clients ), "Same model should return the pooled client"
+                assert mock_chat_client.call_count == 1, "Client should be constructed once"
+                
+                call_kwargs = mock_chat_client.call_args[ 1 ]
+                assert call_kwargs[ "api_key" ] == "key_one", "API key should be passed explicitly"
+                assert call_kwargs[ "base_url" ] == factory.VENDOR_URLS[ "openai" ], "Base URL should be passed explicitly"
+                assert "OPENAI_BASE_URL" not in os.environ, "OPENAI_BASE_URL should not be written"
+                
+                self.utils.print_test_status( "Client reuse test passed", "PASS" )
+                
+                # Test that a rotated key builds a new client
+                os.environ[ "OPENAI_API_KEY" ] = "key_two"
+                rotated = factory.get_client( "openai:gpt-4o-mini" )
+                
+                assert rotated is not first, "Different API key should get a different client"
+                assert mock_chat_client.call_count == 2, "Rotated key should construct a new client"
+                
+                # Test that clearing the pool rebuilds
+                factory.clear_client_pool()
+                rebuilt = factory.get_client( "openai:gpt-4o-mini" )
+                assert rebuilt is not rotated, "Cleared pool should build a fresh client"
+                
+                self.utils.print_test_status( "Pool key and reset test passed", "PASS" )
+                
+                # Test that keys from key files are read once, not on every get_client() call
+                del os.environ[ "OPENAI_API_KEY" ]
+                with patch( 'cosa.agents.llm_client_factory.du.get_api_key', return_value="file_key" ) as mock_get_api_key:
+                    from_file = factory.get_client( "openai:gpt-4o-mini" )
+                    reads     = mock_get_api_key.call_count
+                    for _ in range( 10 ):
+                        assert factory.get_client( "openai:gpt-4o-mini" ) is from_file, "File key should reuse the pooled client"
+                    
+                    assert mock_get_api_key.call_count == reads, "Pooled lookups should not re-read the key file"
+                
+                self.utils.print_test_status( "Key file read once test passed", "PASS" )
+                
+            return True
+            
+        except Exception as e:
+            self.utils.print_test_status( f"Client pooling test failed: {e}", "FAIL" )
+            return False
+    
     def test_error_handling( self ) -> bool:
         """
         Test error handling in LlmClientFactory.
@@ -526,6 +606,7 @@ class LlmClientFactoryUnitTests:
             self.test_model_descriptor_parsing,
             self.test_vendor_configuration,
             self.test_client_creation_mocking,
+            self.test_client_pooling,
             self.test_error_handling,
             self.test_performance_requirements
         ]
@@ -0,0 +1,251 @@
+"""
+Unit tests for the content-addressed LLM response cache (LlmResponseCache).
+
+Tests the LlmResponseCache including:
+- Key derivation from model, prompt and sampling params
+- Bypass for temperature > 0 and streaming requests
+- Memory LRU eviction and SQLite persistence across instances
+- TTL expiry and hit/miss counters
+- ChatClient.run_async() answering repeat prompts from the cache
+
+Zero external dependencies - SQLite files live in a temporary directory.
+"""
+
+import unittest
+from unittest.mock import MagicMock, AsyncMock, patch
+import asyncio
+import os
+import tempfile
+import time
+
+# Import test infrastructure
+import sys
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+from cosa.agents.llm_response_cache import LlmResponseCache
+
+
+PARAMS = { "temperature": 0.0, "max_tokens": 64, "stop": None, "top_p": 1.0, "stream": False }
+
+
+class TestLlmResponseCache( unittest.TestCase ):
+    """
+    Unit tests for LlmResponseCache.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - Only deterministic requests are cached
+        - Both tiers honour their size and TTL limits
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Fresh temporary directory for SQLite files
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+        self.temp_dir       = tempfile.TemporaryDirectory()
+        self.db_path        = os.path.join( self.temp_dir.name, "llm_response_cache.db" )
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Temporary files removed and mocks reset
+        """
+        self.temp_dir.cleanup()
+        self.mock_manager.reset_mocks()
+
+    def test_key_depends_on_model_prompt_and_params( self ):
+        """
+        Test key derivation.
+
+        Ensures:
+            - Same inputs give the same key
+            - Changing endpoint, model, prompt or any sampling param changes the key
+            - The stream flag doesn't take part in the key
+        """
+        cache = LlmResponseCache()
+        key   = cache.make_key( "model-a", "prompt", PARAMS )
+
+        self.assertEqual( key, cache.make_key( "model-a", "prompt", dict( reversed( list( PARAMS.items() ) ) ) ) )
+        self.assertNotEqual( key, cache.make_key( "model-b", "prompt", PARAMS ) )
+        self.assertNotEqual( key, cache.make_key( "model-a", "prompt!", PARAMS ) )
+        self.assertNotEqual( key, cache.make_key( "model-a", "prompt", { **PARAMS, "max_tokens": 65 } ) )
+        self.assertNotEqual( key, cache.make_key( "model-a", "prompt", PARAMS, base_url="http://gpu-1:8000/v1" ) )
+        self.assertNotEqual(
+            cache.make_key( "model-a", "prompt", PARAMS, base_url="http://gpu-1:8000/v1" ),
+            cache.make_key( "model-a", "prompt", PARAMS, base_url="http://gpu-2:8000/v1" )
+        )
+
+    def test_bypassed_when_not_deterministic( self ):
+        """
+        Test that sampled or streamed requests never get a key.
+
+        Ensures:
+            - temperature > 0 returns None
+            - A missing or None temperature returns None (the provider default may be non-zero)
+            - stream=True returns None
+            - Bypasses are counted
+        """
+        cache = LlmResponseCache()
+        unset = { k: v for k, v in PARAMS.items() if k != "temperature" }
+
+        self.assertIsNone( cache.make_key( "m", "p", { **PARAMS, "temperature": 0.7 } ) )
+        self.assertIsNone( cache.make_key( "m", "p", unset ) )
+        self.assertIsNone( cache.make_key( "m", "p", { **PARAMS, "temperature": None } ) )
+        self.assertIsNone( cache.make_key( "m", "p", { **PARAMS, "stream": True } ) )
+        self.assertIsNotNone( cache.make_key( "m", "p", { **PARAMS, "temperature": 0 } ) )
+        self.assertEqual( cache.get_stats()[ "bypassed" ], 4 )
+
+    def test_memory_hit_and_lru_eviction( self ):
+        """
+        Test the in-process LRU tier.
+
+        Ensures:
+            - Stored responses are returned
+            - Least recently used entry is evicted first
+        """
+        cache = LlmResponseCache( max_memory_entries=2 )
+        keys  = [ cache.make_key( "m", f"prompt {i}", PARAMS ) for i in range( 3 ) ]
+
+        cache.put( keys[ 0 ], "zero" )
+        cache.put( keys[ 1 ], "one" )
+        self.assertEqual( cache.get( keys[ 0 ] ), "zero" )
+
+        cache.put( keys[ 2 ], "two" )
+
+        self.assertIsNone( cache.get( keys[ 1 ] ) )
+        self.assertEqual( cache.get( keys[ 0 ] ), "zero" )
+        self.assertEqual( cache.get( keys[ 2 ] ), "two" )
+
+        stats = cache.get_stats()
+        self.assertEqual( stats[ "memory_hits" ], 3 )
+        self.assertEqual( stats[ "misses" ], 1 )
+        self.assertEqual( stats[ "memory_entries" ], 2 )
+
+    def test_disk_tier_persists_across_instances( self ):
+        """
+        Test the SQLite tier.
+
+        Ensures:
+            - A new instance on the same file finds earlier entries
+            - Disk hits are counted separately and promoted into memory
+            - Disk tier is trimmed to max_disk_entries
+        """
+        cache = LlmResponseCache( db_path=self.db_path, max_disk_entries=2 )
+        keys  = [ cache.make_key( "m", f"prompt {i}", PARAMS ) for i in range( 3 ) ]
+        for i, key in enumerate( keys ):
+            cache.put( key, f"answer {i}" )
+            time.sleep( 0.01 )
+        cache.close()
+
+        reopened = LlmResponseCache( db_path=self.db_path )
+
+        self.assertIsNone( reopened.get( keys[ 0 ] ) )
+        self.assertEqual( reopened.get( keys[ 2 ] ), "answer 2" )
+        self.assertEqual( reopened.get( keys[ 2 ] ), "answer 2" )
+
+        stats = reopened.get_stats()
+        self.assertEqual( stats[ "disk_hits" ], 1 )
+        self.assertEqual( stats[ "memory_hits" ], 1 )
+        reopened.close()
+
+    def test_ttl_expiry( self ):
+        """
+        Test that stale entries are dropped.
+
+        Ensures:
+            - Entries older than ttl_seconds are misses in both tiers
+        """
+        cache = LlmResponseCache( db_path=self.db_path, ttl_seconds=0.05 )
+        key   = cache.make_key( "m", "p", PARAMS )
+        cache.put( key, "fresh" )
+
+        self.assertEqual( cache.get( key ), "fresh" )
+        time.sleep( 0.1 )
+        self.assertIsNone( cache.get( key ) )
+        self.assertEqual( cache.get_stats()[ "expired" ], 1 )
+        cache.close()
+
+        reopened = LlmResponseCache( db_path=self.db_path, ttl_seconds=0.05 )
+        self.assertIsNone( reopened.get( key ) )
+        reopened.close()
+
+    def test_chat_client_uses_cache_at_temperature_zero( self ):
+        """
+        Test that ChatClient answers a repeat temperature 0 prompt from the cache.
+
+        Ensures:
+            - The model is called once for two identical deterministic prompts
+            - Sampled prompts always reach the model
+        """
+        from cosa.agents.chat_client import ChatClient
+
+        with patch( "cosa.agents.chat_client.Agent" ) as mock_agent_class, \
+             patch( "cosa.agents.chat_client.TokenCounter" ):
+
+            mock_result        = MagicMock()
+            mock_result.output = "4"
+            mock_agent         = MagicMock()
+            mock_agent.run     = AsyncMock( return_value=mock_result )
+            mock_agent_class.return_value = mock_agent
+
+            client = ChatClient( model_name="openai:gpt-4o-mini", response_cache=LlmResponseCache(), temperature=0.0 )
+
+            self.assertEqual( asyncio.run( client.run_async( "What is 2 + 2?" ) ), "4" )
+            self.assertEqual( asyncio.run( client.run_async( "What is 2 + 2?" ) ), "4" )
+            self.assertEqual( mock_agent.run.await_count, 1 )
+
+            asyncio.run( client.run_async( "What is 2 + 2?", temperature=0.7 ) )
+            asyncio.run( client.run_async( "What is 2 + 2?", temperature=0.7 ) )
+            self.assertEqual( mock_agent.run.await_count, 3 )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for LlmResponseCache in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "LlmResponseCache Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestLlmResponseCache )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} LlmResponseCache unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
@@ -13,6 +13,7 @@ This test module validates:
 - Model-to-tokenizer mapping functionality
 - Error handling for invalid models and text inputs
 - Performance requirements for token counting operations
+- Process-wide encoding memoization and batched count_many()
 - Prompt template formatting and variable substitution
 """
 
@@ -293,8 +294,8 @@ class TokenCounterUnitTests:
                 expected_count = self.expected_token_counts[ self.test_text_short ]
                 assert token_count == expected_count, f"Custom model: expected {expected_count}, got {token_count}"
                 
-                # Verify mapped model was used
-                mocks[ 'tiktoken_module' ].encoding_for_model.assert_called_with( "gpt-4" )
+                # Verify mapped model was used: gpt-4's encoding is already memoized, so no new lookup happens
+                assert mocks[ 'tiktoken_module' ].encoding_for_model.call_count == 0, "Mapped model should reuse the memoized gpt-4 encoding"
                 
                 self.utils.print_test_status( "Custom model mapping test passed", "PASS" )
                 
@@ -317,6 +318,64 @@ class TokenCounterUnitTests:
             self.utils.print_test_status( f"Token counting various models test failed: {e}", "FAIL" )
             return False
     
+    def test_encoding_memoization_and_count_many( self ) -> bool:
+        """
+        Test encoding memoization and the batched count_many() API.
+        
+        Ensures:
+            - encoding_for_model() is called once per tokenizer, across instances
+            - Unknown models pay the KeyError fallback only once
+            - count_many() uses encode_batch() and preserves order
+            - count_many() falls back to estimates on error
+            
+        Returns:
+            True if test passes
+        """
+        self.utils.print_test_banner( "Testing Encoding Memoization and count_many" )
+        
+        try:
+            context, mocks = self._create_token_counter_mock_context()()
+            with context:
+                # Test memoization across calls and instances
+                for _ in range( 5 ):
+                    TokenCounter().count_tokens( "gpt-4", self.test_text_short )
+                    TokenCounter().count_tokens( "gpt-4", self.test_text_medium )
+                
+                assert mocks[ 'tiktoken_module' ].encoding_for_model.call_count == 1, "Encoding should be looked up once"
+                
+                mocks[ 'tiktoken_module' ].encoding_for_model.side_effect = KeyError( "Model not found" )
+                for _ in range( 5 ):
+                    TokenCounter().count_tokens( "brand-new-model", self.test_text_short )
+                
+                assert mocks[ 'tiktoken_module' ].encoding_for_model.call_count == 2, "Unknown model should be looked up once"
+                mocks[ 'tiktoken_module' ].get_encoding.assert_called_once_with( "cl100k_base" )
+                
+                self.utils.print_test_status( "Encoding memoization test passed", "PASS" )
+                
+                # Test batched counting
+                texts = [ self.test_text_short, self.test_text_medium, self.test_text_long ]
+                mocks[ 'encoding' ].encode_batch.side_effect = lambda batch: [ mocks[ 'encoding' ].encode( text ) for text in batch ]
+                
+                counter = TokenCounter()
+                counts  = counter.count_many( "gpt-4", texts )
+                
+                assert counts == [ self.expected_token_counts[ text ] for text in texts ], f"Unexpected batch counts {counts}"
+                mocks[ 'encoding' ].encode_batch.assert_called_once_with( texts )
+                assert counter.count_many( "gpt-4", [] ) == [], "Empty batch should return empty list"
+                
+                mocks[ 'encoding' ].encode_batch.side_effect = Exception( "Batch error" )
+                with patch( 'builtins.print' ):
+                    counts = counter.count_many( "gpt-4", texts )
+                assert counts == [ len( text ) // 4 for text in texts ], "Batch errors should fall back to estimates"
+                
+                self.utils.print_test_status( "count_many test passed", "PASS" )
+                
+            return True
+            
+        except Exception as e:
+            self.utils.print_test_status( f"Encoding memoization test failed: {e}", "FAIL" )
+            return False
+    
     def test_token_counting_error_handling( self ) -> bool:
         """
         Test error handling during token counting operations.
@@ -533,6 +592,7 @@ class TokenCounterUnitTests:
             self.test_token_counter_initialization,
             self.test_token_counter_without_tiktoken,
             self.test_token_counting_various_models,
+            self.test_encoding_memoization_and_count_many,
             self.test_token_counting_error_handling,
             self.test_prompt_template_formatting,
             self.test_performance_requirements
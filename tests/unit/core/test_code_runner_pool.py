@@ -0,0 +1,424 @@
+"""
+Unit tests for the warm sandbox interpreter pool (CodeRunnerPool).
+
+Tests the CodeRunnerPool including:
+- Warm workers with pandas already imported
+- Per-job temporary directories and untouched parent working directory
+- Concurrent runs without cross-talk
+- Timeout and max-jobs recycling
+- assemble_and_run_solution pool path and subprocess fallback
+
+Workers are real `python3` processes; no network or configuration required.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Import test infrastructure
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+import cosa.utils.code_runner_pool as crp
+import cosa.utils.util_code_runner as ucr
+from cosa.utils.code_runner_worker import CODE_FILE_NAME
+
+
+class TestCodeRunnerPool( unittest.TestCase ):
+    """
+    Unit tests for CodeRunnerPool.
+
+    Requires:
+        - A python3 runtime with pandas installed
+
+    Ensures:
+        - Jobs run warm, isolated and concurrently
+        - Unhealthy and worn-out workers are replaced
+    """
+
+    @classmethod
+    def setUpClass( cls ):
+        """Start one shared pool for the tests that don't need special sizing."""
+        cls.pool     = crp.CodeRunnerPool( size=2, max_jobs_per_worker=100 )
+        cls.path_dir = tempfile.gettempdir()
+
+    @classmethod
+    def tearDownClass( cls ):
+        """Kill the shared pool's workers."""
+        cls.pool.shutdown()
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Test infrastructure available
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Mocks reset
+        """
+        self.mock_manager.reset_mocks()
+
+    def test_run_returns_stdout_and_pandas_is_preloaded( self ):
+        """
+        Test a successful run in a warm worker.
+
+        Ensures:
+            - return code 0 and stdout captured
+            - pandas already imported before the job's own import
+        """
+        results = self.pool.run( "import sys\nprint( 'pandas' in sys.modules )\nprint( 6 * 7 )", self.path_dir )
+
+        self.assertEqual( results.returncode, 0 )
+        self.assertEqual( results.stdout.split(), [ "True", "42" ] )
+        self.assertEqual( results.stderr, "" )
+
+    def test_error_returns_traceback_without_worker_frames( self ):
+        """
+        Test that an uncaught exception looks like a failed script run.
+
+        Ensures:
+            - return code 1
+            - Traceback references the job's code file, not the worker module
+        """
+        results = self.pool.run( "x = 1\nraise ValueError( 'boom' )", self.path_dir )
+
+        self.assertEqual( results.returncode, 1 )
+        self.assertIn( "ValueError: boom", results.stderr )
+        self.assertIn( CODE_FILE_NAME, results.stderr )
+        self.assertNotIn( "code_runner_worker.py", results.stderr )
+
+    def test_generated_code_cannot_read_the_command_pipe( self ):
+        """
+        Test that generated code gets its own empty stdin.
+
+        Ensures:
+            - Reading stdin returns EOF instead of the worker's pending command lines
+            - The worker keeps serving jobs afterwards
+        """
+        results = self.pool.run( "import sys\nprint( repr( sys.stdin.read() ) )\nprint( repr( input.__name__ ) )", self.path_dir )
+
+        self.assertEqual( results.returncode, 0 )
+        self.assertEqual( results.stdout.split()[ 0 ], "''" )
+        self.assertEqual( self.pool.run( "print( 'still serving' )", self.path_dir ).stdout.strip(), "still serving" )
+
+    def test_traceback_references_caller_code_path( self ):
+        """
+        Test jobs run from a file the caller wrote.
+
+        Ensures:
+            - Tracebacks and __file__ name the caller's file, which outlives the job
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            code      = "print( __file__ )\nraise ValueError( 'boom' )"
+            code_path = os.path.join( temp_dir, "caller_code.py" )
+            with open( code_path, "w" ) as f:
+                f.write( code )
+
+            results = self.pool.run( code, self.path_dir, code_path=code_path )
+
+            self.assertEqual( results.returncode, 1 )
+            self.assertEqual( results.stdout.strip(), code_path )
+            self.assertIn( f'File "{code_path}", line 2', results.stderr )
+
+    def test_each_job_runs_in_its_own_temp_dir( self ):
+        """
+        Test per-job working directories.
+
+        Ensures:
+            - Two jobs see different working directories
+            - Parent process working directory unchanged
+        """
+        parent_wd = os.getcwd()
+        first     = self.pool.run( "import os\nprint( os.getcwd() )", self.path_dir ).stdout.strip()
+        second    = self.pool.run( "import os\nprint( os.getcwd() )", self.path_dir ).stdout.strip()
+
+        self.assertNotEqual( first, second )
+        self.assertIn( "cosa-code-run-", first )
+        self.assertFalse( os.path.exists( first ) )
+        self.assertEqual( os.getcwd(), parent_wd )
+
+    def test_concurrent_runs_do_not_race( self ):
+        """
+        Test that concurrent callers each get their own program's output.
+
+        Ensures:
+            - 12 concurrent jobs on a 2-worker pool all return their own value
+        """
+        def job( i ):
+            return i, self.pool.run( f"import time\ntime.sleep( 0.02 )\nprint( {i} )", self.path_dir ).stdout.strip()
+
+        with ThreadPoolExecutor( max_workers=6 ) as executor:
+            results = list( executor.map( job, range( 12 ) ) )
+
+        for i, output in results:
+            self.assertEqual( output, str( i ) )
+
+    def test_warm_run_beats_cold_start( self ):
+        """
+        Test that the pool removes interpreter + pandas cold start.
+
+        Ensures:
+            - A warm pandas job is faster than a cold `python3 -c "import pandas"`
+        """
+        self.pool.run( "pass", self.path_dir )
+
+        start = time.perf_counter()
+        subprocess.run( [ "python3", "-c", "import pandas" ], check=True )
+        cold_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.pool.run( "import pandas as pd\nprint( pd.Series( [ 1, 2 ] ).sum() )", self.path_dir )
+        warm_secs = time.perf_counter() - start
+
+        self.assertLess( warm_secs, cold_secs )
+
+    def test_timeout_recycles_worker( self ):
+        """
+        Test timeout handling.
+
+        Ensures:
+            - subprocess.TimeoutExpired raised
+            - Worker replaced and the pool keeps working
+        """
+        pool = crp.CodeRunnerPool( size=1 )
+        try:
+            pid_before = pool.run( "import os\nprint( os.getpid() )", self.path_dir ).stdout.strip()
+            with self.assertRaises( subprocess.TimeoutExpired ):
+                pool.run( "import time\ntime.sleep( 10 )", self.path_dir, timeout=0.5 )
+
+            pid_after = pool.run( "import os\nprint( os.getpid() )", self.path_dir ).stdout.strip()
+            self.assertNotEqual( pid_before, pid_after )
+        finally:
+            pool.shutdown()
+
+    def test_crash_raises_pool_error_and_recycles( self ):
+        """
+        Test that a hard crash of the interpreter surfaces as CodeRunnerPoolError.
+
+        Ensures:
+            - CodeRunnerPoolError raised when the worker dies mid-job
+            - Next job runs in a fresh worker
+        """
+        pool = crp.CodeRunnerPool( size=1 )
+        try:
+            with self.assertRaises( crp.CodeRunnerPoolError ):
+                pool.run( "import os\nos._exit( 3 )", self.path_dir )
+
+            self.assertEqual( pool.run( "print( 'alive' )", self.path_dir ).stdout.strip(), "alive" )
+        finally:
+            pool.shutdown()
+
+    def test_worker_recycled_after_max_jobs( self ):
+        """
+        Test max_jobs_per_worker recycling.
+
+        Ensures:
+            - A new worker process serves the job after the limit
+        """
+        pool = crp.CodeRunnerPool( size=1, max_jobs_per_worker=2 )
+        try:
+            pids = [ pool.run( "import os\nprint( os.getpid() )", self.path_dir ).stdout.strip() for _ in range( 3 ) ]
+            self.assertEqual( pids[ 0 ], pids[ 1 ] )
+            self.assertNotEqual( pids[ 1 ], pids[ 2 ] )
+        finally:
+            pool.shutdown()
+
+    def test_failed_respawn_does_not_hang_callers( self ):
+        """
+        Test a replacement worker that can't be spawned.
+
+        Ensures:
+            - The failed slot raises CodeRunnerPoolError for the caller that claims it
+              instead of leaving run() blocked forever
+            - The slot is respawned once spawning works again
+        """
+        pool = crp.CodeRunnerPool( size=1, max_jobs_per_worker=1 )
+        try:
+            with patch.object( crp, "_PooledWorker", side_effect=OSError( "fork failed" ) ), patch( "cosa.utils.code_runner_pool.du.print_stack_trace" ):
+                self.assertEqual( pool.run( "print( 'first' )", self.path_dir ).stdout.strip(), "first" )
+                with ThreadPoolExecutor( max_workers=1 ) as executor:
+                    future = executor.submit( pool.run, "print( 'second' )", self.path_dir )
+                    with self.assertRaises( crp.CodeRunnerPoolError ):
+                        future.result( timeout=10 )
+
+            self.assertEqual( pool.run( "print( 'respawned' )", self.path_dir ).stdout.strip(), "respawned" )
+        finally:
+            pool.shutdown()
+
+    def test_shutdown_releases_waiting_callers( self ):
+        """
+        Test shutdown() while a caller waits for a busy pool.
+
+        Ensures:
+            - The waiting run() raises CodeRunnerPoolError instead of blocking forever
+        """
+        pool = crp.CodeRunnerPool( size=1 )
+        with ThreadPoolExecutor( max_workers=2 ) as executor:
+            busy    = executor.submit( pool.run, "import time\ntime.sleep( 2 )", self.path_dir )
+            time.sleep( 0.5 )
+            waiting = executor.submit( pool.run, "print( 'never' )", self.path_dir )
+            time.sleep( 0.2 )
+            pool.shutdown()
+
+            with self.assertRaises( crp.CodeRunnerPoolError ):
+                waiting.result( timeout=10 )
+            with self.assertRaises( crp.CodeRunnerPoolError ):
+                busy.result( timeout=10 )
+
+    def test_invalid_pool_size( self ):
+        """
+        Test argument validation.
+
+        Ensures:
+            - ValueError raised for a zero-sized pool
+        """
+        with self.assertRaises( ValueError ):
+            crp.CodeRunnerPool( size=0 )
+
+
+class TestAssembleAndRunSolutionPooling( unittest.TestCase ):
+    """
+    Unit tests for assemble_and_run_solution's use of the pool.
+
+    Ensures:
+        - Pool path used when available
+        - Cold subprocess path used when the pool fails
+    """
+
+    def setUp( self ):
+        """Silence banners and stack traces printed by the code runner, and point its code file at a temp dir."""
+        self.print_patcher = patch( "builtins.print" )
+        self.print_patcher.start()
+        self.temp_dir     = tempfile.TemporaryDirectory()
+        self.code_path    = os.path.join( self.temp_dir.name, "io", "code_execution.py" )
+        self.path_patcher = patch( "cosa.utils.util_code_runner._get_code_path", return_value=self.code_path )
+        self.path_patcher.start()
+
+    def tearDown( self ):
+        """Remove patches and the temp dir."""
+        self.path_patcher.stop()
+        self.print_patcher.stop()
+        self.temp_dir.cleanup()
+
+    def test_runs_in_pool( self ):
+        """
+        Test the warm pool execution path end to end.
+
+        Ensures:
+            - Output of the assembled program returned
+            - Cold subprocess path not used
+            - The configured code file holds the program that ran, for the auto-debugger
+            - Errors trace back to that file
+        """
+        pool = crp.CodeRunnerPool( size=1 )
+        try:
+            with patch( "cosa.utils.util_code_runner.crp.get_code_runner_pool", return_value=pool ), \
+                 patch( "cosa.utils.util_code_runner._run_in_subprocess" ) as mock_subprocess:
+
+                results = ucr.assemble_and_run_solution( [ "def f():", "    return 6 * 7" ], "solution = f()" )
+                with open( self.code_path ) as f:
+                    self.assertIn( "    return 6 * 7", f.read().splitlines() )
+
+                failed = ucr.assemble_and_run_solution( [ "def f():", "    return 1 / 0" ], "solution = f()" )
+
+            self.assertEqual( results[ "return_code" ], 0 )
+            self.assertEqual( results[ "output" ], "42" )
+            mock_subprocess.assert_not_called()
+            self.assertIn( f'File "{self.code_path}"', failed[ "output" ] )
+            with open( self.code_path ) as f:
+                self.assertIn( "    return 1 / 0", f.read().splitlines() )
+        finally:
+            pool.shutdown()
+
+    def test_falls_back_to_subprocess_on_pool_error( self ):
+        """
+        Test the fallback when a pooled worker fails.
+
+        Ensures:
+            - _run_in_subprocess used and its result returned
+        """
+        failing_pool = Mock()
+        failing_pool.run.side_effect = crp.CodeRunnerPoolError( "worker died" )
+        completed = subprocess.CompletedProcess( [ "python3" ], 0, stdout="fallback\n", stderr="" )
+
+        with patch( "cosa.utils.util_code_runner.crp.get_code_runner_pool", return_value=failing_pool ), \
+             patch( "cosa.utils.util_code_runner._run_in_subprocess", return_value=completed ) as mock_subprocess:
+
+            results = ucr.assemble_and_run_solution( [ "def f():", "    return 1" ], "solution = f()" )
+
+        mock_subprocess.assert_called_once()
+        self.assertEqual( results[ "output" ], "fallback" )
+
+    def test_timeout_returns_none_output( self ):
+        """
+        Test that pool timeouts keep the existing return_none_on_timeout behavior.
+
+        Ensures:
+            - output is None and return_code -1
+        """
+        timing_out_pool = Mock()
+        timing_out_pool.run.side_effect = subprocess.TimeoutExpired( [ "python3" ], 60 )
+
+        with patch( "cosa.utils.util_code_runner.crp.get_code_runner_pool", return_value=timing_out_pool ):
+            results = ucr.assemble_and_run_solution( [ "def f():", "    return 1" ], "solution = f()" )
+
+        self.assertEqual( results[ "return_code" ], -1 )
+        self.assertIsNone( results[ "output" ] )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for CodeRunnerPool in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "CodeRunnerPool Unit Tests", prepend_nl=True )
+
+        loader = unittest.TestLoader()
+        suite  = unittest.TestSuite( [
+            loader.loadTestsFromTestCase( TestCodeRunnerPool ),
+            loader.loadTestsFromTestCase( TestAssembleAndRunSolutionPooling ),
+        ] )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} CodeRunnerPool unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
@@ -568,6 +568,81 @@ class TestCanonicalSynonymsTable( unittest.TestCase ):
             # Verify initialization completed without errors
             self.assertTrue( hasattr( synonyms_default, '_ensure_table_exists' ) )
 
+    def _create_indexed_table( self, rows: List[Dict[str, Any]] ):
+        """
+        Create a CanonicalSynonymsTable whose backing table holds the given rows.
+
+        Ensures:
+            - LanceDB, configuration, normalizer and embedding manager are mocked
+            - Returns ( synonyms_table, mock_table )
+        """
+        with patch( 'cosa.memory.canonical_synonyms_table.lancedb' ) as mock_lancedb, \
+             patch( 'cosa.memory.canonical_synonyms_table.ConfigurationManager' ) as mock_config, \
+             patch( 'cosa.memory.canonical_synonyms_table.Normalizer' ), \
+             patch( 'cosa.memory.canonical_synonyms_table.EmbeddingManager' ):
+
+            mock_config.return_value.get.return_value = "768"
+            mock_table = Mock()
+            mock_table.to_lance.return_value.to_table.return_value.to_pylist.return_value = rows
+            mock_lancedb.connect.return_value.table_names.return_value = [ "canonical_synonyms" ]
+            mock_lancedb.connect.return_value.open_table.return_value = mock_table
+            mock_lancedb.connect.return_value.open_table.return_value.schema.field.return_value.type.list_size = 768
+
+            synonyms_table = CanonicalSynonymsTable( db_path="/tmp/fake_db", debug=False, verbose=False )
+
+        return synonyms_table, mock_table
+
+    def test_exact_match_indexes_avoid_table_scan( self ):
+        """
+        Test that exact-match lookups are served from the in-memory indexes.
+
+        Ensures:
+            - Indexes built once at construction
+            - Verbatim, normalized and gist lookups return the first matching row
+            - No to_pandas() scan performed on lookup
+            - The startup read projects the lookup columns in the scan itself
+        """
+        rows = [
+            { "snapshot_id": "snap_1", "question_verbatim": "What time is it?", "question_normalized": "what time be it", "question_gist": "time query" },
+            { "snapshot_id": "snap_2", "question_verbatim": "WHAT TIME IS IT", "question_normalized": "what time be it", "question_gist": "time query" },
+        ]
+        synonyms_table, mock_table = self._create_indexed_table( rows )
+
+        self.assertEqual( synonyms_table.find_exact_verbatim( "WHAT TIME IS IT" ), "snap_2" )
+        self.assertEqual( synonyms_table.find_exact_normalized( "what time be it" ), "snap_1" )
+        self.assertEqual( synonyms_table.find_exact_gist( "time query" ), "snap_1" )
+        self.assertIsNone( synonyms_table.find_exact_verbatim( "Unknown query" ) )
+
+        mock_table.to_pandas.assert_not_called()
+        mock_table.to_arrow.assert_not_called()
+        mock_table.to_lance.return_value.to_table.assert_called_once_with(
+            columns=[ "snapshot_id", "question_verbatim", "question_normalized", "question_gist" ]
+        )
+
+    def test_delete_synonym_updates_indexes( self ):
+        """
+        Test that delete_synonym keeps the exact-match indexes in step with the table.
+
+        Ensures:
+            - Table delete issued with escaped verbatim question
+            - Shared normalized key falls through to the remaining row
+            - Unknown questions return False without touching the table
+        """
+        rows = [
+            { "snapshot_id": "snap_1", "question_verbatim": "What's the time?", "question_normalized": "what be the time", "question_gist": "time query" },
+            { "snapshot_id": "snap_2", "question_verbatim": "Tell me the time", "question_normalized": "what be the time", "question_gist": "time query" },
+        ]
+        synonyms_table, mock_table = self._create_indexed_table( rows )
+
+        self.assertTrue( synonyms_table.delete_synonym( "What's the time?" ) )
+        mock_table.delete.assert_called_once_with( "question_verbatim = 'What''s the time?'" )
+
+        self.assertIsNone( synonyms_table.find_exact_verbatim( "What's the time?" ) )
+        self.assertEqual( synonyms_table.find_exact_normalized( "what be the time" ), "snap_2" )
+
+        self.assertFalse( synonyms_table.delete_synonym( "Unknown query" ) )
+        mock_table.delete.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
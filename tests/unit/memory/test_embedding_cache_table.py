@@ -89,6 +89,7 @@ class TestEmbeddingCacheTable( unittest.TestCase ):
         
         mock_table = Mock()
         mock_table.count_rows.return_value = 42
+        mock_table.list_indices.return_value = []
         
         # Store mocks for easy access
         mocks_dict = {
@@ -142,7 +143,7 @@ class TestEmbeddingCacheTable( unittest.TestCase ):
         Ensures:
             - Database connection established
             - New table created with proper schema
-            - FTS index created
+            - BTREE index created on the lookup key
         """
         cache_table, mocks = self._create_mocked_cache_table(
             config_values={"database_path_wo_root": "/test/db"},
@@ -156,8 +157,8 @@ class TestEmbeddingCacheTable( unittest.TestCase ):
         mocks["db"].create_table.assert_called()
         mocks["db"].open_table.assert_not_called()
         
-        # Verify FTS index created
-        mocks["table"].create_fts_index.assert_called_once_with( "normalized_text", replace=True )
+        # Verify BTREE index created
+        mocks["table"].create_scalar_index.assert_called_once_with( "normalized_text", index_type="BTREE", replace=True )
     
     def test_has_cached_embedding_found( self ):
         """
@@ -339,6 +340,7 @@ class TestEmbeddingCacheTable( unittest.TestCase ):
         Test cache_embedding functionality.
         
         Ensures:
+            - Embedding served from the write buffer before it is flushed
             - Embedding added to table with correct format
             - Row data structured properly
         """
@@ -348,8 +350,12 @@ class TestEmbeddingCacheTable( unittest.TestCase ):
         test_text = "hello world"
         test_embedding = [0.5] * 1536
         
-        # Test caching
+        # Test caching - buffered, so readable but not yet written
         cache_table.cache_embedding( test_text, test_embedding )
+        mocks["table"].add.assert_not_called()
+        self.assertEqual( cache_table.get_cached_embedding( test_text ), test_embedding )
+        
+        cache_table.flush()
         
         # Verify add called with correct data structure
         expected_row = [{"normalized_text": test_text, "embedding": test_embedding}]
@@ -375,10 +381,254 @@ class TestEmbeddingCacheTable( unittest.TestCase ):
         # Should not raise exception
         try:
             cache_table.cache_embedding( test_text, test_embedding )
+            cache_table.flush()
             # If we get here, error was handled gracefully
             self.assertTrue( True )
         except Exception:
             self.fail( "cache_embedding should handle exceptions gracefully" )
+        
+        # Failed rows stay buffered for the next flush
+        self.assertEqual( cache_table.get_write_stats()[ "buffered" ], 1 )
+        self.assertTrue( cache_table.has_cached_embedding( test_text ) )
+    
+    def test_get_cached_embeddings_single_in_filter( self ):
+        """
+        Test get_cached_embeddings uses one IN filter for many texts.
+        
+        Ensures:
+            - Single scanner call with escaped IN list
+            - Returns dict of hits only
+            - Empty input skips the table entirely
+        """
+        cache_table, mocks = self._create_mocked_cache_table()
+        
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = [
+            {"normalized_text": "what's up", "embedding": [0.1] * 4}
+        ]
+        
+        result = cache_table.get_cached_embeddings( [ "what's up", "what's up", "missing" ] )
+        
+        mock_scanner.assert_called_once()
+        filter_str = mock_scanner.call_args.kwargs[ "filter" ]
+        self.assertTrue( filter_str.startswith( "normalized_text IN (" ) )
+        self.assertIn( "'what''s up'", filter_str )
+        self.assertIn( "'missing'", filter_str )
+        self.assertEqual( result, { "what's up": [0.1] * 4 } )
+        
+        mock_scanner.reset_mock()
+        self.assertEqual( cache_table.get_cached_embeddings( [] ), {} )
+        mock_scanner.assert_not_called()
+    
+    def test_cache_embeddings_single_add( self ):
+        """
+        Test cache_embeddings writes all rows with one add call.
+        
+        Ensures:
+            - One add call containing every non-empty embedding
+            - Empty embeddings skipped
+        """
+        cache_table, mocks = self._create_mocked_cache_table()
+        
+        cache_table.cache_embeddings( { "one": [0.1] * 4, "two": [0.2] * 4, "failed": [] } )
+        
+        mocks["table"].add.assert_called_once_with( [
+            {"normalized_text": "one", "embedding": [0.1] * 4},
+            {"normalized_text": "two", "embedding": [0.2] * 4},
+        ] )
+    
+    def test_write_buffer_flushes_on_size_and_compacts( self ):
+        """
+        Test the write-behind buffer thresholds.
+        
+        Ensures:
+            - One add() per full buffer, not per embedding
+            - Buffered texts are served without scanning the table
+            - optimize() runs after the configured number of flushes
+        """
+        cache_table, mocks = self._create_mocked_cache_table( config_values={
+            "database_path_wo_root": "/test/db",
+            "embedding cache write buffer size": "4",
+            "embedding cache write buffer max age seconds": "0",
+            "embedding cache compact every flushes": "2"
+        } )
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        
+        for i in range( 3 ):
+            cache_table.cache_embedding( f"text {i}", [ float( i ) ] * 4 )
+        mocks["table"].add.assert_not_called()
+        
+        self.assertEqual( cache_table.get_cached_embeddings( [ "text 0", "text 2" ] ), { "text 0": [ 0.0 ] * 4, "text 2": [ 2.0 ] * 4 } )
+        mock_scanner.assert_not_called()
+        
+        for i in range( 3, 8 ):
+            cache_table.cache_embedding( f"text {i}", [ float( i ) ] * 4 )
+        
+        self.assertEqual( mocks["table"].add.call_count, 2 )
+        self.assertEqual( len( mocks["table"].add.call_args.args[ 0 ] ), 4 )
+        mocks["table"].optimize.assert_called_once()
+        self.assertEqual( cache_table.get_write_stats(), { "buffered": 0, "flushes": 2, "rows_written": 8, "rows_rejected": 0, "compactions": 1 } )
+    
+    def test_rejected_row_does_not_block_later_flushes( self ):
+        """
+        Test a buffered row the table always refuses (e.g. the wrong embedding dimension).
+        
+        Ensures:
+            - The batch is retried row by row and the good rows are written
+            - The rejected row is dropped and counted, so the buffer drains
+            - Later flushes go back to one add() per batch
+        """
+        cache_table, mocks = self._create_mocked_cache_table()
+        
+        def add( rows ):
+            if any( len( row[ "embedding" ] ) != 4 for row in rows ):
+                raise ValueError( "embedding dimension mismatch" )
+        mocks["table"].add.side_effect = add
+        
+        cache_table.cache_embedding( "good 1", [ 0.1 ] * 4 )
+        cache_table.cache_embedding( "bad", [ 0.1 ] * 3 )
+        cache_table.cache_embedding( "good 2", [ 0.2 ] * 4 )
+        
+        with patch( "builtins.print" ):
+            self.assertEqual( cache_table.flush(), 2 )
+        
+        written = [ add_call.args[ 0 ] for add_call in mocks["table"].add.call_args_list[ 1: ] if len( add_call.args[ 0 ][ 0 ][ "embedding" ] ) == 4 ]
+        self.assertEqual( [ rows[ 0 ][ "normalized_text" ] for rows in written ], [ "good 1", "good 2" ] )
+        self.assertEqual( cache_table.get_write_stats(), { "buffered": 0, "flushes": 1, "rows_written": 2, "rows_rejected": 1, "compactions": 0 } )
+        
+        mocks["table"].add.reset_mock()
+        cache_table.cache_embedding( "good 3", [ 0.3 ] * 4 )
+        self.assertEqual( cache_table.flush(), 1 )
+        mocks["table"].add.assert_called_once()
+    
+    def test_write_buffer_flushes_on_age( self ):
+        """
+        Test that a partly filled buffer is written once its oldest row is old enough.
+        
+        Ensures:
+            - The age timer writes the buffered rows without another cache_embedding() call
+        """
+        cache_table, mocks = self._create_mocked_cache_table( config_values={
+            "database_path_wo_root": "/test/db",
+            "embedding cache write buffer max age seconds": "0.05"
+        } )
+        
+        cache_table.cache_embedding( "lonely text", [ 0.5 ] * 4 )
+        
+        deadline = time.time() + 2.0
+        while not mocks["table"].add.called and time.time() < deadline:
+            time.sleep( 0.01 )
+        
+        mocks["table"].add.assert_called_once_with( [ {"normalized_text": "lonely text", "embedding": [ 0.5 ] * 4} ] )
+    
+    def test_lookup_lru_and_negative_cache( self ):
+        """
+        Test the in-process lookup tier.
+        
+        Ensures:
+            - has_cached_embedding() followed by get_cached_embedding() scans once
+            - Misses are remembered until the TTL expires
+            - Caching an embedding clears a remembered miss
+            - LRU evictions are counted
+        """
+        cache_table, mocks = self._create_mocked_cache_table( config_values={
+            "database_path_wo_root": "/test/db",
+            "embedding cache lru size": "2",
+            "embedding cache negative ttl seconds": "60"
+        } )
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_rows    = mock_scanner.return_value.to_table.return_value.to_pylist
+        
+        mock_rows.return_value = [ {"embedding": [0.1] * 4} ]
+        self.assertTrue( cache_table.has_cached_embedding( "hello world" ) )
+        self.assertEqual( cache_table.get_cached_embedding( "hello world" ), [0.1] * 4 )
+        self.assertEqual( mock_scanner.call_count, 1 )
+        
+        mock_rows.return_value = [ ]
+        self.assertIsNone( cache_table.get_cached_embedding( "missing" ) )
+        self.assertFalse( cache_table.has_cached_embedding( "missing" ) )
+        self.assertEqual( cache_table.get_cached_embeddings( [ "missing", "hello world" ] ), { "hello world": [0.1] * 4 } )
+        self.assertEqual( mock_scanner.call_count, 2 )
+        
+        cache_table._negative[ "missing" ] = time.monotonic() - 1   # expire the remembered miss
+        self.assertIsNone( cache_table.get_cached_embedding( "missing" ) )
+        self.assertEqual( mock_scanner.call_count, 3 )
+        
+        cache_table.cache_embedding( "missing", [0.2] * 4 )
+        cache_table.flush()
+        self.assertEqual( cache_table.get_cached_embedding( "missing" ), [0.2] * 4 )
+        self.assertEqual( mock_scanner.call_count, 3 )
+        
+        cache_table.cache_embedding( "third", [0.3] * 4 )
+        stats = cache_table.get_lookup_stats()
+        self.assertEqual( stats[ "lru_entries" ], 2 )
+        self.assertEqual( stats[ "evictions" ], 1 )
+        self.assertEqual( stats[ "misses" ], 3 )
+        self.assertEqual( stats[ "negative_hits" ], 2 )
+    
+    def test_empty_embedding_is_not_cached( self ):
+        """
+        Test caching the empty result of a failed embedding call.
+        
+        Ensures:
+            - has_cached_embedding() stays False: nothing goes into the LRU or the write buffer
+            - An empty embedding read back from the table is remembered as a miss
+        """
+        cache_table, mocks = self._create_mocked_cache_table( config_values={
+            "database_path_wo_root": "/test/db",
+            "embedding cache negative ttl seconds": "60"
+        } )
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = [ ]
+        
+        cache_table.cache_embedding( "no embedding", [ ] )
+        
+        self.assertEqual( cache_table.get_write_stats()[ "buffered" ], 0 )
+        self.assertEqual( cache_table.get_lookup_stats()[ "lru_entries" ], 0 )
+        self.assertFalse( cache_table.has_cached_embedding( "no embedding" ) )
+        
+        cache_table._remember( "empty row", [ ] )
+        self.assertEqual( cache_table.get_lookup_stats()[ "lru_entries" ], 0 )
+        self.assertEqual( cache_table.get_lookup_stats()[ "negative_entries" ], 2 )
+    
+    def test_fragment_count_with_and_without_buffer( self ):
+        """
+        Test fragment growth on a real LanceDB table after 10k inserts.
+        
+        Unbuffered writes run 1k inserts only: 10k single-row adds take minutes
+        (and leave 10k fragments), which is exactly the problem being tested.
+        
+        Ensures:
+            - Unbuffered writes (buffer size 1) leave one fragment per embedding
+            - Buffered writes with periodic compaction leave a few dozen at most
+        """
+        import tempfile
+        
+        def fragment_count( buffer_size: str, compact_every: str, inserts: int ) -> int:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                config_values = {
+                    "database_path_wo_root": "/db",
+                    "embedding dimensions": "8",
+                    "embedding cache write buffer size": buffer_size,
+                    "embedding cache write buffer max age seconds": "0",
+                    "embedding cache compact every flushes": compact_every
+                }
+                mock_config = Mock()
+                mock_config.get.side_effect = lambda key, default=None: config_values.get( key, default )
+                
+                with patch( "cosa.utils.util.get_project_root", return_value=temp_dir ), \
+                     patch( "cosa.memory.embedding_cache_table.ConfigurationManager", return_value=mock_config ), \
+                     patch( "builtins.print" ):
+                    cache_table = EmbeddingCacheTable( debug=False )
+                    for i in range( inserts ):
+                        cache_table.cache_embedding( f"text {i}", [ 0.1 ] * 8 )
+                    cache_table.close()
+                    
+                    self.assertEqual( cache_table._embedding_cache_tbl.count_rows(), inserts )
+                    return len( cache_table._embedding_cache_tbl.to_lance().get_fragments() )
+        
+        self.assertEqual( fragment_count( "1", "0", 1000 ), 1000 )
+        self.assertLess( fragment_count( "256", "16", 10000 ), 50 )
     
     def test_database_error_handling( self ):
         """
@@ -436,6 +686,10 @@ def isolated_unit_test():
             'test_get_cached_embedding_not_found',
             'test_cache_embedding',
             'test_cache_embedding_error_handling',
+            'test_write_buffer_flushes_on_size_and_compacts',
+            'test_write_buffer_flushes_on_age',
+            'test_lookup_lru_and_negative_cache',
+            'test_fragment_count_with_and_without_buffer',
             'test_database_error_handling'
         ]
         
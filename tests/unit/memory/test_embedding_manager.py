@@ -30,6 +30,26 @@ from unit_test_utilities import UnitTestUtilities
 from cosa.memory.embedding_manager import EmbeddingManager, get_embedding_manager, generate_embedding
 
 
+class FakeEmbeddingClient:
+    """
+    Offline stand-in for openai.OpenAI that records embeddings requests.
+    
+    Ensures:
+        - embeddings.create() returns one deterministic vector per input text
+        - Every call's input list is recorded in self.requests
+    """
+    
+    def __init__( self ):
+        self.requests   = []
+        self.embeddings = self
+    
+    def create( self, input, model, dimensions ):
+        inputs = [ input ] if isinstance( input, str ) else list( input )
+        self.requests.append( inputs )
+        data = [ Mock( index=i, embedding=[ float( len( text ) ) ] * dimensions ) for i, text in enumerate( inputs ) ]
+        return Mock( data=data )
+
+
 class TestEmbeddingManager( unittest.TestCase ):
     """
     Comprehensive unit tests for EmbeddingManager singleton class.
@@ -462,6 +482,77 @@ class TestEmbeddingManager( unittest.TestCase ):
             
             # Verify result
             self.assertEqual( result, generated_embedding )
+    
+    def _create_batch_manager( self, cached=None ):
+        """
+        Create an EmbeddingManager wired to a fake client and an in-memory cache.
+        
+        Returns:
+            Tuple of (manager, mock_cache, fake_client, mock_openai_class)
+        """
+        config_values = { "embedding model name": "text-embedding-3-small", "embedding dimensions": "4" }
+        mock_config   = Mock()
+        mock_config.get.side_effect = lambda key, default=None, return_type="string": config_values.get( key, default )
+        
+        cached     = dict( cached or {} )
+        mock_cache = Mock()
+        mock_cache.get_cached_embeddings.side_effect = lambda keys: { key: cached[ key ] for key in keys if key in cached }
+        
+        fake_client = FakeEmbeddingClient()
+        
+        with patch( "cosa.utils.util.get_project_root", return_value="/test" ), \
+             patch( "cosa.utils.util.get_file_as_dictionary", return_value={} ), \
+             patch( "cosa.memory.embedding_manager.ConfigurationManager", return_value=mock_config ), \
+             patch( "cosa.memory.embedding_manager.EmbeddingCacheTable", return_value=mock_cache ), \
+             patch( "cosa.memory.embedding_manager.GistNormalizer" ):
+            manager = EmbeddingManager( debug=False )
+        
+        mock_openai_class = patch( "cosa.memory.embedding_manager.openai.OpenAI", return_value=fake_client )
+        return manager, mock_cache, fake_client, mock_openai_class
+    
+    def test_generate_embeddings_batches_cache_misses( self ):
+        """
+        Test generate_embeddings() batching against a fake client.
+        
+        Ensures:
+            - One cache lookup for all distinct texts
+            - One API request containing only distinct cache misses
+            - One cache write for the new embeddings
+            - Results returned in input order, duplicates included
+        """
+        manager, mock_cache, fake_client, mock_openai_class = self._create_batch_manager( cached={ "cached": [ 9.0 ] * 4 } )
+        
+        with patch( "cosa.utils.util.get_api_key", return_value="test_key" ), mock_openai_class:
+            result = manager.generate_embeddings( [ "ab", "cached", "abc", "ab" ], normalize_for_cache=False )
+        
+        mock_cache.get_cached_embeddings.assert_called_once_with( [ "ab", "cached", "abc" ] )
+        self.assertEqual( fake_client.requests, [ [ "ab", "abc" ] ] )
+        mock_cache.cache_embeddings.assert_called_once_with( { "ab": [ 2.0 ] * 4, "abc": [ 3.0 ] * 4 } )
+        self.assertEqual( result, [ [ 2.0 ] * 4, [ 9.0 ] * 4, [ 3.0 ] * 4, [ 2.0 ] * 4 ] )
+    
+    def test_generate_embeddings_reuses_client( self ):
+        """
+        Test that the OpenAI client is created once and reused across calls.
+        
+        Ensures:
+            - openai.OpenAI constructed a single time
+            - All-hit batches make no API request and no cache write
+            - generate_embedding() shares the same client
+        """
+        manager, mock_cache, fake_client, mock_openai_class = self._create_batch_manager( cached={ "hit": [ 1.0 ] * 4 } )
+        mock_cache.get_cached_embedding.return_value = None
+        
+        with patch( "cosa.utils.util.get_api_key", return_value="test_key" ), mock_openai_class as mock_openai:
+            manager.generate_embeddings( [ "hit" ], normalize_for_cache=False )
+            self.assertEqual( fake_client.requests, [] )
+            mock_cache.cache_embeddings.assert_not_called()
+            
+            manager.generate_embeddings( [ "one", "two" ], normalize_for_cache=False )
+            manager.generate_embeddings( [ "three" ], normalize_for_cache=False )
+            manager.generate_embedding( "four", normalize_for_cache=False )
+        
+        mock_openai.assert_called_once()
+        self.assertEqual( fake_client.requests, [ [ "one", "two" ], [ "three" ], [ "four" ] ] )
 
 
 def isolated_unit_test():
@@ -0,0 +1,209 @@
+"""
+Unit tests for the vectorized embedding matrix (EmbeddingMatrix).
+
+Tests the EmbeddingMatrix including:
+- Scores matching the per-pair SolutionSnapshot.get_embedding_similarity() loop
+- Top-k selection, thresholds and exclusion callbacks
+- Incremental upsert/remove with capacity growth and swap-with-last deletes
+- Rows with empty or mismatched embeddings being skipped
+
+Zero external dependencies - embeddings are generated with numpy.
+"""
+
+import unittest
+import time
+
+import numpy as np
+
+# Import test infrastructure
+import sys
+import os
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+from cosa.memory.embedding_matrix import EmbeddingMatrix
+
+
+def _unit_vectors( count: int, dim: int = 32, seed: int = 7 ) -> np.ndarray:
+    rng     = np.random.default_rng( seed )
+    vectors = rng.standard_normal( ( count, dim ) )
+    return vectors / np.linalg.norm( vectors, axis=1, keepdims=True )
+
+
+class TestEmbeddingMatrix( unittest.TestCase ):
+    """
+    Unit tests for EmbeddingMatrix.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - Vectorized search returns what the per-pair loop returned
+        - Index stays consistent across incremental updates
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Fresh random unit vectors
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+        self.vectors        = _unit_vectors( 200 )
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - All mocks are reset
+        """
+        self.mock_manager.reset_mocks()
+
+    def _build( self, initial_capacity: int = 4 ) -> EmbeddingMatrix:
+        matrix = EmbeddingMatrix( initial_capacity=initial_capacity )
+        for i, vector in enumerate( self.vectors ):
+            matrix.upsert( f"q{i}", vector.tolist(), f"s{i}" )
+        return matrix
+
+    def test_search_matches_per_pair_loop( self ):
+        """
+        Test that search() agrees with the brute-force loop.
+
+        Ensures:
+            - Same payloads, same order, same float64 scores
+            - At most limit results, all at or above threshold
+        """
+        matrix = self._build()
+        query  = self.vectors[ 3 ] * 0.6 + self.vectors[ 4 ] * 0.4
+        query  = ( query / np.linalg.norm( query ) ).tolist()
+
+        expected = sorted(
+            ( ( np.dot( query, vector.tolist() ) * 100, f"s{i}" ) for i, vector in enumerate( self.vectors ) ),
+            key=lambda item: item[ 0 ], reverse=True
+        )
+        expected = [ item for item in expected if item[ 0 ] >= 10.0 ][ :5 ]
+
+        results = matrix.search( query, threshold=10.0, limit=5 )
+
+        self.assertEqual( [ payload for _, payload in results ], [ payload for _, payload in expected ] )
+        for ( score, _ ), ( expected_score, _ ) in zip( results, expected ):
+            self.assertAlmostEqual( score, expected_score, places=9 )
+
+    def test_exact_match_passes_threshold_100( self ):
+        """
+        Test that an identical embedding still clears a 100.0 threshold when float64 does.
+
+        Ensures:
+            - float32 rounding doesn't drop exact matches
+        """
+        matrix = self._build()
+        query  = self.vectors[ 11 ].tolist()
+        expect = np.dot( query, query ) * 100 >= 100.0
+
+        results = matrix.search( query, threshold=100.0, limit=7 )
+
+        self.assertEqual( [ payload for _, payload in results ], [ "s11" ] if expect else [ ] )
+
+    def test_exclude_widens_window( self ):
+        """
+        Test that excluded payloads don't shrink the result below limit.
+
+        Ensures:
+            - Excluded rows are skipped and the next best rows fill in
+        """
+        matrix   = self._build()
+        query    = self.vectors[ 0 ].tolist()
+        baseline = matrix.search( query, threshold=-100.0, limit=7 )
+        excluded = { payload for _, payload in baseline[ :4 ] }
+
+        results = matrix.search( query, threshold=-100.0, limit=3, exclude=lambda payload: payload in excluded )
+
+        self.assertEqual( [ payload for _, payload in results ], [ payload for _, payload in baseline[ 4:7 ] ] )
+
+    def test_upsert_and_remove_keep_rows_consistent( self ):
+        """
+        Test incremental updates.
+
+        Ensures:
+            - Capacity grows past the initial size
+            - Replacing a key updates its row instead of adding one
+            - Removing a key moves the last row into its slot
+        """
+        matrix = self._build( initial_capacity=1 )
+        self.assertEqual( len( matrix ), 200 )
+
+        matrix.upsert( "q5", self.vectors[ 150 ].tolist(), "s5-replaced" )
+        self.assertEqual( len( matrix ), 200 )
+
+        self.assertTrue( matrix.remove( "q0" ) )
+        self.assertFalse( matrix.remove( "q0" ) )
+        self.assertNotIn( "q0", matrix )
+        self.assertEqual( len( matrix ), 199 )
+
+        last = matrix.search( self.vectors[ 199 ].tolist(), threshold=99.0, limit=1 )
+        self.assertEqual( last[ 0 ][ 1 ], "s199" )
+
+        replaced = matrix.search( self.vectors[ 150 ].tolist(), threshold=99.0, limit=2 )
+        self.assertEqual( sorted( payload for _, payload in replaced ), [ "s150", "s5-replaced" ] )
+
+    def test_invalid_embeddings_skipped( self ):
+        """
+        Test that empty or wrong-dimension embeddings never reach the matrix.
+
+        Ensures:
+            - upsert() returns False and drops any previous row for the key
+            - Mismatched queries return no results
+        """
+        matrix = self._build()
+
+        self.assertFalse( matrix.upsert( "empty", [ ], "nothing" ) )
+        self.assertFalse( matrix.upsert( "q1", [ 1.0, 0.0 ], "short" ) )
+        self.assertNotIn( "q1", matrix )
+        self.assertEqual( len( matrix ), 199 )
+        self.assertEqual( matrix.search( [ 1.0, 0.0 ], threshold=0.0, limit=3 ), [ ] )
+        self.assertEqual( EmbeddingMatrix().search( self.vectors[ 0 ].tolist(), threshold=0.0, limit=3 ), [ ] )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for EmbeddingMatrix in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "EmbeddingMatrix Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestEmbeddingMatrix )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} EmbeddingMatrix unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
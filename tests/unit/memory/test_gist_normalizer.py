@@ -295,7 +295,7 @@ class TestGistNormalizer( unittest.TestCase ):
         
         # Setup mocks
         mocks["gister"].get_gist.side_effect = extracted_gists
-        mocks["normalizer"].normalize_batch.return_value = normalized_results
+        mocks["normalizer"].normalize_many.return_value = normalized_results
         
         # Test batch processing
         results = gn.process_batch( input_texts )
@@ -306,7 +306,7 @@ class TestGistNormalizer( unittest.TestCase ):
             mocks["gister"].get_gist.assert_any_call( text )
         
         # Verify normalizer batch called with gists
-        mocks["normalizer"].normalize_batch.assert_called_once_with( extracted_gists )
+        mocks["normalizer"].normalize_many.assert_called_once_with( extracted_gists, batch_size=64, n_process=1 )
         
         # Verify results
         self.assertEqual( results, normalized_results )
@@ -323,7 +323,7 @@ class TestGistNormalizer( unittest.TestCase ):
         gn, mocks = self._create_mocked_gist_normalizer()
         
         # Setup normalizer to return empty list
-        mocks["normalizer"].normalize_batch.return_value = []
+        mocks["normalizer"].normalize_many.return_value = []
         
         # Test with empty list
         results = gn.process_batch( [] )
@@ -332,7 +332,7 @@ class TestGistNormalizer( unittest.TestCase ):
         mocks["gister"].get_gist.assert_not_called()
         
         # Verify batch normalization called with empty list
-        mocks["normalizer"].normalize_batch.assert_called_once_with( [] )
+        mocks["normalizer"].normalize_many.assert_called_once_with( [], batch_size=64, n_process=1 )
         
         # Verify empty result
         self.assertEqual( results, [] )
@@ -0,0 +1,181 @@
+"""
+Unit tests for exact-match LanceDB lookups (lancedb_exact_lookup).
+
+Tests the lancedb_exact_lookup helpers including:
+- SQL string literal quoting for = and IN filters
+- BTREE index creation, FTS index migration and refresh after appends
+- Single and multi-value lookups through the reused dataset handle
+- Writes made after the handle was opened staying visible
+
+Uses a real LanceDB database in a temporary directory.
+"""
+
+import unittest
+from unittest.mock import patch
+import os
+import tempfile
+import time
+
+# Import test infrastructure
+import sys
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+import lancedb
+import pyarrow as pa
+
+# Import the module under test
+import cosa.memory.lancedb_exact_lookup as lel
+from cosa.memory.lancedb_exact_lookup import ExactMatchLookup, ensure_scalar_index
+
+
+QUESTIONS = [ f"what's {i} plus {i}" for i in range( 50 ) ]
+
+
+class TestLanceDBExactLookup( unittest.TestCase ):
+    """
+    Unit tests for ensure_scalar_index() and ExactMatchLookup.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - Lookups match what an unindexed filter returns
+        - Key columns end up covered by a BTREE index
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Fresh LanceDB database with a small question/answer table
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+        self.temp_dir       = tempfile.TemporaryDirectory()
+
+        schema      = pa.schema( [ pa.field( "question", pa.string() ), pa.field( "answer", pa.string() ) ] )
+        self.db     = lancedb.connect( self.temp_dir.name )
+        self.table  = self.db.create_table( "lookup_tbl", schema=schema )
+        self.table.add( [ { "question": question, "answer": str( i + i ) } for i, question in enumerate( QUESTIONS ) ] )
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Temporary database removed and mocks reset
+        """
+        self.temp_dir.cleanup()
+        self.mock_manager.reset_mocks()
+
+    def _btree_stats( self, column: str ):
+        for index in self.table.list_indices():
+            if list( index.columns ) == [ column ] and "btree" in str( index.index_type ).lower():
+                return self.table.index_stats( index.name )
+        return None
+
+    def test_sql_literals_are_quoted( self ):
+        """
+        Test filter construction for awkward values.
+
+        Ensures:
+            - Single quotes are doubled in = and IN filters
+            - Quote-laden values still match exactly
+        """
+        self.assertEqual( lel.equals_filter( "question", "it's" ), "question = 'it''s'" )
+        self.assertEqual( lel.in_filter( "question", [ "a", "b'c" ] ), "question IN ('a', 'b''c')" )
+
+        awkward = "x'; DROP TABLE lookup_tbl; --"
+        self.table.add( [ { "question": awkward, "answer": "safe" } ] )
+        self.assertEqual( ExactMatchLookup( self.table ).first( "question", awkward, columns=[ "answer" ] ), { "answer": "safe" } )
+
+    def test_scalar_index_lifecycle( self ):
+        """
+        Test BTREE index creation, migration and refresh.
+
+        Ensures:
+            - An FTS index on the key column is replaced by a BTREE index
+            - A current index is left alone
+            - Enough unindexed appends trigger a rebuild that covers them
+        """
+        self.table.create_fts_index( "question", replace=True )
+
+        self.assertEqual( ensure_scalar_index( self.table, "question" ), "created" )
+        index_types = [ str( index.index_type ).lower() for index in self.table.list_indices() ]
+        self.assertEqual( len( index_types ), 1 )
+        self.assertIn( "btree", index_types[ 0 ] )
+        self.assertEqual( self._btree_stats( "question" ).num_indexed_rows, len( QUESTIONS ) )
+
+        self.assertEqual( ensure_scalar_index( self.table, "question" ), "current" )
+
+        self.table.add( [ { "question": f"later {i}", "answer": "" } for i in range( 10 ) ] )
+        self.assertEqual( ensure_scalar_index( self.table, "question" ), "rebuilt" )
+        self.assertEqual( self._btree_stats( "question" ).num_unindexed_rows, 0 )
+
+        self.assertEqual( ensure_scalar_index( self.table, "no_such_column" ), "failed" )
+
+    def test_lookups_and_version_refresh( self ):
+        """
+        Test first() and rows() through one ExactMatchLookup.
+
+        Ensures:
+            - first() returns the requested columns or None
+            - rows() de-duplicates keys, skips misses and splits long IN lists
+            - Rows written after the first lookup are found without rebinding
+        """
+        ensure_scalar_index( self.table, "question" )
+        lookup = ExactMatchLookup( self.table )
+
+        self.assertEqual( lookup.first( "question", QUESTIONS[ 7 ], columns=[ "answer" ] ), { "answer": "14" } )
+        self.assertIsNone( lookup.first( "question", "missing" ) )
+        self.assertEqual( lookup.rows( "question", [ ] ), [ ] )
+
+        with patch.object( lel, "IN_LIST_BATCH_SIZE", 4 ):
+            rows = lookup.rows( "question", QUESTIONS[ :10 ] + QUESTIONS[ :3 ] + [ "missing" ], columns=[ "question" ] )
+        self.assertEqual( sorted( row[ "question" ] for row in rows ), sorted( QUESTIONS[ :10 ] ) )
+
+        self.table.add( [ { "question": "added later", "answer": "yes" } ] )
+        self.assertEqual( lookup.first( "question", "added later", columns=[ "answer" ] ), { "answer": "yes" } )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for lancedb_exact_lookup in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "LanceDB Exact Lookup Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestLanceDBExactLookup )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} LanceDB exact lookup unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
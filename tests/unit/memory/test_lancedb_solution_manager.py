@@ -535,5 +535,174 @@ class TestLanceDBSolutionManager( unittest.TestCase ):
             self.assertTrue( mock_print.called )
 
 
+    def test_projected_load_and_record_lru( self ):
+        """
+        Test column-projected startup and on-demand row hydration.
+
+        Ensures:
+            - Startup scan selects only the lookup columns
+            - _id_lookup holds no embedding vectors
+            - Full rows are read once per id_hash, then served from the LRU
+            - LRU is bounded by record_cache_size
+        """
+        import pyarrow as pa
+
+        with patch( 'cosa.memory.lancedb_solution_manager.lancedb' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.QuestionEmbeddingsTable' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.ConfigurationManager' ) as mock_config:
+
+            mock_config.return_value.get.return_value = "768"
+            config  = { "storage_backend": "local", "db_path": "/tmp/test.lancedb", "table_name": "snapshots", "record_cache_size": 2 }
+            manager = LanceDBSolutionManager( config )
+
+            projected = pa.table( {
+                "id_hash"            : [ "a", "b", "c" ],
+                "question"           : [ "qa", "qb", "qc" ],
+                "question_normalized": [ "qa", "qb", "qc" ],
+                "question_gist"      : [ "ga", "gb", "gc" ]
+            } )
+            mock_table = Mock()
+            mock_table.count_rows.return_value = 3
+            mock_table.schema.names = list( projected.column_names ) + [ "answer", "question_embedding" ]
+            mock_table.search.return_value.select.return_value.limit.return_value.to_arrow.return_value = projected
+            mock_table.search.return_value.where.side_effect = lambda clause: Mock( **{
+                "limit.return_value.to_list.return_value": [ { "id_hash": clause.split( "'" )[ 1 ], "question": "q", "question_embedding": [ 0.1 ] * 4 } ]
+            } )
+            manager._table = mock_table
+
+            self.assertEqual( manager._load_lookups(), 3 )
+            mock_table.search.return_value.select.assert_called_once_with( list( LanceDBSolutionManager.LOOKUP_COLUMNS ) )
+            self.assertEqual( manager._question_lookup[ "qb" ], "b" )
+            self.assertNotIn( "question_embedding", manager._id_lookup[ "b" ] )
+
+            self.assertEqual( manager._get_full_record( "a" )[ "question_embedding" ], [ 0.1 ] * 4 )
+            manager._get_full_record( "a" )
+            manager._get_full_record( "b" )
+            manager._get_full_record( "c" )
+
+            self.assertEqual( mock_table.search.return_value.where.call_count, 3 )
+            self.assertEqual( list( manager._record_cache.keys() ), [ "b", "c" ] )
+            self.assertEqual( manager._record_cache_stats, { "hits": 1, "misses": 3 } )
+
+    def test_vector_results_materialize_only_kept_rows( self ):
+        """
+        Test Arrow-based scoring of vector search results.
+
+        Ensures:
+            - Similarity is ( 1 - _distance ) * 100
+            - Excluded and below-threshold rows are not materialized, except the best one below
+            - Snapshots are lazy views built without embedding columns
+        """
+        import pyarrow as pa
+
+        with patch( 'cosa.memory.lancedb_solution_manager.lancedb' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.QuestionEmbeddingsTable' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.LazySolutionSnapshot' ) as mock_lazy, \
+             patch( 'cosa.memory.lancedb_solution_manager.ConfigurationManager' ) as mock_config:
+
+            mock_config.return_value.get.return_value = "768"
+            config  = { "storage_backend": "local", "db_path": "/tmp/test.lancedb", "table_name": "snapshots" }
+            manager = LanceDBSolutionManager( config )
+
+            mock_lazy.side_effect = lambda loader, **kwargs: kwargs[ "id_hash" ]
+            results = pa.table( {
+                "id_hash"           : [ "self", "a", "b", "c", "d" ],
+                "question"          : [ "q0", "qa", "qb", "qc", "qd" ],
+                "code"              : [ [ "x" ], [ "y" ], [ "z" ], [ ], [ ] ],
+                "question_embedding": [ [ 0.1 ] * 4 ] * 5,
+                "_distance"         : [ 0.0, 0.05, 0.1, 0.3, 0.4 ]
+            } )
+
+            above, below = manager._score_vector_results( results, 85.0, exclude_id_hash="self", ensure_top_result=True )
+
+            self.assertEqual( [ snapshot for _, snapshot in above ], [ "a", "b" ] )
+            self.assertAlmostEqual( above[ 0 ][ 0 ], 95.0 )
+            self.assertEqual( below[ 1 ], "c" )
+            self.assertEqual( mock_lazy.call_count, 3 )
+
+            loader, = mock_lazy.call_args.args
+            self.assertEqual( loader, manager._get_full_record )
+            self.assertNotIn( "question_embedding", mock_lazy.call_args.kwargs )
+            self.assertEqual( mock_lazy.call_args.kwargs[ "code" ], [ ] )
+
+            above, below = manager._score_vector_results( results, 85.0 )
+            self.assertEqual( len( above ), 3 )
+            self.assertIsNone( below )
+
+    def test_ensure_vector_indexes_lifecycle( self ):
+        """
+        Test IVF-PQ index creation, staleness check and rebuild.
+
+        Ensures:
+            - Small tables are left unindexed
+            - Missing indexes are created with size-derived parameters
+            - Fresh indexes are kept, stale ones rebuilt
+        """
+        with patch( 'cosa.memory.lancedb_solution_manager.lancedb' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.QuestionEmbeddingsTable' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.ConfigurationManager' ) as mock_config:
+
+            mock_config.return_value.get.return_value = "768"
+            config  = { "storage_backend": "local", "db_path": "/tmp/test.lancedb", "table_name": "snapshots", "vector_index_min_rows": 5000 }
+            manager = LanceDBSolutionManager( config )
+
+            mock_table = Mock()
+            mock_table.schema = manager._get_schema()
+            mock_table.list_indices.return_value = [ ]
+            manager._table = mock_table
+
+            mock_table.count_rows.return_value = 1000
+            self.assertEqual( set( manager.ensure_vector_indexes().values() ), { "skipped" } )
+            mock_table.create_index.assert_not_called()
+
+            mock_table.count_rows.return_value = 10000
+            actions = manager.ensure_vector_indexes()
+            self.assertEqual( set( actions.values() ), { "created" } )
+            self.assertEqual( mock_table.create_index.call_count, len( LanceDBSolutionManager.VECTOR_INDEX_COLUMNS ) )
+            self.assertEqual( mock_table.create_index.call_args.kwargs[ "num_partitions" ], 39 )
+            self.assertEqual( mock_table.create_index.call_args.kwargs[ "num_sub_vectors" ], 48 )
+
+            mock_table.create_index.reset_mock()
+            indices = [ Mock( columns=[ column ] ) for column in LanceDBSolutionManager.VECTOR_INDEX_COLUMNS ]
+            for index in indices:
+                index.name = f"{index.columns[ 0 ]}_idx"  # Mock( name=... ) names the mock instead
+            mock_table.list_indices.return_value = indices
+            mock_table.index_stats.side_effect = lambda name: Mock(
+                num_indexed_rows=8000, num_unindexed_rows=2000 if name == "code_embedding_idx" else 100
+            )
+            actions = manager.ensure_vector_indexes()
+            self.assertEqual( actions[ "code_embedding" ], "rebuilt" )
+            self.assertEqual( actions[ "question_embedding" ], "current" )
+            mock_table.create_index.assert_called_once()
+
+    def test_vector_search_refines_pq_distances_by_default( self ):
+        """
+        Test that vector searches re-rank approximate PQ candidates unless told otherwise.
+
+        Ensures:
+            - refine_factor defaults to DEFAULT_REFINE_FACTOR, so thresholds see exact distances
+            - An explicit refine_factor of 0 is honored
+        """
+        with patch( 'cosa.memory.lancedb_solution_manager.lancedb' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.QuestionEmbeddingsTable' ), \
+             patch( 'cosa.memory.lancedb_solution_manager.ConfigurationManager' ) as mock_config:
+
+            mock_config.return_value.get.return_value = "768"
+            base = { "storage_backend": "local", "db_path": "/tmp/test.lancedb", "table_name": "snapshots" }
+
+            for config, expected in ( ( base, LanceDBSolutionManager.DEFAULT_REFINE_FACTOR ), ( { **base, "refine_factor": 0 }, None ) ):
+                manager = LanceDBSolutionManager( config )
+                manager._table = Mock()
+                manager._table.schema.names = [ "id_hash", "question", "question_embedding" ]
+                query = manager._table.search.return_value.metric.return_value.nprobes.return_value
+
+                manager._vector_search( [ 0.1 ] * 4, "question_embedding", 10 )
+
+                if expected is None:
+                    query.refine_factor.assert_not_called()
+                else:
+                    query.refine_factor.assert_called_once_with( expected )
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -533,6 +533,111 @@ class TestNormalizer( unittest.TestCase ):
             self.assertEqual( result1, result2,
                            "Normalizer should produce consistent results for same input" )
 
+    def test_restricted_pipeline_contractions_and_cache( self ):
+        """
+        Test the restricted pipeline, single-pass contraction expansion and normalize() LRU.
+
+        Ensures:
+            - Parser and NER are disabled, tagging/lemmatizing components kept, sentencizer added
+            - Contractions expand in one pass, whole words only, longest key first
+            - A repeated normalize() call doesn't run spaCy again
+        """
+        saved_instance = Normalizer._instance
+        Normalizer._instance = None
+
+        mock_config = Mock()
+        mock_config.get.side_effect = lambda key, default=None, **kwargs: default
+
+        try:
+            with patch( 'cosa.memory.normalizer.spacy.load' ) as mock_spacy, \
+                 patch( 'cosa.memory.normalizer.ConfigurationManager', return_value=mock_config ):
+                mock_nlp = Mock()
+                mock_nlp.pipe_names = [ 'tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'ner' ]
+                mock_spacy.return_value = mock_nlp
+
+                normalizer = Normalizer()
+
+                mock_nlp.disable_pipes.assert_called_once_with( [ 'parser', 'ner' ] )
+                mock_nlp.add_pipe.assert_called_once_with( 'sentencizer' )
+
+                self.assertEqual( normalizer.expand_contractions( "What's up? I Don't know, whatsapp" ), "what is up? I do not know, whatsapp" )
+                self.assertEqual( normalizer.expand_contractions( "they'd say it's theirs" ), "they would say it is theirs" )
+
+                mock_doc = Mock()
+                token = Mock()
+                token.is_punct = False
+                token.pos_ = 'NOUN'
+                token.lemma_ = 'test'
+                token.text = 'test'
+                mock_doc.sents = [ [ token ] ]
+                mock_nlp.return_value = mock_doc
+
+                self.assertEqual( normalizer.normalize( "Test" ), "test" )
+                self.assertEqual( normalizer.normalize( "Test" ), "test" )
+                self.assertEqual( mock_nlp.call_count, 1 )
+                self.assertEqual( normalizer.get_cache_stats(), { "hits": 1, "misses": 1, "size": 1 } )
+        finally:
+            Normalizer._instance = saved_instance
+
+    def test_normalize_many_parity( self ):
+        """
+        Test that normalize_many() returns exactly what normalize() returns, text by text.
+
+        Uses a real (blank English) spaCy pipeline so nlp() and nlp.pipe() tokenize for real.
+
+        Ensures:
+            - Identical output on a corpus of contractions, fillers, math, punctuation and blanks
+            - Identical output with n_process=2
+            - Duplicates go through spaCy once and results land in the normalize() LRU
+        """
+        import spacy
+
+        corpus = [
+            "What time is it?",
+            "Um, I don't think we're gonna make it to the meeting.",
+            "So like, you know, I was literally just thinking about it.",
+            "She's hasn't been here, right? I mean, basically, she won't come.",
+            "whats 2+2", "What's 12*3 - 4 = 32?", "is 5 >= 3 and (7 % 2) != 0",
+            "Let's see if we can't fix this issue, you know?",
+            "Hello!!! How are you... doing today? Fine; thanks.",
+            "", "   ", "?!@#$", "HELLO", "what time is it?", "What time is it?",
+            "café naïve résumé", "they'll say it's fine. You'd agree, wouldn't you?"
+        ]
+
+        saved_instance = Normalizer._instance
+        mock_config = Mock()
+        mock_config.get.side_effect = lambda key, default=None, **kwargs: default
+
+        try:
+            with patch( 'cosa.memory.normalizer.spacy.load', side_effect=lambda name: spacy.blank( "en" ) ), \
+                 patch( 'cosa.memory.normalizer.ConfigurationManager', return_value=mock_config ):
+                Normalizer._instance = None
+                batched = Normalizer().normalize_many( corpus, batch_size=4 )
+
+                Normalizer._instance = None
+                normalizer = Normalizer()
+                single     = [ normalizer.normalize( text ) for text in corpus ]
+
+                Normalizer._instance = None
+                forked = Normalizer().normalize_many( corpus, batch_size=4, n_process=2 )
+
+                Normalizer._instance = None
+                normalizer = Normalizer()
+                with patch.object( normalizer.nlp, 'pipe', wraps=normalizer.nlp.pipe ) as mock_pipe:
+                    normalizer.normalize_many( corpus )
+                    normalizer.normalize_many( corpus )
+                unique_texts = len( { text for text in corpus if text.strip() } )
+                self.assertEqual( mock_pipe.call_count, 1 )
+                self.assertEqual( normalizer.get_cache_stats()[ "size" ], unique_texts )
+        finally:
+            Normalizer._instance = saved_instance
+
+        self.assertEqual( batched, single )
+        self.assertEqual( forked, single )
+        self.assertEqual( single[ 0 ], "what time is it" )
+        self.assertIn( "2 + 2", single[ 4 ] )
+        self.assertEqual( single[ 9:11 ], [ "", "" ] )
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -87,6 +87,7 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         mock_embedding_mgr.generate_embedding.return_value = self.test_embedding
         mock_db.open_table.return_value = mock_table
         mock_table.count_rows.return_value = 100
+        mock_table.list_indices.return_value = []
         
         mocks = {
             "config_mgr": mock_config_mgr,
@@ -157,18 +158,9 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         """
         table, mocks = self._create_mocked_question_embeddings_table()
         
-        # Mock search chain for existing question
-        mock_search = Mock()
-        mock_where = Mock()
-        mock_limit = Mock()
-        mock_select = Mock()
-        
-        mock_search.where.return_value = mock_where
-        mock_where.limit.return_value = mock_limit
-        mock_limit.select.return_value = mock_select
-        mock_select.to_list.return_value = [{"question": self.test_question}]
-        
-        mocks["table"].search.return_value = mock_search
+        # Mock scanner for existing question
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = [{"question": self.test_question}]
         
         with patch( "cosa.memory.question_embeddings_table.du.print_banner" ):
             result = table.has( self.test_question )
@@ -176,12 +168,8 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         # Verify result
         self.assertTrue( result )
         
-        # Verify query chain
-        mocks["table"].search.assert_called_once()
-        mock_search.where.assert_called_once_with( f"question = '{self.test_question}'" )
-        mock_where.limit.assert_called_once_with( 1 )
-        mock_limit.select.assert_called_once_with( ["question"] )
-        mock_select.to_list.assert_called_once()
+        # Verify single-row scan on the question key
+        mock_scanner.assert_called_once_with( filter=f"question = '{self.test_question}'", limit=1, columns=["question"] )
     
     def test_has_question_not_exists( self ):
         """
@@ -193,18 +181,9 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         """
         table, mocks = self._create_mocked_question_embeddings_table()
         
-        # Mock search chain for non-existing question
-        mock_search = Mock()
-        mock_where = Mock()
-        mock_limit = Mock()
-        mock_select = Mock()
-        
-        mock_search.where.return_value = mock_where
-        mock_where.limit.return_value = mock_limit
-        mock_limit.select.return_value = mock_select
-        mock_select.to_list.return_value = []  # No results
-        
-        mocks["table"].search.return_value = mock_search
+        # Mock scanner for non-existing question
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = []  # No results
         
         with patch( "cosa.memory.question_embeddings_table.du.print_banner" ):
             result = table.has( "Non-existent question" )
@@ -222,18 +201,9 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         """
         table, mocks = self._create_mocked_question_embeddings_table()
         
-        # Mock search chain
-        mock_search = Mock()
-        mock_where = Mock()
-        mock_limit = Mock()
-        mock_select = Mock()
-        
-        mock_search.where.return_value = mock_where
-        mock_where.limit.return_value = mock_limit
-        mock_limit.select.return_value = mock_select
-        mock_select.to_list.return_value = []
-        
-        mocks["table"].search.return_value = mock_search
+        # Mock scanner
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = []
         
         # Test with single quotes that need escaping
         malicious_question = "What's your name'; DROP TABLE users; --"
@@ -243,7 +213,7 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         
         # Verify quotes were escaped (single quotes doubled)
         expected_escaped = "What''s your name''; DROP TABLE users; --"
-        mock_search.where.assert_called_once_with( f"question = '{expected_escaped}'" )
+        self.assertEqual( mock_scanner.call_args.kwargs["filter"], f"question = '{expected_escaped}'" )
     
     def test_get_embedding_from_table( self ):
         """
@@ -256,18 +226,9 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         """
         table, mocks = self._create_mocked_question_embeddings_table()
         
-        # Mock search chain for existing embedding
-        mock_search = Mock()
-        mock_where = Mock()
-        mock_limit = Mock()
-        mock_select = Mock()
-        
-        mock_search.where.return_value = mock_where
-        mock_where.limit.return_value = mock_limit
-        mock_limit.select.return_value = mock_select
-        mock_select.to_list.return_value = [{"embedding": self.test_embedding}]
-        
-        mocks["table"].search.return_value = mock_search
+        # Mock scanner for existing embedding
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = [{"embedding": self.test_embedding}]
         
         result = table.get_embedding( self.test_question )
         
@@ -278,8 +239,7 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         mocks["embedding_mgr"].generate_embedding.assert_not_called()
         
         # Verify query structure
-        mock_search.where.assert_called_once_with( f"question = '{self.test_question}'" )
-        mock_limit.select.assert_called_once_with( ["embedding"] )
+        mock_scanner.assert_called_once_with( filter=f"question = '{self.test_question}'", limit=1, columns=["embedding"] )
     
     def test_get_embedding_generate_new( self ):
         """
@@ -292,18 +252,9 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         """
         table, mocks = self._create_mocked_question_embeddings_table()
         
-        # Mock search chain for non-existing embedding
-        mock_search = Mock()
-        mock_where = Mock()
-        mock_limit = Mock()
-        mock_select = Mock()
-        
-        mock_search.where.return_value = mock_where
-        mock_where.limit.return_value = mock_limit
-        mock_limit.select.return_value = mock_select
-        mock_select.to_list.return_value = []  # No results
-        
-        mocks["table"].search.return_value = mock_search
+        # Mock scanner for non-existing embedding
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = []  # No results
         
         result = table.get_embedding( self.test_question )
         
@@ -327,8 +278,8 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         """
         table, mocks = self._create_mocked_question_embeddings_table()
         
-        # Mock search to throw exception
-        mocks["table"].search.side_effect = Exception( "Database connection failed" )
+        # Mock scanner to throw exception
+        mocks["table"].to_lance.return_value.scanner.side_effect = Exception( "Database connection failed" )
         
         with patch( "cosa.memory.question_embeddings_table.du.print_stack_trace" ) as mock_print_trace:
             result = table.get_embedding( self.test_question )
@@ -397,18 +348,9 @@ class TestQuestionEmbeddingsTable( unittest.TestCase ):
         table, mocks = self._create_mocked_question_embeddings_table()
         table.debug = True  # Enable debug mode
         
-        # Mock search chain
-        mock_search = Mock()
-        mock_where = Mock()
-        mock_limit = Mock()
-        mock_select = Mock()
-        
-        mock_search.where.return_value = mock_where
-        mock_where.limit.return_value = mock_limit
-        mock_limit.select.return_value = mock_select
-        mock_select.to_list.return_value = []
-        
-        mocks["table"].search.return_value = mock_search
+        # Mock scanner
+        mock_scanner = mocks["table"].to_lance.return_value.scanner
+        mock_scanner.return_value.to_table.return_value.to_pylist.return_value = []
         
         with patch( "cosa.memory.question_embeddings_table.Stopwatch" ) as mock_stopwatch_class, \
              patch( "cosa.memory.question_embeddings_table.du.print_banner" ):
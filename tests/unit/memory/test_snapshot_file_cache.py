@@ -0,0 +1,214 @@
+"""
+Unit tests for the snapshot load cache (SnapshotFileCache).
+
+Tests the SnapshotFileCache including:
+- Manifest + .npy sidecar round trip across instances
+- Embeddings served from the sidecar at full JSON precision
+- Changed files missing the cache, touched-but-identical files hitting it
+- Pruning entries for deleted files
+- Non-list embedding values staying in the manifest record
+
+Zero external dependencies - files live in a temporary directory.
+"""
+
+import unittest
+import json
+import os
+import tempfile
+import time
+
+# Import test infrastructure
+import sys
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+from cosa.memory.snapshot_file_cache import SnapshotFileCache
+
+
+SNAPSHOT = {
+    "question"               : "what time is it",
+    "question_gist"          : "current time",
+    "synonymous_questions"   : { "what time is it": 100.0 },
+    "code"                   : [ "import datetime", "print( datetime.datetime.now() )" ],
+    "question_embedding"     : [ 0.5, 0.25, -0.125 ],
+    "question_gist_embedding": [ 1.0, 0.0, 0.0 ],
+    "code_embedding"         : [ ]
+}
+
+
+class TestSnapshotFileCache( unittest.TestCase ):
+    """
+    Unit tests for SnapshotFileCache.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - Unchanged files are served without re-parsing
+        - Any change to a file's content forces a re-parse
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Fresh temporary snapshot directory
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+        self.temp_dir       = tempfile.TemporaryDirectory()
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Temporary files removed and mocks reset
+        """
+        self.temp_dir.cleanup()
+        self.mock_manager.reset_mocks()
+
+    def _write_snapshot( self, name: str, data: dict ) -> tuple:
+        path = os.path.join( self.temp_dir.name, name )
+        raw  = json.dumps( data ).encode( "utf-8" )
+        with open( path, "wb" ) as file:
+            file.write( raw )
+        return path, raw
+
+    def _store( self, name: str, data: dict ) -> str:
+        path, raw = self._write_snapshot( name, data )
+        cache     = SnapshotFileCache( self.temp_dir.name )
+        cache.store( name, os.stat( path ), raw, data )
+        cache.save()
+        return path
+
+    def test_round_trip_across_instances( self ):
+        """
+        Test that a stored file is rebuilt exactly by a new instance.
+
+        Ensures:
+            - Embeddings come back from the sidecar, other fields from the manifest
+            - Returned dicts are independent of each other
+        """
+        path = self._store( "what-time-is-it-0.json", SNAPSHOT )
+
+        cache  = SnapshotFileCache( self.temp_dir.name )
+        first  = cache.lookup( "what-time-is-it-0.json", path, os.stat( path ) )
+        second = cache.lookup( "what-time-is-it-0.json", path, os.stat( path ) )
+
+        self.assertEqual( first, SNAPSHOT )
+        self.assertTrue( os.path.exists( os.path.join( cache.cache_dir, "what-time-is-it-0.npy" ) ) )
+
+        first[ "code" ].append( "mutated" )
+        self.assertEqual( second[ "code" ], SNAPSHOT[ "code" ] )
+
+    def test_hit_returns_the_same_floats_as_a_parse( self ):
+        """
+        Test embedding precision on a cache hit.
+
+        Ensures:
+            - Values float32 can't represent come back exactly as json.loads() parses them,
+              so hits and misses score alike and a rewritten snapshot loses nothing
+        """
+        data = { **SNAPSHOT, "question_embedding": [ 0.1, 1 / 3, -0.123456789012345 ] }
+        path = self._store( "precise-0.json", data )
+
+        cached = SnapshotFileCache( self.temp_dir.name ).lookup( "precise-0.json", path, os.stat( path ) )
+        with open( path, "r" ) as file:
+            parsed = json.load( file )
+
+        self.assertEqual( cached[ "question_embedding" ], parsed[ "question_embedding" ] )
+        self.assertEqual( cached, parsed )
+
+    def test_changed_file_misses_and_touched_file_hits( self ):
+        """
+        Test stat and content-hash validation.
+
+        Ensures:
+            - New content is a miss
+            - New mtime with the same bytes is a hit
+        """
+        path  = self._store( "what-time-is-it-0.json", SNAPSHOT )
+        stat  = os.stat( path )
+        os.utime( path, ns=( stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000 ) )
+
+        cache = SnapshotFileCache( self.temp_dir.name )
+        self.assertEqual( cache.lookup( "what-time-is-it-0.json", path, os.stat( path ) ), SNAPSHOT )
+
+        self._write_snapshot( "what-time-is-it-0.json", { **SNAPSHOT, "question": "what time is it now" } )
+        self.assertIsNone( cache.lookup( "what-time-is-it-0.json", path, os.stat( path ) ) )
+        self.assertIsNone( cache.lookup( "unknown.json", path, os.stat( path ) ) )
+
+    def test_prune_removes_deleted_files( self ):
+        """
+        Test pruning.
+
+        Ensures:
+            - Entries and sidecars for missing files are removed and persisted
+        """
+        self._store( "what-time-is-it-0.json", SNAPSHOT )
+
+        cache = SnapshotFileCache( self.temp_dir.name )
+        self.assertEqual( cache.prune( [ "other.json" ] ), 1 )
+        cache.save()
+
+        self.assertEqual( len( SnapshotFileCache( self.temp_dir.name ) ), 0 )
+        self.assertFalse( os.path.exists( os.path.join( cache.cache_dir, "what-time-is-it-0.npy" ) ) )
+
+    def test_non_list_embeddings_stay_in_record( self ):
+        """
+        Test that odd embedding values survive unchanged.
+
+        Ensures:
+            - None and nested lists are kept in the manifest record
+            - A snapshot with no list embeddings needs no sidecar
+        """
+        data = { "question": "odd", "question_embedding": None, "code_embedding": [ [ 1.0 ], [ 2.0 ] ] }
+        path = self._store( "odd-0.json", data )
+
+        cache = SnapshotFileCache( self.temp_dir.name )
+        self.assertEqual( cache.lookup( "odd-0.json", path, os.stat( path ) ), data )
+        self.assertFalse( os.path.exists( os.path.join( cache.cache_dir, "odd-0.npy" ) ) )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for SnapshotFileCache in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "SnapshotFileCache Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestSnapshotFileCache )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} SnapshotFileCache unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
@@ -9,6 +9,7 @@ Tests the FifoQueue class including:
 - User job tracking and filtering
 - Queue statistics and metrics
 - Thread-safe operations and concurrent access patterns
+- Indexed delete, position lookup and per-user listing (including a 100k-job stress run)
 
 Zero external dependencies - all WebSocket operations, user tracking,
 and external service calls are mocked for isolated testing.
@@ -16,6 +17,7 @@ and external service calls are mocked for isolated testing.
 
 import unittest
 from unittest.mock import Mock, MagicMock, patch, call
+import threading
 import time
 from collections import OrderedDict
 from typing import List, Dict, Any, Optional
@@ -31,6 +33,40 @@ from unit_test_utilities import UnitTestUtilities
 from cosa.rest.fifo_queue import FifoQueue
 
 
+class StressJob:
+    """Lightweight QueueableJob for high-volume queue tests (Mock is too slow at 100k)."""
+
+    push_counter          = 0
+    session_id            = "stress_session"
+    routing_command       = "stress"
+    user_email            = "stress@test.com"
+    run_date              = "2025-01-30"
+    created_date          = "2025-01-30"
+    started_at            = None
+    completed_at          = None
+    question              = "stress"
+    last_question_asked   = "stress"
+    answer                = ""
+    answer_conversational = ""
+    job_type              = "StressJob"
+    is_cache_hit          = False
+    status                = "pending"
+    error                 = None
+
+    def __init__( self, id_hash, user_id ):
+        self.id_hash = id_hash
+        self.user_id = user_id
+
+    def do_all( self ):
+        return "done"
+
+    def code_ran_to_completion( self ):
+        return True
+
+    def formatter_ran_to_completion( self ):
+        return True
+
+
 class TestFifoQueue( unittest.TestCase ):
     """
     Comprehensive unit tests for FifoQueue class.
@@ -459,6 +495,102 @@ class TestFifoQueue( unittest.TestCase ):
             queue_no_ws.push( self.test_job )
             mock_emit.assert_called_once()  # Method is called but won't emit due to missing websocket_mgr
 
+    def test_indexed_delete_position_and_user_listing( self ):
+        """
+        Test the ordered index and per-user index through deletes and inserts.
+
+        Ensures:
+            - Middle deletes keep the order of the remaining items
+            - get_position() is 1-based and skips deleted items
+            - get_jobs_for_user() returns only that user's jobs, in queue order
+            - Priority inserts ahead of the tail keep both indexes in order
+        """
+        queue, mocks = self._create_mocked_fifo_queue()
+        jobs = [ StressJob( f"job_{i}", f"user_{i % 2}" ) for i in range( 6 ) ]
+        for job in jobs:
+            queue.push( job )
+
+        self.assertTrue( queue.delete_by_id_hash( "job_2" ) )
+        self.assertFalse( queue.delete_by_id_hash( "job_2" ) )
+        self.assertEqual( [ job.id_hash for job in queue.queue_list ], [ "job_0", "job_1", "job_3", "job_4", "job_5" ] )
+        self.assertEqual( [ queue.get_position( f"job_{i}" ) for i in range( 6 ) ], [ 1, 2, None, 3, 4, 5 ] )
+        self.assertEqual( queue.get_jobs_for_user( "user_0" ), [ jobs[ 0 ], jobs[ 4 ] ] )
+        self.assertEqual( queue.get_jobs_for_user( "nobody" ), [ ] )
+
+        self.assertEqual( queue.pop(), jobs[ 0 ] )
+        self.assertEqual( queue.get_position( "job_1" ), 1 )
+        self.assertEqual( queue.get_position( "job_5" ), 4 )
+
+        urgent = StressJob( "urgent", "user_0" )
+        queue._add_item( urgent, index=1 )
+        self.assertEqual( [ job.id_hash for job in queue.get_all_jobs() ], [ "job_1", "urgent", "job_3", "job_4", "job_5" ] )
+        self.assertEqual( queue.get_position( "urgent" ), 2 )
+        self.assertEqual( queue.get_jobs_for_user( "user_0" ), [ urgent, jobs[ 4 ] ] )
+
+        queue.clear()
+        self.assertIsNone( queue.get_position( "job_1" ) )
+        self.assertEqual( queue.get_jobs_for_user( "user_1" ), [ ] )
+
+    def test_concurrent_stress_100k_jobs_1k_users( self ):
+        """
+        Test 100k jobs across 1k users with producers, a consumer and a reader running at once.
+
+        Ensures:
+            - Every job is popped exactly once
+            - Each producer's jobs are popped in the order they were pushed
+            - Per-user listings and positions stay consistent mid-run
+            - All indexes are empty once the queue drains
+        """
+        queue, mocks = self._create_mocked_fifo_queue()
+        producers    = 4
+        per_producer = 25000
+        total        = producers * per_producer
+        popped       = [ ]
+        errors       = [ ]
+        done         = threading.Event()
+
+        def produce( producer ):
+            for i in range( per_producer ):
+                queue.push( StressJob( f"p{producer}_{i}", f"user_{( producer * per_producer + i ) % 1000}" ) )
+
+        def consume():
+            while len( popped ) < total:
+                job = queue.pop()
+                if job is None:
+                    time.sleep( 0.0001 )
+                else:
+                    popped.append( job.id_hash )
+            done.set()
+
+        def read():
+            while not done.is_set():
+                user_jobs = queue.get_jobs_for_user( "user_7" )
+                positions = [ queue.get_position( job.id_hash ) for job in user_jobs ]
+                live      = [ position for position in positions if position is not None ]
+                if any( job.user_id != "user_7" for job in user_jobs ) or live != sorted( live ):
+                    errors.append( ( [ job.id_hash for job in user_jobs ], positions ) )
+                time.sleep( 0.001 )
+
+        threads = [ threading.Thread( target=produce, args=( p, ) ) for p in range( producers ) ]
+        threads += [ threading.Thread( target=consume ), threading.Thread( target=read ) ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join( timeout=120 )
+
+        self.assertTrue( done.is_set() )
+        self.assertEqual( errors, [ ] )
+        self.assertEqual( len( popped ), total )
+        self.assertEqual( len( set( popped ) ), total )
+        for producer in range( producers ):
+            order = [ int( id_hash.split( "_" )[ 1 ] ) for id_hash in popped if id_hash.startswith( f"p{producer}_" ) ]
+            self.assertEqual( order, list( range( per_producer ) ) )
+
+        self.assertTrue( queue.is_empty() )
+        self.assertEqual( queue.get_push_counter(), total )
+        self.assertEqual( queue._user_index, { } )
+        self.assertEqual( queue._seq, { } )
+
 
 def isolated_unit_test():
     """
@@ -498,7 +630,9 @@ def isolated_unit_test():
             'test_get_by_id_hash_nonexistent',
             'test_queue_state_management',
             'test_size_and_empty_status',
-            'test_websocket_emission'
+            'test_websocket_emission',
+            'test_indexed_delete_position_and_user_listing',
+            'test_concurrent_stress_100k_jobs_1k_users'
         ]
         
         for method in test_methods:
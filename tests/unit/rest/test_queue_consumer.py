@@ -0,0 +1,326 @@
+"""
+Unit tests for the lane-aware queue consumer (LaneExecutor).
+
+Tests the LaneExecutor including:
+- Lane routing (fast vs. agentic)
+- Fast-lane latency while agentic jobs are running
+- Per-user ordering within a lane
+- todo -> run WebSocket transitions for every started job
+- Clean shutdown of all lane workers
+
+Zero external dependencies - jobs are mocks that sleep, the running queue
+is a recording fake and WebSocket emission is patched out.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import threading
+import time
+from typing import List
+
+# Import test infrastructure
+import sys
+import os
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+from cosa.rest.fifo_queue import FifoQueue
+from cosa.rest.queue_consumer import LaneExecutor, FAST_LANE, AGENTIC_LANE
+from cosa.agents.agentic_job_base import AgenticJobBase
+
+
+class FakeRunningQueue:
+    """
+    Stand-in for RunningFifoQueue that sleeps for each job's duration and records timings.
+    """
+
+    def __init__( self ):
+        self.websocket_mgr    = Mock()
+        self.user_job_tracker = Mock()
+        self.user_job_tracker.get_user_for_job.return_value = None
+        self.lock             = threading.Lock()
+        self.started          = { }
+        self.finished         = { }
+
+    def push( self, job ):
+        with self.lock:
+            self.started[ job.id_hash ] = time.perf_counter()
+
+    def _process_job( self, job ):
+        time.sleep( job.duration )
+        with self.lock:
+            self.finished[ job.id_hash ] = time.perf_counter()
+
+
+class TestLaneExecutor( unittest.TestCase ):
+    """
+    Unit tests for LaneExecutor.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - Agentic jobs do not block the fast lane
+        - Per-user ordering preserved within a lane
+        - todo -> run transitions emitted
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Fresh todo queue with condition variable support
+            - Fake running queue and patched WebSocket emission
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+
+        self.todo_queue = FifoQueue()
+        self.todo_queue.condition        = threading.Condition()
+        self.todo_queue.consumer_running = False
+        self.todo_queue.debug            = False
+
+        self.running_queue = FakeRunningQueue()
+        self.executor      = None
+
+        self.emit_patcher = patch( "cosa.rest.queue_consumer.emit_job_state_transition" )
+        self.mock_emit    = self.emit_patcher.start()
+
+        self.print_patcher = patch( "builtins.print" )
+        self.print_patcher.start()
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Lane workers stopped and patches removed
+        """
+        if self.executor: self.executor.stop()
+        self.emit_patcher.stop()
+        self.print_patcher.stop()
+        self.mock_manager.reset_mocks()
+
+    def _make_job( self, id_hash: str, duration: float, user_id: str="user_1", agentic: bool=False ) -> Mock:
+        """Create a mock job that takes `duration` seconds to process."""
+        job = Mock( spec=AgenticJobBase ) if agentic else Mock()
+        job.id_hash             = id_hash
+        job.user_id             = user_id
+        job.duration            = duration
+        job.last_question_asked = f"question {id_hash}"
+        job.job_type            = "agentic" if agentic else "MathAgent"
+        job.created_date        = "2026-01-01T00:00:00"
+
+        # Remaining QueueableJob protocol attributes (spec'd mocks don't auto-create them)
+        for attr in ( "push_counter", "session_id", "routing_command", "user_email", "run_date", "started_at",
+                      "completed_at", "question", "answer", "answer_conversational", "is_cache_hit", "status", "error" ):
+            setattr( job, attr, None )
+        job.do_all = Mock( return_value="" )
+        return job
+
+    def _push( self, job: Mock ) -> None:
+        """Push a job the way TodoFifoQueue.push does."""
+        with self.todo_queue.condition:
+            self.todo_queue.push( job )
+            self.todo_queue.condition.notify_all()
+
+    def _wait_for( self, id_hashes: List[str], timeout: float=10.0 ) -> None:
+        """Wait until all given jobs have finished."""
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if all( id_hash in self.running_queue.finished for id_hash in id_hashes ): return
+            time.sleep( 0.01 )
+        self.fail( f"Jobs did not finish in {timeout}s: {[ h for h in id_hashes if h not in self.running_queue.finished ]}" )
+
+    def _p95( self, values: List[float] ) -> float:
+        """Nearest-rank 95th percentile."""
+        ordered = sorted( values )
+        return ordered[ max( 0, int( round( 0.95 * len( ordered ) ) ) - 1 ) ]
+
+    def _fast_lane_latencies( self, count: int, prefix: str ) -> List[float]:
+        """Submit `count` fast jobs one after another and return submit -> finish latencies."""
+        latencies = [ ]
+        for i in range( count ):
+            id_hash   = f"{prefix}_{i}"
+            submitted = time.perf_counter()
+            self._push( self._make_job( id_hash, 0.01, user_id=f"fast_user_{i}" ) )
+            self._wait_for( [ id_hash ] )
+            latencies.append( self.running_queue.finished[ id_hash ] - submitted )
+        return latencies
+
+    def test_get_lane( self ):
+        """
+        Test lane routing by job type.
+
+        Ensures:
+            - AgenticJobBase instances go to the agentic lane
+            - Everything else goes to the fast lane
+        """
+        self.assertEqual( LaneExecutor.get_lane( self._make_job( "a", 0, agentic=True ) ), AGENTIC_LANE )
+        self.assertEqual( LaneExecutor.get_lane( self._make_job( "f", 0 ) ), FAST_LANE )
+
+    def test_invalid_worker_count( self ):
+        """
+        Test that lanes require at least one worker.
+
+        Ensures:
+            - ValueError raised for a zero worker count
+        """
+        with self.assertRaises( ValueError ):
+            LaneExecutor( self.todo_queue, self.running_queue, fast_workers=0 )
+
+    def test_fast_lane_p95_flat_while_agentic_running( self ):
+        """
+        Test that fast-lane p95 latency stays flat while agentic jobs are running.
+
+        Ensures:
+            - Baseline fast-lane p95 measured with idle agentic lane
+            - Fast-lane p95 with two long agentic jobs in flight stays within a small bound of baseline
+            - Agentic jobs still complete
+        """
+        self.executor = LaneExecutor( self.todo_queue, self.running_queue, fast_workers=1, agentic_workers=2 ).start()
+
+        baseline_p95 = self._p95( self._fast_lane_latencies( 20, "baseline" ) )
+
+        self._push( self._make_job( "agentic_1", 1.0, user_id="agentic_user_1", agentic=True ) )
+        self._push( self._make_job( "agentic_2", 1.0, user_id="agentic_user_2", agentic=True ) )
+        time.sleep( 0.05 )
+
+        loaded_p95 = self._p95( self._fast_lane_latencies( 20, "loaded" ) )
+
+        # Every loaded fast job finished while the agentic jobs were still running
+        self.assertNotIn( "agentic_1", self.running_queue.finished )
+        self.assertNotIn( "agentic_2", self.running_queue.finished )
+        self.assertLess( loaded_p95, baseline_p95 + 0.05 )
+
+        self._wait_for( [ "agentic_1", "agentic_2" ] )
+
+    def test_per_user_ordering_within_lane( self ):
+        """
+        Test that one user's jobs in a lane run one at a time, in submission order.
+
+        Ensures:
+            - With several fast workers, a user's jobs never overlap
+            - Another user's job is not blocked behind them
+        """
+        self.executor = LaneExecutor( self.todo_queue, self.running_queue, fast_workers=3, agentic_workers=1 ).start()
+
+        for i in range( 3 ):
+            self._push( self._make_job( f"user_1_{i}", 0.1, user_id="user_1" ) )
+        self._push( self._make_job( "user_2_0", 0.1, user_id="user_2" ) )
+
+        self._wait_for( [ "user_1_0", "user_1_1", "user_1_2", "user_2_0" ] )
+
+        started  = self.running_queue.started
+        finished = self.running_queue.finished
+        self.assertLessEqual( finished[ "user_1_0" ], started[ "user_1_1" ] )
+        self.assertLessEqual( finished[ "user_1_1" ], started[ "user_1_2" ] )
+        self.assertLess( started[ "user_2_0" ], finished[ "user_1_0" ] )
+
+    def test_emits_todo_to_run_transition( self ):
+        """
+        Test that every started job emits a todo -> run transition.
+
+        Ensures:
+            - emit_job_state_transition called with 'todo', 'run' for each job
+            - Todo queue drained
+        """
+        self.executor = LaneExecutor( self.todo_queue, self.running_queue ).start()
+
+        self._push( self._make_job( "fast_job", 0.0 ) )
+        self._push( self._make_job( "agentic_job", 0.0, agentic=True ) )
+        self._wait_for( [ "fast_job", "agentic_job" ] )
+
+        transitions = { c.args[ 1 ]: c.args[ 2:4 ] for c in self.mock_emit.call_args_list }
+        self.assertEqual( transitions, { "fast_job": ( "todo", "run" ), "agentic_job": ( "todo", "run" ) } )
+        self.assertTrue( self.todo_queue.is_empty() )
+
+    def test_claim_scan_tolerates_concurrent_clear_and_delete( self ):
+        """
+        Test that the claim scan can't see the todo index change under it.
+
+        Ensures:
+            - clear() and delete_by_id_hash() from another thread (as the queues router
+              does, without the condition) wait for the scan instead of breaking it
+            - Their effects apply once the scan finishes
+        """
+        executor = LaneExecutor( self.todo_queue, self.running_queue )
+        executor._active_users[ FAST_LANE ].add( "busy_user" )
+        for i in range( 20 ):
+            self.todo_queue.push( self._make_job( f"busy_{i}", 0.0, user_id="busy_user" ) )
+
+        for mutate in ( lambda: self.todo_queue.delete_by_id_hash( "busy_19" ), self.todo_queue.clear ):
+            mutator    = threading.Thread( target=mutate )
+            real_user  = executor._get_user
+
+            def get_user_while_mutating( job ):
+                # Start the other thread mid-scan and give it every chance to run
+                if not mutator.is_alive() and mutator.ident is None:
+                    mutator.start()
+                    time.sleep( 0.05 )
+                return real_user( job )
+
+            with patch.object( executor, "_get_user", side_effect=get_user_while_mutating ):
+                with self.todo_queue.condition:
+                    self.assertIsNone( executor._claim_next_job( FAST_LANE ) )
+            mutator.join( 5 )
+
+        self.assertTrue( self.todo_queue.is_empty() )
+
+    def test_stop_shuts_down_workers( self ):
+        """
+        Test that stop() wakes and exits all idle lane workers.
+
+        Ensures:
+            - Workers alive after start()
+            - No workers alive after stop()
+        """
+        self.executor = LaneExecutor( self.todo_queue, self.running_queue, fast_workers=2, agentic_workers=2 ).start()
+        self.assertTrue( self.executor.is_alive() )
+
+        self.executor.stop()
+        self.assertFalse( self.executor.is_alive() )
+        self.assertFalse( self.todo_queue.consumer_running )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for LaneExecutor in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "LaneExecutor Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestLaneExecutor )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} LaneExecutor unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
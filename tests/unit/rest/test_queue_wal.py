@@ -0,0 +1,334 @@
+"""
+Unit tests for the queue write-ahead log (queue_wal).
+
+Tests QueueWriteAheadLog together with FifoQueue.attach_wal() including:
+- Replay of surviving jobs after an unclean stop, in push order
+- Checkpoints that compact the log down to live records
+- Jobs that can't be pickled being reported instead of replayed
+- Real AgentBase jobs replaying with their config manager rebuilt
+- Pushes never waiting on the writer thread's disk I/O
+
+Uses a real SQLite file in a temporary directory.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+# Import test infrastructure
+import sys
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+from cosa.agents.agent_base import AgentBase
+from cosa.agents.math_agent import MathAgent
+from cosa.rest.fifo_queue import FifoQueue
+from cosa.rest.queue_wal import QueueWriteAheadLog
+
+
+class WalJob:
+    """Picklable QueueableJob for WAL tests."""
+
+    push_counter          = 0
+    session_id            = "wal_session"
+    routing_command       = "wal"
+    user_email            = "wal@test.com"
+    run_date              = "2025-01-30"
+    created_date          = "2025-01-30"
+    started_at            = None
+    completed_at          = None
+    last_question_asked   = "what's 2 + 2"
+    question              = "what's 2 + 2"
+    answer                = ""
+    answer_conversational = ""
+    job_type              = "WalJob"
+    is_cache_hit          = False
+    status                = "pending"
+    error                 = None
+
+    def __init__( self, id_hash, user_id="wal_user" ):
+        self.id_hash = id_hash
+        self.user_id = user_id
+
+    def do_all( self ):
+        return "done"
+
+    def code_ran_to_completion( self ):
+        return True
+
+    def formatter_ran_to_completion( self ):
+        return True
+
+
+class TestQueueWal( unittest.TestCase ):
+    """
+    Unit tests for QueueWriteAheadLog and FifoQueue.attach_wal().
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - A queue rebuilt from the log holds what the original held
+        - The log stays bounded by the live items after checkpoints
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - Fresh WAL file per test
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+        self.temp_dir       = tempfile.TemporaryDirectory()
+        self.db_path        = os.path.join( self.temp_dir.name, "queue-wal.db" )
+        self.wals           = [ ]
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - Writer threads stopped, temporary files removed and mocks reset
+        """
+        for wal in self.wals:
+            wal.close()
+        self.temp_dir.cleanup()
+        self.mock_manager.reset_mocks()
+
+    def _open_wal( self, **kwargs ):
+        wal = QueueWriteAheadLog( self.db_path, **kwargs )
+        self.wals.append( wal )
+        return wal
+
+    def _row_count( self ):
+        with sqlite3.connect( self.db_path ) as conn:
+            return conn.execute( f"SELECT COUNT( * ) FROM {QueueWriteAheadLog.TABLE_NAME}" ).fetchone()[ 0 ]
+
+    def test_replay_after_unclean_stop( self ):
+        """
+        Test replay into fresh queues from a log that was never closed.
+
+        Ensures:
+            - Popped and deleted jobs stay gone, the rest come back in push order
+            - A todo -> done transition lands the job in the done queue only
+            - clear() empties a queue for replay too
+            - Replayed jobs are not logged a second time
+        """
+        wal   = self._open_wal()
+        todo  = FifoQueue( queue_name="todo" )
+        done  = FifoQueue( queue_name="done" )
+        dead  = FifoQueue( queue_name="dead" )
+        for queue in ( todo, done, dead ):
+            queue.attach_wal( wal )
+
+        for i in range( 5 ):
+            todo.push( WalJob( f"job_{i}", user_id=f"user_{i % 2}" ) )
+        done.push( todo.pop() )
+        todo.delete_by_id_hash( "job_3" )
+        dead.push( WalJob( "dead_0" ) )
+        dead.clear()
+        self.assertTrue( wal.flush( timeout=10 ) )
+
+        replay_wal = self._open_wal()
+        new_todo   = FifoQueue( queue_name="todo" )
+        new_done   = FifoQueue( queue_name="done" )
+        new_dead   = FifoQueue( queue_name="dead" )
+        for queue in ( new_todo, new_done, new_dead ):
+            self.assertEqual( queue.attach_wal( replay_wal ), [ ] )
+
+        self.assertEqual( [ job.id_hash for job in new_todo.get_all_jobs() ], [ "job_1", "job_2", "job_4" ] )
+        self.assertEqual( [ job.id_hash for job in new_done.get_all_jobs() ], [ "job_0" ] )
+        self.assertTrue( new_dead.is_empty() )
+        self.assertEqual( [ job.id_hash for job in new_todo.get_jobs_for_user( "user_0" ) ], [ "job_2", "job_4" ] )
+        self.assertEqual( replay_wal.get_stats()[ "appended" ], 0 )
+
+        new_todo.pop()
+        self.assertTrue( replay_wal.flush( timeout=10 ) )
+        items, lost = self._open_wal().load_queue( "todo" )
+        self.assertEqual( [ job.id_hash for job in items ], [ "job_2", "job_4" ] )
+
+    def test_checkpoint_compacts_to_live_records( self ):
+        """
+        Test checkpoint() and the automatic checkpoint interval.
+
+        Ensures:
+            - Only pushes of live jobs survive a checkpoint
+            - Replay after a checkpoint is unchanged
+            - checkpoint_every triggers checkpoints from the writer thread
+        """
+        wal   = self._open_wal( checkpoint_every=1000000 )
+        queue = FifoQueue( queue_name="todo" )
+        queue.attach_wal( wal )
+
+        for i in range( 100 ):
+            queue.push( WalJob( f"job_{i}" ) )
+        for _ in range( 90 ):
+            queue.pop()
+
+        self.assertEqual( wal.checkpoint(), 180 )
+        self.assertEqual( self._row_count(), 10 )
+        items, lost = wal.load_queue( "todo" )
+        self.assertEqual( [ job.id_hash for job in items ], [ f"job_{i}" for i in range( 90, 100 ) ] )
+
+        auto_wal = self._open_wal( checkpoint_every=50, flush_interval=0.01 )
+        other    = FifoQueue( queue_name="other" )
+        other.attach_wal( auto_wal )
+        for i in range( 60 ):
+            other.push( WalJob( f"other_{i}" ) )
+            other.pop()
+        self.assertTrue( auto_wal.flush( timeout=10 ) )
+
+        # The writer checkpoints right after making the batch durable
+        deadline = time.time() + 10
+        while auto_wal.get_stats()[ "checkpoints" ] == 0 and time.time() < deadline:
+            time.sleep( 0.01 )
+        self.assertGreaterEqual( auto_wal.get_stats()[ "checkpoints" ], 1 )
+
+    def test_unserializable_jobs_reported_as_lost( self ):
+        """
+        Test jobs that can't be pickled.
+
+        Ensures:
+            - The push still succeeds and is counted as unserializable
+            - Replay returns the job's id_hash, user and question as lost
+        """
+        wal   = self._open_wal()
+        queue = FifoQueue( queue_name="todo" )
+        queue.attach_wal( wal )
+
+        job          = WalJob( "unpicklable", user_id="user_9" )
+        job.callback = lambda: None
+        queue.push( job )
+        queue.push( WalJob( "fine" ) )
+        self.assertTrue( wal.flush( timeout=10 ) )
+        self.assertEqual( wal.get_stats()[ "unserializable" ], 1 )
+
+        replayed = FifoQueue( queue_name="todo" )
+        lost     = replayed.attach_wal( self._open_wal() )
+        self.assertEqual( [ job.id_hash for job in replayed.get_all_jobs() ], [ "fine" ] )
+        self.assertEqual( lost, [ { "id_hash": "unpicklable", "user_id": "user_9", "question": "what's 2 + 2" } ] )
+
+    def test_agent_job_replays_with_rebuilt_config( self ):
+        """
+        Test replay of a real AgentBase job, whose config_mgr can't be pickled.
+
+        Ensures:
+            - The job is persisted and restored instead of reported as lost
+            - Question, prompt and identity fields survive the round trip
+            - config_mgr and the XML parser factory are rebuilt for this process
+        """
+        with open( os.path.join( self.temp_dir.name, "math.txt" ), "w" ) as template:
+            template.write( "Math problem: {question}" )
+        config_values = {
+            "prompt template for agent router go to math": "/math.txt",
+            "llm spec key for agent router go to math"   : "math_llm_spec"
+        }
+        # Like the @singleton ConfigurationManager, a mock can't be pickled
+        config_mgr = MagicMock()
+        config_mgr.get.side_effect = lambda key, default=None, **kwargs: config_values.get( key, default )
+
+        with patch( "cosa.agents.agent_base.ConfigurationManager", return_value=config_mgr ), \
+             patch( "cosa.agents.agent_base.du.get_project_root", return_value=self.temp_dir.name ):
+            job   = MathAgent( question="What is 2 + 2?", push_counter=1, user_id="user_7", user_email="user7@test.com", session_id="session_7" )
+            wal   = self._open_wal()
+            queue = FifoQueue( queue_name="todo" )
+            queue.attach_wal( wal )
+            queue.push( job )
+            self.assertTrue( wal.flush( timeout=10 ) )
+            self.assertEqual( wal.get_stats()[ "unserializable" ], 0 )
+
+            replayed = FifoQueue( queue_name="todo" )
+            self.assertEqual( replayed.attach_wal( self._open_wal() ), [ ] )
+
+        restored = replayed.get_all_jobs()[ 0 ]
+        self.assertIsInstance( restored, MathAgent )
+        for field in ( "id_hash", "question", "prompt", "model_name", "user_id", "user_email", "session_id", "two_word_id" ):
+            self.assertEqual( getattr( restored, field ), getattr( job, field ) )
+        self.assertIs( restored.config_mgr, config_mgr )
+        self.assertIs( restored.xml_parser_factory.config_mgr, config_mgr )
+        self.assertEqual( restored.execution_state, AgentBase.STATE_WAITING_TO_RUN )
+
+    def test_push_does_not_wait_on_disk( self ):
+        """
+        Test that a stalled writer never blocks the queue.
+
+        Ensures:
+            - Pushes and pops complete while the writer is stuck in a batch write
+            - Everything becomes durable once the writer resumes
+        """
+        wal      = self._open_wal( flush_interval=0.01 )
+        queue    = FifoQueue( queue_name="todo" )
+        queue.attach_wal( wal )
+        release  = threading.Event()
+        entered  = threading.Event()
+        original = wal._write_batch
+
+        def stalled_write( batch ):
+            entered.set()
+            release.wait( 10 )
+            original( batch )
+
+        with patch.object( wal, "_write_batch", side_effect=stalled_write ):
+            queue.push( WalJob( "first" ) )
+            self.assertTrue( entered.wait( 5 ) )
+
+            start = time.perf_counter()
+            for i in range( 1000 ):
+                queue.push( WalJob( f"job_{i}" ) )
+            queue.pop()
+            self.assertLess( time.perf_counter() - start, 5 )
+            self.assertFalse( wal.flush( timeout=0.05 ) )
+
+            release.set()
+            self.assertTrue( wal.flush( timeout=10 ) )
+
+        self.assertEqual( wal.get_stats()[ "written" ], 1002 )
+        self.assertEqual( len( wal.load_queue( "todo" )[ 0 ] ), 1000 )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for queue_wal in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "Queue WAL Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestQueueWal )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} Queue WAL unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
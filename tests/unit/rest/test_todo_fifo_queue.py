@@ -419,6 +419,109 @@ class TestTodoFifoQueue( unittest.TestCase ):
         self.assertTrue( hasattr( queue, 'size' ) )
         self.assertTrue( hasattr( queue, 'is_empty' ) )
 
+    def _create_preprocessing_queue( self, latencies: Dict[str, float], enable_gisting: bool=True ) -> TodoFifoQueue:
+        """
+        Create a bare TodoFifoQueue whose preprocessing stages sleep for the given latencies.
+
+        Requires:
+            - latencies has 'gist', 'normalize', 'embed' keys (seconds per call)
+        """
+        import concurrent.futures
+
+        def fake_gist( text ):
+            time.sleep( latencies[ "gist" ] )
+            return "current time"
+
+        def fake_normalize( text ):
+            time.sleep( latencies[ "normalize" ] )
+            return "what time be it"
+
+        def fake_embedding( text, content_type="prose" ):
+            time.sleep( latencies[ "embed" ] )
+            return [ float( len( text ) ) ]
+
+        def fake_embeddings_batch( texts, content_type="prose" ):
+            time.sleep( latencies[ "embed" ] )
+            return [ [ float( len( text ) ) ] for text in texts ]
+
+        queue = TodoFifoQueue.__new__( TodoFifoQueue )
+        queue.config_mgr           = Mock()
+        queue.config_mgr.get.side_effect = lambda key, default=None, return_type="string": enable_gisting
+        queue.gist_normalizer      = Mock()
+        queue.gist_normalizer.get_normalized_gist.side_effect = fake_gist
+        queue.normalizer           = Mock()
+        queue.normalizer.normalize.side_effect = fake_normalize
+        queue._embedding_provider  = Mock()
+        queue._embedding_provider.generate_embedding.side_effect        = fake_embedding
+        queue._embedding_provider.generate_embeddings_batch.side_effect = fake_embeddings_batch
+        queue._preprocess_executor = concurrent.futures.ThreadPoolExecutor( max_workers=4 )
+        self.addCleanup( queue.close )
+        return queue
+
+    def test_preprocessing_critical_path_is_max_not_sum( self ):
+        """
+        Test the gist / normalization / embedding fan-out with injected latencies.
+
+        Ensures:
+            - Wall time ~ max( gist + embed gist, normalize + embed V+N ), well under the sum of stages
+            - Verbatim and normalized embeddings sent as one batch
+            - Each representation mapped to its own embedding
+        """
+        latencies = { "gist": 0.3, "normalize": 0.05, "embed": 0.1 }
+        queue     = self._create_preprocessing_queue( latencies )
+
+        start   = time.perf_counter()
+        results = queue._generate_representations( self.test_query_verbatim, self.test_query_verbatim )
+        elapsed = time.perf_counter() - start
+
+        sequential_sum = latencies[ "gist" ] + latencies[ "normalize" ] + 2 * latencies[ "embed" ]
+        critical_path  = max( latencies[ "gist" ] + latencies[ "embed" ], latencies[ "normalize" ] + latencies[ "embed" ] )
+        self.assertGreaterEqual( elapsed, critical_path )
+        self.assertLess( elapsed, sequential_sum - 0.1 )
+
+        self.assertEqual( results[ "normalized" ], self.test_query_normalized )
+        self.assertEqual( results[ "gist" ], self.test_query_gist )
+        self.assertEqual( results[ "embeddings" ][ "verbatim" ], [ float( len( self.test_query_verbatim ) ) ] )
+        self.assertEqual( results[ "embeddings" ][ "normalized" ], [ float( len( self.test_query_normalized ) ) ] )
+        self.assertEqual( results[ "embeddings" ][ "gist" ], [ float( len( self.test_query_gist ) ) ] )
+
+        queue._embedding_provider.generate_embeddings_batch.assert_called_once_with( [ self.test_query_verbatim, self.test_query_normalized ], content_type="prose" )
+        queue._embedding_provider.generate_embedding.assert_called_once_with( self.test_query_gist, content_type="prose" )
+        self.assertEqual( set( results[ "timings_ms" ].keys() ), { "gist", "normalize", "embed_verbatim_normalized", "embed_gist", "total" } )
+
+    def test_preprocessing_without_gisting_reuses_normalized_embedding( self ):
+        """
+        Test the preprocessing graph when input gisting is disabled.
+
+        Ensures:
+            - No gist LLM call; gist equals the normalized question
+            - Gist embedding reuses the normalized embedding (no extra embedding call)
+        """
+        queue   = self._create_preprocessing_queue( { "gist": 0.0, "normalize": 0.0, "embed": 0.0 }, enable_gisting=False )
+        results = queue._generate_representations( self.test_query_verbatim, self.test_query_verbatim )
+
+        queue.gist_normalizer.get_normalized_gist.assert_not_called()
+        queue._embedding_provider.generate_embedding.assert_not_called()
+        self.assertEqual( results[ "gist" ], results[ "normalized" ] )
+        self.assertEqual( results[ "embeddings" ][ "gist" ], results[ "embeddings" ][ "normalized" ] )
+
+    def test_close_shuts_down_preprocessing_pool( self ):
+        """
+        Test the preprocessing pool's shutdown hook.
+
+        Ensures:
+            - close() stops the pool's threads from accepting work
+            - close() is safe to call more than once
+        """
+        queue = self._create_preprocessing_queue( { "gist": 0.0, "normalize": 0.0, "embed": 0.0 } )
+        queue._generate_representations( self.test_query_verbatim, self.test_query_verbatim )
+
+        queue.close()
+        queue.close()
+
+        with self.assertRaises( RuntimeError ):
+            queue._preprocess_executor.submit( time.sleep, 0 )
+
 
 def isolated_unit_test():
     """
@@ -452,7 +555,9 @@ def isolated_unit_test():
             'test_three_level_text_processing',
             'test_embedding_manager_integration',
             'test_configuration_management',
-            'test_inheritance_from_fifo_queue'
+            'test_inheritance_from_fifo_queue',
+            'test_preprocessing_critical_path_is_max_not_sum',
+            'test_preprocessing_without_gisting_reuses_normalized_embedding'
         ]
 
         for method in test_methods:
@@ -0,0 +1,599 @@
+"""
+Unit tests for WebSocketManager outbound fan-out.
+
+Tests the WebSocketManager emit paths including:
+- One serialization per event, shared by every recipient
+- Subscription filtering and per-user routing
+- Per-session bounded outbound queues drained by writer tasks
+- Stalled clients being dropped on send timeout or a full queue
+- A 500-socket broadcast with one deliberately slow client
+- The event -> sessions subscription index staying in step with sessions
+- Coalescing of bursty job transitions and progress notifications per ( user, job )
+
+ConfigurationManager is mocked; sockets are in-memory fakes.
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Import test infrastructure
+import sys
+import os
+sys.path.append( os.path.join( os.path.dirname( __file__ ), "..", "infrastructure" ) )
+from mock_manager import MockManager
+from unit_test_utilities import UnitTestUtilities
+
+# Import the module under test
+import cosa.rest.websocket_manager as wsm
+from cosa.rest.websocket_manager import WebSocketManager
+
+
+class FakeWebSocket:
+    """In-memory WebSocket that records sent text and can be made slow, stuck or broken."""
+
+    def __init__( self, delay: float = 0.0, stuck: bool = False, broken: bool = False ):
+        self.delay  = delay
+        self.stuck  = stuck
+        self.broken = broken
+        self.sent   = [ ]
+        self.closed = None
+
+    async def send_text( self, text ):
+        if self.broken:
+            raise ConnectionResetError( "peer went away" )
+        if self.stuck:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep( self.delay )
+        else:
+            await asyncio.sleep( 0 )
+        self.sent.append( text )
+
+    async def close( self, code=1000, reason=None ):
+        self.closed = code
+
+
+class TestWebSocketManager( unittest.TestCase ):
+    """
+    Unit tests for WebSocketManager emission.
+
+    Requires:
+        - MockManager for external dependency mocking
+        - UnitTestUtilities for common test patterns
+
+    Ensures:
+        - No client can delay delivery to any other client
+    """
+
+    def setUp( self ):
+        """
+        Setup for each test method.
+
+        Ensures:
+            - ConfigurationManager returns defaults plus a small event list
+        """
+        self.mock_manager   = MockManager()
+        self.test_utilities = UnitTestUtilities()
+
+        def config_get( key, default=None, return_type=None ):
+            if key == "websocket available events":
+                return [ "queue_todo_update", "notification_queue_update", "sys_ping" ]
+            return default
+
+        config_mgr     = Mock()
+        config_mgr.get = Mock( side_effect=config_get )
+        with patch( "cosa.rest.websocket_manager.ConfigurationManager", return_value=config_mgr ), patch( "builtins.print" ):
+            self.manager = WebSocketManager()
+
+    def tearDown( self ):
+        """
+        Cleanup after each test method.
+
+        Ensures:
+            - All mocks are reset
+        """
+        self.mock_manager.reset_mocks()
+
+    def _connect( self, session_id, websocket, user_id=None, events=None ):
+        with patch( "builtins.print" ):
+            self.manager.connect( websocket, session_id, user_id=user_id, subscribed_events=events )
+        return websocket
+
+    async def _settle( self, seconds=0.05 ):
+        await asyncio.sleep( seconds )
+
+    def _start_loop( self ):
+        """Run an event loop in a background thread, the way the app's COSA threads see it."""
+        loop   = asyncio.new_event_loop()
+        thread = threading.Thread( target=loop.run_forever, daemon=True )
+        thread.start()
+        with patch( "builtins.print" ):
+            self.manager.set_event_loop( loop )
+
+        def stop():
+            # Let the writer tasks finish cancelling before the loop goes away
+            with patch( "builtins.print" ):
+                for session_id in list( self.manager.active_connections ):
+                    self.manager.disconnect( session_id )
+            asyncio.run_coroutine_threadsafe( asyncio.sleep( 0.05 ), loop ).result( 5 )
+            loop.call_soon_threadsafe( loop.stop )
+            thread.join( 5 )
+            loop.close()
+
+        self.addCleanup( stop )
+        return loop
+
+    def _wait_for_quiet( self, sockets, quiet=0.1, timeout=10 ):
+        """Wait until nothing is held for coalescing and no socket has received anything for `quiet` seconds."""
+        deadline = time.time() + timeout
+        last     = -1
+        while time.time() < deadline:
+            total = sum( len( websocket.sent ) for websocket in sockets )
+            if total == last and self.manager.get_coalescing_stats()[ "pending" ] == 0:
+                return total
+            last = total
+            time.sleep( quiet )
+        self.fail( "sockets never went quiet" )
+
+    @staticmethod
+    def _notification( n, job_id, type="progress", priority="low", response_requested=False ):
+        return {
+            "queue_name"   : "notification",
+            "value"        : n,
+            "notification" : {
+                "id_hash"            : f"{job_id}_n{n}",
+                "message"            : f"step {n}",
+                "type"               : type,
+                "priority"           : priority,
+                "job_id"             : job_id,
+                "response_requested" : response_requested
+            }
+        }
+
+    def test_serializes_once_and_filters_subscriptions( self ):
+        """
+        Test a broadcast to subscribed and unsubscribed sessions.
+
+        Ensures:
+            - json.dumps runs once per event, whatever the number of recipients
+            - Every subscriber receives the same queue.js-shaped message
+            - Sessions subscribed to other events receive nothing
+        """
+        everyone = [ self._connect( f"s{i}", FakeWebSocket() ) for i in range( 3 ) ]
+        filtered = self._connect( "filtered", FakeWebSocket(), events=[ "notification_queue_update" ] )
+
+        async def run():
+            with patch.object( wsm.json, "dumps", wraps=json.dumps ) as dumps:
+                await self.manager.async_emit( "queue_todo_update", { "value": 3 } )
+                self.assertEqual( dumps.call_count, 1 )
+            await self._settle()
+
+        asyncio.run( run() )
+
+        self.assertEqual( filtered.sent, [ ] )
+        self.assertEqual( len( { websocket.sent[ 0 ] for websocket in everyone } ), 1 )
+        message = json.loads( everyone[ 0 ].sent[ 0 ] )
+        self.assertEqual( message[ "type" ], "queue_todo_update" )
+        self.assertEqual( message[ "value" ], 3 )
+        self.assertIn( "timestamp", message )
+
+    def test_emit_to_user_and_session( self ):
+        """
+        Test targeted emission.
+
+        Ensures:
+            - emit_to_user() reaches only that user's sessions and reports whether any were queued
+            - emit_to_session() reaches only that session
+            - Messages keep their order per session
+        """
+        alice_1 = self._connect( "a1", FakeWebSocket(), user_id="alice" )
+        alice_2 = self._connect( "a2", FakeWebSocket(), user_id="alice" )
+        bob     = self._connect( "b1", FakeWebSocket(), user_id="bob" )
+
+        async def run():
+            self.assertTrue( await self.manager.emit_to_user( "alice", "notification_queue_update", { "n": 1 } ) )
+            self.assertFalse( await self.manager.emit_to_user( "nobody", "notification_queue_update", { "n": 1 } ) )
+            await self.manager.emit_to_session( "a1", "notification_queue_update", { "n": 2 } )
+            await self._settle()
+
+        asyncio.run( run() )
+
+        self.assertEqual( [ json.loads( text )[ "n" ] for text in alice_1.sent ], [ 1, 2 ] )
+        self.assertEqual( [ json.loads( text )[ "n" ] for text in alice_2.sent ], [ 1 ] )
+        self.assertEqual( bob.sent, [ ] )
+
+    def test_stalled_client_dropped_on_timeout_or_full_queue( self ):
+        """
+        Test the two ways a stalled client is disconnected.
+
+        Ensures:
+            - A send exceeding send_timeout drops and closes the session
+            - A full outbound queue drops the session without waiting
+            - Healthy sessions keep receiving everything
+        """
+        self.manager.send_timeout        = 0.05
+        self.manager.outbound_queue_size = 2
+        healthy  = self._connect( "healthy", FakeWebSocket() )
+        timed    = self._connect( "timed", FakeWebSocket( stuck=True ) )
+
+        async def run():
+            with patch( "builtins.print" ):
+                await self.manager.async_emit( "queue_todo_update", { "value": 1 } )
+                await self._settle( 0.2 )
+                self.assertFalse( self.manager.is_connected( "timed" ) )
+
+                self.manager.send_timeout = 60
+                full = self._connect( "full", FakeWebSocket( stuck=True ) )
+                # Emits are separate tasks in the app, so writers get a turn between them
+                for i in range( 4 ):
+                    await self.manager.async_emit( "queue_todo_update", { "value": i } )
+                    await self._settle( 0.01 )
+                self.assertFalse( self.manager.is_connected( "full" ) )
+                await self._settle()
+                return full
+
+        full = asyncio.run( run() )
+
+        self.assertEqual( timed.closed, 1013 )
+        self.assertEqual( full.closed, 1013 )
+        self.assertEqual( len( healthy.sent ), 5 )
+        self.assertTrue( self.manager.is_connected( "healthy" ) )
+
+    def test_heartbeat_counts_sessions_whose_ping_failed( self ):
+        """
+        Test heartbeat_check() with a client whose sends fail.
+
+        Ensures:
+            - A ping that fails in the writer task is counted by the next check
+            - That check logs the removal; the count resets afterwards
+            - Healthy sessions keep receiving pings
+        """
+        healthy = self._connect( "healthy", FakeWebSocket() )
+        broken  = self._connect( "broken", FakeWebSocket( broken=True ) )
+
+        async def run():
+            counts = [ ]
+            with patch( "builtins.print" ) as mock_print:
+                for _ in range( 3 ):
+                    counts.append( await self.manager.heartbeat_check() )
+                    await self._settle()
+            return counts, [ call.args[ 0 ] for call in mock_print.call_args_list if call.args ]
+
+        counts, printed = asyncio.run( run() )
+
+        self.assertEqual( counts, [ 0, 1, 0 ] )
+        self.assertIn( "[WS-HEARTBEAT] Removed 1 dead connection(s)", printed )
+        self.assertFalse( self.manager.is_connected( "broken" ) )
+        self.assertEqual( broken.closed, 1013 )
+        self.assertEqual( [ json.loads( text )[ "type" ] for text in healthy.sent ], [ "sys_ping" ] * 3 )
+
+    def test_fan_out_500_sockets_with_one_slow( self ):
+        """
+        Benchmark a broadcast to 500 fake sockets, one of which is slow.
+
+        Ensures:
+            - Fast clients receive every event, in order, while the slow one lags
+            - The slow client is dropped once a send exceeds send_timeout
+            - Timings against a sequential send loop (the previous implementation) are printed, not asserted
+        """
+        events     = 5
+        slow_delay = 0.2
+        self.manager.send_timeout = 0.1
+
+        async def sequential_baseline():
+            sockets = [ FakeWebSocket() for _ in range( 499 ) ] + [ FakeWebSocket( delay=slow_delay ) ]
+            start   = time.perf_counter()
+            for i in range( events ):
+                message = { "type": "queue_todo_update", "value": i }
+                for websocket in sockets:
+                    await websocket.send_text( json.dumps( message ) )
+            return time.perf_counter() - start
+
+        async def fan_out():
+            fast = [ self._connect( f"fast_{i}", FakeWebSocket() ) for i in range( 499 ) ]
+            slow = self._connect( "slow", FakeWebSocket( delay=slow_delay ) )
+            start = time.perf_counter()
+            with patch( "builtins.print" ):
+                for i in range( events ):
+                    await self.manager.async_emit( "queue_todo_update", { "value": i } )
+                while any( len( websocket.sent ) < events for websocket in fast ):
+                    await asyncio.sleep( 0.001 )
+            elapsed = time.perf_counter() - start
+            await self._settle( 0.2 )
+            return elapsed, fast, slow
+
+        baseline_s            = asyncio.run( sequential_baseline() )
+        fan_out_s, fast, slow = asyncio.run( fan_out() )
+        print( f"\n  500 sockets x {events} events, 1 slow ({slow_delay}s/send): sequential {baseline_s * 1000:.0f}ms, queued fan-out {fan_out_s * 1000:.0f}ms" )
+
+        # Wall-clock numbers are reported above only; asserting on them flakes on loaded machines
+        for websocket in fast:
+            self.assertEqual( [ json.loads( text )[ "value" ] for text in websocket.sent ], list( range( events ) ) )
+        self.assertFalse( self.manager.is_connected( "slow" ) )
+        self.assertEqual( slow.sent, [ ] )
+        self.assertEqual( self.manager.get_connection_count(), 499 )
+
+    def _assert_index_consistent( self ):
+        """Rebuild the inverted index from session_subscriptions and compare."""
+        expected_events   = { }
+        expected_wildcard = set()
+        for session_id, events in self.manager.session_subscriptions.items():
+            for event in events:
+                if event == "*":
+                    expected_wildcard.add( session_id )
+                else:
+                    expected_events.setdefault( event, set() ).add( session_id )
+        self.assertEqual( self.manager.event_subscribers, expected_events )
+        self.assertEqual( self.manager.wildcard_sessions, expected_wildcard )
+        self.assertLessEqual( set( self.manager.session_subscriptions ), set( self.manager.active_connections ) )
+
+    def test_subscription_index_tracks_updates_and_disconnects( self ):
+        """
+        Test the inverted index through subscribe, update and disconnect.
+
+        Ensures:
+            - replace, add and remove keep the index equal to session_subscriptions
+            - async_emit reaches only sessions indexed under the event or "*"
+            - Disconnected sessions leave no index entries, and empty event sets are dropped
+        """
+        everyone = self._connect( "everyone", FakeWebSocket() )
+        pings    = self._connect( "pings", FakeWebSocket(), events=[ "sys_ping" ] )
+        self._assert_index_consistent()
+        self.assertEqual( self.manager.event_subscribers, { "sys_ping": { "pings" } } )
+
+        with patch( "builtins.print" ):
+            self.manager.update_subscriptions( "pings", [ "queue_todo_update" ], action="add" )
+            self._assert_index_consistent()
+            self.manager.update_subscriptions( "pings", [ "sys_ping" ], action="remove" )
+            self._assert_index_consistent()
+            self.manager.update_subscriptions( "everyone", [ "notification_queue_update" ], action="replace" )
+            self._assert_index_consistent()
+        self.assertEqual( self.manager.wildcard_sessions, set() )
+        self.assertNotIn( "sys_ping", self.manager.event_subscribers )
+
+        async def run():
+            await self.manager.async_emit( "queue_todo_update", { "value": 1 } )
+            await self._settle()
+
+        asyncio.run( run() )
+        self.assertEqual( len( pings.sent ), 1 )
+        self.assertEqual( everyone.sent, [ ] )
+
+        with patch( "builtins.print" ):
+            self.manager.disconnect( "pings" )
+            self.manager.disconnect( "everyone" )
+        self._assert_index_consistent()
+        self.assertEqual( self.manager.event_subscribers, { } )
+
+    def test_subscription_index_through_stale_cleanup_and_single_session( self ):
+        """
+        Test the index on the two paths that disconnect sessions on the caller's behalf.
+
+        Ensures:
+            - cleanup_stale_sessions() removes stale sessions from the index and keeps fresh ones
+            - The single-session policy removes the user's old session from the index
+            - A new session then receives events the old one was subscribed to
+        """
+        for i in range( 4 ):
+            self._connect( f"stale_{i}", FakeWebSocket(), events=[ "queue_todo_update" ] if i % 2 else None )
+        fresh = self._connect( "fresh", FakeWebSocket(), events=[ "queue_todo_update" ] )
+        for i in range( 4 ):
+            self.manager.session_timestamps[ f"stale_{i}" ] = datetime.now() - timedelta( hours=48 )
+
+        with patch( "builtins.print" ):
+            self.assertEqual( self.manager.cleanup_stale_sessions( max_age_hours=24 ), 4 )
+        self._assert_index_consistent()
+        self.assertEqual( self.manager.event_subscribers, { "queue_todo_update": { "fresh" } } )
+        self.assertEqual( self.manager.wildcard_sessions, set() )
+
+        with patch( "builtins.print" ):
+            self.manager.set_single_session_policy( True )
+        old_tab = self._connect( "tab_1", FakeWebSocket(), user_id="alice", events=[ "sys_ping" ] )
+        new_tab = self._connect( "tab_2", FakeWebSocket(), user_id="alice", events=[ "sys_ping", "queue_todo_update" ] )
+        self._assert_index_consistent()
+        self.assertFalse( self.manager.is_connected( "tab_1" ) )
+        self.assertEqual( self.manager.event_subscribers[ "sys_ping" ], { "tab_2" } )
+        self.assertEqual( self.manager.event_subscribers[ "queue_todo_update" ], { "fresh", "tab_2" } )
+
+        async def run():
+            await self.manager.async_emit( "sys_ping", { "n": 1 } )
+            await self.manager.async_emit( "queue_todo_update", { "n": 2 } )
+            await self._settle()
+
+        asyncio.run( run() )
+        self.assertEqual( old_tab.sent, [ ] )
+        self.assertEqual( [ json.loads( text )[ "n" ] for text in new_tab.sent ], [ 1, 2 ] )
+        self.assertEqual( [ json.loads( text )[ "n" ] for text in fresh.sent ], [ 2 ] )
+
+    def test_coalesces_transitions_and_progress_per_user_job( self ):
+        """
+        Test the coalescing window on the sync emit paths.
+
+        Ensures:
+            - A cache-hit replay pending -> todo -> run -> done arrives as one pending -> done
+              transition carrying the final metadata and coalesced_count
+            - A burst of progress notifications arrives as the latest one, and a following
+              response-requested notification still arrives after it
+            - A lone non-terminal transition is delivered once the window expires
+            - Other users' streams are untouched
+        """
+        self.manager.coalesce_window = 0.05
+        self._start_loop()
+        alice = [ self._connect( f"a{i}", FakeWebSocket(), user_id="alice" ) for i in range( 2 ) ]
+        bob   = self._connect( "b1", FakeWebSocket(), user_id="bob" )
+
+        def transition( job_id, from_queue, to_queue, metadata=None, user_id="alice" ):
+            data = { "job_id": job_id, "from_queue": from_queue, "to_queue": to_queue }
+            if metadata: data[ "metadata" ] = metadata
+            self.manager.emit_to_user_sync( user_id, "job_state_transition", data )
+
+        with patch( "builtins.print" ):
+            transition( "cached", "pending", "todo" )
+            transition( "cached", "todo", "run", { "started_at": "t1" } )
+            transition( "cached", "run", "done", { "response_text": "4" } )
+            for n in range( 1, 6 ):
+                self.manager.emit_to_user_sync( "alice", "notification_queue_update", self._notification( n, "agentic" ) )
+            self.manager.emit_to_user_sync( "alice", "notification_queue_update", self._notification( 6, "agentic", type="task", response_requested=True ) )
+            transition( "slow", "todo", "run" )
+            transition( "other", "todo", "run", user_id="bob" )
+            self._wait_for_quiet( alice + [ bob ] )
+
+        for websocket in alice:
+            messages = [ json.loads( text ) for text in websocket.sent ]
+            self.assertEqual( len( messages ), 4 )
+            cached, progress, question, slow = messages
+            self.assertEqual( ( cached[ "from_queue" ], cached[ "to_queue" ] ), ( "pending", "done" ) )
+            self.assertEqual( cached[ "metadata" ], { "response_text": "4" } )
+            self.assertEqual( cached[ "coalesced_count" ], 3 )
+            self.assertEqual( progress[ "notification" ][ "message" ], "step 5" )
+            self.assertEqual( progress[ "coalesced_count" ], 5 )
+            self.assertTrue( question[ "notification" ][ "response_requested" ] )
+            self.assertNotIn( "coalesced_count", question )
+            self.assertEqual( ( slow[ "job_id" ], slow[ "to_queue" ] ), ( "slow", "run" ) )
+
+        self.assertEqual( [ json.loads( text )[ "job_id" ] for text in bob.sent ], [ "other" ] )
+        stats = self.manager.get_coalescing_stats()
+        self.assertEqual( stats[ "merged" ], 6 )
+        self.assertEqual( stats[ "scheduled" ], 5 )
+
+    def test_schedule_emit_reports_failure_before_coroutine_exists( self ):
+        """
+        Test a failure while building the emit coroutine.
+
+        Ensures:
+            - The original error is reported, not a NameError from the cleanup
+            - Nothing is counted as scheduled
+        """
+        self.manager.main_loop = Mock()
+        with patch.object( self.manager, "emit_to_user", new=Mock( side_effect=RuntimeError( "no coroutine" ) ) ), patch( "builtins.print" ) as mock_print:
+            self.manager._schedule_emit( "alice", "notification_queue_update", { "n": 1 } )
+
+        mock_print.assert_called_once_with( "[ERROR] Failed to schedule emission to user alice: no coroutine" )
+        self.assertEqual( self.manager.get_coalescing_stats()[ "scheduled" ], 0 )
+
+    def test_terminal_transition_flushes_held_progress_first( self ):
+        """
+        Test ordering between a job's held progress and its final transition.
+
+        Ensures:
+            - Progress held for a job goes out before that job's done or error transition
+            - Nothing for the job arrives after its terminal transition
+            - Progress held for other jobs stays held until its own window expires
+        """
+        self.manager.coalesce_window = 0.2
+        self._start_loop()
+        socket = self._connect( "a1", FakeWebSocket(), user_id="alice" )
+
+        with patch( "builtins.print" ):
+            for n in range( 1, 4 ):
+                self.manager.emit_to_user_sync( "alice", "notification_queue_update", self._notification( n, "finished" ) )
+                self.manager.emit_to_user_sync( "alice", "notification_queue_update", self._notification( n, "failed" ) )
+                self.manager.emit_to_user_sync( "alice", "notification_queue_update", self._notification( n, "running" ) )
+            self.manager.emit_to_user_sync( "alice", "job_state_transition", { "job_id": "finished", "from_queue": "run", "to_queue": "done" } )
+            self.manager.emit_to_user_sync( "alice", "job_state_transition", { "job_id": "failed", "from_queue": "run", "to_queue": "run", "metadata": { "error": "boom" } } )
+            self.assertEqual( self.manager.get_coalescing_stats()[ "pending" ], 1 )
+            self._wait_for_quiet( [ socket ] )
+
+        messages = [ json.loads( text ) for text in socket.sent ]
+        summary  = [ ( m[ "type" ], m.get( "job_id" ) or m[ "notification" ][ "job_id" ], m.get( "to_queue" ) or m[ "notification" ][ "message" ] ) for m in messages ]
+        self.assertEqual( summary, [
+            ( "notification_queue_update", "finished", "step 3" ),
+            ( "job_state_transition",      "finished", "done" ),
+            ( "notification_queue_update", "failed",   "step 3" ),
+            ( "job_state_transition",      "failed",   "run" ),
+            ( "notification_queue_update", "running",  "step 3" )
+        ] )
+        self.assertEqual( messages[ 0 ][ "coalesced_count" ], 3 )
+
+    def test_burst_message_and_cpu_reduction( self ):
+        """
+        Benchmark a synthetic burst with the window off and on.
+
+        Each of 200 jobs replays from cache ( three transitions ), pushes 10 progress
+        notifications and a final task notification, to a user with three open tabs.
+
+        Ensures:
+            - Coalescing cuts delivered messages by at least 3x
+            - Every job's final transition and final notification are still delivered
+            - Process CPU for both bursts is printed, not asserted ( it flakes on loaded machines )
+        """
+        jobs, progress, tabs = 200, 10, 3
+        # Large enough that the uncoalesced burst is not dropped as a stalled client
+        self.manager.outbound_queue_size = jobs * ( 3 + progress + 1 )
+
+        def burst( window_s ):
+            self.manager.coalesce_window = window_s
+            self.manager.coalesce_stats  = { "received": 0, "scheduled": 0, "merged": 0 }
+            sockets = [ self._connect( f"{window_s}_{i}", FakeWebSocket(), user_id=f"user_{window_s}" ) for i in range( tabs ) ]
+            user_id = f"user_{window_s}"
+            start   = time.process_time()
+            with patch( "builtins.print" ):
+                for j in range( jobs ):
+                    job_id = f"job_{j}"
+                    for from_queue, to_queue in ( ( "pending", "todo" ), ( "todo", "run" ) ):
+                        self.manager.emit_to_user_sync( user_id, "job_state_transition", { "job_id": job_id, "from_queue": from_queue, "to_queue": to_queue } )
+                    for n in range( progress ):
+                        self.manager.emit_to_user_sync( user_id, "notification_queue_update", self._notification( n, job_id ) )
+                    self.manager.emit_to_user_sync( user_id, "notification_queue_update", self._notification( progress, job_id, type="task" ) )
+                    self.manager.emit_to_user_sync( user_id, "job_state_transition", { "job_id": job_id, "from_queue": "run", "to_queue": "done", "metadata": { "response_text": job_id } } )
+                delivered = self._wait_for_quiet( sockets )
+            cpu = time.process_time() - start
+            finals = [ json.loads( text ) for text in sockets[ 0 ].sent ]
+            done   = [ m for m in finals if m[ "type" ] == "job_state_transition" and m[ "to_queue" ] == "done" ]
+            tasks  = [ m for m in finals if m[ "type" ] == "notification_queue_update" and m[ "notification" ][ "type" ] == "task" ]
+            self.assertEqual( len( done ), jobs )
+            self.assertEqual( len( tasks ), jobs )
+            return delivered, cpu
+
+        self._start_loop()
+        raw_messages, raw_cpu         = burst( 0 )
+        merged_messages, merged_cpu   = burst( 0.075 )
+        print( f"\n  burst of {jobs} jobs x ( 3 transitions + {progress + 1} notifications ) to {tabs} tabs: "
+               f"{raw_messages} -> {merged_messages} messages, CPU {raw_cpu * 1000:.0f}ms -> {merged_cpu * 1000:.0f}ms" )
+
+        self.assertEqual( raw_messages, jobs * ( 3 + progress + 1 ) * tabs )
+        self.assertLessEqual( merged_messages * 3, raw_messages )
+
+
+def isolated_unit_test():
+    """
+    Run unit tests for WebSocketManager in complete isolation.
+
+    Returns:
+        Tuple[bool, float, str]: (success, duration, message)
+    """
+    import cosa.utils.util as du
+
+    start_time = time.time()
+
+    try:
+        du.print_banner( "WebSocketManager Unit Tests", prepend_nl=True )
+
+        suite  = unittest.TestLoader().loadTestsFromTestCase( TestWebSocketManager )
+        result = unittest.TextTestRunner( verbosity=2, stream=sys.stdout ).run( suite )
+
+        duration = time.time() - start_time
+        success  = result.wasSuccessful()
+
+        if success:
+            message = f"All {result.testsRun} tests passed successfully in {duration:.3f}s"
+        else:
+            message = f"{len( result.failures )} failures, {len( result.errors )} errors out of {result.testsRun} tests"
+
+        return success, duration, message
+
+    except Exception as e:
+        duration = time.time() - start_time
+        return False, duration, f"Unit test execution failed: {str( e )}"
+
+
+if __name__ == "__main__":
+    success, duration, message = isolated_unit_test()
+    status = "✅ PASS" if success else "❌ FAIL"
+    print( f"\n{status} WebSocketManager unit tests completed in {duration:.3f}s" )
+    print( f"Result: {message}" )
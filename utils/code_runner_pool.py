@@ -0,0 +1,381 @@
+"""
+Warm pool of pre-started sandbox interpreters for util_code_runner.
+
+Each worker is a long-lived `python3 -u code_runner_worker.py` process that has
+already imported pandas and cosa.utils.util_pandas. Jobs are sent over the
+worker's stdin as one JSON line and answered with one JSON line, and every job
+runs in its own temporary directory inside the worker, so concurrent runs never
+share a code file or the parent's working directory.
+
+Workers are replaced after `max_jobs_per_worker` jobs, after a timeout, or after
+any crash. A slot whose replacement fails to spawn is retried by the next caller
+that claims it. Callers fall back to the cold subprocess path when the pool raises
+CodeRunnerPoolError.
+"""
+
+import json
+import os
+import queue
+import select
+import subprocess
+import threading
+from subprocess import PIPE, DEVNULL
+from typing import Optional
+
+import cosa.utils.util as du
+
+WORKER_PATH = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), "code_runner_worker.py" )
+
+DEFAULT_POOL_SIZE           = 2
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+DEFAULT_READY_TIMEOUT       = 60
+
+# How often a caller waiting for an idle worker re-checks for shutdown
+IDLE_POLL_SECONDS = 0.5
+
+# Queued in place of a worker whose replacement failed to spawn
+_LOST_SLOT = object()
+
+
+class CodeRunnerPoolError( Exception ):
+    """Raised when a pooled worker cannot run a job (failed to start, crashed or broke protocol)."""
+    pass
+
+
+class _PooledWorker:
+    """
+    Handle on one warm interpreter process.
+
+    Requires:
+        - python_runtime is an executable Python command
+
+    Ensures:
+        - Process spawned immediately; readiness confirmed lazily on first use
+    """
+
+    def __init__( self, python_runtime: str ) -> None:
+        self.jobs_run = 0
+        self.ready    = False
+        self.process  = subprocess.Popen(
+            [ python_runtime, "-u", WORKER_PATH ], stdin=PIPE, stdout=PIPE, stderr=DEVNULL, universal_newlines=True, bufsize=1
+        )
+
+    def _read_message( self, timeout: float ) -> dict:
+        """
+        Read one protocol line from the worker.
+
+        Requires:
+            - timeout > 0
+
+        Ensures:
+            - Returns the decoded JSON message
+
+        Raises:
+            - subprocess.TimeoutExpired if no line arrives within timeout
+            - CodeRunnerPoolError if the worker exited or wrote something that isn't JSON
+        """
+        readable, _, _ = select.select( [ self.process.stdout ], [ ], [ ], timeout )
+        if not readable:
+            raise subprocess.TimeoutExpired( self.process.args, timeout )
+
+        line = self.process.stdout.readline()
+        if not line:
+            raise CodeRunnerPoolError( f"Worker exited with return code {self.process.poll()}" )
+        try:
+            return json.loads( line )
+        except json.JSONDecodeError as e:
+            raise CodeRunnerPoolError( f"Worker protocol error: {e}" ) from e
+
+    def wait_until_ready( self, timeout: float ) -> None:
+        """
+        Block until the worker reports that its warm imports are done.
+
+        Raises:
+            - CodeRunnerPoolError if the worker doesn't become ready within timeout
+        """
+        if self.ready: return
+        try:
+            message = self._read_message( timeout )
+        except subprocess.TimeoutExpired as e:
+            raise CodeRunnerPoolError( f"Worker not ready after {timeout}s" ) from e
+
+        if not message.get( "ready", False ):
+            raise CodeRunnerPoolError( f"Unexpected worker handshake: {message}" )
+        if message.get( "missing" ):
+            print( f"CodeRunnerPool: worker could not pre-import {message[ 'missing' ]}" )
+        self.ready = True
+
+    def run( self, code: str, path_dir: str, timeout: float, code_path: Optional[str]=None ) -> subprocess.CompletedProcess:
+        """
+        Send one job to the worker and wait for its result.
+
+        Requires:
+            - Worker is ready
+            - code is the complete program source
+            - code_path is None or a file already holding code, used as the program's file name
+
+        Ensures:
+            - Returns a CompletedProcess shaped like subprocess.run() output
+
+        Raises:
+            - subprocess.TimeoutExpired if the job runs longer than timeout
+            - CodeRunnerPoolError if the worker crashes mid-job
+        """
+        try:
+            self.process.stdin.write( json.dumps( { "code": code, "path_dir": path_dir, "code_path": code_path } ) + "\n" )
+            self.process.stdin.flush()
+        except ( BrokenPipeError, OSError ) as e:
+            raise CodeRunnerPoolError( f"Worker pipe closed: {e}" ) from e
+
+        result = self._read_message( timeout )
+        self.jobs_run += 1
+
+        return subprocess.CompletedProcess( self.process.args, result[ "return_code" ], stdout=result[ "stdout" ], stderr=result[ "stderr" ] )
+
+    def is_alive( self ) -> bool:
+        """Return True while the worker process is running."""
+        return self.process.poll() is None
+
+    def kill( self ) -> None:
+        """Terminate the worker process and release its pipes."""
+        try:
+            self.process.kill()
+            self.process.wait( timeout=5 )
+        except Exception:
+            pass
+        for stream in [ self.process.stdin, self.process.stdout ]:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+
+class CodeRunnerPool:
+    """
+    Fixed-size pool of warm sandbox interpreters.
+
+    Requires:
+        - size >= 1
+        - max_jobs_per_worker >= 1
+
+    Ensures:
+        - `size` workers spawned up front and warmed in parallel
+        - run() is thread-safe; callers block when every worker is busy, until shutdown()
+        - Unhealthy or worn-out workers replaced on release
+    """
+
+    def __init__( self, size: int=DEFAULT_POOL_SIZE, max_jobs_per_worker: int=DEFAULT_MAX_JOBS_PER_WORKER, python_runtime: str="python3", ready_timeout: float=DEFAULT_READY_TIMEOUT, debug: bool=False ) -> None:
+        if size < 1:
+            raise ValueError( f"CodeRunnerPool size must be >= 1, got {size}" )
+        if max_jobs_per_worker < 1:
+            raise ValueError( f"CodeRunnerPool max_jobs_per_worker must be >= 1, got {max_jobs_per_worker}" )
+
+        self.size                = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.python_runtime      = python_runtime
+        self.ready_timeout       = ready_timeout
+        self.debug               = debug
+        self._lock               = threading.Lock()
+        self._closed             = False
+        self._workers            = [ _PooledWorker( python_runtime ) for _ in range( size ) ]
+        self._idle               = queue.Queue()
+
+        for worker in self._workers: self._idle.put( worker )
+
+    def run( self, code: str, path_dir: str, timeout: float=60, code_path: Optional[str]=None ) -> subprocess.CompletedProcess:
+        """
+        Run a complete program in a warm worker.
+
+        Requires:
+            - code is the complete program source
+            - path_dir is the directory a script run would see as sys.path[ 0 ]
+            - code_path is None or a file the caller wrote code to; tracebacks and __file__ then
+              refer to it instead of a copy in the job's temporary directory
+
+        Ensures:
+            - Returns a CompletedProcess with returncode, stdout and stderr
+            - Worker returned to the pool, or replaced if it timed out, crashed or hit max_jobs_per_worker
+
+        Raises:
+            - subprocess.TimeoutExpired if the program runs longer than timeout
+            - CodeRunnerPoolError if the pool is closed (also while waiting), the worker failed,
+              or the claimed slot's worker could not be spawned
+        """
+        worker  = self._claim_worker()
+        healthy = False
+        try:
+            worker.wait_until_ready( self.ready_timeout )
+            results = worker.run( code, path_dir, timeout, code_path=code_path )
+            healthy = True
+            return results
+        finally:
+            self._release( worker, healthy )
+
+    def _claim_worker( self ) -> _PooledWorker:
+        """
+        Take an idle worker, waiting for one if all are busy.
+
+        Ensures:
+            - Returns a worker that is no longer on the idle queue
+            - A lost slot is respawned here; if that fails again the slot goes back on the
+              queue for the next caller
+
+        Raises:
+            - CodeRunnerPoolError if the pool is or becomes shut down, or the respawn fails
+        """
+        while True:
+            if self._closed: raise CodeRunnerPoolError( "CodeRunnerPool is shut down" )
+            try:
+                worker = self._idle.get( timeout=IDLE_POLL_SECONDS )
+            except queue.Empty:
+                continue
+            if worker is not _LOST_SLOT: return worker
+
+            with self._lock:
+                if self._closed:
+                    self._idle.put( _LOST_SLOT )
+                    raise CodeRunnerPoolError( "CodeRunnerPool is shut down" )
+                try:
+                    replacement = _PooledWorker( self.python_runtime )
+                except Exception as e:
+                    self._idle.put( _LOST_SLOT )
+                    raise CodeRunnerPoolError( f"Spawning worker failed: {e}" ) from e
+                self._workers.append( replacement )
+            return replacement
+
+    def _release( self, worker: _PooledWorker, healthy: bool ) -> None:
+        """
+        Return a worker to the idle queue, recycling it first if needed.
+
+        Ensures:
+            - Workers that failed, died or ran max_jobs_per_worker jobs are killed and replaced
+            - If the replacement can't be spawned, a lost-slot marker keeps the slot's place
+              on the idle queue so it is retried instead of shrinking the pool for good
+            - No replacement spawned once the pool is shut down
+        """
+        if healthy and worker.is_alive() and worker.jobs_run < self.max_jobs_per_worker:
+            self._idle.put( worker )
+            return
+
+        if self.debug: print( f"CodeRunnerPool: recycling worker after {worker.jobs_run} job(s), healthy={healthy}" )
+        worker.kill()
+
+        with self._lock:
+            self._workers = [ w for w in self._workers if w is not worker ]
+            if self._closed: return
+            try:
+                replacement = _PooledWorker( self.python_runtime )
+            except Exception as e:
+                du.print_stack_trace( e, explanation="Spawning replacement worker failed", caller="CodeRunnerPool._release()" )
+                replacement = _LOST_SLOT
+            else:
+                self._workers.append( replacement )
+        self._idle.put( replacement )
+
+    def shutdown( self ) -> None:
+        """
+        Kill every worker. Subsequent run() calls, and calls already waiting for
+        a worker, raise CodeRunnerPoolError.
+        """
+        with self._lock:
+            self._closed = True
+            workers      = list( self._workers )
+        for worker in workers: worker.kill()
+
+
+_pool: Optional[CodeRunnerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_code_runner_pool( python_runtime: str="python3", debug: bool=False ) -> Optional[CodeRunnerPool]:
+    """
+    Return the process-wide pool, creating it on first use.
+
+    Requires:
+        - python_runtime is the runtime the caller wants to execute with
+
+    Ensures:
+        - Reads 'code runner pool size' (default 2, 0 disables the pool) and
+          'code runner pool max jobs per worker' (default 50) from config, falling back to defaults
+        - Returns None if the pool is disabled, could not start, or was built for another runtime
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            size, max_jobs = _get_pool_config()
+            if size < 1: return None
+            try:
+                _pool = CodeRunnerPool( size=size, max_jobs_per_worker=max_jobs, python_runtime=python_runtime, debug=debug )
+            except Exception as e:
+                du.print_stack_trace( e, explanation="Starting code runner pool failed", caller="get_code_runner_pool()" )
+                return None
+
+    return _pool if _pool.python_runtime == python_runtime else None
+
+
+def shutdown_code_runner_pool() -> None:
+    """Shut down the process-wide pool, if one was started."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None: _pool.shutdown()
+        _pool = None
+
+
+def _get_pool_config() -> tuple[int, int]:
+    """
+    Read pool sizing from configuration.
+
+    Ensures:
+        - Returns ( size, max_jobs_per_worker ), using defaults when no configuration is available
+    """
+    from cosa.config.configuration_manager import ConfigurationManager
+
+    try:
+        config_mgr = ConfigurationManager( env_var_name="LUPIN_CONFIG_MGR_CLI_ARGS" )
+        size       = config_mgr.get( "code runner pool size", default=DEFAULT_POOL_SIZE, return_type="int" )
+        max_jobs   = config_mgr.get( "code runner pool max jobs per worker", default=DEFAULT_MAX_JOBS_PER_WORKER, return_type="int" )
+        return size, max_jobs
+    except ValueError:
+        return DEFAULT_POOL_SIZE, DEFAULT_MAX_JOBS_PER_WORKER
+
+
+def quick_smoke_test():
+    """Quick smoke test for the warm code runner pool."""
+    import tempfile
+    from cosa.utils.util_stopwatch import Stopwatch
+
+    du.print_banner( "CodeRunnerPool Smoke Test", prepend_nl=True )
+
+    pool = CodeRunnerPool( size=2 )
+    try:
+        path_dir = tempfile.gettempdir()
+
+        timer   = Stopwatch( msg="First (warm-up) run" )
+        results = pool.run( "import pandas as pd\nprint( pd.DataFrame( { 'a': [ 1, 2 ] } ).a.sum() )", path_dir )
+        timer.print( "Done!", use_millis=True )
+        print( f"✓ return_code={results.returncode} stdout={results.stdout.strip()!r}" )
+
+        timer = Stopwatch( msg="Ten warm runs" )
+        for i in range( 10 ): pool.run( f"print( {i} * 2 )", path_dir )
+        timer.print( "Done!", use_millis=True )
+
+        results = pool.run( "raise ValueError( 'boom' )", path_dir )
+        print( f"✓ Error run: return_code={results.returncode} last stderr line={results.stderr.strip().splitlines()[ -1 ]!r}" )
+
+        try:
+            pool.run( "import time\ntime.sleep( 5 )", path_dir, timeout=0.5 )
+        except subprocess.TimeoutExpired:
+            print( "✓ Timeout raised and worker recycled" )
+
+    except Exception as e:
+        du.print_stack_trace( e, explanation="Smoke test failed", caller="code_runner_pool.quick_smoke_test()" )
+    finally:
+        pool.shutdown()
+
+    print( "✓ CodeRunnerPool smoke test completed" )
+
+
+if __name__ == "__main__":
+    quick_smoke_test()
@@ -0,0 +1,178 @@
+"""
+Long-lived sandbox interpreter for the code runner pool.
+
+Started by CodeRunnerPool as `python3 -u code_runner_worker.py`. Imports pandas
+and cosa.utils.util_pandas once at startup, then loops reading one JSON job per
+line from a private copy of the original stdin and writing one JSON result per
+line to a private copy of the original stdout. Generated code sees /dev/null as
+its stdin, so it can never read or consume the command pipe.
+
+Each job runs in its own temporary directory, with file descriptors 1 and 2
+redirected into files in that directory, so the generated code's output,
+including output from anything it shells out to, never reaches the protocol pipe.
+"""
+
+import builtins
+import json
+import os
+import sys
+import tempfile
+import traceback
+
+CODE_FILE_NAME = "code_execution.py"
+
+
+def _warm_imports() -> list[str]:
+    """
+    Import the heavy modules generated code relies on so each job starts warm.
+
+    Requires:
+        - None
+
+    Ensures:
+        - pandas and cosa.utils.util_pandas imported if available
+        - Returns the names of modules that could not be imported (never raises)
+    """
+    missing = [ ]
+    for module_name in [ "pandas", "cosa.utils.util_pandas" ]:
+        try:
+            __import__( module_name )
+        except Exception:
+            missing.append( module_name )
+    return missing
+
+
+def _exit_code( e: SystemExit ) -> int:
+    """
+    Map a SystemExit raised by generated code to a process-style return code.
+
+    Requires:
+        - e is a SystemExit instance
+
+    Ensures:
+        - None -> 0, int -> itself, anything else -> printed to stderr and 1
+    """
+    if e.code is None: return 0
+    if isinstance( e.code, int ): return e.code
+    print( e.code, file=sys.stderr )
+    return 1
+
+
+def run_job( code: str, path_dir: str, code_path: str=None ) -> int:
+    """
+    Execute one program in a fresh namespace, as if run as a `__main__` script.
+
+    Requires:
+        - code is the complete program source
+        - path_dir is the directory a script run used to see as sys.path[ 0 ]
+        - code_path is None or a file the caller already wrote code to
+        - Current working directory is the job's temporary directory
+
+    Ensures:
+        - Tracebacks and __file__ reference code_path, or CODE_FILE_NAME written into
+          the working directory when no code_path is given
+        - Returns 0 on success, 1 on an uncaught exception, or the SystemExit code
+        - Tracebacks printed to stderr without this module's frames
+        - sys.path restored afterwards
+    """
+    if not code_path:
+        code_path = os.path.join( os.getcwd(), CODE_FILE_NAME )
+        with open( code_path, "w" ) as f:
+            f.write( code )
+
+    saved_sys_path = list( sys.path )
+    sys.path[ 0 ]  = path_dir
+    namespace      = { "__name__": "__main__", "__file__": code_path, "__builtins__": builtins }
+    try:
+        exec( compile( code, code_path, "exec" ), namespace )
+        return 0
+    except SystemExit as e:
+        return _exit_code( e )
+    except SyntaxError as e:
+        traceback.print_exception( type( e ), e, None )
+        return 1
+    except BaseException as e:
+        traceback.print_exception( type( e ), e, e.__traceback__.tb_next )
+        return 1
+    finally:
+        sys.path[ : ] = saved_sys_path
+
+
+def _run_in_temp_dir( job: dict ) -> dict:
+    """
+    Run a job inside its own temporary directory with fds 1 and 2 captured.
+
+    Requires:
+        - job has 'code' and 'path_dir' keys, and optionally 'code_path'
+        - File descriptors 0, 1 and 2 currently point at /dev/null
+
+    Ensures:
+        - Returns dict with 'return_code', 'stdout' and 'stderr'
+        - Working directory and fds 1/2 restored; temporary directory removed
+    """
+    original_wd = os.getcwd()
+    with tempfile.TemporaryDirectory( prefix="cosa-code-run-" ) as job_dir:
+
+        stdout_path = os.path.join( job_dir, "stdout.txt" )
+        stderr_path = os.path.join( job_dir, "stderr.txt" )
+        stdout_fd   = os.open( stdout_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC )
+        stderr_fd   = os.open( stderr_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC )
+        os.dup2( stdout_fd, 1 )
+        os.dup2( stderr_fd, 2 )
+        os.close( stdout_fd )
+        os.close( stderr_fd )
+
+        os.chdir( job_dir )
+        try:
+            # A fresh /dev/null stdin per job, in case earlier code replaced or closed sys.stdin
+            sys.stdin   = open( os.devnull )
+            return_code = run_job( job[ "code" ], job[ "path_dir" ], job.get( "code_path" ) )
+        finally:
+            sys.stdin.close()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.chdir( original_wd )
+            devnull = os.open( os.devnull, os.O_WRONLY )
+            os.dup2( devnull, 1 )
+            os.dup2( devnull, 2 )
+            os.close( devnull )
+
+        with open( stdout_path, errors="replace" ) as f: stdout = f.read()
+        with open( stderr_path, errors="replace" ) as f: stderr = f.read()
+
+    return { "return_code": return_code, "stdout": stdout, "stderr": stderr }
+
+
+def main() -> None:
+    """
+    Worker entry point: warm up, announce readiness, then serve jobs until stdin closes.
+
+    Requires:
+        - stdin and stdout are pipes owned by CodeRunnerPool
+
+    Ensures:
+        - First line written is {"ready": true, "missing": [...]}
+        - One JSON result line per JSON job line
+        - Generated code can reach neither pipe through fds 0, 1 or 2
+        - Exits cleanly on EOF
+    """
+    # Keep private handles on the real stdin/stdout for the protocol, then point fds 0/1/2 at /dev/null
+    protocol_in  = os.fdopen( os.dup( 0 ), "r" )
+    protocol_out = os.fdopen( os.dup( 1 ), "w", buffering=1 )
+    devnull      = os.open( os.devnull, os.O_RDWR )
+    os.dup2( devnull, 0 )
+    os.dup2( devnull, 1 )
+    os.dup2( devnull, 2 )
+    os.close( devnull )
+
+    missing = _warm_imports()
+    protocol_out.write( json.dumps( { "ready": True, "missing": missing } ) + "\n" )
+
+    for line in protocol_in:
+        if not line.strip(): continue
+        result = _run_in_temp_dir( json.loads( line ) )
+        protocol_out.write( json.dumps( result ) + "\n" )
+
+
+if __name__ == "__main__":
+    main()
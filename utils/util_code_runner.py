@@ -1,10 +1,17 @@
 import os
 import subprocess
+import threading
 from subprocess import PIPE, run
 from typing import Any, Optional
 
 debug = os.getenv( "LUPIN_CODE_EXEC_DEBUG", "False" ) == "True"
 import cosa.utils.util as du
+import cosa.utils.code_runner_pool as crp
+
+CODE_EXECUTION_TIMEOUT = 60
+
+# The fallback path shares one code file and the process-wide working directory, so runs are serialized
+_subprocess_lock = threading.Lock()
 
 @staticmethod
 def initialize_code_response_dict() -> dict[str, Any]:
@@ -243,6 +250,84 @@ def _remove_consecutive_empty_strings( strings: list[str] ) -> list[str]:
             
     return result
 
+def _get_code_path() -> str:
+    """
+    Resolve the absolute path of the configured code execution file.
+    
+    Requires:
+        - None
+        
+    Ensures:
+        - Returns <project root> + code_execution_file_path, or the test fallback if configuration is unavailable
+    """
+    from cosa.config.configuration_manager import ConfigurationManager
+    
+    # Get the code execution file path, with a fallback for test environments
+    try:
+        config_mgr = ConfigurationManager( env_var_name="LUPIN_CONFIG_MGR_CLI_ARGS" )
+        code_file_path = config_mgr.get( "code_execution_file_path" )
+    except ValueError as e:
+        # We're likely in a test environment without the environment variable set
+        du.print_banner( f"ConfigurationManager error: {str(e)}", expletive=True, chunk="🤔" )
+        print("Using fallback code execution file path for testing")
+        code_file_path = "/io/code_execution.py"
+        
+    return du.get_project_root() + code_file_path
+
+def _write_code_file( code_path: str, solution_code: list[str] ) -> None:
+    """
+    Write the assembled code to the code execution file, replacing it atomically.
+    
+    Requires:
+        - code_path is an absolute file path
+        - solution_code is the fully assembled list of code lines
+        
+    Ensures:
+        - code_path holds exactly solution_code, so the debugger and tracebacks see the code that ran
+        - Concurrent writers never leave a partially written file behind
+    """
+    # Create directory if it doesn't exist (defensive programming for Docker environments)
+    os.makedirs( os.path.dirname( code_path ), exist_ok=True )
+    
+    temp_path = f"{code_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    du.write_lines_to_file( temp_path, solution_code )
+    os.replace( temp_path, code_path )
+
+def _run_in_subprocess( solution_code: list[str], python_runtime: str, debug: bool=False ) -> subprocess.CompletedProcess:
+    """
+    Run assembled code in a cold subprocess (the original, fallback execution path).
+    
+    Requires:
+        - solution_code is the fully assembled list of code lines
+        - python_runtime is a valid Python runtime command
+        
+    Ensures:
+        - Writes code to the configured code_execution_file_path and runs it from <project root>/io
+        - Serialized with other fallback runs, since they share the file and the working directory
+        - Original working directory restored, even on timeout
+        
+    Raises:
+        - subprocess.TimeoutExpired if the run exceeds CODE_EXECUTION_TIMEOUT
+    """
+    code_path = _get_code_path()
+
+    with _subprocess_lock:
+        
+        _write_code_file( code_path, solution_code )
+        
+        # Stash current working directory, so we can return to it after code has finished executing
+        original_wd = os.getcwd()
+        os.chdir( du.get_project_root() + "/io" )
+        
+        if debug: print( "Code runner executing [{}]... ".format( code_path ), end="" )
+        
+        # ¡OJO! Hardcoded value of python runtime... Make this runtime configurable
+        try:
+            return run( [ python_runtime, code_path ], stdout=PIPE, stderr=PIPE, universal_newlines=True, timeout=CODE_EXECUTION_TIMEOUT )
+        finally:
+            # Return to original working directory
+            os.chdir( original_wd )
+
 # TODO: Flip return none on timeout from true to false!
 def assemble_and_run_solution( solution_code: list[str], example_code: str, path_to_df: Optional[str]=None, solution_code_returns: str="string", python_runtime: str="python3", debug: bool=False, verbose: bool=False, inject_bugs: bool=False, return_none_on_timeout: bool=True ) -> dict[str, Any]:
     """
@@ -258,7 +343,8 @@ def assemble_and_run_solution( solution_code: list[str], example_code: str, path
         
     Ensures:
         - Returns a dictionary with 'return_code' and 'output' keys
-        - Executes the assembled code in a subprocess
+        - Executes the assembled code in a warm pooled worker, falling back to a cold subprocess
+        - Either way, the assembled code is left in the configured code_execution_file_path
         - Handles timeouts based on return_none_on_timeout flag
         - Includes proper imports and post-processing based on return type
         - Captures both stdout and stderr from the execution
@@ -288,34 +374,24 @@ def assemble_and_run_solution( solution_code: list[str], example_code: str, path
         response_dict = bug_injector.run_prompt()
         solution_code = response_dict[ "code" ]
         
-    from cosa.config.configuration_manager import ConfigurationManager
-    
-    # Get the code execution file path, with a fallback for test environments
-    try:
-        config_mgr = ConfigurationManager( env_var_name="LUPIN_CONFIG_MGR_CLI_ARGS" )
-        code_file_path = config_mgr.get( "code_execution_file_path" )
-    except ValueError as e:
-        # We're likely in a test environment without the environment variable set
-        du.print_banner( f"ConfigurationManager error: {str(e)}", expletive=True, chunk="🤔" )
-        print("Using fallback code execution file path for testing")
-        code_file_path = "/io/code_execution.py"
-        
-    code_path = du.get_project_root() + code_file_path
-
-    # Create directory if it doesn't exist (defensive programming for Docker environments)
-    os.makedirs( os.path.dirname( code_path ), exist_ok=True )
-
-    du.write_lines_to_file( code_path, solution_code )
-    
-    # Stash current working directory, so we can return to it after code has finished executing
-    original_wd = os.getcwd()
-    os.chdir( du.get_project_root() + "/io" )
+    # Prefer a warm pooled interpreter: no cold pandas import, and each job gets its own temp dir
+    results = None
+    pool    = crp.get_code_runner_pool( python_runtime=python_runtime, debug=debug )
     
-    if debug: print( "Code runner executing [{}]... ".format( code_path ), end="" )
-    
-    # ¡OJO! Hardcoded value of python runtime... Make this runtime configurable
     try:
-        results = run( [ python_runtime, code_path ], stdout=PIPE, stderr=PIPE, universal_newlines=True, timeout=60 )
+        if pool is not None:
+            if debug: print( "Code runner executing in pooled worker... ", end="" )
+            try:
+                # The configured file is still written: the auto-debugger reads it, and tracebacks point at it
+                code_path = _get_code_path()
+                _write_code_file( code_path, solution_code )
+                results = pool.run( "\n".join( solution_code ), du.get_project_root() + "/io", timeout=CODE_EXECUTION_TIMEOUT, code_path=code_path )
+            except crp.CodeRunnerPoolError as e:
+                du.print_stack_trace( e, explanation="Pooled worker failed, falling back to subprocess", caller="assemble_and_run_solution" )
+        
+        if results is None:
+            results = _run_in_subprocess( solution_code, python_runtime, debug=debug )
+            
     except subprocess.TimeoutExpired as e:
         
         du.print_stack_trace( e, explanation="subprocess.TimeExpired calling run(...)", caller="assemble_and_run_solution" )
@@ -325,9 +401,6 @@ def assemble_and_run_solution( solution_code: list[str], example_code: str, path
         # !OJO! This is a GIANT kludge, but it's a way to return a response that doesn't crash the gsm8k client
         if return_none_on_timeout:
             
-            # Return to original working directory
-            os.chdir( original_wd )
-            
             results_dict = initialize_code_response_dict()
             results_dict[ "output" ] = None
             
@@ -355,9 +428,6 @@ def assemble_and_run_solution( solution_code: list[str], example_code: str, path
         du.print_banner( "assemble_and_run_solution() output:", prepend_nl=True )
         print( results_dict[ "output" ] )
     
-    # Return to original working directory
-    os.chdir( original_wd )
-    
     return results_dict
 
 def test_assemble_and_run_solution( debug: bool=False, verbose: bool=False) -> None:
@@ -405,7 +475,7 @@ def quick_smoke_test():
             "initialize_code_response_dict", "_ensure_proper_appendages",
             "_append_post_function_code", "_remove_all_but_the_1st_of_repeated_lines",
             "_get_imports", "_remove_consecutive_empty_strings",
-            "assemble_and_run_solution", "test_assemble_and_run_solution"
+            "_run_in_subprocess", "assemble_and_run_solution", "test_assemble_and_run_solution"
         ]
         
         # Get all functions in the current module